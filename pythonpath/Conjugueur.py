@@ -284,7 +284,7 @@ class Conjugueur (unohelper.Base, XActionListener, XJobExecutor):
                 self.input.TextColor = 0xAA2200
             else:
                 self.input.TextColor = 0x666666
-                self.oVerb = conj_fr.Verb(sVerb)
+                self.oVerb = conj_fr.getVerb(sVerb)
                 sRawInfo = conj_fr.getVtyp(sVerb)
                 self.info.Label = self.oVerb.sInfo
                 self.opro.Label = "pronominal"
@@ -4,6 +4,8 @@ import sys
 import os.path
 import argparse
 import json
+import re
+import mmap
 
 import grammalecte.fr as gce
 import grammalecte.fr.lexicographe as lxg
@@ -39,14 +41,34 @@ def _getText (sInputText):
     return sText
 
 
-def generateText (iParagraph, sText, oTokenizer, oDict, bJSON, nWidth=100, bDebug=False, bEmptyIfNoErrors=False):
+_nBufferSize = 1 << 20      # file reading: size of chunks
+
+# memory-mapped file: separators of paragraphs (bytes)
+_dParagraphSeparator = {
+    "line": re.compile(rb"\n"),
+    "blank": re.compile(rb"\n(?:[ \t\r]*\n)+"),
+    "indent": re.compile(rb"\n(?:[ \t\r]*\n)*(?=[ \t])|\n(?:[ \t\r]*\n)+"),
+}
+
+
+def generateText (iParagraph, sText, oTokenizer, oDict, bJSON, nWidth=100, bDebug=False, bEmptyIfNoErrors=False, iFirstLine=0, lLineOffset=None, nByteOffset=None):
     aGrammErrs = gce.parse(sText, "FR", bDebug)
     aSpellErrs = []
-    for dToken in oTokenizer.genTokens(sText):
-        if dToken['sType'] == "WORD" and not oDict.isValidToken(dToken['sValue']):
-            aSpellErrs.append(dToken)
+    for sWord, nStart, nEnd in oTokenizer.genWords(sText):
+        if not oDict.isValidToken(sWord):
+            aSpellErrs.append({ "sType": "WORD", "sValue": sWord, "nStart": nStart, "nEnd": nEnd })
     if bEmptyIfNoErrors and not aGrammErrs and not aSpellErrs:
         return ""
+    if lLineOffset:
+        # paragraph reassembled from several lines: positions in source file
+        for dErr in aGrammErrs:
+            txt.setLineAndColumn(dErr, iFirstLine, lLineOffset)
+        for dErr in aSpellErrs:
+            txt.setLineAndColumn(dErr, iFirstLine, lLineOffset)
+    if nByteOffset is not None:
+        # memory-mapped file: positions in bytes in source file
+        setByteOffsets(aGrammErrs, sText, nByteOffset)
+        setByteOffsets(aSpellErrs, sText, nByteOffset)
     if not bJSON:
         return txt.generateParagraph(sText, aGrammErrs, aSpellErrs, nWidth)
     return "  " + json.dumps({ "iParagraph": iParagraph, "lGrammarErrors": aGrammErrs, "lSpellingErrors": aSpellErrs }, ensure_ascii=False)
@@ -54,13 +76,66 @@ def generateText (iParagraph, sText, oTokenizer, oDict, bJSON, nWidth=100, bDebu
 
 def readfile (spf):
     if os.path.isfile(spf):
-        with open(spf, "r", encoding="utf-8") as hSrc:
+        with open(spf, "r", encoding="utf-8", buffering=_nBufferSize) as hSrc:
             for sText in hSrc:
                 yield sText
     else:
         print("# Error: file not found.")
 
 
+def readfileAsParagraphs (spf, sMode="line"):
+    """generator: returns (paragraph, number of its first line, offsets of its lines in paragraph or None)
+       sMode: "line" (each line is a paragraph), "blank" or "indent" (hard-wrapped lines reassembled, see text.genParagraphsFromLines)"""
+    if sMode == "line":
+        for iLine, sText in enumerate(readfile(spf), 1):
+            yield sText, iLine, None
+    else:
+        yield from txt.genParagraphsFromLines(readfile(spf), sMode)
+
+
+def genParagraphSpans (hMap, sMode="line"):
+    """generator: returns (start, end) in bytes of paragraphs of a memory-mapped file (nothing read)
+       mode “line”: each line is a paragraph, with its line ending, empty lines included (as with readfile)"""
+    nStart = 0
+    for m in _dParagraphSeparator[sMode].finditer(hMap):
+        if sMode == "line":
+            yield nStart, m.end()
+        elif m.start() > nStart:
+            yield nStart, m.start()
+        nStart = m.end()
+    if len(hMap) > nStart:
+        yield nStart, len(hMap)
+
+
+def readfileWithMmap (spf, sMode="line"):
+    """generator: returns (paragraph, offset in bytes) from a memory-mapped file (only paragraphs are decoded)
+       LF line endings expected; with modes “blank” and “indent”, line endings within a paragraph become spaces (same offsets)"""
+    if not os.path.isfile(spf):
+        print("# Error: file not found.")
+        return
+    if not os.path.getsize(spf):
+        return
+    with open(spf, "rb") as hSrc, mmap.mmap(hSrc.fileno(), 0, access=mmap.ACCESS_READ) as hMap:
+        for nStart, nEnd in genParagraphSpans(hMap, sMode):
+            sText = hMap[nStart:nEnd].decode("utf-8")
+            if sMode != "line":
+                sText = sText.rstrip("\n").replace("\n", " ")
+            yield sText, nStart
+
+
+def setByteOffsets (lErr, sText, nByteOffset):
+    "adds to errors of sText their positions in bytes in source file: nByteStart, nByteEnd (sText begins at nByteOffset)"
+    if len(sText.encode("utf-8")) == len(sText):
+        # ASCII only
+        for dErr in lErr:
+            dErr["nByteStart"] = nByteOffset + dErr["nStart"]
+            dErr["nByteEnd"] = nByteOffset + dErr["nEnd"]
+        return
+    for dErr in lErr:
+        dErr["nByteStart"] = nByteOffset + len(sText[:dErr["nStart"]].encode("utf-8"))
+        dErr["nByteEnd"] = dErr["nByteStart"] + len(sText[dErr["nStart"]:dErr["nEnd"]].encode("utf-8"))
+
+
 def output (sText, hDst=None):
     if not hDst:
         echo(sText, end="")
@@ -76,9 +151,31 @@ def main ():
     xParser.add_argument("-w", "--width", help="width in characters (40 < width < 200; default: 100)", type=int, choices=range(40,201,10), default=100)
     xParser.add_argument("-tf", "--textformatter", help="auto-format text according to typographical rules", action="store_true")
     xParser.add_argument("-tfo", "--textformatteronly", help="auto-format text and disable grammar checking (only with option 'file' or 'file_to_file')", action="store_true")
+    xParser.add_argument("-bli", "--build_lemma_index", help="build the lemma index (lemma -> flexions) from the dictionary", action="store_true")
+    xParser.add_argument("-d", "--dictionaries", help="stack of binary dictionaries (main dictionary first), default: french.bdic", nargs="+", type=str)
+    xParser.add_argument("-ov", "--overlay", help="add words of a lexicon to the dictionary (UTF-8, each line: flexion[TAB]stem[TAB]tag, or flexion only)", type=str)
+    xParser.add_argument("-mo", "--merge_overlay", help="write a new binary dictionary (*.bdic) with the dictionary and the overlay merged, then quit", type=str)
+    xParser.add_argument("-p", "--paragraphs", help="file processing: how to get paragraphs from lines (line: each line is a paragraph [default]; blank: hard-wrapped lines reassembled, paragraphs separated by blank lines; indent: same, and indented lines begin paragraphs); with blank or indent, errors get line and column in file", type=str, choices=["line", "blank", "indent"], default="line")
+    xParser.add_argument("-mm", "--mmap", help="file processing: memory-map the file and decode paragraphs one by one (for files larger than memory; UTF-8 and LF line endings required), errors get positions in bytes in file", action="store_true")
+    xParser.add_argument("-ec", "--export_conj", help="write all forms of all verbs in a file (*.csv or *.jsonl: infinitive, tense, person, form), then quit", type=str)
+    xParser.add_argument("-bt", "--build_tables", help="build the packed tables (verbs, masculine forms, plurals, similar words) from the generated data, then quit", action="store_true")
     xArgs = xParser.parse_args()
 
-    gce.load()
+    if xArgs.build_tables:
+        gce.buildTables()
+        return
+    if xArgs.export_conj:
+        import grammalecte.fr.conj as conj
+        echo("{} forms written in {}".format(conj.exportAllForms(xArgs.export_conj), xArgs.export_conj))
+        return
+    gce.load(xArgs.dictionaries)
+    if xArgs.build_lemma_index:
+        gce.buildLemmaIndex()
+    if xArgs.overlay:
+        gce.loadOverlay(xArgs.overlay)
+    if xArgs.merge_overlay:
+        gce.getDictionary().mergeOverlay(xArgs.merge_overlay)
+        return
     gce.setOptions({"html": True})
     echo("Grammalecte v{}".format(gce.version))
     oDict = gce.getDictionary()
@@ -94,13 +191,19 @@ def main ():
         bComma = False
         if xArgs.json:
             output('{ "grammalecte": "'+gce.version+'", "lang": "'+gce.lang+'", "data" : [\n', hDst)
-        for i, sText in enumerate(readfile(sFile), 1):
+        if xArgs.mmap:
+            genParagraphs = ( (sText, 0, None, nByteOffset)  for sText, nByteOffset in readfileWithMmap(sFile, xArgs.paragraphs) )
+        else:
+            genParagraphs = ( (sText, iFirstLine, lLineOffset, None)  for sText, iFirstLine, lLineOffset in readfileAsParagraphs(sFile, xArgs.paragraphs) )
+        for i, (sText, iFirstLine, lLineOffset, nByteOffset) in enumerate(genParagraphs, 1):
             if xArgs.textformatter or xArgs.textformatteronly:
                 sText = oTF.formatText(sText)
+                lLineOffset = None  # positions changed: no line and column
+                nByteOffset = None
             if xArgs.textformatteronly:
-                output(sText, hDst)
+                output(sText  if xArgs.paragraphs == "line"  else sText + "\n\n", hDst)
             else:
-                sText = generateText(i, sText, oTokenizer, oDict, xArgs.json, nWidth=xArgs.width)
+                sText = generateText(i, sText, oTokenizer, oDict, xArgs.json, nWidth=xArgs.width, iFirstLine=iFirstLine, lLineOffset=lLineOffset, nByteOffset=nByteOffset)
                 if sText:
                     if xArgs.json and bComma:
                         output(",\n", hDst)
@@ -120,8 +223,8 @@ def main ():
                 for sWord in sText[1:].strip().split():
                     if sWord:
                         echo("* {}".format(sWord))
-                        for sMorph in oDict.getMorph(sWord):
-                            echo("  {:<32} {}".format(sMorph, oLexGraphe.formatTags(sMorph)))
+                        for sStem, iTag in oDict.getMorphIds(sWord):
+                            echo("  {:<32} {}".format(">" + sStem + " " + oDict.lTag[iTag], oLexGraphe.formatTagId(sStem, iTag)))
             elif sText.startswith("/+"):
                 gce.setOptions({ opt:True  for opt in sText[2:].strip().split()  if opt in gce.getOptions() })
             elif sText.startswith("/-"):
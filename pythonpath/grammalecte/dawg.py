@@ -7,12 +7,21 @@
 #
 # This tool encodes lexicon into an indexable binary dictionary 
 # Input files MUST be encoded in UTF-8.
+# Lexicons sorted by flexion (code points order: Python sort, or `LC_ALL=C sort`) are built
+# without sorting the whole list of words in memory.
 
 
 import sys
 import os
+import time
 import collections
 
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
 from . import str_transform as st
 from .progressbar import ProgressBar
 
@@ -27,6 +36,7 @@ class DAWG:
 
     def __init__ (self, spfSrc, sLangName, cStemming):
         print("===== Direct Acyclic Word Graph - Minimal Acyclic Finite State Automaton =====")
+        fStartTime = time.time()
         cStemming = cStemming.upper()
         if cStemming == "A":
             funcStemmingGen = st.defineAffixCode
@@ -38,56 +48,55 @@ class DAWG:
             print("# Error code: {}".format(cStemming))
             exit()
 
-        lEntry = []
         lChar = ['']; dChar = {}; nChar = 1; dCharOccur = {}
         lAff  = [];   dAff  = {}; nAff  = 0; dAffOccur = {}
         lTag  = [];   dTag  = {}; nTag  = 0; dTagOccur = {}
         nErr = 0
+        nEntry = 0
+        bSorted = True
+        sPrevFlex = ""
         
-        # read lexicon
-        with open(spfSrc, 'r', encoding='utf-8') as hSrc:
-            print(" > Reading lexicon: " + spfSrc + " ...")
-            for line in hSrc:
-                line = line.strip()
-                if not (line.startswith('#') or line == ''):
-                    try:
-                        flex, stem, tag = line.split("\t")
-                    except:
-                        nErr += 1
-                        continue
-                    # chars
-                    for c in flex:
-                        if c not in dChar:
-                            dChar[c] = nChar
-                            lChar.append(c)
-                            nChar += 1
-                        dCharOccur[c] = dCharOccur.get(c, 0) + 1
-                    # affixes to find stem from flexion
-                    aff = funcStemmingGen(flex, stem)
-                    if aff not in dAff:
-                        dAff[aff] = nAff
-                        lAff.append(aff)
-                        nAff += 1
-                    dAffOccur[aff] = dCharOccur.get(aff, 0) + 1
-                    # tags
-                    if tag not in dTag:
-                        dTag[tag] = nTag
-                        lTag.append(tag)
-                        nTag += 1
-                    dTagOccur[tag] = dTagOccur.get(tag, 0) + 1
-                    lEntry.append((flex, dAff[aff], dTag[tag]))
-            hSrc.close()
+        # read lexicon (first pass): values, occurrences, and are entries already sorted?
+        # Only these tables are kept in memory, entries are read again while building.
+        print(" > Reading lexicon: " + spfSrc + " ...")
+        for tEntry in readLexicon(spfSrc):
+            if not tEntry:
+                nErr += 1
+                continue
+            flex, stem, tag = tEntry
+            # chars
+            for c in flex:
+                if c not in dChar:
+                    dChar[c] = nChar
+                    lChar.append(c)
+                    nChar += 1
+                dCharOccur[c] = dCharOccur.get(c, 0) + 1
+            # affixes to find stem from flexion
+            aff = funcStemmingGen(flex, stem)
+            if aff not in dAff:
+                dAff[aff] = nAff
+                lAff.append(aff)
+                nAff += 1
+            dAffOccur[aff] = dCharOccur.get(aff, 0) + 1
+            # tags
+            if tag not in dTag:
+                dTag[tag] = nTag
+                lTag.append(tag)
+                nTag += 1
+            dTagOccur[tag] = dTagOccur.get(tag, 0) + 1
+            nEntry += 1
+            if bSorted:
+                # lexicon sorted by flexion (code points order, as Python or `LC_ALL=C sort`)?
+                if flex < sPrevFlex:
+                    bSorted = False
+                sPrevFlex = flex
         if nErr:
             print(" # Lines ignored: {:>10}".format(nErr))
-        if not(lEntry):
+        if not nEntry:
             print(" # Empty lexicon")
             exit()
         
-        # Preparing DAWG
-        print(" > Preparing list of words")
         lVal = lChar + lAff + lTag
-        lWord = [ [dChar[c] for c in sFlex] + [iAff+nChar] + [iTag+nChar+nAff]  for sFlex, iAff, iTag in lEntry ]
-        lEntry = None
         
         # Dictionary of arc values occurrency, to sort arcs of each node
         dValOccur = dict( [ (dChar[c], dCharOccur[c])  for c in dChar ] \
@@ -100,17 +109,17 @@ class DAWG:
         
         self.sFile = spfSrc
         self.sLang = sLangName
-        self.nEntry = len(lWord)
+        self.nEntry = nEntry
         self.previousWord = []
         DawgNode.resetNextId()
         self.root = DawgNode()
         self.uncheckedNodes = []  # list of nodes that have not been checked for duplication.
-        self.minimizedNodes = {}  # list of unique nodes that have been checked for duplication.
+        self.minimizedNodes = {}  # unique nodes that have been checked for duplication (key: node signature).
         self.sortedNodes = []     # version 2 and 3
         self.nNode = 0
         self.nArc = 0
         self.dChar = dChar
-        self.nChar = len(dChar)
+        self.nChar = nChar
         self.nAff = nAff
         self.lArcVal = lVal
         self.nArcVal = len(lVal)
@@ -123,11 +132,19 @@ class DAWG:
         else:
             self.funcStemming = st.noStemming
         
-        # build
-        lWord.sort()
-        oProgBar = ProgressBar(0, len(lWord))
-        for word in lWord:
-            self.insert(word)
+        # build (second pass)
+        # A word is encoded as a string of arc values: such strings are compact and sorted as lists of arc values.
+        genWords = ( "".join( chr(dChar[c])  for c in flex ) + chr(dAff[funcStemmingGen(flex, stem)]+nChar) + chr(dTag[tag]+nChar+nAff) \
+                     for flex, stem, tag in filter(None, readLexicon(spfSrc)) )
+        if bSorted:
+            print(" > Building graph from sorted lexicon")
+            genWords = _genWordsInGraphOrder(genWords, lChar)
+        else:
+            print(" > Preparing list of words")
+            genWords = sorted(genWords)
+        oProgBar = ProgressBar(0, nEntry)
+        for sWord in genWords:
+            self.insert([ ord(c)  for c in sWord ])
             oProgBar.increment(1)
         oProgBar.done()
         self.finish()
@@ -135,6 +152,7 @@ class DAWG:
         self.countArcs()
         self.sortNodes()
         self.sortNodeArcs(dValOccur)
+        self.fBuildTime = time.time() - fStartTime
         self.displayInfo()
 
     # BUILD DAWG
@@ -144,8 +162,8 @@ class DAWG:
         
         # find common prefix between word and previous word
         commonPrefix = 0
-        for i in range(min(len(word), len(self.previousWord))):
-            if word[i] != self.previousWord[i]:
+        for c1, c2 in zip(word, self.previousWord):
+            if c1 != c2:
                 break
             commonPrefix += 1
 
@@ -159,14 +177,14 @@ class DAWG:
         else:
             oNode = self.uncheckedNodes[-1][2]
 
-        iChar = commonPrefix
-        for c in word[commonPrefix:]:
+        iFlexEnd = len(word) - 2    # the node after the last char of the flexion is final
+        for iChar in range(commonPrefix, len(word)):
+            c = word[iChar]
             oNextNode = DawgNode()
             oNode.arcs[c] = oNextNode
             self.uncheckedNodes.append((oNode, c, oNextNode))
-            if iChar == (len(word) - 2): 
+            if iChar == iFlexEnd:
                 oNode.final = True
-            iChar += 1
             oNode = oNextNode
         oNode.final = True
         self.previousWord = word
@@ -179,12 +197,14 @@ class DAWG:
         # proceed from the leaf up to a certain point
         for i in range( len(self.uncheckedNodes)-1, downTo-1, -1 ):
             (parent, char, child) = self.uncheckedNodes[i]
-            if child in self.minimizedNodes:
+            # nodes are equivalent if they have identical signatures
+            sig = child.getSignature()
+            if sig in self.minimizedNodes:
                 # replace the child with the previously encountered one
-                parent.arcs[char] = self.minimizedNodes[child]
+                parent.arcs[char] = self.minimizedNodes[sig]
             else:
                 # add the state to the minimized nodes.
-                self.minimizedNodes[child] = child
+                self.minimizedNodes[sig] = child
             self.uncheckedNodes.pop()
 
     def countNodes (self):
@@ -192,13 +212,13 @@ class DAWG:
 
     def countArcs (self):
         self.nArc = 0
-        for node in self.minimizedNodes:
+        for node in self.minimizedNodes.values():
             self.nArc += len(node.arcs)
     
     def sortNodeArcs (self, dValOccur):
         print(" > Sort node arcs")
         self.root.sortArcs(dValOccur)
-        for oNode in self.minimizedNodes:
+        for oNode in self.minimizedNodes.values():
             oNode.sortArcs(dValOccur)
     
     def sortNodes (self):
@@ -250,10 +270,15 @@ class DAWG:
         print(" * {:<12} {:>16,}".format("Nodes:", self.nNode))
         print(" * {:<12} {:>16,}".format("Arcs:", self.nArc))
         print(" * {:<12} {:>16}".format("Stemming:", self.cStemming + "FX"))
+        print(" * {:<12} {:>14.1f} s".format("Build time:", self.fBuildTime))
+        if resource:
+            # ru_maxrss is in kilobytes on Linux, in bytes on macOS
+            nPeakRSS = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 * 1024  if sys.platform == "darwin"  else 1024)
+            print(" * {:<12} {:>13,} MB".format("Peak RSS:", nPeakRSS))
 
     def getArcStats (self):
         d = {}
-        for oNode in self.minimizedNodes:
+        for oNode in self.minimizedNodes.values():
             n = len(oNode.arcs)
             d[n] = d.get(n, 0) + 1
         s = " * Nodes:\n"
@@ -306,7 +331,7 @@ class DAWG:
     def _calcNodesAddress1 (self):
         nBytesNode = self.nBytesArc + self.nBytesNodeAddress
         iAddr = len(self.root.arcs) * nBytesNode
-        for oNode in self.minimizedNodes:
+        for oNode in self.minimizedNodes.values():
             oNode.addr = iAddr
             iAddr += max(len(oNode.arcs), 1) * nBytesNode
 
@@ -394,7 +419,7 @@ class DAWG:
             # DAWG: nodes / arcs
             if nMethod == 1:
                 hDst.write(self.root.convToBytes1(self.nBytesArc, self.nBytesNodeAddress))
-                for oNode in self.minimizedNodes:
+                for oNode in self.minimizedNodes.values():
                     hDst.write(oNode.convToBytes1(self.nBytesArc, self.nBytesNodeAddress))
             elif nMethod == 2:
                 hDst.write(self.root.convToBytes2(self.nBytesArc, self.nBytesNodeAddress))
@@ -413,7 +438,7 @@ class DAWG:
             if nMethod == 1:
                 hDst.write(self.root.getTxtRepr1(self.nBytesArc, self.nBytesNodeAddress, self.lArcVal)+"\n")
                 #hDst.write( ''.join( [ "%02X " %  z  for z in self.root.convToBytes1(self.nBytesArc, self.nBytesNodeAddress) ] ).strip() )
-                for oNode in self.minimizedNodes:
+                for oNode in self.minimizedNodes.values():
                     hDst.write(oNode.getTxtRepr1(self.nBytesArc, self.nBytesNodeAddress, self.lArcVal)+"\n")
             if nMethod == 2:
                 hDst.write(self.root.getTxtRepr2(self.nBytesArc, self.nBytesNodeAddress, self.lArcVal)+"\n")
@@ -439,10 +464,82 @@ class DAWG:
             hDst.close()
 
 
+def _genWordsInGraphOrder (genWords, lChar):
+    """generator: returns words (strings of arc values) of a lexicon sorted by flexion (code points order), sorted as lists of arc values
+       Chars ids are in order of first appearance, not in code points order, and stemming codes and tags are after chars:
+       the words with the same first chars (a branch of the graph) are given as soon as no unread branch can be before them,
+       otherwise they are kept, and sorted when the branch ends."""
+    # min id of the chars after each char (code points order): ids of the branches that may still come after it
+    lMinIdAfter = [0] * len(lChar)
+    nMinId = len(lChar)
+    for c, iChar in sorted(( (c, i)  for i, c in enumerate(lChar)  if i ), reverse=True):
+        lMinIdAfter[iChar] = nMinId
+        nMinId = min(nMinId, iChar)
+    lStack = [("", {}, [])]     # branches whose words are given when read: (prefix, ended branches kept {id: words}, words of the prefix)
+    sKeptPrefix = None          # branch whose words are kept
+    lKept = []
+    for sWord in genWords:
+        sFlex = sWord[:-2]
+        if sKeptPrefix is not None:
+            if sFlex.startswith(sKeptPrefix):
+                lKept.append(sWord)
+                continue
+            lStack[-1][1][ord(sKeptPrefix[-1])] = sorted(lKept)
+            sKeptPrefix = None
+            lKept = []
+        while not sFlex.startswith(lStack[-1][0]):
+            yield from _genEndedBranch(*lStack.pop())
+        while sKeptPrefix is None:
+            sPrefix, dPending, lOwn = lStack[-1]
+            if sFlex == sPrefix:
+                lOwn.append(sWord)
+                break
+            iChar = ord(sFlex[len(sPrefix)])
+            nMax = min(iChar, lMinIdAfter[iChar])
+            for iPending in sorted(dPending):
+                if iPending > nMax:
+                    break
+                yield from dPending.pop(iPending)
+            if iChar < lMinIdAfter[iChar]:
+                # no unread branch before this one, and the kept ones before it are given: its words are given when read
+                lStack.append((sFlex[:len(sPrefix)+1], {}, []))
+            else:
+                sKeptPrefix = sFlex[:len(sPrefix)+1]
+                lKept.append(sWord)
+    if sKeptPrefix is not None:
+        lStack[-1][1][ord(sKeptPrefix[-1])] = sorted(lKept)
+    while lStack:
+        yield from _genEndedBranch(*lStack.pop())
+
+
+def _genEndedBranch (sPrefix, dPending, lOwn):
+    "generator: returns the words of a branch not given yet: its kept branches, then its own words (stemming codes and tags are after chars)"
+    for iPending in sorted(dPending):
+        yield from dPending[iPending]
+    yield from sorted(lOwn)
+
+
+def readLexicon (spfSrc):
+    "generator: returns entries of the lexicon as tuples (flexion, stem, tag), None for each malformed line"
+    with open(spfSrc, 'r', encoding='utf-8') as hSrc:
+        for line in hSrc:
+            line = line.strip()
+            if not (line.startswith('#') or line == ''):
+                try:
+                    flex, stem, tag = line.split("\t")
+                except:
+                    yield None
+                    continue
+                yield (flex, stem, tag)
+
+
 
 class DawgNode:
     NextId = 0
     NextPos = 1 # (version 2)
+
+    # no __dict__ per node: there are millions of nodes created while building
+    __slots__ = ("i", "final", "arcs", "addr", "pos", "size", "sig")
     
     def __init__ (self):
         self.i = DawgNode.NextId
@@ -452,6 +549,7 @@ class DawgNode:
         self.addr = 0           # address in the binary dictionary
         self.pos = 0            # position in the binary dictionary (version 2)
         self.size = 0           # size of node in bytes (version 3)
+        self.sig = None         # signature, computed once when the node is checked for minimization
 
     @classmethod
     def resetNextId (cls):
@@ -462,25 +560,20 @@ class DawgNode:
         DawgNode.NextPos += 1
 
     def __str__ (self):
-        # Caution! this function is used for hashing and comparison!
-        l = []
-        if self.final: 
-            l.append("1")
-        else:
-            l.append("0")
-        for (key, node) in self.arcs.items():
-            l.append(str(key))
-            l.append(str(node.i))
-        return "_".join(l)
-
-    def __hash__ (self):
-        # Used as a key in a python dictionary.
-        return self.__str__().__hash__()
-
-    def __eq__ (self, other):
-        # Used as a key in a python dictionary.
-        # Nodes are equivalent if they have identical arcs, and each identical arc leads to identical states.
-        return self.__str__() == other.__str__()
+        # for debugging
+        return "_".join( str(e)  for e in self.getSignature() )
+
+    def getSignature (self):
+        """returns a flat tuple identifying the node: final state, then for each arc, its value and the id of the next node
+           Nodes are equivalent if they have identical arcs, and each identical arc leads to identical states.
+           Caution! The signature is cached: arcs must not change anymore (all next nodes are already minimized)."""
+        if self.sig is None:
+            l = [self.final]
+            for key, node in self.arcs.items():
+                l.append(key)
+                l.append(node.i)
+            self.sig = tuple(l)
+        return self.sig
 
     def sortArcs (self, dValOccur):
         self.arcs = collections.OrderedDict(sorted(self.arcs.items(), key=lambda t: dValOccur[t[0]], reverse=True))
@@ -0,0 +1,197 @@
+#!python3
+# -*- coding: UTF-8 -*-
+
+# DICTIONARY STACK
+#
+# Ordered list of binary dictionaries (main, regional variant, user, domain…) seen as one dictionary.
+# Binary dictionaries are loaded once per process and shared by all stacks.
+
+import itertools
+from array import array
+
+from .ibdawg import IBDAWG
+from . import str_transform as st
+
+
+_dDictionaries = {}     # loaded binary dictionaries: name -> IBDAWG
+
+# interned suffix codes (to get stems from words) and tags of morphologies (“>stem tag”), shared by all morphologies caches
+# suffix code 0: the morphology is not “>stem tag”, it is stored as a tag
+_lSfx = [None]
+_dSfxId = {}
+_lTag = []
+_dTagId = {}
+
+
+def getDictionary (sDicName):
+    "returns the binary dictionary sDicName (loaded only once)"
+    if sDicName not in _dDictionaries:
+        _dDictionaries[sDicName] = IBDAWG(sDicName)
+    return _dDictionaries[sDicName]
+
+
+class DictionaryStack:
+    """STACK OF BINARY DICTIONARIES: lookups and morphologies merged, the first dictionary is the main one"""
+
+    def __init__ (self, lDicName):
+        if not lDicName:
+            raise ValueError("# Error. Empty dictionary stack.")
+        self.lDicName = list(lDicName)
+        self.lDict = [ getDictionary(sDicName)  for sDicName in self.lDicName ]
+        self.oMain = self.lDict[0]
+        self.sName = " + ".join(self.lDicName)
+        self.sLang = self.oMain.sLang
+        self.dAnalyses = {}                 # morphologies of words being parsed (strings)
+        self.oMorphCache = MorphCache()     # morphologies of all words already parsed (compact)
+        # tags of all dictionaries: tag id -> tag, and for each dictionary, its tag ids -> tag ids of the stack
+        self.lTag = []
+        self.dTagId = {}
+        self._lTagIdMap = [ []  for oDict in self.lDict ]
+        if len(self.lDict) == 1:
+            # nothing to merge: no indirection
+            # (not for morph and stem, which the overlay may replace)
+            self.isValidToken = self.oMain.isValidToken
+            self.isValid = self.oMain.isValid
+            self.lookup = self.oMain.lookup
+            self.getMorph = self.oMain.getMorph
+            self.getMorphIds = self.oMain.getMorphIds
+            self.lTag = self.oMain.lTag
+            self.dTagId = self.oMain.dTagId
+
+    def __len__ (self):
+        return len(self.lDict)
+
+    def getInfo (self):
+        return "\n".join( oDict.getInfo()  for oDict in self.lDict )
+
+    def isValidToken (self, sToken):
+        "checks if sToken is valid (if there is hyphens in sToken, sToken is split, each part is checked)"
+        if self.isValid(sToken):
+            return True
+        if "-" in sToken:
+            if sToken.count("-") > 4:
+                return True
+            return all(self.isValid(sWord)  for sWord in sToken.split("-"))
+        return False
+
+    def isValid (self, sWord):
+        "checks if sWord is valid in one of the dictionaries (different casing tested if the first letter is a capital)"
+        return any(oDict.isValid(sWord)  for oDict in self.lDict)
+
+    def lookup (self, sWord):
+        "returns True if sWord in one of the dictionaries (strict verification)"
+        return any(oDict.lookup(sWord)  for oDict in self.lDict)
+
+    def getMorph (self, sWord):
+        "retrieves morphologies list from all dictionaries, different casing allowed"
+        return self._merge( oDict.getMorph(sWord)  for oDict in self.lDict )
+
+    def getMorphIds (self, sWord):
+        "retrieves morphologies list as pairs (stem, tag id) from all dictionaries, different casing allowed (tag id: index in lTag)"
+        lResult = []
+        for iDict, oDict in enumerate(self.lDict):
+            lTagIdMap = self._lTagIdMap[iDict]
+            for sStem, iTag in oDict.getMorphIds(sWord):
+                if iTag >= len(lTagIdMap):
+                    self._updateTagIdMap(iDict)
+                tMorph = (sStem, lTagIdMap[iTag])
+                if tMorph not in lResult:
+                    lResult.append(tMorph)
+        return lResult
+
+    def _updateTagIdMap (self, iDict):
+        "maps new tags of dictionary iDict (graph or overlay) to tag ids of the stack"
+        lTagIdMap = self._lTagIdMap[iDict]
+        for sTag in self.lDict[iDict].lTag[len(lTagIdMap):]:
+            if sTag not in self.dTagId:
+                self.dTagId[sTag] = len(self.lTag)
+                self.lTag.append(sTag)
+            lTagIdMap.append(self.dTagId[sTag])
+
+    def morph (self, sWord):
+        "retrieves morphologies list from all dictionaries"
+        return self._merge( oDict.morph(sWord)  for oDict in self.lDict )
+
+    def stem (self, sWord):
+        "returns stems list of sWord from all dictionaries"
+        return self._merge( oDict.stem(sWord)  for oDict in self.lDict )
+
+    def _merge (self, genLists):
+        "concatenates lists, without duplicates, order kept"
+        lResult = []
+        for l in genLists:
+            lResult.extend( s  for s in l  if s not in lResult )
+        return lResult
+
+    def complete (self, sPrefix, nLimit=10, bAlpha=False):
+        "returns a list of at most nLimit words beginning with sPrefix, from all dictionaries"
+        lWord = self._merge( oDict.complete(sPrefix, nLimit, bAlpha)  for oDict in self.lDict )
+        if bAlpha:
+            lWord.sort()
+        return lWord[:nLimit]
+
+    def getTags (self):
+        "returns the list of tags of all dictionaries (without duplicates)"
+        return list(dict.fromkeys(itertools.chain.from_iterable( oDict.getTags()  for oDict in self.lDict )))
+
+    def genEntries (self):
+        "generator: returns all entries of all dictionaries as tuples (flexion, stem, tag)"
+        return itertools.chain.from_iterable( oDict.genEntries()  for oDict in self.lDict )
+
+    def loadOverlay (self, spfSrc):
+        "adds entries of a lexicon to the last dictionary of the stack (shared by all stacks using it)"
+        self.lDict[-1].loadOverlay(spfSrc)
+
+    def mergeOverlay (self, spfDest):
+        "writes a new binary dictionary with the last dictionary of the stack and its overlay merged"
+        self.lDict[-1].mergeOverlay(spfDest)
+
+
+def _internMorph (sWord, sMorph):
+    "returns (suffix code id, tag id) of sMorph, morphology of sWord"
+    i = sMorph.find(" ")
+    if sMorph.startswith(">") and i > 0:
+        # the stem is stored as a code to get it from sWord
+        sSfx = st.defineSuffixCode(sWord, sMorph[1:i])
+        sTag = sMorph[i+1:]
+        if sSfx not in _dSfxId:
+            _dSfxId[sSfx] = len(_lSfx)
+            _lSfx.append(sSfx)
+        iSfx = _dSfxId[sSfx]
+    else:
+        sTag = sMorph
+        iSfx = 0
+    if sTag not in _dTagId:
+        _dTagId[sTag] = len(_lTag)
+        _lTag.append(sTag)
+    return iSfx, _dTagId[sTag]
+
+
+class MorphCache (dict):
+    """MORPHOLOGIES CACHE: word -> list of morphologies
+       morphologies are stored as pairs (suffix code id, tag id) of 32-bit integers and rendered as strings when read"""
+
+    def __setitem__ (self, sWord, lMorph):
+        aId = array("I")
+        for sMorph in lMorph:
+            aId.extend(_internMorph(sWord, sMorph))
+        dict.__setitem__(self, sWord, aId.tobytes())
+
+    def __getitem__ (self, sWord):
+        return self._render(sWord, dict.__getitem__(self, sWord))
+
+    def get (self, sWord, default=None):
+        byMorph = dict.get(self, sWord, None)
+        if byMorph is None:
+            return default
+        return self._render(sWord, byMorph)
+
+    def items (self):
+        return [ (sWord, self._render(sWord, byMorph))  for sWord, byMorph in dict.items(self) ]
+
+    def values (self):
+        return [ self._render(sWord, byMorph)  for sWord, byMorph in dict.items(self) ]
+
+    def _render (self, sWord, byMorph):
+        aId = memoryview(byMorph).cast("I")
+        return [ ">" + st.getStemFromSuffixCode(sWord, _lSfx[aId[i]]) + " " + _lTag[aId[i+1]]  if aId[i]  else _lTag[aId[i+1]]  for i in range(0, len(aId), 2) ]
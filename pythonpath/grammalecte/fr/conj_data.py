@@ -0,0 +1,6 @@
+# -*- encoding: UTF-8 -*-
+# Grammalecte - Conjugueur (generated data, packed in tables by gc_engine.buildTables)
+# License: GPL 3
+
+# dictionary of verbs : (index of Vtyp, index of Tags)
+_dVerb = {'redéclarer': (22, 0), 'fossoyer': (1, 6), 'combiner': (0, 0), 'construire': (5, 52), 'rebiquer': (9, 5), 'honorer': (0, 0), 'souquer': (7, 0), 'kidnapper': (1, 0), 'dégourer': (1, 1), 'matriculer': (1, 0), 'co-extruder': (41, 0), 'déforester': (7, 0), 'cannibaliser': (0, 0), 'fermenter': (9, 5), 'légaliser': (1, 0), 'charrier': (7, 0), 'parsemer': (1, 75), 'dénoyer': (1, 6), 'poinçonner': (1, 0), 'calibrer': (1, 0), 'goder': (9, 5), 'chamarrer': (1, 0), 'déverdir': (16, 32), 'oxygéner': (0, 35), 'caponner': (9, 5), 'dépecer': (1, 76), 'dorer': (0, 0), 'russifier': (1, 0), 'sous-estimer': (1, 0), 'recontacter': (1, 0), 'étripailler': (7, 0), 'guerroyer': (7, 6), 'enticher': (20, 0), 'désynchroniser': (1, 0), 'madériser': (0, 0), 'courailler': (9, 5), 'entrelacer': (0, 31), 'attrister': (0, 0), 'tonifier': (1, 0), 'pasteller': (7, 0), 'aimer': (21, 0), 'multiplier': (6, 0), 'exemplifier': (1, 0), 'tuiler': (1, 0), 'chienner': (9, 5), 'tancer': (1, 31), 'découpler': (1, 0), 'négocier': (6, 0), 'renseigner': (0, 0), 'sommeiller': (9, 5), 'crépiter': (9, 5), 'interfolier': (1, 0), 'motiver': (1, 0), 'extruder': (1, 0), 'professer': (7, 0), 'débouquer': (9, 5), 'affaiter': (1, 0), 'cofonder': (1, 0), 'repêcher': (1, 0), 'aduler': (0, 0), 'gaffer': (7, 0), 'triquer': (1, 0), 'ressasser': (1, 0), 'héliporter': (1, 0), 'raturer': (1, 0), 'palabrer': (9, 5), 'rétablir': (34, 2), 'dérougir': (16, 2), 'remanger': (1, 7), 'siphonner': (1, 0), 'fienter': (9, 5), 'émotionner': (0, 0), 'ameublir': (4, 2), 'désamorcer': (0, 31), 'finaliser': (1, 0), 'connecter': (1, 0), 'revernir': (4, 2), 'bléser': (9, 58), 'épierrer': (1, 0), 'treuiller': (1, 0), 'tiédir': (24, 2), 'engainer': (1, 0), 'dégrossir': (2, 2), 'bunkériser': (21, 0), 'rebrancher': (6, 0), 'pageoter': (20, 0), 'violer': (1, 0), 'repercer': (1, 31), 'abêtifier': (1, 1), 'desceller': (0, 0), 'récliner': (9, 5), 'faufiler': (6, 0), 'procrastiner': (7, 0), 'resplendir': (37, 32), 'instiguer': (1, 0), 'chambarder': (1, 0), 'détaxer': (1, 0), 'bonifier': (0, 0), 'dissimiler': (1, 0), 'rejuger': (1, 7), 'spécifier': (1, 0), 'encuver': (1, 0), 'spiritualiser': (1, 0), 'dansoter': (9, 5), 'fissurer': (0, 0), 'réincorporer': (1, 0), 'dénuer': (20, 0), 'baguenauder': (32, 0), 'tiser': (1, 0), 'téléphoner': (46, 0), 'recercler': (1, 0), 'petit-déjeuner': (9, 5), 'brailler': (6, 0), 'débrocher': (1, 0), 'cinématographier': (1, 0), 'étirer': (0, 0), 'congratuler': (0, 0), 'bousculer': (0, 0), 'parfumer': (0, 0), 'correspondre': (67, 85), 'doler': (1, 0), 'activer': (6, 0), 'craquer': (7, 0), 'glouglouter': (9, 5), 'chainer': (1, 0), 'farder': (6, 0), 'criquer': (0, 0), 'recommencer': (7, 31), 'essoucher': (1, 0), 'emmener': (1, 39), 'glandouiller': (9, 5), 'courbaturer': (1, 0), 'localiser': (0, 0), 'béer': (9, 5), 'saturer': (7, 0), 'sous-exploiter': (1, 0), 'kaoter': (1, 0), 'arborer': (1, 0), 'chausser': (6, 0), 'toupiller': (7, 0), 'amorcer': (6, 31), 'priser': (7, 0), 'jaillir': (16, 2), 'déballer': (7, 0), 'réifier': (1, 0), 'reblanchir': (4, 2), 'fourbir': (4, 2), 'nigérianiser': (1, 0), 'judaïser': (7, 0), 'acheminer': (0, 0), 'réémettre': (26, 29), 'dédoublonner': (1, 0), 'replier': (0, 0), 'sous-traiter': (7, 0), 'inclure': (10, 139), 'molletonner': (1, 0), 'pitancher': (1, 0), 'courir': (56, 13), 'disputer': (19, 0), 'totaliser': (1, 0), 'trouer': (0, 0), 'matabicher': (1, 0), 'surtendre': (26, 1), 'rappeler': (3, 40), 'larder': (1, 0), 'remodeler': (1, 22), 'calter': (32, 0), 'aicher': (1, 0), 'provenir': (35, 10), 'abcéder': (6, 4), 'déphaser': (1, 0), 'américaniser': (0, 0), 'demeurer': (9, 5), 'clouter': (1, 0), 'régler': (21, 112), 'rattraper': (0, 0), 'corroborer': (1, 0), 'mouronner': (32, 0), 'forcer': (6, 31), 'ressurgir': (16, 32), 'surcreuser': (1, 0), 'réitérer': (7, 19), 'bucheronner': (9, 5), 'fourrer': (0, 0), 'mélanger': (21, 7), 'pleuviner': (54, 61), 'crosser': (1, 0), 'compter': (6, 0), 'rebecter': (1, 0), 'fourguer': (1, 0), 'programmer': (7, 0), 'criminaliser': (1, 0), 'démoduler': (1, 0), 'concerter': (6, 0), 'nuire': (72, 144), 'brader': (1, 0), 'tourber': (9, 5), 'nigauder': (9, 1), 'piloter': (1, 0), 'esbaudir': (8, 2), 'rénover': (1, 0), 'camoufler': (0, 0), 'émotter': (1, 0), 'zoner': (6, 0), 'solvater': (41, 0), 'maroquiner': (1, 0), 'fluoriser': (1, 0), 'révérer': (1, 19), 'revendiquer': (6, 0), 'textualiser': (1, 0), 'suiffer': (1, 0), 'ressuyer': (0, 6), 'époustoufler': (1, 0), 'authentiquer': (1, 0), 'repeupler': (0, 0), 'brasseyer': (1, 0), 'traire': (26, 11), 'vulcaniser': (1, 0), 'pinailler': (9, 5), 'grommeler': (7, 40), 'rebaisser': (9, 5), 'toréer': (9, 5), 'sanctifier': (1, 0), 'bourreler': (1, 40), 'municipaliser': (1, 0), 'coordonner': (1, 0), 'réassigner': (1, 0), 'dérouter': (0, 0), 'travailler': (64, 0), 'solfier': (1, 0), 'dessabler': (1, 0), 'appareiller': (6, 0), 'décharger': (6, 7), 'allégoriser': (1, 0), 'suçoter': (1, 0), 'recroiser': (1, 0), 'cosigner': (1, 0), 'ombrager': (1, 7), 'trimballer': (0, 0), 'débonder': (0, 0), 'ciseler': (1, 22), 'cachetonner': (9, 5), 'traînailler': (9, 5), 'liquider': (1, 0), 'décadrer': (1, 0), 'venter': (54, 61), 'pester': (9, 5), 'surnager': (9, 47), 'dealer': (7, 0), 'chopper': (9, 5), 'paniquer': (6, 0), 'crapaüter': (9, 5), 'désinculper': (1, 0), 'stabiliser': (0, 0), 'couler': (6, 0), 'approvisionner': (0, 0), 'braiser': (1, 0), 'énamourer': (20, 0), 'passionner': (0, 0), 'limander': (1, 0), 'réoxygéner': (40, 35), 'penser': (64, 0), 'désenclaver': (0, 0), 'adonner': (32, 0), 'rubéfier': (1, 0), 'intermédier': (21, 0), 'choyer': (1, 6), 'volatiliser': (0, 0), 'embarder': (0, 0), 'muser': (32, 0), 'troncher': (1, 0), 'chronométrer': (1, 70), 'faucher': (7, 0), 'pipeter': (41, 34), 'inhumer': (1, 0), 'désenvaser': (1, 0), 'aguerrir': (2, 2), 'salarier': (1, 0), 'user': (19, 0), 'reporter': (0, 0), 'ravoir': (26, 1), 'repositionner': (0, 0), 'déhotter': (7, 0), 'sacagner': (1, 0), 'ozoner': (33, 0), 'réimprimer': (1, 0), 'recauser': (9, 5), 'flatter': (0, 0), 'démonter': (0, 0), 'enrouer': (0, 0), 'politiquer': (9, 5), 'entrehaïr': (75, 122), 'carburer': (7, 0), 'biologiser': (1, 0), 'prélasser': (20, 0), 'fluidifier': (1, 0), 'ribler': (1, 0), 'féticher': (1, 0), 'trépaner': (1, 0), 'charger': (6, 7), 'honnir': (4, 2), 'recristalliser': (1, 0), 'sentir': (5, 87), 'mornifler': (1, 0), 'abrier': (0, 1), 'empailler': (1, 0), 'digresser': (9, 5), 'tarifer': (1, 0), 'braser': (1, 0), 'tistre': (26, 189), 'présider': (64, 0), 'sévir': (11, 32), 'assaisonner': (1, 0), 'déméthaniser': (1, 0), 'opérer': (6, 19), 'récriminer': (9, 5), 'recueillir': (31, 17), 'drapeler': (1, 40), 'décorréler': (1, 64), 'cligner': (23, 0), 'dévider': (0, 0), 'désemmancher': (1, 0), 'baréter': (9, 56), 'débucher': (7, 0), 'munitionner': (1, 0), 'baronner': (1, 0), 'tanguer': (9, 5), 'entrevouter': (1, 0), 'grouiller': (32, 0), 'excuser': (0, 0), 'facetter': (1, 0), 'galipoter': (1, 0), 'remixer': (1, 0), 'soucheter': (1, 34), 'laquer': (1, 0), 'passiver': (21, 0), 'décrisper': (0, 0), 'pimenter': (1, 0), 'containériser': (1, 0), 'débouler': (7, 0), 'voiturer': (1, 1), 'lasser': (6, 0), 'atteler': (6, 40), 'dracher': (54, 61), 'surgreffer': (1, 0), 'antidater': (1, 0), 'potiner': (9, 5), 'center': (1, 0), 'estramasser': (20, 0), 'snober': (1, 0), 'parvenir': (42, 10), 'dérésumenter': (1, 1), 'subsidier': (1, 0), 'misérer': (9, 25), 'réabsorber': (1, 0), 'claver': (1, 0), 'recenser': (1, 0), 'béquiller': (7, 0), 'absoudre': (10, 9), 'contacter': (1, 0), 'rabougrir': (13, 2), 'décontextualiser': (1, 0), 'hésiter': (9, 5), 'chevaler': (1, 0), 'ruiner': (0, 0), 'postdater': (1, 0), 'réémerger': (9, 47), 'reconstruire': (5, 52), 'planter': (0, 0), 'podcaster': (41, 0), 'dégoiser': (7, 0), 'sous-entendre': (26, 45), 'safraner': (1, 0), 'relooker': (1, 0), 'enchâsser': (0, 0), 'déplanquer': (0, 0), 'carbonater': (1, 0), 'dénigrer': (1, 0), 'émailler': (1, 0), 'déhaler': (0, 0), 'réalimenter': (0, 0), 'piétiner': (7, 0), 'obtempérer': (12, 25), 'courtiser': (1, 0), 'revaloriser': (1, 0), 'déstructurer': (0, 0), 'contrebattre': (26, 3), 'vidimer': (1, 0), 'définir': (15, 2), 'transbahuter': (1, 0), 'vallonner': (20, 0), 'mondialiser': (0, 0), 'varier': (7, 0), 'miroiter': (9, 5), 'connoter': (1, 0), 'entre-tisser': (0, 0), 'bécoter': (0, 0), 'tontiner': (1, 0), 'délabialiser': (0, 0), 'butiner': (7, 0), 'dépoudrer': (1, 0), 'démailler': (0, 0), 'rubaner': (1, 0), 'aleviner': (1, 0), 'blaser': (0, 0), 'désavantager': (1, 7), 'oscariser': (1, 0), 'angliciser': (0, 0), 'violenter': (1, 0), 'crapahuter': (9, 5), 'densifier': (1, 0), 'marcotter': (1, 0), 'rocquer': (9, 5), 'équarrier': (1, 1), 'amadouer': (1, 0), 'embarrer': (6, 0), 'obtenir': (87, 10), 'emboiter': (0, 0), 'raidir': (2, 2), 'tailler': (6, 0), 'dépaver': (1, 0), 'détracter': (1, 0), 'pratiquer': (6, 0), 'crouter': (7, 0), 'examiner': (21, 0), 'loguer': (9, 5), 'affourrager': (1, 7), 'phosphoryler': (1, 0), 'chuter': (53, 5), 'précompter': (1, 0), 'envoyer': (40, 126), 'ruser': (53, 5), 'berdeller': (7, 0), 'rifler': (1, 0), 'enchainer': (6, 0), 'patafioler': (1, 0), 'réécouter': (1, 0), 'clôturer': (7, 0), 'ennuyer': (6, 6), 'schmecter': (9, 5), 'enrésiner': (1, 0), 'orner': (0, 0), 'associer': (0, 0), 'valdinguer': (9, 5), 'ramasser': (0, 0), 'soubresauter': (9, 5), 'empapilloter': (1, 0), 'déjeuner': (9, 5), 'surcompenser': (7, 0), 'sectoriser': (1, 0), 'renfiler': (1, 0), 'quérir': (26, 1), 'mâchonner': (1, 0), 'récidiver': (9, 5), 'modérer': (0, 19), 'botteler': (1, 40), 'authentifier': (0, 0), 'secréter': (1, 16), 'parcellariser': (1, 0), 'fraiser': (1, 0), 'additionner': (0, 0), 'renfrogner': (20, 0), 'transverbérer': (1, 19), 'outrepasser': (1, 0), 'surproduire': (26, 52), 'cloisonner': (1, 0), 'adoniser': (20, 0), 'ébrécher': (0, 12), 'chômer': (7, 0), 'engrumeler': (0, 40), 'miser': (7, 0), 'subdéléguer': (1, 37), 'défausser': (0, 0), 'vernisser': (1, 0), 'machiner': (1, 0), 'exempter': (0, 0), 'amuser': (21, 0), 'emprisonner': (0, 0), 'défrayer': (1, 0), 'balancer': (6, 31), 'écumer': (7, 0), 'musser': (0, 0), 'coudoyer': (1, 6), 'éjarrer': (1, 0), 'dépontiller': (9, 5), 'manœuvrer': (7, 0), 'putter': (9, 5), 'remmailler': (1, 0), 'empiéter': (9, 56), 'criticailler': (7, 0), 'rognonner': (9, 5), 'rouer': (1, 0), 'bégayer': (7, 0), 'blackbouler': (1, 0), 'désaimanter': (1, 0), 'désister': (20, 0), 'endurer': (1, 0), 'pontiller': (1, 0), 'chimer': (1, 0), 'balkaniser': (0, 0), 'évoquer': (1, 0), 'aiguillonner': (1, 0), 'discuputer': (9, 5), 'fritter': (7, 0), 'racler': (0, 0), 'décrépir': (2, 2), 'enharnacher': (1, 0), 'carguer': (1, 0), 'trabouler': (9, 5), 'souffler': (7, 0), 'gouailler': (9, 5), 'éclabousser': (0, 0), 'enchtiber': (1, 1), 'leurrer': (0, 0), 'reficeler': (1, 40), 'parcourir': (27, 13), 'objecter': (1, 0), 'bistrer': (1, 0), 'désadapter': (0, 0), 'compenser': (21, 0), 'retarder': (7, 0), 'relativiser': (1, 0), 'ouvrer': (7, 0), 'globaliser': (1, 0), 'blaguer': (6, 0), 'palisser': (1, 0), 'déambuler': (32, 0), 'purger': (0, 7), 'ragréer': (1, 0), 'courroucer': (0, 31), 'râteler': (1, 40), 'flipper': (9, 5), 'bossuer': (1, 0), 'enfutailler': (1, 0), 'recentrer': (1, 0), 'manéger': (1, 8), 'déconner': (9, 5), 'verjuter': (1, 0), 'larmoyer': (9, 51), 'mapper': (1, 0), 'proposer': (21, 0), 'tomer': (1, 0), 'languir': (59, 2), 'zoomer': (38, 0), 'cléber': (9, 5), 'siliconer': (1, 0), 'rêvasser': (9, 5), 'dévaliser': (1, 0), 'désaliniser': (6, 0), 'désherber': (1, 0), 'carmer': (1, 0), 'circuler': (9, 5), 'ablater': (0, 0), 'ouïr': (26, 155), 'étêter': (1, 0), 'romancer': (1, 31), 'démarrer': (7, 0), 'étrésillonner': (1, 0), 'pécher': (53, 100), 'écher': (1, 12), 'emplafonner': (0, 0), 'cégotter': (1, 0), 'partager': (3, 7), 'mater': (7, 0), 'pleurnicher': (9, 5), 'rabibocher': (0, 0), 'immiscer': (20, 31), 'bureaucratiser': (0, 0), 'azimuter': (1, 0), 'contresigner': (1, 0), 'flouser': (9, 5), 'rompre': (69, 92), 'stater': (1, 0), 'empéguer': (0, 37), 'calotter': (1, 0), 'piller': (1, 0), 'cameloter': (9, 5), 'volcaniser': (1, 0), 'nationaliser': (1, 0), 'surcomprimer': (1, 0), 'prépensionner': (1, 0), 'mémoriser': (7, 0), 'poivrer': (0, 0), 'clapser': (9, 5), 'déloger': (7, 7), 'magnétiser': (1, 0), 'fracasser': (0, 0), 'pauser': (9, 5), 'déradicaliser': (21, 0), 'animer': (0, 0), 'remmailloter': (1, 0), 'arabiser': (0, 0), 'conspirer': (23, 0), 'sceller': (1, 0), 'graillonner': (9, 5), 'réserver': (0, 0), 'caguer': (9, 5), 'ozoniser': (33, 0), 'lichetrogner': (7, 1), 'crachiner': (54, 61), 'désempoisonner': (0, 0), 'férir': (26, 134), 'paralléliser': (1, 0), 'fructifier': (9, 5), 'déchaîner': (0, 0), 'baquer': (1, 0), 'empreindre': (10, 28), 'faillir': (43, 128), 'supprimer': (0, 0), 'exploiter': (7, 0), 'disculper': (0, 0), 'moisir': (16, 2), 'masquer': (6, 0), 'accouardir': (2, 1), 'roter': (9, 5), 'chamailler': (20, 0), 'désabonner': (0, 0), 'fertiliser': (1, 0), 'indurer': (1, 0), 'bistourner': (1, 0), 'défléchir': (24, 2), 'vouter': (0, 0), 'parfondre': (26, 45), 'graisser': (7, 0), 'bleffer': (9, 5), 'sédentariser': (0, 0), 'flouter': (1, 0), 'enfourner': (0, 0), 'liéger': (1, 8), 'remorquer': (1, 0), 'palanquer': (7, 0), 'toussoter': (9, 5), 'coencadrer': (41, 0), 'explanter': (1, 0), 'verdoyer': (9, 51), 'émincer': (1, 31), 'délaiter': (1, 0), 'travailloter': (9, 5), 'varapper': (9, 5), 'gerber': (7, 0), 'défibrer': (1, 0), 'dépropaniser': (1, 0), 'témoigner': (38, 0), 'défourrer': (1, 0), 'dépelotonner': (1, 0), 'entrebâiller': (0, 0), 'engouler': (1, 0), 'bancher': (1, 0), 'préétablir': (4, 2), 'dépaisseler': (1, 40), 'lisbroquer': (9, 1), 'médiatiser': (1, 0), 'diriger': (21, 7), 'codiriger': (1, 7), 'aveulir': (2, 2), 'opiner': (9, 5), 'meringuer': (1, 0), 'recroqueviller': (20, 0), 'plafonner': (7, 0), 'décréditer': (0, 0), 'enchevaucher': (1, 0), 'trainer': (6, 0), 'grogner': (7, 0), 'rythmer': (1, 0), 'inaugurer': (1, 0), 'appertiser': (1, 0), 'tayloriser': (1, 0), 'ablutionner': (0, 1), 'arcbouter': (0, 0), 'déconcerter': (1, 0), 'affoler': (0, 0), 'excentrer': (1, 0), 'achromatiser': (1, 0), 'concocter': (1, 0), 'éclore': (25, 109), 'pommader': (0, 0), 'sphacéler': (1, 64), 'attirer': (0, 0), 'téléverser': (1, 0), 'pérenniser': (1, 0), 'édicter': (1, 0), 'postfacer': (41, 31), 'calciner': (1, 0), 'renifler': (7, 0), 'essouffler': (0, 0), 'boulotter': (7, 0), 'branler': (6, 0), 'désaffectionner': (20, 0), 'snifer': (7, 0), 'crasher': (20, 0), 'empoisser': (1, 0), 'abandonner': (3, 0), 'open-sourcer': (41, 31), 'ravitailler': (0, 0), 'pétrarquiser': (9, 5), 'émoucheter': (1, 34), 'recomposer': (0, 0), 'pétrifier': (0, 0), 'équivoquer': (9, 5), 'enkyster': (20, 0), 'longer': (1, 7), 'squattériser': (1, 0), 'recreuser': (1, 0), 'balter': (1, 0), 'abraser': (0, 0), 'envaser': (0, 0), 'adire': (17, 26), 'sursauter': (9, 5), 'rembouger': (1, 7), 'abougrir': (13, 1), 'bruir': (4, 2), 'syllaber': (1, 0), 'télexer': (1, 0), 'égoutter': (6, 0), 'plagier': (7, 0), 'pailleter': (1, 34), 'hypertrophier': (0, 0), 'tester': (7, 0), 'endenter': (1, 0), 'raccoutrer': (1, 0), 'rechanger': (0, 7), 'ébattre': (17, 3), 'dessaler': (6, 0), 'flotter': (7, 0), 'emboire': (17, 59), 'paver': (1, 0), 'réorchestrer': (1, 0), 'encharner': (1, 0), 'mouver': (32, 0), 'regagner': (1, 0), 'répliquer': (6, 0), 'réinterroger': (0, 7), 'réimputer': (19, 0), 'pioncer': (9, 23), 'interférer': (9, 25), 'paralyser': (1, 0), 'nerver': (1, 0), 'improviser': (6, 0), 'repayer': (1, 0), 'obliquer': (9, 5), 'smiller': (1, 0), 'dégoudronner': (1, 0), 'désaffilier': (1, 0), 'observer': (21, 0), 'absenter': (0, 0), 'analyser': (21, 0), 'ébouillanter': (0, 0), 'livrer': (22, 0), 'méthyler': (21, 0), 'décoincer': (1, 31), 'embobeliner': (1, 0), 'potasser': (7, 0), 'redresser': (0, 0), 'terraformer': (1, 0), 'majorer': (1, 0), 'renfaiter': (1, 0), 'désensibiliser': (0, 0), 'souffrir': (69, 94), 'interpréter': (0, 16), 'fouir': (4, 2), 'scandaliser': (6, 0), 'tapir': (8, 2), 'aboucher': (0, 0), 'vomir': (11, 2), 'damner': (6, 0), 'raréfier': (0, 0), 'empiéger': (1, 8), 'posticher': (9, 5), 'grailler': (7, 0), 'parafer': (1, 0), 'remarier': (0, 0), 'banqueter': (9, 54), 'rébellionner': (20, 1), 'marivauder': (9, 5), 'gargariser': (20, 0), 'rejouer': (7, 0), 'désincruster': (1, 0), 'relationner': (41, 0), 'éteindre': (5, 28), 'émerillonner': (1, 0), 'ériger': (0, 7), 'obturer': (1, 0), 'japoniser': (0, 0), 'raouster': (1, 1), 'gouter': (23, 0), 'assiéger': (1, 8), 'circonscrire': (10, 74), 'lemmatiser': (1, 0), 'enrouiller': (32, 0), 'rebasculer': (33, 0), 'détaller': (1, 0), 'industrialiser': (0, 0), 'affluer': (9, 5), 'assombrir': (34, 2), 'prononcer': (6, 31), 'surfleurir': (4, 1), 'assener': (1, 39), 'marquer': (6, 0), 'stuquer': (1, 0), 'déréférencer': (1, 31), 'châtaigner': (32, 0), 'positiver': (7, 0), 'concentrer': (0, 0), 'renformir': (4, 2), 'cuter': (20, 1), 'herbager': (1, 7), 'clamecer': (9, 76), 'aviner': (1, 0), 'émulsifier': (1, 0), 'pleuvoir': (89, 158), 'approximer': (1, 0), 'reloger': (0, 7), 'poivroter': (20, 0), 'italianiser': (6, 0), 'déligner': (1, 0), 'ségréguer': (33, 37), 'entretisser': (0, 0), 'décuire': (26, 52), 'couper': (46, 0), 'confiner': (29, 0), 'rempoter': (1, 0), 'disséquer': (1, 67), 'acculer': (1, 0), 'repointer': (0, 0), 'orbiter': (9, 5), 'échelonner': (0, 0), 'consister': (30, 5), 'désatomiser': (1, 0), 'enclencher': (0, 0), 'fonder': (6, 0), 'traverser': (1, 0), 'punaiser': (1, 0), 'révéler': (22, 64), 'affamer': (1, 0), 'dévitrifier': (1, 0), 'impatienter': (0, 0), 'bouturer': (1, 0), 'érotiser': (1, 0), 'moduler': (7, 0), 'prévaloir': (93, 162), 'briffer': (1, 0), 'penduler': (9, 5), 'entretenir': (10, 10), 'dénombrer': (1, 0), 'farguer': (1, 1), 'abracadabrer': (0, 1), 'toiletter': (0, 0), 'corser': (0, 0), 'reformuler': (1, 0), 'fédérer': (0, 19), 'expertiser': (1, 0), 'déshydrogéner': (1, 35), 'transcrire': (56, 74), 'bosser': (7, 0), 'offrir': (50, 94), 'aliéner': (0, 35), 'pendiller': (9, 5), 'épuiser': (0, 0), 'surexploiter': (1, 0), 'massifier': (1, 0), 'préempter': (1, 0), 'mortifier': (0, 0), 'requitter': (41, 0), 'restabiliser': (0, 0), 'assourdir': (13, 2), 'délasser': (6, 0), 'concélébrer': (1, 84), 'dérocher': (7, 0), 'sataniser': (1, 0), 'cancériser': (20, 0), 'dépaqueter': (1, 34), 'retraduire': (26, 52), 'coudre': (26, 93), 'bêtiser': (9, 5), 'empresser': (20, 0), 'griveler': (7, 40), 'reconnaître': (31, 15), 'resservir': (69, 103), 'remprunter': (1, 0), 'réemployer': (1, 6), 'métalliser': (1, 0), 'redynamiser': (1, 0), 'vérifier': (0, 0), 'guinder': (0, 0), 'évangéliser': (1, 0), 'diluer': (0, 0), 'constater': (41, 0), 'lainer': (1, 0), 'biturer': (20, 0), 'dévêtir': (31, 115), 'raguer': (9, 5), 'noyauter': (1, 0), 'caboter': (9, 5), 'énumérer': (1, 19), 'dépasser': (6, 0), 'refleurir': (24, 2), 'sermonner': (1, 0), 'décommuniser': (1, 0), 'remotiver': (0, 0), 'pétitionner': (9, 5), 'botaniser': (9, 5), 'commémorer': (1, 0), 'continuer': (64, 0), 'entêter': (0, 0), 'smasher': (7, 0), 'illustrer': (0, 0), 'trafiquer': (38, 0), 'surimpressionner': (22, 0), 'patoiser': (9, 5), 'frictionner': (0, 0), 'nanifier': (1, 0), 'insister': (9, 5), 'dissiper': (0, 0), 'cramer': (7, 0), 'démaigrir': (24, 2), 'désamidonner': (1, 0), 'exacerber': (0, 0), 'syncoper': (7, 0), 'entortiller': (0, 0), 'regrimper': (7, 0), 'enduire': (69, 52), 'hoqueter': (9, 54), 'pucer': (33, 31), 'surfacturer': (1, 0), 'pifer': (1, 0), 'dégazer': (7, 0), 'router': (1, 0), 'entourer': (0, 0), 'capuchonner': (1, 0), 'atomiser': (0, 0), 'bagouler': (9, 5), 'coaguler': (6, 0), 'tracaner': (7, 0), 'clairsemer': (0, 75), 'bla-blater': (9, 5), 'triballer': (1, 0), 'macquer': (1, 0), 'convulsionner': (1, 0), 'cloper': (9, 5), 'clocher': (9, 5), 'tisser': (1, 0), 'bourder': (9, 5), 'anathématiser': (1, 0), 'fayotter': (9, 5), 'blobloter': (9, 5), 'détourer': (1, 0), 'volleyer': (9, 5), 'passer': (6, 0), 'empenner': (1, 0), 'frisonner': (9, 1), 'rapointir': (4, 2), 'craindre': (56, 28), 'houpper': (1, 0), 'reborder': (1, 0), 'resynchroniser': (1, 0), 'fissionner': (1, 0), 'prouter': (9, 5), 'ségréger': (33, 8), 'palataliser': (1, 0), 'clisser': (1, 0), 'fluctuer': (9, 5), 'décarbonater': (1, 0), 'tendre': (18, 45), 'hérissonner': (6, 0), 'mignoter': (0, 0), 'brunir': (13, 2), 'revoir': (10, 125), 'palper': (1, 0), 'ramener': (0, 39), 'parasiter': (1, 0), 'osciller': (9, 5), 'surprendre': (10, 46), 'défragmenter': (1, 0), 'enverguer': (1, 0), 'réengager': (0, 7), 'carder': (1, 0), 'flauper': (1, 0), 'liciter': (1, 0), 'pallier': (1, 0), 'taler': (1, 0), 'béquer': (1, 67), 'aviver': (1, 0), 'désénerver': (0, 0), 'guiper': (1, 0), 'topicaliser': (1, 0), 'annoncer': (3, 31), 'ironiser': (9, 5), 'opiniâtrer': (20, 0), 'épeurer': (1, 0), 'défloquer': (1, 0), 'embéguiner': (20, 0), 'enrubanner': (0, 0), 'débarrer': (1, 0), 'savourer': (1, 0), 'lacérer': (1, 19), 'tacheter': (1, 34), 'croupionner': (9, 5), 'tonsurer': (1, 0), 'tomber': (47, 0), 'désautomatiser': (41, 0), 'labourer': (0, 0), 'crémer': (9, 101), 'collaborer': (7, 0), 'crampser': (9, 5), 'ruiler': (1, 0), 'débâcler': (7, 0), 'épinceter': (1, 34), 'surmonter': (0, 0), 'réparer': (1, 0), 'ossifier': (0, 0), 'assigner': (1, 0), 'choisir': (11, 2), 'mathématiser': (1, 0), 'flâner': (9, 5), 'discompter': (1, 0), 'raboter': (1, 0), 'argumenter': (9, 5), 'customiser': (1, 0), 'fournir': (36, 2), 'unir': (48, 2), 'reverdir': (24, 2), 'chérir': (51, 2), 'roder': (1, 0), 'dynamiser': (1, 0), 'escharifier': (1, 1), 'emballotter': (1, 0), 'servir': (50, 103), 'encroûter': (0, 0), 'republier': (1, 0), 'papouiller': (1, 0), 'désenvenimer': (1, 0), 'renforcer': (0, 31), 'renouer': (0, 0), 'désenvelopper': (1, 0), 'encorder': (0, 0), 'vivre': (56, 171), 'échauder': (0, 0), 'rabâcher': (7, 0), 'gauler': (1, 0), 'pourlécher': (0, 12), 'carroyer': (1, 6), 'franciser': (1, 0), 'bémoliser': (1, 0), 'détisser': (1, 0), 'énouer': (1, 0), 'corriger': (0, 7), 'contusionner': (1, 0), 'limoger': (1, 7), 'réclamer': (6, 0), 'engoncer': (1, 31), 'sidérer': (1, 19), 'ioniser': (1, 0), 'layer': (1, 0), 'rappareiller': (1, 0), 'désinstaller': (1, 0), 'embrouiller': (0, 0), 'rétrocéder': (7, 4), 'communaliser': (1, 0), 'démouscailler': (20, 0), 'embouteiller': (1, 0), 'silhouetter': (0, 0), 'nivaquiner': (9, 5), 'désaérer': (1, 19), 'rebuter': (6, 0), 'offenser': (0, 0), 'dévirer': (7, 0), 'retraiter': (1, 0), 'vaincre': (5, 91), 'transhumer': (7, 0), 'chaparder': (7, 0), 'déspiritualiser': (0, 0), 'dessaper': (0, 0), 'enfuir': (17, 118), 'gambiller': (9, 5), 'mouetter': (9, 5), 'améliorer': (40, 0), 'latiniser': (7, 0), 'hérisser': (0, 0), 'tutorer': (33, 0), 'contenter': (0, 0), 'doser': (1, 0), 'environner': (0, 0), 'biper': (1, 0), 'amodier': (1, 0), 'enjouer': (1, 0), 'thermaliser': (1, 0), 'obstruer': (0, 0), 'apprendre': (45, 46), 'sous-rémunérer': (1, 19), 'ferrouter': (1, 0), 'dénerver': (1, 0), 'affuter': (1, 0), 'surlier': (1, 0), 'déconseiller': (1, 0), 'débroussailler': (1, 0), 'écaler': (0, 0), 'hispaniser': (0, 0), 'protester': (23, 0), 'veiller': (23, 0), 'dessaouler': (6, 0), 'juguler': (1, 0), 'grever': (1, 21), 'soumettre': (18, 29), 'persiffler': (1, 0), 'défarder': (1, 0), 'hocher': (1, 0), 'exposer': (22, 0), 'subduire': (43, 183), 'bouquiner': (7, 0), 'transmigrer': (9, 5), 'rapparier': (1, 0), 'pimer': (1, 0), 'cohabiter': (9, 5), 'hypostasier': (1, 0), 'préciser': (6, 0), 'clavetter': (1, 0), 'désertifier': (0, 0), 'déparier': (1, 0), 'désaveugler': (1, 0), 'incruster': (0, 0), 'cercler': (1, 0), 'déclasser': (1, 0), 'contrefoutre': (17, 90), 'rentamer': (1, 0), 'exhausser': (1, 0), 'capeyer': (9, 5), 'vexer': (0, 0), 'chroumer': (7, 0), 'immatriculer': (1, 0), 'auto-compenser': (40, 0), 'sponsoriser': (1, 0), 'rambiner': (9, 5), 'goujonner': (1, 0), 'glisser': (6, 0), 'grattouiller': (1, 0), 'rebobiner': (1, 0), 'ambifier': (20, 0), 'entifler': (0, 0), 'régulariser': (1, 0), 'relocaliser': (0, 0), 'équilibrer': (0, 0), 'rouloter': (1, 0), 'rechasser': (7, 0), 'caréner': (7, 35), 'versifier': (7, 0), 'coter': (7, 0), 'officier': (9, 5), 'réchauffer': (0, 0), 'improuver': (1, 0), 'marger': (7, 7), 'chicotter': (1, 0), 'dévaloriser': (0, 0), 'préposer': (1, 0), 'paraphraser': (1, 0), 'contagionner': (1, 0), 'ébiseler': (1, 40), 'récurer': (1, 0), 'emboutir': (4, 2), 'pignocher': (7, 0), 'déjuger': (20, 7), 'adjurer': (1, 0), 'déminéraliser': (1, 0), 'quémander': (7, 0), 'verdir': (24, 2), 'écurer': (1, 0), 'damasser': (1, 0), 'louvoyer': (9, 51), 'raffuter': (1, 0), 'souligner': (1, 0), 'intenter': (1, 0), 'tûteler': (1, 40), 'déventer': (1, 0), 'horrifier': (1, 0), 'twister': (9, 5), 'ressouder': (0, 0), 'prédominer': (9, 5), 'assécher': (6, 12), 'crécher': (9, 100), 'désassimiler': (1, 0), 'bienvenir': (43, 1), 'éclater': (6, 0), 'reneiger': (54, 154), 'ringardiser': (1, 0), 'démoder': (0, 0), 'ratiboiser': (1, 0), 'stupéfier': (1, 0), 'mordre': (85, 45), 'détirer': (0, 0), 'dépeindre': (31, 28), 'bitturer': (20, 0), 'énieller': (1, 0), 'acheter': (6, 20), 'inciser': (1, 0), 'torturer': (1, 0), 'écaffer': (1, 0), 'foncer': (7, 31), 'tiercer': (7, 31), 'lapider': (1, 0), 'échantillonner': (1, 0), 'analgésier': (1, 0), 'correctionnaliser': (1, 0), 'gouttiner': (54, 61), 'procéder': (53, 18), 'abuser': (19, 0), 'quetter': (1, 0), 'navrer': (1, 0), 'efforcer': (20, 31), 'plonger': (6, 7), 'dénoter': (7, 0), 'acétyler': (1, 0), 'bredouiller': (7, 0), 'robotiser': (1, 0), 'terroriser': (1, 0), 'décerner': (1, 0), 'décaisser': (1, 0), 'mutiner': (20, 0), 'repaver': (1, 0), 'ronéoter': (1, 0), 'pétuner': (9, 5), 'rebondir': (16, 2), 'déchausser': (6, 0), 'angoisser': (6, 0), 'lapiner': (9, 5), 'évaluer': (0, 0), 'flirter': (9, 5), 'traduire': (55, 52), 'saluer': (0, 0), 'photocopier': (1, 0), 'enfouir': (2, 2), 'apprécier': (0, 0), 'élargir': (13, 2), 'repeindre': (73, 28), 'ourler': (1, 0), 'figer': (6, 7), 'frisotter': (7, 0), 'rasseoir': (69, 49), 'bréler': (1, 64), 'crétiniser': (1, 0), 'oindre': (10, 28), 'ratifier': (1, 0), 'subvertir': (4, 2), 'terrer': (6, 0), 'éclaircir': (2, 2), 'recorriger': (1, 7), 'perfuser': (1, 0), 'nicotiniser': (1, 0), 'pioger': (9, 47), 'décommander': (0, 0), 'séquencer': (1, 31), 'folioter': (1, 0), 'emmailloter': (0, 0), 'délocaliser': (0, 0), 'rouler': (6, 0), 'bonder': (1, 0), 'ocrer': (1, 0), 'dramatiser': (7, 0), 'reperdre': (5, 45), 'superposer': (0, 0), 'dépendre': (45, 45), 'exiger': (64, 7), 'subventionner': (1, 0), 'détrancher': (9, 5), 'motamoter': (9, 5), 'lutiner': (1, 0), 'salifier': (1, 0), 'réincruder': (0, 0), 'tracasser': (0, 0), 'bleuir': (24, 2), 'départementaliser': (1, 0), 'encarter': (1, 0), 'effiler': (0, 0), 'noper': (1, 0), 'réguler': (0, 0), 'reforger': (1, 7), 'ravaler': (0, 0), 'soufrer': (1, 0), 'désoler': (0, 0), 'prévoir': (56, 163), 'concilier': (0, 0), 'déjanter': (1, 0), 'septupler': (7, 0), 'paillarder': (32, 0), 'rayonner': (7, 0), 'devoir': (31, 104), 'cartographier': (1, 0), 'ébrancher': (1, 0), 'grigner': (9, 5), 'rebroder': (1, 0), 'flemmarder': (9, 5), 'buller': (9, 5), 'coincer': (0, 31), 'délaver': (1, 0), 'entrouvrir': (10, 94), 'mordorer': (1, 0), 'positionner': (0, 0), 'moitir': (4, 2), 'arriver': (47, 0), 'chapitrer': (1, 0), 'djibser': (9, 5), 'héler': (0, 64), 'géométriser': (1, 0), 'encagouler': (0, 0), 'blairer': (1, 0), 'lapidifier': (0, 0), 'tatouer': (1, 0), 'tuberculiner': (1, 0), 'ténoriser': (9, 5), 'savonner': (0, 0), 'zigonner': (9, 5), 'contrepasser': (1, 0), 'réinjecter': (1, 0), 'léguer': (0, 37), "entr'ouvrir": (10, 94), 'éponger': (0, 7), 'anhéler': (9, 41), 'parangonner': (1, 0), 'interligner': (1, 0), 'emmuseler': (0, 40), 'émerveiller': (0, 0), 'plier': (6, 0), 'croire': (50, 95), 'radicaliser': (0, 0), 'amatir': (4, 2), 'écœurer': (7, 0), 'louquer': (1, 1), 'attrouper': (0, 0), 'calfeutrer': (0, 0), 'décheviller': (1, 0), 'rainer': (1, 0), 'contractualiser': (1, 0), 'retordre': (26, 45), 'enclaver': (0, 0), 'recourber': (0, 0), 'pommeler': (20, 40), 'finasser': (7, 0), 'accentuer': (0, 0), 'camionner': (1, 0), 'arder': (9, 5), 'vouvoyer': (0, 6), 'goupillonner': (1, 0), 'répandre': (10, 45), 'dodeliner': (9, 5), 'mésallier': (20, 0), 'sillonner': (1, 0), 'accréditer': (0, 0), 'accepter': (21, 0), 'vagir': (16, 32), 'encelluler': (1, 0), 'soulager': (0, 7), 'baptiser': (0, 0), 'biloquer': (1, 0), 'meubler': (0, 0), 'ziber': (1, 0), 'tourner': (21, 0), 'chinoiser': (9, 5), 'tabasser': (0, 0), 'étoiler': (0, 0), 'haler': (1, 0), 'floconner': (9, 5), 'anordir': (16, 32), 'brouetter': (1, 0), 'gicler': (9, 5), 'survenir': (35, 10), 'raugmenter': (7, 0), 'surboucher': (1, 0), 'découronner': (1, 0), 'désorbiter': (0, 0), 'suriner': (1, 0), 'guêtrer': (0, 0), 'bondériser': (1, 0), 'granuler': (1, 0), 'tressaillir': (25, 110), 'libérer': (0, 19), 'ressentir': (10, 87), 'proverbialiser': (1, 0), 'caracoler': (9, 5), 'tourillonner': (9, 5), 'repréciser': (7, 0), 'glatir': (16, 32), 'braire': (43, 62), 'exhéréder': (1, 4), 'désorganiser': (0, 0), 'estoquer': (1, 0), 'entériner': (1, 0), 'griffer': (7, 0), 'ramender': (1, 0), 'baisoter': (1, 0), 'barbouiller': (1, 0), 'suscrire': (26, 74), 'conforter': (0, 0), 'dégluer': (1, 0), 'estourbir': (4, 2), 'lancer': (0, 31), 'résorber': (0, 0), 'clopiner': (9, 5), 'bèqueter': (1, 20), 'coulisser': (7, 0), 'avocasser': (1, 0), 'refléter': (0, 16), 'retransmettre': (26, 29), 'rabrouer': (1, 0), 'clapoter': (9, 5), 'humidifier': (1, 0), 'grossoyer': (1, 6), 'émécher': (1, 12), 'escroquer': (1, 0), 'numériser': (1, 0), 'fringuer': (6, 0), 'enforcir': (16, 32), 'dégouter': (0, 0), 'retravailler': (23, 0), 'impétrer': (1, 70), 'psalmodier': (7, 0), 'dicter': (1, 0), 'désembourgeoiser': (0, 0), 'décrotter': (1, 0), 'arriérer': (1, 19), 'débarbouiller': (0, 0), 'exorciser': (1, 0), 'cuivrer': (1, 0), 'opiacer': (1, 31), 'crèneler': (1, 98), 'moleter': (1, 34), 'lessiver': (1, 0), 'similiser': (1, 0), 'dilapider': (1, 0), 'abdiquer': (7, 0), 'défriser': (1, 0), 'éconduire': (56, 52), 'extrader': (1, 0), 'incarner': (0, 0), 'dessuinter': (1, 0), 'farter': (1, 0), 'exciter': (0, 0), 'absconder': (0, 1), 'achaler': (1, 0), 'opensourcer': (41, 31), 'reculotter': (0, 0), 'réprimer': (1, 0), 'brasiller': (9, 5), 'puddler': (1, 0), 'sélectionner': (1, 0), 'aquiger': (9, 47), 'dépassionner': (1, 0), 'sociabiliser': (0, 0), 'contrecarrer': (1, 0), 'restreindre': (10, 28), 'crisper': (0, 0), 'vermouler': (20, 0), 'advenir': (35, 30), 'pinter': (32, 0), 'mâchurer': (1, 0), 'nomadiser': (9, 5), 'refourrer': (1, 0), 'lotir': (4, 2), 'fouder': (1, 0), 'casse-crouter': (9, 5), 'dégréner': (7, 35), 'parementer': (1, 0), 'décorner': (1, 0), 'détremper': (1, 0), 'faubérer': (9, 25), 'brosser': (6, 0), 'crâner': (9, 5), 'dégueulasser': (1, 0), 'valider': (1, 0), 'déshuiler': (1, 0), 'nourrir': (36, 2), 'imposer': (0, 0), 'marteler': (1, 22), 'entretoiser': (1, 0), 'fréter': (1, 16), 'recouper': (0, 0), 'peinturlurer': (1, 0), 'dénatter': (1, 0), 'déparler': (9, 5), 'commercialiser': (1, 0), 'affronter': (0, 0), 'propager': (0, 7), 'chier': (6, 0), 'tracer': (7, 31), 'pourvoir': (90, 111), 'carotter': (7, 0), 'renflammer': (1, 0), 'contre-manifester': (9, 5), 'manufacturer': (1, 0), 'sérialiser': (1, 0), 'peiner': (88, 0), 'trinqueballer': (1, 0), 'retentir': (37, 32), 'emménager': (7, 7), 'sasser': (1, 0), 'désentraver': (1, 0), 'défraîchir': (4, 2), 'latter': (1, 0), 'méfaire': (43, 1), 'anticommuter': (1, 0), 'problématiser': (1, 0), 'cochonner': (7, 0), 'déclamer': (7, 0), 'fibrer': (1, 0), 'peroxyder': (1, 0), 'décauser': (1, 0), 'percher': (6, 0), 'décercler': (1, 0), 'recharger': (1, 7), 'poudroyer': (7, 1), 'herboriser': (9, 5), 'affubler': (0, 0), 'culminer': (9, 5), 'décapitaliser': (1, 0), 'rabistoquer': (1, 0), 'débanaliser': (1, 0), 'exulter': (9, 5), 'défeuiller': (1, 0), 'franchir': (51, 2), 'mignarder': (1, 0), 'excommunier': (1, 0), 'postillonner': (9, 5), 'balanstiquer': (1, 0), 'recéder': (1, 4), 'défendre': (5, 45), 'redonder': (9, 5), 'décarburer': (1, 0), 'émuler': (1, 0), 'taire': (31, 188), 'dégrafer': (0, 0), 'charcuter': (0, 0), 'enorgueillir': (34, 2), 'rééduquer': (1, 0), 'trôler': (9, 5), 'bornoyer': (7, 6), 'ouater': (1, 0), 'baguer': (1, 0), 'émettre': (56, 29), 'canuler': (1, 0), 'ziguer': (1, 0), 'goudronner': (1, 0), 'raffiner': (7, 0), 'pensionner': (1, 0), 'détonner': (9, 5), 'vidanger': (1, 7), 'lambrisser': (1, 0), 'casquer': (7, 0), 'contreficher': (20, 0), 'corroyer': (1, 6), 'axiomatiser': (1, 0), 'agneler': (9, 33), 'pressurer': (0, 0), 'mécompter': (20, 0), 'caparaçonner': (0, 0), 'amarrer': (0, 0), 'congréer': (1, 0), 'surdimensionner': (1, 0), 'refendre': (26, 45), 'onduler': (7, 0), 'décapeler': (1, 40), 'soubattre': (26, 3), 'rudoyer': (1, 6), 'dérèglementer': (7, 0), 'héberger': (1, 7), 'décentrer': (0, 0), 'pervertir': (2, 2), 'bedonner': (9, 5), 'valoriser': (0, 0), 'rincer': (0, 31), 'suinter': (7, 0), 'taper': (6, 0), 'tarifier': (1, 0), 'sous-utiliser': (1, 0), 'rudenter': (1, 0), 'comporter': (0, 0), 'réfréner': (0, 35), 'désagglomérer': (21, 19), 'aboyer': (7, 6), 'régater': (9, 5), 'déifier': (1, 0), 'effriter': (0, 0), 'ébraser': (1, 0), 'collisionner': (0, 0), 'accomplir': (15, 2), 'pâturer': (7, 0), 'embourgeoiser': (0, 0), 'entrainer': (40, 0), 'décadenasser': (1, 0), 'vinifier': (1, 0), 'coupler': (1, 0), 'agréger': (0, 8), 'taveler': (0, 40), 'obstiner': (20, 0), 'pulser': (1, 0), 'désindexer': (1, 0), 'égriser': (1, 0), 'soudoyer': (1, 6), 'véroler': (21, 0), 'accommoder': (0, 0), 'précipiter': (0, 0), 'vétiller': (9, 5), 'mordiller': (7, 0), 'placer': (0, 31), 'rehausser': (0, 0), 'déraciner': (1, 0), 'niquer': (1, 0), 'afféager': (1, 7), 'driver': (7, 0), 'établer': (1, 0), 'striquer': (1, 0), 'effondrer': (0, 0), 'autoguider': (20, 0), 'rallier': (6, 0), 'rapapilloter': (1, 0), 'dévoiler': (0, 0), 'détecter': (1, 0), 'vapoter': (41, 0), 'syntoniser': (1, 0), 'choquer': (0, 0), 'aggraver': (0, 0), 'rediffuser': (1, 0), 'colliger': (1, 7), 'botter': (6, 0), 'scratcher': (7, 0), 'donner': (3, 0), 'bouleverser': (1, 0), 'gélatiniser': (1, 0), 'désincorporer': (1, 0), 'retéléphoner': (58, 5), 'biopsier': (1, 0), 'retapisser': (1, 0), 'gagner': (6, 0), 'gazonner': (7, 0), 'égruger': (1, 7), 'gâtifier': (9, 5), 'câbler': (1, 0), 'tousser': (9, 5), 'téléporter': (0, 0), 'bringuebaler': (7, 0), 'interroger': (0, 7), 'radoucir': (13, 2), 'phrasicoter': (9, 1), 'désassortir': (4, 2), 'faire': (5, 89), 'greloter': (9, 5), 'récréer': (0, 0), 'indulgencier': (1, 0), 'piter': (9, 5), 'bâcler': (7, 0), 'parier': (7, 0), 'maturer': (1, 0), 'gager': (1, 7), 'étonner': (0, 0), 'pigeonner': (1, 0), 'tanniser': (1, 0), 'quadriller': (1, 0), 'gargoter': (9, 5), 'regarnir': (4, 2), 'chicorner': (20, 0), 'œilletonner': (1, 0), 'exister': (53, 5), 'insensibiliser': (0, 0), 'formuler': (0, 0), 'écrouler': (20, 0), 'redissoudre': (31, 9), 'radier': (1, 0), 'comparaître': (25, 79), 'décorder': (0, 0), 'sexualiser': (1, 0), 'chaloir': (43, 68), 'réfracter': (1, 0), 'lignifier': (20, 0), 'endoctriner': (1, 0), 'tourniller': (9, 5), 'encoder': (1, 0), 'canaliser': (1, 0), 'chaperonner': (1, 0), 'concréter': (1, 16), 'imbiber': (0, 0), 'duper': (0, 0), 'pencher': (6, 0), "s'abader": (20, 1), 'exonérer': (0, 19), 'désinsectiser': (1, 0), 'sécuriser': (1, 0), 'picter': (7, 0), 'érafler': (0, 0), 'toquer': (32, 0), 'chialer': (9, 5), 'décélérer': (9, 25), 'grainer': (1, 0), 'balader': (0, 0), 'réinstaurer': (1, 0), 'ressaigner': (7, 0), 'planquer': (6, 0), 'dépouiller': (0, 0), 'fiscaliser': (1, 0), 'dépressuriser': (1, 0), 'piéger': (1, 8), 'sevrer': (1, 179), 'boxer': (7, 0), 'empanner': (7, 0), 'biloter': (20, 0), 'fourvoyer': (0, 6), 'déganter': (0, 0), 'composer': (6, 0), 'émeriser': (1, 0), 'dériver': (23, 0), 'approprier': (0, 0), 'finlandiser': (0, 0), 'autodéterminer': (20, 0), 'ripoliner': (1, 0), 'contreminer': (1, 0), 'trémater': (1, 0), 'oringuer': (1, 0), 'désarçonner': (1, 0), 'voliger': (1, 7), 'croiser': (6, 0), 'giter': (9, 5), 'débouter': (1, 0), 'étioler': (0, 0), 'changer': (46, 7), 'annualiser': (1, 0), 'entrechoquer': (0, 0), 'renuméroter': (0, 0), 'virtualiser': (1, 0), 'épouvanter': (0, 0), 'envoler': (20, 0), 'agaillardir': (2, 1), 'ébruiter': (0, 0), 'privilégier': (1, 0), 'harpailler': (9, 0), 'dénucléariser': (1, 0), 'roquer': (9, 5), 'entôler': (1, 0), 'estampiller': (1, 0), 'désencastrer': (1, 0), 'riffauder': (7, 0), 'entailler': (0, 0), 'déboiter': (6, 0), 'saborder': (0, 0), 'critiquer': (1, 0), 'caresser': (0, 0), 'emmanteler': (0, 40), 'chercher': (21, 0), 'purifier': (0, 0), 'désengluer': (0, 0), 'dénitrifier': (1, 0), 'alourdir': (2, 2), 'calaminer': (20, 0), 'bridger': (9, 47), 'rassortir': (4, 1), 'supposer': (41, 0), 'glaglater': (9, 1), 'plébisciter': (1, 0), 'rapièceter': (1, 20), 'tituber': (9, 5), 'lifter': (1, 0), 'glairer': (1, 0), 'applaudir': (36, 2), 'massacrer': (0, 0), 'retendre': (26, 45), 'désaccorder': (0, 0), 'montrer': (22, 0), 'réinventer': (0, 0), 'contremanifester': (9, 5), 'chameauser': (9, 5), 'tartiner': (7, 0), 'remastiquer': (1, 0), 'réaménager': (1, 7), 'paupériser': (1, 0), 'retercer': (1, 31), 'redévelopper': (0, 0), 'désacclimater': (1, 0), 'défleurir': (24, 2), 'rajeunir': (13, 2), 'engrener': (0, 39), 'relouer': (1, 0), 'dégermer': (1, 0), 'coutoner': (1, 0), 'apparoir': (43, 43), 'filtrer': (7, 0), 'kaotiser': (1, 0), 'gratifier': (1, 0), 'barioler': (1, 0), 'préaffranchir': (51, 2), 'exproprier': (1, 0), 'banaliser': (0, 0), 'caser': (0, 0), 'terser': (1, 0), 'essayer': (21, 0), 'redéployer': (1, 6), 'koter': (9, 5), 'flageller': (0, 0), 'insuffler': (1, 0), 'humaniser': (0, 0), 'remblaver': (1, 0), 'agresser': (1, 0), 'aciduler': (1, 0), 'pointer': (6, 0), 'raconter': (0, 0), 'dévaser': (1, 0), 'rembroquer': (1, 1), 'recompter': (1, 0), 'dénickeler': (1, 40), 'amnistier': (1, 0), 'ressayer': (41, 0), 'chiqueter': (41, 34), 'couter': (23, 0), 'labialiser': (0, 0), 'solidariser': (0, 0), 'aboutir': (14, 2), 'stipuler': (1, 0), 'aboter': (12, 1), 'gazouiller': (9, 5), 'décarpiller': (1, 0), 'ponter': (7, 0), 'bavasser': (9, 5), 'conter': (1, 0), 'cachotter': (1, 0), 'immuniser': (0, 0), 'débrousser': (1, 0), 'instruire': (10, 52), 'calculer': (7, 0), 'biseauter': (1, 0), 'rejeter': (0, 34), 'subtiliser': (6, 0), 'oser': (1, 0), 'avorter': (7, 0), 'esbigner': (20, 0), 'badigeonner': (19, 0), 'gloutonner': (7, 0), 'grognonner': (9, 5), 'abecquer': (1, 1), 'enchanter': (0, 0), 'messeoir': (9, 147), 'ébranler': (0, 0), 'règlementer': (1, 0), 'enrégimenter': (1, 0), 'regorger': (9, 47), 'palettiser': (1, 0), 'conformer': (0, 0), 'expédier': (1, 0), 'écheniller': (1, 0), 'gueuser': (7, 0), 'cabiner': (9, 5), 'technocratiser': (0, 0), 'dégoûter': (0, 0), 'curer': (0, 0), 'renfoncer': (1, 31), 'permuter': (6, 0), 'luger': (9, 47), 'sténographier': (1, 0), 'engargousser': (1, 0), 'survêtir': (26, 115), 'déchiqueter': (1, 34), 'croler': (9, 5), 'ronronner': (9, 5), 'panacher': (6, 0), 'captiver': (0, 0), 'décrapouiller': (0, 1), 'débrailler': (20, 0), 'surréagir': (14, 32), 'jeter': (3, 34), 'techniser': (1, 0), 'cocufier': (1, 0), 'égermer': (1, 0), 'biser': (7, 0), 'inférer': (1, 19), 'séjourner': (9, 5), 'déduire': (5, 52), 'orchestrer': (1, 0), 'éployer': (0, 6), 'éradiquer': (1, 0), 'scolariser': (1, 0), 'raviver': (0, 0), 'démancher': (0, 0), 'shampouiner': (1, 0), 'expulser': (0, 0), 'rebouiser': (1, 1), 'chapeler': (1, 40), 'perturber': (1, 0), 'jardiner': (7, 0), 'cabrer': (0, 0), 'laitonner': (1, 0), 'désensorceler': (1, 40), 'implanter': (0, 0), 'putréfier': (0, 0), 'enhardir': (2, 2), 'réessayer': (1, 0), 'rapatronner': (1, 0), 'acclamer': (1, 0), 'coqueter': (1, 34), 'fortifier': (0, 0), 'déshypothéquer': (1, 67), 'casemater': (1, 0), 'polissonner': (9, 5), 'bouler': (7, 0), 'débourrer': (7, 0), 'déchromer': (1, 0), 'barguigner': (9, 5), 'lourder': (33, 0), 'fluber': (9, 5), 'abalober': (1, 1), 'débrider': (7, 0), 'produire': (5, 52), 'débâillonner': (1, 0), 'discutailler': (7, 0), 'intimider': (1, 0), 'embardoufler': (1, 0), 'déminer': (1, 0), 'raire': (43, 62), 'roser': (1, 0), 'acquiescer': (30, 23), 'atteindre': (49, 28), 'aventurer': (0, 0), 'moucheter': (1, 34), 'commotionner': (1, 0), 'tirebouchonner': (6, 0), 'rapipoter': (9, 5), 'charioter': (1, 0), 'troller': (9, 5), 'endetter': (0, 0), 'dialyser': (1, 0), 'diminuer': (6, 0), 'instrumenter': (7, 0), 'chourer': (1, 0), 'transfuser': (1, 0), 'discréditer': (0, 0), 'tâter': (19, 0), 'estrapasser': (1, 0), 'désacraliser': (1, 0), 'fracturer': (0, 0), 'délier': (0, 0), 'magnifier': (1, 0), 'libéraliser': (0, 0), 'bretter': (1, 0), 'démythifier': (1, 0), 'extrémiser': (0, 0), 'repriser': (1, 0), 'fermer': (3, 0), 'hululer': (9, 5), 'soucier': (0, 0), 'bégaler': (1, 0), 'maculer': (1, 0), 'pisser': (7, 0), 'rempiéter': (1, 16), 'attitrer': (1, 0), 'injecter': (0, 0), 'escarmoucher': (9, 5), 'dégueuler': (7, 0), 'réinstaller': (0, 0), 'quartager': (1, 7), 'reluquer': (1, 0), 'chansonner': (1, 0), 'redécouvrir': (31, 94), 'dépérir': (37, 32), 'télédiffuser': (1, 0), 'togoliser': (1, 0), 'respirer': (7, 0), 'isomériser': (1, 0), 'régresser': (9, 5), 'rétreindre': (26, 1), 'endeuiller': (1, 0), 'ristourner': (1, 0), 'ramander': (7, 0), 'finir': (11, 2), 'frôler': (0, 0), 'fuiter': (1, 0), 'pourprer': (20, 0), 'sérancer': (1, 31), 'viner': (1, 0), 'introduire': (31, 52), 'titrer': (1, 0), 'chaptaliser': (1, 0), 'pixeliser': (41, 0), 'lockouter': (1, 0), 'maniérer': (0, 19), 'étalinguer': (1, 0), 'décapsuler': (1, 0), 'débillarder': (1, 0), 'désespérer': (6, 19), 'menotter': (0, 0), 'briquer': (1, 0), 'babiller': (9, 5), 'chiner': (7, 0), 'satonner': (1, 0), 'tapisser': (1, 0), 'décartonner': (1, 0), 'justifier': (19, 0), 'démotiver': (0, 0), 'réexpliquer': (1, 0), 'détériorer': (0, 0), 'secourir': (27, 13), 'fier': (20, 0), 'compresser': (1, 0), 'abluer': (0, 1), 'désenchainer': (1, 0), 'apparaitre': (42, 14), 'dégiter': (1, 0), 'classer': (0, 0), 'berlurer': (32, 0), 'reconfigurer': (1, 0), 'macérer': (7, 19), 'draver': (7, 0), 'abaisser': (0, 0), 'signaliser': (1, 0), 'racheter': (0, 20), 'personnifier': (1, 0), 'étoupiller': (1, 0), 'désinstitutionnaliser': (0, 0), 'foëner': (7, 0), 'déhâler': (1, 1), 'mouvementer': (1, 0), 'distiller': (7, 0), 'épouiller': (0, 0), 'ordonnancer': (1, 31), 'cultiver': (0, 0), 'détalonner': (1, 0), 'démocratiser': (0, 0), 'cadancher': (9, 5), 'reteindre': (26, 28), 'soûler': (0, 0), 'lobotomiser': (1, 0), 'javeler': (7, 40), 'tabuler': (7, 0), 'électrifier': (1, 0), 'rameter': (9, 54), 'écarquiller': (1, 0), 'rémunérer': (1, 19), 'déactiver': (1, 0), 'rapprocher': (6, 0), 'fétichiser': (1, 0), 'placarder': (1, 0), 'mander': (1, 0), 'juter': (9, 5), 'amonceler': (0, 40), 'encirer': (1, 0), 'désaccentuer': (1, 0), 'aimanter': (0, 0), 'présurer': (1, 0), 'shampooiner': (1, 0), 'recoller': (19, 0), 'pétrir': (11, 2), 'fléchir': (13, 2), 'arracher': (0, 0), 'spolier': (1, 0), 'réinviter': (1, 0), 'maigrir': (11, 2), 'utiliser': (33, 0), 'dévirginer': (1, 1), 'toiler': (1, 0), 'épaler': (1, 0), 'annihiler': (0, 0), 'écroûter': (1, 0), 'nimber': (0, 0), 'clapper': (9, 5), 'dissuader': (1, 0), 'déceler': (1, 22), 'greffer': (0, 0), 'manoquer': (1, 0), 'controverser': (7, 0), 'brumer': (54, 61), 'retremper': (0, 0), 'préjudicier': (9, 5), 'romantiser': (7, 0), 'marabouter': (1, 0), 'enquêter': (9, 5), 'fariner': (7, 0), 'hanter': (1, 0), 'socialiser': (21, 0), 'maçonner': (1, 0), 'apaiser': (0, 0), 'carrer': (0, 0), 'journaliser': (41, 0), 'féliciter': (0, 0), 'morfondre': (17, 45), 'ardre': (43, 1), 'embrever': (1, 21), 'pondre': (56, 45), 'moinssoyer': (7, 6), 'emprunter': (7, 0), 'assommer': (0, 0), 'azimuther': (1, 0), 'sabrer': (7, 0), 'mariner': (7, 0), 'rediscuter': (1, 0), 'surcadencer': (0, 31), 'culotter': (0, 0), 'reclure': (26, 131), 'concrétiser': (0, 0), 'persuader': (0, 0), 'razzier': (1, 0), 'végéter': (9, 56), 'repentir': (17, 87), 'gaver': (0, 0), 'pourchasser': (0, 0), 'rebrûler': (9, 5), 'accéder': (28, 18), 'intéresser': (3, 0), 'décrémenter': (1, 0), 'fristouiller': (7, 0), 'victimiser': (1, 0), 'zigzaguer': (9, 5), 'jalonner': (7, 0), 'rechristianiser': (1, 0), 'jumeler': (1, 40), 'encocher': (1, 0), 'rapiéceter': (1, 34), 'carboniser': (1, 0), 'pouffer': (9, 5), 'ronchonner': (9, 5), 'bretteler': (1, 40), 'réconforter': (0, 0), 'bouillonner': (7, 0), 'ingénier': (20, 0), 'tauper': (1, 0), 'cylindrer': (1, 0), 'fretter': (1, 0), 'réembaucher': (1, 0), 'enfumer': (0, 0), 'émier': (1, 0), 'attendre': (50, 45), 'équivaloir': (107, 190), 'contrer': (7, 0), 'maquer': (0, 0), 'excracher': (1, 1), 'rattacher': (0, 0), 'villégiaturer': (9, 5), 'déqualifier': (1, 0), 'boiter': (1, 0), 'immobiliser': (0, 0), 'compacter': (1, 0), 'apprivoiser': (46, 0), 'divaguer': (53, 5), 'dialoguer': (7, 0), 'contre-tirer': (1, 0), 'déraper': (9, 5), 'cavaler': (6, 0), 'scléroser': (0, 0), 'trémousser': (20, 0), 'fractionner': (0, 0), 'vider': (0, 0), 'aluner': (1, 0), 'ébouter': (1, 0), 'contrecoller': (1, 0), 'dénicher': (7, 0), 'muloter': (9, 5), 'enter': (1, 0), 'réinvestir': (51, 2), 'intellectualiser': (1, 0), 'truander': (7, 0), 'procréer': (1, 0), 'impartir': (4, 137), 'recouponner': (1, 0), 'dribbler': (7, 0), 'covoiturer': (1, 0), 'intuber': (1, 0), 'transpirer': (7, 0), 'flinguer': (6, 0), 'circoncire': (26, 73), 'piocher': (7, 0), 'missionner': (7, 0), 'désocialiser': (1, 0), 'idiotiser': (1, 0), 'ratatiner': (0, 0), 'hourdir': (4, 2), 'dégringoler': (7, 0), 'godiller': (9, 5), 'polémiquer': (9, 5), 'munir': (2, 2), 'ébourgeonner': (1, 0), 'décourager': (0, 7), 'sacraliser': (1, 0), 'renfler': (6, 0), 'entrefrapper': (65, 88), 'handeler': (1, 40), 'filigraner': (1, 0), 'porphyriser': (1, 0), 'briocher': (1, 0), 'métamorphoser': (0, 0), 'administrationaliser': (0, 1), 'asserter': (33, 0), 'illusionner': (0, 0), 'randomiser': (1, 0), 'enfieller': (1, 0), 'universaliser': (0, 0), 'pulvériser': (1, 0), 'déniveler': (1, 40), 'étamer': (1, 0), 'éclipser': (0, 0), 'hyperboliser': (41, 0), 'bizuter': (1, 0), 'surnommer': (1, 0), 'décoller': (6, 0), 'agenouiller': (20, 0), 'limer': (6, 0), 'dessaisonner': (21, 0), 'garrotter': (1, 0), 'brocher': (1, 0), 'jaunir': (24, 2), 'confondre': (10, 45), 'passepoiler': (1, 0), 'articuler': (6, 0), 'marrer': (20, 0), 'mansarder': (1, 0), 'grigriser': (1, 0), 'décrambuter': (7, 1), 'catiner': (7, 0), 'seriner': (1, 0), 'retracer': (1, 31), 'fraterniser': (9, 5), 'entraider': (65, 88), 'huiler': (1, 0), 'reposter': (0, 0), 'pluviner': (54, 61), 'transsubstantier': (1, 0), 'brandiller': (7, 0), 'reverser': (1, 0), 'excardiner': (1, 0), 'housser': (1, 0), 'traficoter': (9, 5), 'rimailler': (9, 5), 'compasser': (1, 0), 'terrasser': (7, 0), 'jacter': (7, 0), 'entraver': (1, 0), 'grappiller': (7, 0), 'sanctuariser': (1, 0), 'corréler': (1, 64), 'disjoncter': (7, 0), 'boulonner': (7, 0), 'encrister': (1, 1), 'assimiler': (0, 0), 'détapisser': (1, 0), 'égrener': (0, 39), 'désintermédier': (21, 0), 'contribuer': (58, 5), 'comater': (9, 5), 'peausser': (9, 5), 'électroniser': (1, 0), 'exulcérer': (1, 19), 'sniffer': (7, 0), 'réinterpréter': (1, 16), 'vigiler': (1, 0), 'réprouver': (1, 0), 'marmiter': (1, 0), 'parfaire': (27, 89), 'interpoler': (1, 0), 'kilométrer': (1, 70), 'barrir': (16, 32), 'revisiter': (1, 0), 'vendre': (50, 45), 'rougnotter': (9, 5), 'cocaliser': (20, 0), 'inviter': (0, 0), 'computer': (1, 0), 'décaver': (0, 0), 'affruiter': (7, 0), 'prélever': (1, 21), 'désenfumer': (1, 0), 'disjoindre': (10, 28), 'condescendre': (63, 85), 'colorer': (0, 0), 'décommettre': (26, 29), 'ébouzer': (1, 1), 'braver': (1, 0), 'idéologiser': (1, 0), 'resurgir': (16, 32), 'barjaquer': (9, 5), 'structurer': (0, 0), 'cocher': (1, 0), 'bigorner': (0, 0), 'ébaudir': (2, 2), 'avantager': (1, 7), 'épingler': (1, 0), 'distribuer': (0, 0), 'octroyer': (0, 6), 'émarger': (7, 7), 'carbonitrurer': (33, 0), 'recracher': (7, 0), 'exprimer': (0, 0), 'décolérer': (9, 25), 'arnacher': (1, 0), 'surcoter': (1, 0), 'débarquer': (7, 0), 'déculturer': (0, 0), 'transparaitre': (43, 78), 'anastomoser': (32, 0), 'vilipender': (1, 0), 'appairer': (1, 0), 'dysfonctionner': (9, 5), 'baiser': (7, 0), 'chirographier': (1, 0), 'destituer': (1, 0), 'bidonner': (19, 0), 'préférer': (6, 19), 'seoir': (43, 178), 'embarquer': (6, 0), 'résinifier': (1, 0), 'entremêler': (0, 0), 'capturer': (1, 0), 'écacher': (1, 0), 'cabrioler': (9, 5), 'ouiller': (7, 0), 'désencombrer': (0, 0), 'vectoriser': (1, 0), 'mâcher': (1, 0), 'esthétiser': (7, 0), 'ravilir': (4, 2), 'sous-employer': (1, 6), 'décontenancer': (0, 31), 'digérer': (6, 19), 'déréglementer': (7, 0), 'empaffer': (1, 0), 'filmer': (7, 0), 'rationaliser': (1, 0), 'fluxer': (1, 0), 'délayer': (1, 0), 'galéjer': (9, 5), 'godronner': (1, 0), 'ambrer': (1, 0), 'traînasser': (7, 0), 'corseter': (1, 20), 'défroisser': (0, 0), 'élucubrer': (1, 0), 'niaiser': (9, 5), 'remmancher': (1, 0), 'court-circuiter': (1, 0), 'doter': (0, 0), 'carnifier': (20, 0), 'abat-carrer': (1, 0), 'décamper': (9, 5), 'langueyer': (1, 0), 'brouter': (7, 0), 'lofer': (9, 5), 'lésiner': (9, 5), 'contre-calquer': (1, 0), 'suspecter': (0, 0), 'étudier': (6, 0), 'peser': (6, 113), 'traîner': (6, 0), 'proliférer': (9, 25), 'beugler': (7, 0), 'admirer': (21, 0), 'chaumer': (7, 0), 'déjucher': (7, 0), 'boucharder': (1, 0), 'quarter': (1, 0), 'translittérer': (1, 19), 'treillager': (1, 7), 'défaillir': (25, 110), 'ombrer': (1, 0), 'assagir': (2, 2), 'affiler': (1, 0), 'convier': (1, 0), 'assortir': (2, 2), 'concerner': (1, 82), 'déposséder': (1, 4), 'agrafer': (1, 0), 'murir': (7, 2), 'dégoupiller': (1, 0), 'photosynthétiser': (7, 0), 'échalasser': (1, 0), 'entre-dévorer': (65, 88), 'départager': (1, 7), 'entarter': (1, 0), 'épouser': (6, 0), 'geindre': (73, 28), 'chalouper': (9, 5), 'surévaluer': (1, 0), 'souler': (0, 0), 'conchier': (6, 0), 'saliver': (9, 5), 'harder': (1, 0), 'sophistiquer': (0, 0), 'déverrouiller': (1, 0), 'contredire': (5, 86), 'danser': (7, 0), 'embattre': (26, 3), 'décacheter': (1, 34), 'remouiller': (7, 0), 'entrevoir': (10, 125), 'mourir': (86, 150), 'conquérir': (5, 24), 'provigner': (7, 0), 'cauchemarder': (9, 5), 'farfouiller': (7, 0), 'chouriner': (1, 0), 'imperméabiliser': (1, 0), 'rétamer': (0, 0), 'crypter': (1, 0), 'réaffuter': (1, 0), 'épaissir': (13, 2), 'boustifailler': (9, 5), 'ronéotyper': (1, 0), 'atrophier': (0, 0), 'ensaisiner': (1, 0), 'ergoter': (9, 5), 'sélecter': (1, 0), 'sensibiliser': (0, 0), 'configurer': (1, 0), 'enjaveler': (1, 40), 'enlever': (0, 21), 'dessoler': (1, 0), 'hébraïser': (7, 0), 'créer': (21, 0), 'liter': (1, 0), 'étendre': (31, 45), 'bétonner': (7, 0), 'postposer': (1, 0), 'pâmer': (20, 0), 'défourner': (1, 0), 'recongeler': (1, 22), 'bavarder': (9, 5), 'turlupiner': (1, 0), 'arrondir': (2, 2), 'flairer': (1, 0), 'égrainer': (0, 0), 'déchainer': (0, 0), 'outrager': (1, 7), 'désargenter': (0, 0), 'techniciser': (1, 0), 'approfondir': (2, 2), 'outiller': (0, 0), 'cafter': (7, 0), 'ébroudir': (4, 2), 'zerver': (1, 0), 'floculer': (9, 5), 'pépier': (9, 5), 'mamelonner': (1, 0), 'formaliser': (0, 0), 'redécouper': (0, 0), 'graffer': (20, 1), 'dépalisser': (1, 0), 'abriter': (0, 0), 'jabler': (1, 0), 'déplacer': (0, 31), 'loufer': (9, 5), 'redonner': (6, 0), 'ramailler': (1, 0), 'insolubiliser': (1, 0), 'rebraguetter': (0, 0), 'monétiser': (1, 0), 'défrusquer': (1, 1), 'river': (1, 0), 'réaliser': (0, 0), 'instaurer': (0, 0), 'précharger': (1, 7), 'parler': (3, 0), 'trépigner': (7, 0), 'déroger': (58, 47), 'emboucher': (1, 0), 'spathifier': (1, 0), 'rebrousser': (6, 0), 'mitiger': (1, 7), 'gongonner': (9, 5), 'échampir': (4, 2), 'loger': (6, 7), 'adosser': (0, 0), 'réaffecter': (1, 0), 'cadrer': (7, 0), 'entrevoûter': (1, 0), 'alcaliniser': (1, 0), 'abstraire': (18, 11), 'restituer': (1, 0), 'bourrer': (6, 0), 'aubiner': (9, 5), 'raccommoder': (0, 0), 'effaroucher': (0, 0), 'frissonner': (9, 5), 'forcir': (37, 32), 'dépayser': (1, 0), 'ébouqueter': (1, 1), 'chapeauter': (1, 0), 'cybersquatter': (1, 0), 'libeller': (1, 0), 'trainasser': (7, 0), 'bander': (6, 0), 'spécialiser': (0, 0), 'déshumidifier': (1, 0), 'accastiller': (1, 0), 'vaporiser': (1, 0), 'ripailler': (9, 5), 'inséminer': (1, 0), 'buzzer': (9, 5), 'détoxiquer': (1, 0), 'lichotter': (7, 1), 'démantibuler': (0, 0), 'émietter': (0, 0), 'réacquérir': (26, 24), 'impatroniser': (0, 0), 'déserter': (6, 0), 'déstresser': (6, 0), 'frégater': (1, 0), 'badiner': (53, 5), 'décalquer': (1, 0), 'bronzer': (6, 0), 'sublimer': (7, 0), 'intervenir': (35, 10), 'conjuguer': (0, 0), 'défiger': (1, 7), 'cabaler': (9, 5), 'retailler': (1, 0), 'saponifier': (1, 0), 'redistribuer': (1, 0), 'attriquer': (1, 0), 'emplumer': (1, 0), 'sectionner': (0, 0), 'assavoir': (26, 1), 'composter': (1, 0), 'ménager': (0, 7), 'œiller': (1, 0), 'échopper': (1, 0), 'subjectiver': (21, 0), 'contresceller': (1, 0), 'affirmer': (3, 0), 'repousser': (6, 0), 'manager': (1, 7), 'moufeter': (9, 1), 'rentabiliser': (1, 0), 'rendosser': (1, 0), 'amenuiser': (1, 0), 'acharner': (0, 0), 'éviscérer': (1, 19), 'entretuer': (65, 88), 'flageoler': (9, 5), 'décolorer': (0, 0), 'épanouir': (34, 2), 'élire': (27, 142), 'muter': (7, 0), 'émonder': (1, 0), 'piailler': (9, 5), 'revancher': (20, 0), 'repiquer': (7, 0), 'nettoyer': (1, 6), 'saliniser': (88, 0), 'rengraisser': (41, 0), 'tromper': (0, 0), 'agglomérer': (0, 19), 'verger': (9, 47), 'buser': (1, 0), 'déboulonner': (1, 0), 'emboucaner': (21, 0), 'brancher': (6, 0), 'chancetiquer': (9, 5), 'lécher': (0, 12), 'radioguider': (1, 0), 'ébaubir': (8, 2), 'teindre': (10, 28), 'effectuer': (0, 0), 'saumurer': (1, 0), 'conclure': (45, 83), 'couver': (7, 0), 'mugir': (16, 2), 'émoustiller': (0, 0), 'interloquer': (1, 0), 'dévaler': (7, 0), 'déconstruire': (10, 52), 'bavocher': (9, 5), 'booster': (1, 0), 'détenir': (27, 10), 'modéliser': (1, 0), 'colmater': (1, 0), 'vitrer': (1, 0), 'réhabiliter': (0, 0), 'populariser': (0, 0), 'parcelliser': (0, 0), 'profiter': (58, 5), 'pasticher': (1, 0), 'centrifuger': (1, 7), 'effaner': (1, 0), 'apprêter': (0, 0), 'fureter': (9, 66), 'innocenter': (1, 0), 'indexer': (1, 0), 'volter': (9, 5), 'ramastiquer': (1, 0), 'remaquiller': (0, 0), 'banner': (1, 0), 'dynamiter': (1, 0), 'ressauter': (7, 0), 'surbroder': (1, 0), 'tigrer': (1, 0), 'chatonner': (9, 5), 'goûter': (23, 0), 'ragoûter': (1, 0), 'méprendre': (17, 46), 'kératiniser': (0, 0), 'délibérer': (12, 25), 'saper': (0, 0), 'incurver': (0, 0), 'rééditer': (1, 0), 'singer': (1, 7), 'zozoter': (9, 5), 'décongeler': (1, 22), 'amordancer': (1, 31), 'oppresser': (1, 0), 'abicher': (1, 1), 'discuter': (6, 0), 'externer': (1, 0), 'commissionner': (1, 0), 'avaliser': (1, 0), 'rebiffer': (20, 0), 'mériter': (83, 0), 'renier': (0, 0), 'dégrader': (0, 0), 'abloquer': (1, 0), 'saurir': (4, 2), 'incanter': (7, 0), 'décroître': (25, 15), 'propulser': (0, 0), 'sécréter': (1, 16), 'vouer': (0, 0), 'herber': (1, 0), 'démoucheter': (1, 34), 'répondre': (101, 45), 'déformer': (0, 0), 'accoutumer': (0, 0), 'démener': (20, 39), 'apparier': (0, 0), 'présonoriser': (33, 0), 'démoniser': (0, 0), 'identifier': (0, 0), 'tarir': (13, 2), 'promouvoir': (26, 161), 'receler': (7, 22), 'nieller': (1, 0), 'contre-indiquer': (1, 0), 'cosmétiquer': (1, 0), 'cordonner': (1, 0), 'adjuger': (0, 7), 'fatiguer': (6, 0), 'jalouser': (0, 0), 'sucer': (6, 31), 'hâler': (0, 0), 'abreuver': (0, 0), 'poireauter': (9, 5), 'anglaiser': (1, 0), 'vasouiller': (9, 5), 'jacqueter': (7, 1), 'radoter': (9, 5), 'dénaturaliser': (1, 0), 'fondre': (5, 45), 'déficher': (1, 0), 'enfler': (6, 0), 'liarder': (9, 5), 'mystifier': (1, 0), 'dormir': (25, 106), 'bloquer': (0, 0), 'ensauvager': (1, 7), 'réprimander': (1, 0), 'maudire': (26, 145), 'revoler': (7, 0), 'marchandiser': (33, 0), 'déplaner': (9, 5), 'consacrer': (40, 0), 'épiner': (1, 0), 'réargenter': (0, 0), 'défacer': (33, 31), 'quarrer': (1, 0), 'paganiser': (7, 0), 'crépir': (4, 2), 'tramer': (0, 0), 'sédimenter': (1, 0), 'vesser': (9, 5), 'contrebalancer': (0, 31), 'repérer': (0, 19), 'lardonner': (1, 0), 'graver': (6, 0), 'émaner': (9, 5), 'enrayer': (0, 0), 'reconstituer': (0, 0), 'renverser': (0, 0), 'anneler': (1, 40), 'débourser': (1, 0), 'époumoner': (20, 0), 'obvier': (58, 5), 'débourber': (1, 0), 'escaloper': (1, 0), 'indifférer': (1, 19), 'déchirer': (0, 0), 'transmuer': (0, 0), 'prendre': (5, 46), 'emberlificoter': (0, 0), 'rôdailler': (9, 5), 'répertorier': (1, 0), 'débalourder': (1, 0), 'imaginer': (0, 0), 'remédier': (58, 5), 'jongler': (9, 5), 'frigorifuger': (1, 7), 'décatir': (2, 2), 'grenouiller': (9, 5), 'biberonner': (9, 5), 'transcender': (0, 0), 'républicaniser': (1, 0), 'roulotter': (1, 0), 'tapoter': (7, 0), 'pincer': (6, 31), 'croûter': (7, 0), 'crier': (7, 0), 'vieller': (9, 5), 'empester': (7, 0), 'confluer': (9, 5), 'boucher': (0, 0), 'suborner': (1, 0), 'étinceler': (9, 33), 'élinguer': (1, 0), 'démasquer': (0, 0), 'houer': (1, 0), 'pacquer': (1, 0), 'caserner': (1, 0), 'claudiquer': (9, 5), 'scanner': (1, 0), 'cadoter': (1, 0), 'bricoler': (7, 0), 'castagner': (6, 0), 'incliner': (6, 0), 'rebruler': (9, 5), 'minéraliser': (1, 0), 'surplomber': (7, 0), 'agriffer': (20, 0), 'bitonner': (9, 5), 'déprolétariser': (1, 0), 'historiser': (6, 0), 'égarer': (0, 0), 'surcoller': (9, 5), 'débrancher': (0, 0), 'délainer': (1, 0), 'extasier': (20, 0), 'déconsigner': (1, 0), 'stariser': (1, 0), 'désenfler': (6, 0), 'désapparier': (1, 0), 'fauconner': (9, 5), 'patienter': (9, 5), 'cryogéniser': (1, 0), 'emmagasiner': (1, 0), 'déconventionner': (1, 0), 'cuirasser': (0, 0), 'arpenter': (1, 0), 'parcheminer': (0, 0), 'intercaler': (0, 0), 'platiniser': (1, 0), 'contre-percer': (1, 31), 'dater': (41, 0), 'interviewer': (1, 0), 'encaisser': (1, 0), 'préformer': (1, 0), 'tangenter': (54, 61), 'étouffer': (6, 0), 'glapir': (24, 2), 'euphoriser': (7, 0), 'embabouiner': (1, 0), 'bégueter': (9, 66), 'surir': (16, 32), 'appuyer': (3, 6), 'yoyoter': (9, 5), 'déroder': (1, 0), 'stopper': (7, 0), 'évider': (1, 0), 'disproportionner': (1, 0), 'entendre': (50, 45), 'achalander': (1, 0), 'préchauffer': (1, 0), 'prolonger': (0, 7), 'cribler': (1, 0), 'encrouter': (0, 0), 'sous-exposer': (1, 0), 'rempiler': (7, 0), 'intervertir': (51, 2), 'pleuvoter': (54, 61), 'enjôler': (1, 0), 'ethniciser': (1, 0), 'introjecter': (33, 0), 'intoxiquer': (0, 0), 'élaborer': (0, 0), 'déclarer': (22, 0), 'rafantir': (9, 164), 'oraliser': (1, 0), 'déboussoler': (1, 0), 'dérouler': (0, 0), 'hydrater': (0, 0), 'rationner': (0, 0), 'rafraichir': (69, 2), 'désinfecter': (1, 0), 'perquisitionner': (9, 5), 'gesticuler': (9, 5), 'couillonner': (1, 0), 'empourprer': (0, 0), 'démailloter': (1, 0), 'affûter': (1, 0), 'serfouir': (4, 2), 'aménager': (0, 7), 'récupérer': (1, 19), 'grêler': (81, 55), 'charpenter': (1, 0), 'précéder': (7, 4), 'recâbler': (1, 0), 'ruter': (9, 5), 'matricer': (1, 31), 'pustuler': (53, 0), 'matir': (4, 2), 'tâcher': (38, 0), 'dérembourser': (1, 0), 'réacclimater': (40, 0), 'mitonner': (6, 0), 'fluter': (7, 0), 'azurer': (1, 0), 'sonnailler': (9, 5), 'ballotter': (7, 0), 'coasser': (1, 0), 'pavoiser': (7, 0), 'débèqueter': (0, 20), 'instituer': (0, 0), 'stocker': (1, 0), 'désarmer': (6, 0), 'fragmenter': (1, 0), 'suivre': (55, 159), 'ghettoïser': (41, 0), 'débleuir': (4, 2), 'enculer': (1, 0), 'réciproquer': (7, 0), 'désemplir': (13, 2), 'décompenser': (9, 5), 'ballonner': (1, 0), 'symétriser': (7, 0), 'diamanter': (1, 0), 'aboutonner': (0, 1), 'alestir': (26, 1), 'résilier': (1, 0), 'autopsier': (1, 0), 'ronflaguer': (1, 0), 'tenter': (41, 0), 'alarmer': (0, 0), 'comparer': (0, 0), 'surgeonner': (9, 5), 'infecter': (0, 0), 'éthériser': (1, 0), 'être': (108, 194), 'disparaître': (68, 15), 'pajoter': (20, 1), 'éblouir': (11, 2), 'parkériser': (1, 0), 'pétarader': (9, 5), 'claquer': (6, 0), 'invétérer': (20, 19), 'palanguer': (7, 0), 'dévaluer': (0, 0), 'fesser': (1, 0), 'taxer': (1, 0), 'engendrer': (1, 0), 'réactiver': (1, 0), 'rechaper': (1, 0), 'hisser': (0, 0), 'lisérer': (1, 19), 'garder': (0, 0), 'mixtionner': (1, 0), 'décavaillonner': (1, 0), 'dégrouper': (1, 0), 'pomponner': (0, 0), 'seller': (1, 0), 'pluraliser': (0, 0), 'festonner': (1, 0), 'bouliner': (1, 0), 'clochardiser': (0, 0), 'engloutir': (2, 2), 'harponner': (1, 0), 'paramétrer': (40, 70), 'entredétruire': (74, 121), 'décalotter': (1, 0), 'démédicaliser': (1, 0), 'paginer': (1, 0), 'tournoyer': (9, 51), 'virguler': (1, 0), 'désembrayer': (1, 0), 'écimer': (1, 0), 'gondoler': (32, 0), 'détransposer': (1, 0), 'bruiner': (54, 61), 'cordeler': (1, 40), 'naturaliser': (1, 0), 'brumasser': (54, 61), 'débarder': (1, 0), 'grammaticaliser': (0, 0), 'musicaliser': (1, 0), 'dépuceler': (1, 40), 'concevoir': (55, 42), 'débouillir': (26, 60), 'reconditionner': (1, 0), 'réengendrer': (21, 0), 'autogouverner': (20, 0), 'démontrer': (0, 0), 'roidir': (2, 2), 'bercer': (0, 31), 'aigrir': (13, 2), 'embistrouiller': (1, 1), 'relier': (1, 0), 'clarifier': (0, 0), 'heurter': (6, 0), 'biner': (7, 0), 'époutier': (1, 0), 'désaminer': (1, 0), 'basculer': (7, 0), 'concorder': (9, 5), 'emblaver': (1, 0), 'réinsérer': (0, 19), 'abloquir': (4, 1), 'forclore': (26, 131), 'pateliner': (7, 0), 'swinguer': (9, 5), 'métrer': (1, 70), 'déconstiper': (1, 0), 'égratigner': (0, 0), 'défiscaliser': (1, 0), 'disqualifier': (0, 0), 'lyophiliser': (1, 0), 'fignoler': (40, 0), 'grelotter': (9, 5), 'déferriser': (1, 0), 'déconditionner': (1, 0), 'normaliser': (0, 0), 'enligner': (1, 0), 'patauger': (9, 47), 'débecqueter': (0, 34), 'télécommander': (1, 0), 'assibiler': (0, 0), 'impulser': (1, 0), 'opacifier': (0, 0), 'survaloriser': (1, 0), 'ratonner': (41, 0), 'respiritualiser': (0, 0), 'grimper': (7, 0), 'représenter': (6, 0), 'lambiner': (9, 5), 'prédéfinir': (4, 2), 'acclimater': (0, 0), 'rempaqueter': (1, 34), 'dindonner': (1, 0), 'rembucher': (6, 0), 'solutionner': (1, 0), 'mazouter': (7, 0), 'accoler': (0, 0), 'récrire': (26, 74), 'bivouaquer': (9, 5), 'blutiner': (9, 5), 'muséifier': (41, 0), 'forer': (1, 0), 'ploquer': (0, 0), 'houssiner': (1, 0), 'détester': (0, 0), 'transvaser': (1, 0), 'démaquiller': (0, 0), 'disséminer': (0, 0), 'déglutir': (24, 2), 'enceinter': (1, 0), 'réimplémenter': (33, 0), 'blondoyer': (9, 51), 'rembobiner': (1, 0), 'enjuiver': (0, 0), 'murailler': (1, 0), 'écornifler': (1, 0), 'entreregarder': (65, 88), 'cotonner': (6, 0), 'déjaunir': (4, 2), 'surendetter': (0, 0), 'hâbler': (9, 0), 'prescrire': (69, 74), 'mitrailler': (7, 0), 'étriper': (0, 0), 'starifier': (1, 0), 'projeter': (0, 34), 'côcher': (1, 0), 'scander': (1, 0), 'jouter': (9, 5), 'droitiser': (40, 0), 'consentir': (45, 87), 'marier': (0, 0), 'dédorer': (1, 0), 'moirer': (1, 0), 'reconduire': (26, 52), 'folâtrer': (9, 5), 'endommager': (1, 7), 'renvoyer': (0, 126), 'commérer': (9, 25), 'tronçonner': (1, 0), 'vacuoliser': (1, 0), 'cavacher': (9, 5), 'abêtir': (2, 2), 'géocoder': (41, 0), 'surligner': (1, 0), 'yoyotter': (9, 5), 'soviétiser': (1, 0), 'vagabonder': (9, 5), 'naufrager': (9, 47), 'briqueter': (1, 34), 'hasarder': (0, 0), 'ajourner': (1, 0), 'affecter': (0, 0), 'décoiffer': (0, 0), 'repatiner': (1, 0), 'abroger': (1, 7), 'ennoblir': (4, 2), 'merceriser': (1, 0), 'satelliser': (0, 0), 'surjeter': (1, 34), 'resalir': (2, 2), 'flagorner': (1, 0), 'suffire': (72, 184), 'enténébrer': (0, 84), 'dépeupler': (0, 0), 'égayer': (0, 0), 'déjecter': (7, 0), 'intensifier': (0, 0), 'réassumer': (0, 0), 'siniser': (0, 0), 'boitiller': (9, 5), 'siffler': (7, 0), 'amortir': (2, 2), 'ployer': (7, 6), 'commettre': (31, 29), 'dégourrer': (1, 1), 'qualifier': (0, 0), 'réescompter': (1, 0), 'marmonner': (1, 0), 'recaser': (0, 0), 'décrire': (5, 74), 'susciter': (1, 0), 'remercier': (1, 0), 'styliser': (1, 0), 'proroger': (0, 7), 'résiner': (1, 0), 'diviser': (40, 0), 'abéquer': (1, 1), 'narguer': (1, 0), 'damer': (7, 0), 'accuser': (0, 0), 'regonfler': (7, 0), 'déshydrater': (0, 0), 'biler': (20, 0), 'retranscrire': (26, 74), 'machicoter': (9, 5), 'communautariser': (1, 0), 'plecquer': (9, 5), 'vicier': (7, 0), 'margoter': (9, 5), 'vioquir': (16, 32), 'paloter': (1, 0), 'piquer': (6, 0), 'dispenser': (0, 0), 'désenvouter': (1, 0), 'déchaumer': (1, 0), 'déclencher': (0, 0), 'navaler': (20, 1), 'gaîner': (1, 0), 'rediviser': (40, 0), 'ondoyer': (7, 6), 'débagouler': (7, 0), 'contrarier': (0, 0), 'méjuger': (19, 7), 'budgétiser': (1, 0), 'peindre': (69, 28), 'calamistrer': (1, 0), 'blasonner': (1, 0), 'désobstruer': (1, 0), 'grenailler': (1, 0), 'agréer': (38, 0), 'accompagner': (0, 0), 'brusquer': (1, 0), 'brutaliser': (1, 0), 'déniaiser': (0, 0), 'rencaisser': (1, 0), 'empierrer': (1, 0), 'bostonner': (9, 5), 'bloguer': (1, 0), 'câliner': (1, 0), 'contrebuter': (1, 0), 'inactiver': (1, 0), 'racrapoter': (20, 0), 'dandiner': (0, 0), 'encanailler': (0, 0), 'faseyer': (9, 5), 'clamper': (1, 0), 'biffetonner': (9, 5), 'exhaler': (0, 0), 'apanager': (1, 7), 'couvrir': (31, 94), 'claquemurer': (0, 0), 'équeuter': (1, 0), 'courre': (26, 1), 'voiler': (6, 0), 'embrocher': (0, 0), 'adultérer': (1, 19), 'têtuer': (1, 0), 'occuper': (0, 0), 'attoucher': (19, 0), 'appartenir': (44, 44), 'engaver': (1, 0), 'désosser': (0, 0), 'queuter': (7, 0), 'palancrer': (1, 0), 'baffer': (1, 0), 'mannequiner': (1, 0), 'rédiger': (7, 7), 'crônir': (16, 1), 'dénoncer': (0, 31), 'transmuter': (0, 0), 'aménuiser': (1, 1), 'franger': (1, 7), 'réinscrire': (10, 74), 'apeurer': (1, 0), 'museler': (1, 40), 'enquiquiner': (0, 0), 'mortaiser': (1, 0), 'faseiller': (9, 1), 'regimber': (32, 0), 'solariser': (1, 0), 'végétaliser': (1, 0), 'édenter': (1, 0), 'défatiguer': (6, 0), 'érailler': (0, 0), 'baster': (9, 5), 'réédifier': (1, 0), 'avouer': (0, 0), 'havir': (24, 2), 'rejaillir': (16, 32), 'ribouler': (9, 5), 'exténuer': (0, 0), 'déplâtrer': (1, 0), 'tacher': (6, 0), 'égaler': (1, 0), 'ganser': (1, 0), 'cintrer': (1, 0), 'ajouter': (3, 0), 'perpétuer': (0, 0), 'zwanzer': (9, 5), 'trahir': (2, 2), 'endosser': (1, 0), 'entartrer': (0, 0), 'valeter': (9, 54), 'vrombir': (37, 32), 'marmotter': (7, 0), 'fuguer': (9, 5), 'enrager': (9, 47), 'épamprer': (1, 0), 'bisegmenter': (1, 0), 'biaiser': (7, 0), 'bouillotter': (9, 5), 'catholiciser': (0, 0), 'acagnarder': (20, 0), 'confronter': (1, 0), 'durer': (9, 5), 'dénantir': (4, 2), 'encourir': (31, 13), 'octavier': (7, 0), 'guillotiner': (1, 0), 'suffoquer': (7, 0), 'malmener': (1, 39), 'mouler': (7, 0), 'hercher': (9, 5), 'zûner': (9, 5), 'nommer': (0, 0), 'chauvir': (16, 32), 'pianoter': (7, 0), 'écrouir': (4, 2), 'arroger': (20, 7), 'empaqueter': (1, 34), 'achever': (21, 21), 'assarmenter': (1, 0), 'agripper': (0, 0), 'blaster': (41, 0), 'réarranger': (1, 7), 'dépoiler': (20, 1), 'rassembler': (0, 0), 'décarboner': (21, 0), 'télédéclarer': (33, 0), 'avilir': (34, 2), 'déraisonner': (9, 5), 'dégonfler': (6, 0), 'débâtir': (4, 2), 'pilonner': (1, 0), 'refréner': (0, 35), 'échouer': (6, 0), 'presser': (6, 0), 'liguer': (0, 0), 'laminer': (1, 0), 'badger': (9, 47), 'meuler': (1, 0), 'faxer': (1, 0), 'capsuler': (1, 0), 'quimper': (9, 5), 'ferrer': (1, 0), 'lober': (1, 0), 'adverbialiser': (1, 0), 'typographier': (1, 0), 'orthogonaliser': (21, 0), 'sarcler': (1, 0), 'anthropomorphiser': (0, 0), 'bâiller': (9, 5), 'contrôler': (0, 0), 'policer': (1, 31), 'tarer': (1, 0), 'pieuter': (20, 0), 'coûter': (23, 0), 'éluer': (1, 0), 'grimer': (0, 0), 'émorfiler': (1, 0), 'jaspiner': (7, 0), 'enchausser': (1, 0), 'faignanter': (9, 5), 'enlaidir': (13, 2), 'ahurir': (4, 2), 'escher': (1, 0), 'brocanter': (7, 0), 'gonder': (1, 0), 'décharner': (1, 0), 'engager': (3, 7), 'transir': (24, 2), 'sacquer': (1, 0), 'documenter': (0, 0), 'affriander': (1, 0), 'inonder': (0, 0), 'rassir': (16, 2), 'groumer': (9, 5), 'microniser': (1, 0), 'léviger': (1, 7), 'ourder': (20, 1), 'espionner': (1, 0), 'encliqueter': (1, 34), 'rempailler': (1, 0), 'lanciner': (7, 0), 'mettre': (31, 29), 'installer': (0, 0), 'désenrayer': (1, 0), 'fasciner': (1, 0), 'couiner': (9, 5), 'décider': (19, 0), 'fricasser': (1, 0), 'brinquebaler': (7, 0), 'cajoler': (1, 0), 'chauler': (1, 0), 'envahir': (4, 2), 'cheviller': (1, 0), 'regretter': (1, 0), 'distancier': (0, 0), 'avenir': (26, 1), 'dédommager': (0, 7), 'relever': (3, 21), 'préserver': (0, 0), 'méconduire': (17, 52), 'dessécher': (0, 12), 'accoquiner': (0, 0), 'voir': (50, 125), 'poisser': (7, 0), 'déneiger': (1, 7), 'détricoter': (1, 0), 'esquiver': (0, 0), 'débotter': (0, 0), 'meurtrir': (11, 2), 'surveiller': (0, 0), 'saietter': (1, 0), 'démarabouter': (1, 0), 'fonctionnaliser': (41, 0), 'euthanasier': (1, 0), 'formicaliser': (1, 0), 'cocoter': (9, 5), 'ratiociner': (9, 5), 'zébrer': (1, 84), 'apposer': (1, 0), 'hébéter': (0, 16), 'reconquérir': (10, 24), 'bouffer': (6, 0), 'coposséder': (1, 4), 'embourrer': (0, 0), 'brimer': (1, 0), 'fonctionnariser': (1, 0), 'sourciller': (9, 5), 'affairer': (20, 0), 'noyer': (0, 6), 'porter': (46, 0), 'vermiculer': (9, 5), 'compartimenter': (1, 0), 'moderniser': (0, 0), 'monopoliser': (1, 0), 'gléner': (1, 35), 'maratoner': (9, 5), 'ramoner': (7, 0), 'importer': (23, 0), 'manger': (40, 7), 'déporter': (40, 0), 'déséquiper': (0, 0), 'croître': (25, 97), 'sprinter': (9, 5), 'abimer': (0, 0), 'désaciérer': (1, 19), 'empapaouter': (1, 0), 'ester': (9, 1), 'piéter': (32, 16), 'sukkeler': (9, 33), 'psychologiser': (1, 0), 'reboucher': (0, 0), 'encaserner': (1, 0), 'éditionner': (1, 0), 'naviguer': (9, 5), 'plastronner': (7, 0), 'opérationnaliser': (1, 0), 'manutentionner': (1, 0), 'gémir': (24, 2), 'feuilletiser': (1, 0), 'trinquer': (9, 5), 'rencogner': (40, 0), 'inhaler': (1, 0), 'encloquer': (1, 1), 'enchetarder': (1, 1), 'asphalter': (1, 0), 'décéder': (71, 4), 'carter': (1, 0), 'dévernir': (4, 2), 'didactiser': (33, 0), 'désulfiter': (1, 0), 'bâtir': (2, 2), 'épousseter': (1, 34), 'hériter': (12, 5), 'interconnecter': (1, 0), 'exonder': (20, 0), 'administrer': (0, 0), 'dulcifier': (1, 0), 'mijoter': (6, 0), 'guider': (0, 0), 'piluler': (9, 5), 'ébaucher': (0, 0), 'arc-bouter': (0, 0), 'escrimer': (20, 0), 'parachever': (1, 21), 'retourner': (6, 0), 'braconner': (7, 0), 'décontracter': (0, 0), 'désenflammer': (1, 0), 'désallouer': (1, 0), 'panthéoniser': (1, 0), 'féminiser': (0, 0), 'désinhiber': (1, 0), 'catir': (4, 2), 'boycotter': (1, 0), 'lier': (22, 0), 'martyriser': (1, 0), 'nucléer': (1, 0), 'décerveler': (1, 40), 'tiller': (1, 0), 'empêtrer': (0, 0), 'déciller': (0, 0), 'empuantir': (4, 2), 'diagonaliser': (1, 0), 'tisonner': (7, 0), 'exfolier': (0, 0), 'actionner': (1, 0), 'chagriner': (1, 0), 'présumer': (38, 0), 'chouraver': (1, 0), 'iouler': (9, 5), 'dégoutter': (9, 5), 'discounter': (1, 0), 'actualiser': (1, 0), 'plaire': (72, 81), 'hypothéquer': (0, 67), 'effarer': (0, 0), 'pérégriner': (9, 5), 'christianiser': (1, 0), 'remembrer': (1, 0), 'surfiler': (1, 0), 'retomber': (71, 0), 'étager': (0, 7), 'infliger': (38, 7), 'flasher': (7, 0), 'excéder': (1, 4), 'épucer': (0, 31), 'seringuer': (1, 0), 'sonder': (1, 0), 'entraccorder': (65, 88), 'remobiliser': (0, 0), 'crucifier': (1, 0), 'atermoyer': (9, 51), 'rabioter': (7, 0), 'survirer': (1, 0), 'staliniser': (1, 0), 'redéfinir': (4, 2), 'insculper': (1, 0), 'profiler': (0, 0), 'dératiser': (1, 0), 'congédier': (1, 0), 'pâlir': (24, 2), 'émulsionner': (1, 0), 'condimenter': (41, 0), 'vautrer': (20, 0), 'hucher': (1, 0), 'embaumer': (7, 0), 'spammer': (7, 0), 'tringler': (1, 0), 'astiquer': (1, 0), 'cumuler': (1, 0), 'nover': (7, 0), 'déculasser': (1, 0), 'discursiviser': (1, 1), 'dilacérer': (1, 19), 'infatuer': (0, 0), 'interclasser': (1, 0), 'réanimer': (1, 0), 'humilier': (0, 0), 'marginer': (1, 0), 'railler': (6, 0), 'xyloglotter': (53, 5), 'métastaser': (7, 0), 'déchaperonner': (1, 0), 'repenser': (7, 0), 'restyler': (1, 1), 'gribouiller': (7, 0), 'refouiller': (1, 0), 'emmerder': (0, 0), 'blettir': (16, 32), 'vibrer': (7, 0), 'fanatiser': (0, 0), 'copermuter': (1, 0), 'sonoriser': (1, 0), 'jouailler': (9, 5), 'protéger': (0, 8), 'décuver': (1, 0), 'oranger': (1, 7), 'occidentaliser': (0, 0), 'disparaitre': (68, 14), 'entorser': (9, 5), 'islamiser': (0, 0), 'voguer': (9, 5), 'renaitre': (42, 152), 'colleter': (0, 34), 'warranter': (1, 0), 'tondre': (56, 45), 'pocharder': (20, 0), 'enneiger': (1, 7), 'écobuer': (1, 0), 'piler': (7, 0), 'épaufrer': (1, 0), 'capitonner': (0, 0), 'éthoxyler': (41, 0), 'enchanteler': (1, 1), 'oublier': (6, 0), 'barboter': (7, 0), 'boxonner': (9, 5), 'écheveler': (1, 40), 'sulfiter': (1, 0), 'décrédibiliser': (1, 0), 'enchérir': (37, 2), 'roussir': (24, 2), 'joindre': (5, 28), 'désépaissir': (4, 2), 'illégaliser': (33, 0), 'vriller': (7, 0), 'surexposer': (1, 0), 'pochetronner': (20, 0), 'tûter': (7, 0), 'foisonner': (9, 5), 'ornementer': (1, 0), 'manquer': (46, 0), 'subdiviser': (1, 0), 'ascensionner': (1, 0), 'charlater': (9, 5), 'distordre': (10, 45), 'calfater': (1, 0), 'infester': (1, 0), 'compétitionner': (53, 5), 'patrouiller': (9, 5), 'détrôner': (1, 0), 'bisser': (1, 0), 'vêler': (1, 0), 'flanquer': (0, 0), 'enchevêtrer': (0, 0), 'saurer': (1, 0), 'régenter': (7, 0), 'goutter': (9, 5), 'insulter': (46, 0), 'moufler': (1, 0), 'hydrolyser': (1, 0), 'rebeller': (20, 0), 'soirer': (9, 5), 'bocarder': (1, 0), 'démurger': (7, 7), 'modifier': (40, 0), 'animaliser': (1, 0), 'poiroter': (9, 5), 'désengourdir': (4, 2), 'dévaster': (1, 0), 'roupiller': (9, 5), 'magner': (20, 0), 'embouer': (7, 0), 'agiter': (0, 0), 'prépayer': (1, 0), 'bramer': (9, 5), 'boulocher': (9, 5), 'tournasser': (1, 0), 'abjurer': (7, 0), 'abeaudir': (8, 1), 'embastiller': (1, 0), 'amplifier': (0, 0), 'officialiser': (1, 0), 'démettre': (10, 29), 'détraquer': (0, 0), 'lacaniser': (7, 1), 'poutser': (1, 0), 'souper': (9, 5), 'charroyer': (1, 6), 'décompléter': (41, 16), 'anodiser': (1, 0), 'copolymériser': (7, 0), 'égueuler': (1, 0), 'conjecturer': (41, 0), 'esquinter': (0, 0), 'grignoter': (7, 0), 'cambrioler': (1, 0), 'cliquoter': (9, 5), 'encasteler': (20, 22), 'déresponsabiliser': (1, 0), 'altérer': (0, 19), 'intriguer': (1, 0), 'tartir': (16, 32), 'coïter': (9, 5), 'décondenser': (1, 0), 'capahuter': (1, 0), 'plaquer': (0, 0), 'enjoncer': (1, 31), 'réformer': (0, 0), 'métisser': (1, 0), 'merdoyer': (9, 51), 'moiser': (1, 0), 'détourner': (0, 0), 'attiser': (1, 0), 'emmieller': (1, 0), 'engluer': (0, 0), 'triompher': (12, 5), 'démentir': (5, 87), 'profaner': (1, 0), 'récapituler': (1, 0), 'étuver': (1, 0), 'bader': (41, 0), 'condamner': (1, 0), 'déchanter': (9, 5), 'pagnoter': (32, 5), 'attester': (1, 0), 'devancer': (1, 31), 'contre-passer': (1, 0), 'lacer': (0, 31), 'tournebouler': (1, 0), 'invalider': (1, 0), 'enfermer': (0, 0), 'chambrer': (1, 0), 'érayer': (1, 0), 'remilitariser': (0, 0), 'débureaucratiser': (1, 0), 'aplomber': (0, 0), 'détoner': (9, 5), 'affouager': (1, 7), 'décreuser': (1, 0), 'breller': (1, 0), 'tempêter': (9, 5), 'radiobaliser': (1, 0), 'castrer': (1, 0), 'inciter': (1, 0), 'débudgétiser': (1, 0), 'litroner': (9, 1), 'déloquer': (0, 0), 'sécher': (6, 12), 'préjuger': (38, 7), 'recolorer': (1, 0), 'encrer': (7, 0), 'texturiser': (1, 0), 'baigner': (6, 0), 'trusquiner': (1, 0), 'attenter': (12, 5), 'poêler': (1, 0), 'masser': (0, 0), 'renégocier': (1, 0), 'aiguilleter': (1, 34), 'patronner': (1, 0), 'pérorer': (9, 5), 'teinter': (0, 0), 'démuseler': (1, 40), 'ensuquer': (1, 0), 'molester': (1, 0), 'pervibrer': (1, 0), 'alterner': (7, 0), 'assumer': (6, 0), 'catégoriser': (0, 0), 'théâtraliser': (7, 0), 'revasculariser': (1, 0), 'exercer': (3, 31), 'coupailler': (1, 0), 'enceindre': (26, 28), 'respecter': (0, 0), 'douiller': (9, 5), 'dérégler': (0, 112), 'lâcher': (7, 0), 'râper': (1, 0), 'admettre': (27, 29), 'emmotter': (1, 0), 'klaxonner': (7, 0), 'sanctionner': (1, 0), 'inverser': (0, 0), 'écailler': (0, 0), 'signer': (21, 0), 'caraméliser': (6, 0), 'philosopher': (9, 5), 'surfer': (9, 5), 'chopiner': (9, 5), 'renvelopper': (1, 0), 'chorégraphier': (7, 0), 'forfaire': (77, 132), 'pardonner': (6, 0), 'rétrograder': (7, 0), 'consommer': (6, 0), 'démaçonner': (1, 0), 'prêcher': (7, 0), 'champagniser': (1, 0), 'frotter': (6, 0), 'essuyer': (0, 6), 'cornancher': (0, 0), 'cognoter': (9, 5), 'rebâtir': (4, 2), 'contrecalquer': (1, 0), 'enfarger': (0, 7), 'déchlorurer': (1, 0), 'baqueter': (1, 34), 'extourner': (1, 0), 'tonitruer': (9, 5), 'emparquer': (1, 0), 'déculpabiliser': (1, 0), 'satiner': (1, 0), 'dépenser': (0, 0), 'palissader': (1, 0), 'incendier': (1, 0), 'prédire': (10, 86), 'avitailler': (0, 0), 'épicer': (1, 31), 'striduler': (7, 0), 'houblonner': (1, 0), 'ensoleiller': (1, 0), 'surmener': (0, 39), 'récoler': (1, 0), 'ordonner': (6, 0), 'moutonner': (9, 5), 'déclaveter': (1, 34), 'exciser': (1, 0), 'merder': (9, 5), 'nuancer': (1, 31), 'mécontenter': (1, 0), 'grimacer': (9, 23), 'enserrer': (1, 0), 'reprendre': (5, 46), 'raccourcir': (13, 2), 'ruisseler': (9, 33), 'éclairer': (6, 0), 'singulariser': (0, 0), 'cogérer': (1, 19), 'saupoudrer': (1, 0), 'emmurer': (0, 0), 'rembourrer': (1, 0), 'bastillonner': (1, 0), 'retreindre': (26, 1), 'lisser': (1, 0), 'enchatonner': (1, 0), 'sauver': (6, 0), 'suppurer': (9, 5), 'remplir': (15, 2), 'revisser': (1, 0), 'écouvillonner': (1, 0), 'michetonner': (9, 5), 'déshabiller': (0, 0), 'mésuser': (58, 5), 'entrelarder': (1, 0), 'cérébraliser': (41, 0), 'flûter': (7, 0), 'pitonner': (9, 5), 'fayoter': (9, 5), 'cramponner': (0, 0), 'centrer': (7, 0), 'débiter': (1, 0), 'prédisposer': (7, 0), 'entrer': (41, 0), 'pelotonner': (0, 0), 'guéer': (1, 0), 'caïmanter': (1, 0), 'réutiliser': (1, 0), 'jogger': (9, 141), 'panser': (0, 0), 'soutacher': (1, 0), 'imbriquer': (0, 0), 'droguer': (6, 0), 'clipper': (0, 0), 'cliver': (0, 0), 'happer': (7, 0), 'nocer': (9, 23), 'bousiller': (7, 0), 'téléguider': (1, 0), 'messoir': (9, 148), 'surmédiatiser': (41, 0), 'tchadiser': (1, 0), 'gruger': (1, 7), 'décimer': (1, 0), 'dénitrer': (1, 0), 'unifier': (0, 0), 'rapatrier': (0, 0), 'évanouir': (8, 2), 'enfoirer': (0, 1), 'percuter': (7, 0), 'écharner': (1, 0), 'panner': (1, 0), 'combattre': (45, 3), 'régurgiter': (1, 0), 'remuer': (6, 0), 'historier': (1, 0), 'désoperculer': (1, 0), 'affranchir': (36, 2), 'immortaliser': (0, 0), 'rigoler': (9, 5), 'craqueler': (0, 40), 'vêtir': (31, 115), 'herscher': (9, 5), 'désendetter': (20, 0), 'vulganiser': (1, 0), 'subsumer': (1, 0), 'consterner': (1, 0), 'souloir': (43, 1), 'gouverner': (6, 0), 'concurrencer': (1, 31), 'arguer': (38, 0), 'échoir': (35, 193), 'prétendre': (18, 45), 'débuller': (1, 0), 'salir': (15, 2), 'acidifier': (0, 0), 'malter': (1, 0), 'boetter': (1, 0), 'nitrurer': (1, 0), 'impacter': (1, 0), 'rouscailler': (9, 5), 'alléguer': (1, 37), 'diffracter': (1, 0), 'incinérer': (1, 19), 'goaler': (1, 0), 'éreinter': (0, 0), 'permanenter': (1, 0), 'irriter': (0, 0), 'groûler': (9, 5), 'vermifuger': (41, 7), 'touer': (0, 0), 'survoler': (1, 0), 'écrivasser': (1, 0), 'stéréotyper': (1, 0), 'saccharifier': (1, 0), 'excaver': (1, 0), 'bituminer': (1, 0), 'dénasaliser': (1, 0), 'tripoter': (7, 0), 'bailler': (1, 0), 'enfirouaper': (1, 0), 'accouer': (1, 0), 'étanchéifier': (1, 0), 'convoiter': (7, 0), 'boursoufler': (0, 0), 'institutionnaliser': (0, 0), 'capoter': (7, 0), 'mugueter': (1, 34), 'suréquiper': (1, 0), 'saouler': (0, 0), 'pourrir': (13, 2), 'rentrer': (7, 0), 'abscondre': (10, 1), 'dédier': (1, 0), 'retenter': (1, 0), 'recadrer': (1, 0), 'achopper': (29, 0), 'pruner': (1, 1), 'désencrasser': (1, 0), 'stigmatiser': (1, 0), 'savater': (1, 0), 'désenlaidir': (24, 2), 'plaindre': (10, 28), 'coucher': (6, 0), 'rajuster': (0, 0), 'retoquer': (33, 0), 'recoudre': (10, 93), 'réélire': (27, 142), 'choir': (43, 69), 'tercer': (1, 31), 'repaître': (10, 15), 'échafauder': (7, 0), 'réamorcer': (1, 31), 'cailler': (6, 0), 'surinterpréter': (1, 16), 'caler': (6, 0), 'golfer': (53, 5), 'organsiner': (1, 0), 'désembobiner': (1, 0), 'céder': (64, 4), 'extérioriser': (0, 0), 'claqueter': (9, 54), 'reverrouiller': (0, 0), 'appeler': (3, 40), 'occurrer': (53, 5), 'racabouillir': (43, 1), 'plumer': (6, 0), 'converger': (9, 47), 'javer': (1, 0), 'pique-niquer': (9, 5), 'maximiser': (1, 0), 'paraisonner': (1, 0), 'aurifier': (1, 0), 'surfaire': (26, 89), 'convenir': (67, 10), 'jouer': (6, 0), 'négrifier': (1, 0), 'départir': (10, 87), 'siroter': (1, 0), 'loucher': (9, 5), 'tourbillonner': (9, 5), 'autoriser': (22, 0), 'délégitimer': (1, 0), 'gletter': (9, 5), 'cuber': (7, 0), 'opaliser': (1, 0), 'rentrouvrir': (26, 94), 'retenir': (5, 10), 'excréter': (1, 16), 'sculpter': (7, 0), 'reconsidérer': (1, 19), 'enjoliver': (0, 0), 'désenrhumer': (1, 0), 'aciérer': (1, 19), 'boumer': (54, 61), 'répudier': (1, 0), 'nacrer': (0, 0), 'redémontrer': (0, 0), 'japper': (9, 5), 'idiotifier': (1, 0), 'pâtisser': (9, 5), 'pacager': (7, 7), 'investir': (15, 2), 'encrypter': (1, 0), 'envisager': (1, 7), 'ventouser': (1, 0), 'parfiler': (1, 0), 'cacarder': (9, 5), 'déplier': (0, 0), 'instancier': (1, 0), 'ramollir': (2, 2), 'retrancher': (0, 0), 'écolleter': (0, 34), 'lichoter': (7, 1), 'effeuiller': (0, 0), 'recapturer': (41, 0), 'ouvrir': (50, 94), 'licencier': (1, 0), 'dégager': (6, 7), 'gamberger': (7, 7), 'reformer': (0, 0), 'moraliser': (7, 0), 'désapprouver': (7, 0), 'tabouiser': (1, 0), 'miter': (32, 0), 'dévouer': (0, 0), 'soupçonner': (1, 0), 'rembarrer': (1, 0), 'néguer': (20, 0), 'embobiner': (1, 0), 'redécorer': (1, 0), 'abominer': (1, 0), 'griffonner': (7, 0), 'semer': (7, 75), 'ligoter': (1, 0), 'briguer': (1, 0), 'ébouler': (6, 0), 'essanger': (1, 7), 'vousoyer': (0, 6), 'enrôler': (0, 0), 'contre-murer': (1, 0), 'exsuder': (7, 0), 'iriser': (0, 0), 'encoffrer': (1, 0), 'discerner': (1, 0), 'épater': (0, 0), 'acétifier': (1, 0), 'embidonner': (1, 0), 'obnubiler': (1, 0), 'sous-virer': (9, 5), 'faséyer': (9, 130), 'embroussailler': (0, 0), 'occulter': (1, 0), 'béqueter': (1, 34), 'cycliser': (1, 0), 'dépiter': (0, 0), 'aligner': (0, 0), 'ci-gisent': (43, 71), 'étaler': (6, 0), 'renvider': (1, 0), 'fréquenter': (6, 0), 'adirer': (1, 27), 'accoter': (0, 0), 'désamianter': (1, 0), 'égrapper': (1, 0), 'raffûter': (1, 0), 'larguer': (1, 0), 'discontinuer': (9, 1), 'prévariquer': (9, 5), 'enflécher': (1, 12), 'gérer': (1, 19), 'paraître': (25, 15), 'vaguer': (7, 0), 'fricoter': (7, 0), 'repleuvoir': (97, 158), 'désambiguïser': (1, 0), 'confédérer': (1, 19), 'émigrer': (9, 5), 'conjoindre': (26, 28), 'fraîchir': (16, 32), 'diphtonguer': (1, 0), 'beurrer': (0, 0), 'amocher': (0, 0), 'cherrer': (9, 5), 'clamer': (1, 0), 'chambouler': (1, 0), 'démissionner': (12, 5), 'opposer': (0, 0), 'chouiner': (9, 5), 'momifier': (0, 0), 'déterrer': (1, 0), 'rembarquer': (6, 0), 'couronner': (0, 0), 'dévitaminer': (33, 0), 'démanteler': (1, 22), 'couiller': (1, 0), 'irriguer': (1, 0), 'scalper': (1, 0), 'réincarcérer': (1, 19), 'substantiver': (1, 0), 'tacler': (1, 0), 'agrandir': (15, 2), 'hiberner': (9, 5), 'affréter': (1, 16), 'ôter': (0, 0), 'cimenter': (0, 0), 'encaquer': (1, 0), 'gréer': (1, 0), 'ouvrager': (1, 7), 'surdoser': (33, 0), 'proscrire': (56, 74), 'décesser': (1, 0), 'dégripper': (1, 0), 'africaniser': (0, 0), 'rembrunir': (2, 2), 'épisser': (1, 0), 'becqueter': (1, 34), 'enjuguer': (1, 0), 'hiérarchiser': (1, 0), 'emmortaiser': (1, 0), 'enrucher': (1, 0), 'étamper': (1, 0), 'allouer': (0, 0), 'gangréner': (0, 35), 'réajuster': (0, 0), 'désétamer': (1, 0), 'simuler': (1, 0), 'mouvoir': (10, 151), 'saligoter': (1, 0), 'gougnotter': (1, 1), 'zieuter': (1, 0), 'guincher': (9, 5), 'celer': (1, 22), 'jobarder': (1, 0), 'stimuler': (0, 0), 'chloroformer': (1, 0), 'dérondir': (4, 1), 'préfinancer': (33, 31), 'épincer': (1, 31), 'saccarifier': (1, 0), 'chuinter': (9, 5), 'casser': (6, 0), 'bafouiller': (7, 0), 'bomber': (7, 0), 'jaser': (9, 5), 'ensauver': (20, 0), 'allier': (0, 0), 'rapprendre': (26, 1), 'décaler': (1, 0), 'succomber': (12, 5), 'répartir': (2, 2), 'besogner': (9, 5), 'froufrouter': (9, 5), 'hormoner': (1, 0), 'pister': (1, 0), 'visser': (0, 0), 'chevroter': (9, 5), 'dégommer': (1, 0), 'carier': (0, 0), 'imputer': (19, 0), 'redisposer': (1, 0), 'pronostiquer': (1, 0), 'remparder': (0, 1), 'surimposer': (0, 0), 'complaire': (44, 81), 'arsouiller': (20, 0), 'renchaîner': (1, 0), 'réceptionner': (1, 0), 'bombarder': (1, 0), 'stipendier': (1, 0), 'décâbler': (0, 0), 'dédaigner': (38, 0), 'malfaire': (43, 1), 'sangloter': (9, 5), 'cônir': (4, 2), 'perforer': (1, 0), 'frousser': (9, 5), 'facturer': (1, 0), 'revisionner': (1, 0), 'lustrer': (1, 0), 'emmétrer': (1, 70), 'scier': (7, 0), 'nasiller': (7, 0), 'détrousser': (1, 0), 'scripter': (6, 0), 'biglouser': (9, 5), 'bastonner': (0, 0), 'pendre': (5, 45), 'domestiquer': (1, 0), 'papoter': (9, 5), 'brêler': (1, 0), 'surentraîner': (1, 0), 'autodétruire': (17, 52), 'mythifier': (7, 0), 'imager': (1, 7), 'repasser': (6, 0), 'défouler': (0, 0), 'subordonner': (0, 0), 'glaiser': (1, 0), 'assister': (7, 0), 'rengrener': (1, 39), 'rétrécir': (13, 2), 'tuber': (1, 0), 'accumuler': (6, 0), 'minauder': (9, 5), 'maganer': (0, 0), 'disgracier': (1, 0), 'brimbaler': (7, 0), 'envouter': (1, 0), 'perméabiliser': (1, 0), 'secouer': (0, 0), 'lotionner': (1, 0), 'recalibrer': (1, 0), 'empirer': (6, 0), 'méfier': (20, 0), 'clore': (56, 77), 'démembrer': (1, 0), 'transistoriser': (1, 0), 'feinter': (7, 0), 'embêter': (0, 0), 'annoter': (1, 0), 'dévisager': (1, 7), 'fluidiser': (1, 0), 'désirer': (1, 0), 'scotomiser': (1, 0), 'détromper': (0, 0), 'gueuler': (7, 0), 'brocarder': (1, 0), 'remettre': (18, 29), 'déboiser': (1, 0), 'denteler': (1, 40), 'essoriller': (1, 0), 'dérayer': (7, 0), 'buvoter': (9, 5), 'suifer': (1, 0), 'entre-déchirer': (65, 88), 'déferler': (7, 0), "entr'égorger": (65, 120), 'limoner': (1, 0), 'allumer': (0, 0), 'surcharger': (1, 7), 'capter': (1, 0), 'aromatiser': (1, 0), 'partir': (35, 87), 'polluer': (7, 0), 'estomaquer': (1, 0), 'maintenir': (5, 10), 'dirimer': (1, 0), 'fleurdeliser': (1, 0), 'panifier': (1, 0), 'envoiler': (20, 0), 'adoucir': (34, 2), 'gésir': (82, 135), 'octupler': (1, 0), 'matelasser': (1, 0), 'gravillonner': (1, 0), 'vitrifier': (1, 0), 'blanchoyer': (41, 51), 'ressuer': (7, 0), 'miner': (1, 0), 'enferrer': (0, 0), 'avaler': (1, 0), 'chiper': (1, 0), 'détacher': (0, 0), 'attendrir': (34, 2), 'moquetter': (1, 0), 'accoupler': (0, 0), 'valser': (7, 0), 'schlinguer': (9, 5), 'séparer': (0, 0), 'cloquer': (7, 0), 'rafraîchir': (69, 2), 'juxtaposer': (1, 0), 'détroquer': (1, 0), 'différentier': (0, 1), 'squatter': (1, 0), 'rauquer': (9, 5), 'thésauriser': (7, 0), 'financiariser': (1, 0), 'causer': (7, 0), 'prépositionner': (0, 0), 'réindustrialiser': (1, 0), 'convaincre': (5, 91), 'démanger': (7, 7), 'fossiliser': (0, 0), 'fouailler': (1, 0), 'reléguer': (1, 37), 'climatiser': (1, 0), 'démultiplexer': (1, 0), 'tirer': (46, 0), 'notifier': (1, 0), 'polariser': (0, 0), 'aguicher': (1, 0), 'enjoindre': (49, 28), 'sourcer': (1, 31), 'refriser': (6, 0), 'accorer': (1, 0), 'calandrer': (1, 0), 'effranger': (0, 7), 'disconvenir': (68, 10), 'coder': (7, 0), 'empoigner': (0, 0), 'étriller': (1, 0), 'sulfoner': (1, 0), 'démazouter': (1, 0), 'louveter': (9, 54), 'décrêper': (1, 0), 'escompter': (1, 0), 'compéter': (9, 56), 'cailleter': (9, 54), 'réaccoutumer': (0, 0), 'entamer': (1, 0), 'doigter': (7, 0), 'enrhuner': (1, 1), 'escalader': (1, 0), 'caviarder': (1, 0), 'égravillonner': (1, 0), 'agacer': (0, 31), 'entretailler': (20, 0), 'chiffonner': (6, 0), 'dessiller': (0, 0), 'carapater': (20, 0), 'démobiliser': (6, 0), 'apparaître': (42, 15), 'ameuter': (0, 0), 'entremettre': (17, 29), 'nonupler': (41, 0), 'reparaitre': (43, 14), 'caleter': (32, 34), 'matraquer': (1, 0), 'déconsidérer': (0, 19), 'fenêtrer': (1, 0), 'scarifier': (1, 0), 'asséner': (1, 35), 'bêcher': (7, 0), 'moissonner': (1, 0), 'censurer': (41, 0), 'simplifier': (6, 0), 'désouffler': (1, 0), 'transborder': (1, 0), 'demander': (0, 0), 'grisonner': (9, 5), 'ioder': (1, 0), 'bouchonner': (6, 0), 'estamper': (1, 0), 'déthéiner': (33, 0), 'fidéliser': (1, 0), 'partouzer': (9, 5), 'bottiner': (7, 0), 'entreheurter': (65, 88), 'antiquer': (1, 0), 'cosser': (9, 5), 'soupeser': (1, 113), 'reclouer': (1, 0), 'remâcher': (1, 0), 'sporuler': (9, 5), 'francophoniser': (1, 0), 'replonger': (6, 7), 'diviniser': (1, 0), 'godiner': (20, 0), 'désodoriser': (1, 0), 'requérir': (26, 24), 'élucider': (1, 0), 'gaminer': (9, 5), 'fasciser': (1, 0), 'extirper': (0, 0), 'cryptographier': (1, 0), 'veiner': (1, 0), 'grésiller': (54, 5), 'sulfurer': (1, 0), 'revendre': (10, 45), 'magoter': (1, 0), 'réimperméabiliser': (1, 0), 'crapoter': (9, 5), 'rameuter': (0, 0), 'cotir': (4, 2), 'resaler': (1, 0), 'endurcir': (34, 2), 'toiser': (0, 0), 'gaspiller': (1, 0), 'contre-buter': (1, 0), 'jodler': (9, 5), 'désenchanter': (1, 0), 'dépoter': (1, 0), 'fanfrelucher': (1, 0), 'mécher': (1, 12), 'limousiner': (1, 0), 'tournailler': (9, 5), 'aveindre': (26, 28), 'ballaster': (1, 0), 'paresser': (9, 5), 'compliquer': (0, 0), 'frétiller': (9, 5), 'déviroler': (1, 0), 'désindustrialiser': (0, 0), 'convertir': (36, 2), 'teseter': (1, 34), 'ressourcer': (0, 31), 'dévisser': (7, 0), 'gainer': (1, 0), 'cantonner': (6, 0), 'frigorifier': (1, 0), 'abonder': (9, 5), 'valouser': (1, 0), 'tambouriner': (7, 0), 'gourmander': (1, 0), 'révolter': (0, 0), 'enchemiser': (1, 0), 'revaloir': (26, 170), 'tarder': (12, 5), 'indemniser': (0, 0), 'coller': (46, 0), 'euphémiser': (21, 0), 'charrioter': (1, 0), 'ennoyer': (1, 6), 'assurer': (6, 0), 'imprimer': (0, 0), 'vociférer': (7, 19), 'préluder': (12, 5), 'copier': (7, 0), 'masculiniser': (0, 0), 'fêter': (1, 0), 'baver': (9, 5), 'désoccuper': (1, 0), 'abonner': (0, 0), 'sclérifier': (0, 0), 'platiner': (1, 0), 'enclore': (26, 109), 'draper': (0, 0), 'entasser': (0, 0), 'caramboler': (6, 0), 'recompiler': (1, 0), 'tricoter': (7, 0), 'saisonner': (9, 5), 'dédifférencier': (20, 0), 'désagréger': (0, 8), 'avoir': (52, 53), 'enrailler': (1, 0), 'partouser': (9, 5), 'bateler': (9, 33), 'sacrer': (7, 0), 'rembourser': (1, 0), 'flibuster': (7, 0), 'enchaperonner': (1, 0), 'interfacer': (1, 31), 'désunir': (2, 2), 'prostituer': (0, 0), 'babeler': (9, 33), 'stripper': (1, 0), 'expatrier': (0, 0), 'retoucher': (38, 0), 'caséifier': (1, 0), 'empanacher': (1, 0), 'abeausir': (8, 1), 'ébarber': (1, 0), 'staffer': (1, 0), 'mandater': (1, 0), 'entoiler': (1, 0), 'exhorter': (0, 0), 'déjeter': (0, 34), 'enfûter': (1, 0), 'redéposer': (21, 0), 'démarcher': (1, 0), 'bannir': (4, 2), 'transparaître': (43, 79), 'pyramider': (9, 5), 'barder': (54, 55), 'écraser': (6, 0), 'nervurer': (1, 0), 'embroncher': (1, 0), 'ajuster': (0, 0), 'décarreler': (1, 40), 'gâter': (0, 0), 'flouer': (1, 0), 'démieller': (1, 0), 'délacer': (1, 31), 'réorienter': (0, 0), 'anesthésier': (0, 0), 'zipper': (1, 0), 'nantir': (2, 2), 'réexpédier': (1, 0), 'renâcler': (9, 5), 'holographier': (1, 0), 'particulariser': (0, 0), 'descendre': (56, 45), 'surfrapper': (1, 0), 'assujettir': (48, 2), 'grouper': (6, 0), 'préaviser': (1, 0), 'immerger': (0, 7), 'diffamer': (1, 0), 'saisir': (34, 2), 'desseller': (1, 0), 'sauter': (7, 0), 'affriter': (1, 0), 'bondonner': (1, 0), 'amaigrir': (2, 2), 'obliger': (22, 7), 'révolutionner': (1, 0), 'clasher': (53, 5), 'dénazifier': (1, 0), 'morfaler': (9, 5), 'vaseliner': (1, 0), 'éfaufiler': (1, 0), 'dépiquer': (1, 0), 'rupiner': (9, 5), 'dépurer': (1, 0), 'ressemer': (0, 75), 'enchifrener': (1, 39), 'épépiner': (1, 0), 'darder': (6, 0), 'généraliser': (0, 0), 'cokéfier': (1, 0), 'recarder': (1, 0), 'délinéariser': (33, 0), 'plainer': (1, 0), 'abraquer': (1, 1), 'mévendre': (26, 45), 'gougnoter': (1, 1), 'rengréner': (1, 35), 'maltraiter': (1, 0), 'fransquillonner': (9, 5), 'cémenter': (1, 0), 'marbrer': (1, 0), 'délatter': (0, 0), 'mécroire': (26, 95), 'troquer': (1, 0), 'énoncer': (0, 31), 'grincher': (1, 0), 'verser': (6, 0), 'désendoctriner': (40, 0), 'morfler': (1, 0), 'bestialiser': (40, 0), 'autocompenser': (40, 0), 'yodiser': (1, 0), 'dupliquer': (1, 0), 'corrompre': (5, 92), 'époutir': (4, 2), 'rapiécer': (1, 166), 'réséquer': (1, 67), 'diverger': (9, 47), 'rancir': (59, 2), 'pulluler': (9, 5), 'domicilier': (1, 0), 'déramer': (7, 0), 'encadrer': (21, 0), 'syndiquer': (0, 0), 'ardoiser': (1, 0), 'poquer': (9, 5), 'désannexer': (1, 0), 'surtitrer': (1, 0), 'ennuager': (0, 7), 'viroler': (1, 0), 'gercer': (6, 31), 'charmer': (41, 0), 'démystifier': (1, 0), 'déférer': (38, 19), 'désempeser': (1, 113), 'interrompre': (10, 92), 'écouter': (21, 0), 'dépister': (1, 0), 'éventrer': (0, 0), 'indisposer': (1, 0), 'ébahir': (2, 2), 'grillager': (1, 7), 'légitimer': (1, 0), 'microfilmer': (1, 0), 'désamarrer': (1, 0), 'tambouler': (9, 5), 'permettre': (18, 29), 'abstenir': (17, 10), 'débraguetter': (0, 0), 'déchiffrer': (7, 0), 'dégurgiter': (1, 0), 'bagotter': (9, 5), 'insinuer': (0, 0), 'raser': (0, 0), 'scotcher': (1, 0), 'insonoriser': (1, 0), 'ferrailler': (9, 5), 'jarreter': (7, 34), 'suturer': (1, 0), 'préméditer': (38, 0), 'cliqueter': (9, 54), 'rechuter': (9, 5), 'cadencer': (1, 31), 'fourgonner': (9, 5), 'estranciner': (20, 0), 'renquiller': (1, 0), 'accœurer': (0, 1), 'baller': (9, 5), 'déhancher': (0, 0), 'dessangler': (0, 0), 'piqueter': (1, 34), 'brouiller': (0, 0), 'cesser': (41, 0), 'humer': (1, 0), 'consteller': (1, 0), 'auditionner': (7, 0), 'supplier': (1, 0), 'tapager': (9, 47), 'rustiquer': (1, 0), 'dépanner': (1, 0), 'recréer': (0, 0), 'surenchérir': (16, 32), 'persifler': (1, 0), 'persister': (9, 5), 'glaviotter': (9, 5), 'réintégrer': (1, 114), 'coextruder': (41, 0), 'anamostoser': (0, 0), 'verticaliser': (21, 0), 'refluer': (9, 5), 'décriminaliser': (1, 0), 'dérader': (9, 5), 'affermir': (2, 2), 'émerger': (9, 47), 'ankyloser': (0, 0), 'soqueter': (9, 54), 'brasser': (0, 0), 'inféoder': (0, 0), 'nitrater': (1, 0), 'persévérer': (9, 25), 'engranger': (1, 7), 'crocher': (7, 0), 'téter': (7, 16), 'méthaniser': (1, 0), 'coprésider': (64, 0), 'dépointer': (1, 0), 'briefer': (1, 0), 'récompenser': (0, 0), 'rencarder': (1, 0), 'aouter': (1, 0), 'caillebotter': (1, 0), 'raplatir': (4, 2), 'louver': (1, 0), 'sextupler': (7, 0), 'gabionner': (1, 0), 'réarmer': (6, 0), 'amasser': (6, 0), 'paitre': (73, 156), 'blasphémer': (7, 57), 'issir': (43, 134), 'racornir': (2, 2), 'sursaturer': (1, 0), 'dénationaliser': (1, 0), 'regazonner': (1, 0), 'endauber': (1, 0), 'socratiser': (9, 5), 'craqueter': (9, 54), 'dégorger': (6, 7), 'venger': (0, 7), 'liaisonner': (1, 0), 'gausser': (20, 0), 'enherber': (1, 0), 'convivialiser': (7, 0), 'tuyauter': (7, 0), 'macadamiser': (1, 0), 'catastropher': (1, 0), 'légender': (1, 0), 'saucer': (1, 31), 'embratteler': (0, 40), 'encorner': (1, 0), 'bosseler': (1, 40), 'épandre': (10, 45), 'dribler': (7, 0), 'sataner': (1, 0), 'triséquer': (1, 67), 'marmoriser': (1, 0), 'contremarquer': (1, 0), 'intercéder': (9, 18), 'apostiller': (1, 0), 'désintoxiquer': (0, 0), 'fendre': (10, 45), 'stériliser': (1, 0), 'agrémenter': (1, 0), 'affouiller': (1, 0), 'chevaucher': (6, 0), 'aérer': (0, 19), 'baser': (0, 0), 'réimporter': (1, 0), 'boquilloner': (9, 5), 'émousser': (0, 0), 'schématiser': (7, 0), 'redessiner': (1, 0), 'roustir': (4, 2), 'gripper': (6, 0), 'réimplanter': (1, 0), 'dialectiser': (1, 0), 'encartoucher': (1, 0), 'peinturer': (1, 0), 'confectionner': (0, 0), 'traiter': (19, 0), 'coévoluer': (9, 5), 'reboucler': (1, 0), 'daller': (1, 0), 'billonner': (1, 0), 'ragaillardir': (4, 2), 'mêler': (0, 0), 'abasourdir': (4, 2), 'transpercer': (1, 31), 'investiguer': (9, 5), 'coaliser': (0, 0), 'coacher': (1, 0), 'teiller': (1, 0), 'abolir': (11, 2), 'caillouter': (1, 0), 'rafistoler': (1, 0), 'résigner': (0, 0), 'démaquer': (20, 0), 'déprécier': (0, 0), 'rabattre': (69, 3), 'soupirer': (7, 0), 'entrecouper': (0, 0), 'turbiner': (7, 0), 'cabaner': (1, 0), 'nouer': (6, 0), 'garnir': (2, 2), 'gafouiller': (1, 1), 'tisaner': (1, 0), 'envieillir': (2, 2), 'rasséréner': (0, 35), 'déshériter': (1, 0), 'scannériser': (1, 0), 'flaquer': (9, 5), 'viriliser': (1, 0), 'désinvestir': (24, 2), 'parader': (9, 5), 'lyrer': (9, 5), 'vermillonner': (7, 0), 'adopter': (33, 0), 'terminer': (0, 0), 'tréfondre': (43, 1), 'surpasser': (0, 0), 'commander': (46, 0), 'arithmétiser': (41, 0), 'réadapter': (0, 0), 'hennir': (16, 32), 'désimbriquer': (40, 0), 'bibarder': (9, 5), 'prélaver': (1, 0), 'houspiller': (1, 0), 'sourdiner': (1, 0), 'tricher': (9, 5), 'décliqueter': (1, 34), 'hâter': (0, 0), 'initialiser': (1, 0), 'plancher': (9, 5), 'aspirer': (38, 0), 'reprogrammer': (0, 0), 'piqueniquer': (9, 5), 'suffixer': (1, 0), 'syndicaliser': (1, 0), 'criailler': (9, 5), 'espouliner': (1, 0), 'tinter': (23, 0), 'contremurer': (1, 0), 'caqueter': (9, 54), 'inculper': (1, 0), 'expirer': (7, 0), 'remanier': (1, 0), 'adorner': (0, 0), 'dinguer': (9, 5), 'béatifier': (1, 0), 'floquer': (1, 0), 'désengorger': (1, 7), 'dessertir': (4, 2), 'dépourvoir': (10, 111), 'réussir': (103, 2), 'autofinancer': (0, 31), 'bruisser': (9, 5), 'déchaper': (1, 0), 'débarboter': (1, 0), 'souhaiter': (1, 0), 'bâtonner': (1, 0), 'préoccuper': (0, 0), 'décroûter': (1, 0), "entr'aimer": (65, 88), 'bauger': (20, 7), 'mégoter': (7, 0), 'lithographier': (1, 0), 'zonzonner': (9, 5), 'surestimer': (0, 0), 'dégotter': (7, 0), 'contrevérifier': (41, 0), 'impliquer': (0, 0), 'valoir': (55, 190), 'rappliquer': (9, 5), 'enquiller': (9, 5), 'psychoter': (9, 107), 'défeutrer': (1, 0), 'contrebouter': (1, 0), 'dudgeonner': (1, 1), 'remontrer': (46, 0), 'tictaquer': (9, 5), 'recombiner': (1, 0), 'hyperventiler': (9, 5), 'resituer': (0, 0), 'soulever': (0, 21), 'révulser': (0, 0), 'paillonner': (1, 0), 'rabiauter': (9, 1), 'contre-attaquer': (7, 0), 'entraccuser': (65, 88), 'accouder': (20, 0), 'caoutchouter': (1, 0), 'deviser': (9, 5), 'charbonner': (7, 0), 'chosifier': (1, 0), 'punir': (15, 2), 'rassasier': (0, 0), 'asperger': (0, 7), 'rejoindre': (10, 28), 'esclaffer': (20, 0), 'émouvoir': (5, 161), 'rallumer': (6, 0), 'refondre': (73, 45), 'soumissionner': (7, 0), 'dégazoliner': (1, 0), 'agonir': (4, 2), 'liquéfier': (0, 0), 'tapiner': (9, 5), 'contourner': (1, 0), 'étoffer': (0, 0), 'accalmir': (8, 1), 'informatiser': (0, 0), 'titulariser': (1, 0), 'feuilleter': (1, 34), 'apostropher': (0, 0), 'renchainer': (1, 0), 'tâtonner': (9, 5), 'clabauder': (9, 5), 'désétablir': (4, 2), 'mollir': (24, 2), 'brancarder': (1, 0), 'déplaire': (72, 81), 'cafarder': (7, 0), 'ficeler': (1, 40), 'serpenter': (9, 5), 'prénommer': (0, 0), 'canonner': (1, 0), 'équerrer': (1, 0), 'caver': (6, 0), 'ambler': (9, 5), 'reparamétrer': (40, 70), 'niveler': (1, 40), 'coltiner': (0, 0), 'pondérer': (1, 19), 'assaillir': (26, 48), 'plastiquer': (1, 0), 'pistacher': (20, 0), 'décliner': (6, 0), 'surinvestir': (13, 2), 'crisser': (9, 5), 'placoter': (9, 5), 'placardiser': (1, 0), 'délurer': (1, 0), 'moyenner': (7, 0), 'faisander': (0, 0), 'resocialiser': (21, 0), 'styler': (1, 0), 'jambonner': (1, 0), 'urger': (54, 154), 'engouffrer': (0, 0), 'incuber': (1, 0), 'raccoutumer': (0, 0), 'aveugler': (0, 0), 'désinscrire': (10, 74), 'gâcher': (7, 0), 'débuter': (7, 0), 'bitumer': (1, 0), 'débaptiser': (1, 0), 'entremanger': (65, 120), 'retondre': (26, 45), 'pleurer': (7, 0), 'airer': (9, 5), 'triller': (7, 0), 'recontrôler': (0, 0), 'doucir': (4, 2), 'sous-évaluer': (1, 0), 'fainéanter': (9, 5), 'enfourcher': (1, 0), 'débouder': (6, 0), 'redoubler': (23, 0), 'dépoétiser': (1, 0), 'décrouter': (1, 0), 'béguer': (9, 65), 'étrangler': (0, 0), 'faséier': (9, 1), 'dogmatiser': (7, 0), 'polliniser': (1, 0), 'extrapoler': (7, 0), 'regratter': (7, 0), 'clignoter': (9, 5), 'réactualiser': (1, 0), 'talonner': (7, 0), 'cyanoser': (1, 0), 'écrémer': (1, 57), 'reprouver': (1, 0), 'graphiter': (1, 0), 'douer': (1, 1), 'bolchéviser': (1, 0), 'surélever': (1, 21), 'bûcher': (7, 0), 'épointer': (1, 0), 'promener': (0, 39), 'désapprendre': (26, 46), 'framboiser': (1, 0), 'contracter': (0, 0), 'compromettre': (5, 29), 'engamer': (1, 0), 'dépailler': (0, 0), 'pivoter': (9, 5), 'ratatouiller': (9, 5), 'intercepter': (1, 0), 'jeûner': (9, 5), 'pingler': (1, 1), 'enfiler': (0, 0), 'linéariser': (1, 0), 'embusquer': (0, 0), 'toaster': (7, 0), 'entuber': (1, 0), 'failler': (20, 0), 'interpénétrer': (20, 70), 'exploser': (9, 5), 'éjointer': (1, 0), 'ensevelir': (34, 2), 'rançonner': (1, 0), 'dérater': (1, 0), 'détruire': (5, 52), 'magnétoscoper': (1, 0), 'méditer': (7, 0), 'révoquer': (1, 0), 'préfacer': (1, 31), 'capeler': (1, 40), 'diversifier': (0, 0), 'violoner': (7, 0), 'ébourrer': (1, 0), 'cotiser': (32, 0), 'gomorrhiser': (1, 1), 'guigner': (1, 0), 'laper': (7, 0), 'abouter': (1, 0), 'dévorer': (6, 0), 'rancarder': (0, 0), 'désâmer': (20, 0), 'dégénérer': (32, 19), 'boucler': (6, 0), 'déménager': (7, 7), 'envier': (1, 0), 'phosphater': (1, 0), 'cramser': (9, 5), 'frapper': (6, 0), 'externaliser': (1, 0), 'contraster': (7, 0), 'décohabiter': (33, 0), 'splitter': (1, 0), 'sous-informer': (33, 0), 'électrocuter': (0, 0), 'cueillir': (56, 17), 'gauchir': (13, 2), 'relater': (1, 0), 'recruter': (6, 0), 'régénérer': (0, 19), 'agencer': (0, 31), 'crêter': (0, 0), 'proclamer': (0, 0), 'réfléchir': (36, 2), 'établir': (34, 2), 'démascler': (1, 0), 'froisser': (0, 0), 'refiler': (1, 0), 'convoler': (9, 5), 'organiser': (0, 0), 'détoxifier': (0, 0), 'embarbouiller': (0, 0), 'sulfater': (1, 0), 'recevoir': (5, 42), 'prospérer': (9, 25), 'biffer': (1, 0), 'brider': (1, 0), 'cravacher': (7, 0), 'reparler': (3, 0), 'péricliter': (9, 5), 'constituer': (0, 0), 'bénir': (4, 2), 'prémunir': (2, 2), 'mépriser': (0, 0), 'contretirer': (1, 0), 'tropicaliser': (1, 0), 'hélitreuiller': (1, 0), 'décomposer': (0, 0), 'aluminer': (1, 0), 'dénommer': (1, 0), 'aborner': (1, 1), 'marronner': (9, 5), 'apporter': (1, 0), 'jasper': (1, 0), 'faloter': (9, 1), 'ravauder': (7, 0), 'vulgariser': (1, 0), 'rétorquer': (1, 0), 'rétracter': (0, 0), 'recarreler': (1, 40), 'culpabiliser': (7, 0), 'contrefaire': (26, 89), 'surdorer': (1, 0), 'rapper': (41, 0), 'chicoter': (7, 0), 'cirer': (1, 0), 'pesteller': (9, 5), 'essarter': (1, 0), 'patenter': (1, 0), 'pénétrer': (6, 70), 'bigler': (7, 0), 'confire': (10, 86), 'pagayer': (9, 5), 'numéroter': (0, 0), 'citer': (1, 0), 'dégréer': (1, 0), 'artiller': (9, 5), 'crachoter': (9, 5), 'ligner': (1, 0), 'décaniller': (9, 5), 'comparaitre': (25, 78), 'révolvériser': (1, 0), 'recomparaitre': (43, 78), 'drosser': (1, 0), 'décintrer': (1, 0), 'dimensionner': (1, 0), 'truffer': (1, 0), 'helléniser': (6, 0), 'décroitre': (25, 14), 'accroupir': (8, 2), 'intriquer': (1, 0), 'participer': (58, 5), 'cadastrer': (1, 0), 'extorquer': (1, 0), 'abalourdir': (2, 1), 'cliquer': (9, 5), 'échanfreiner': (1, 0), 'démolir': (4, 2), 'présupposer': (1, 0), 'scinder': (0, 0), 'rélargir': (4, 2), 'croupir': (37, 32), 'siester': (9, 5), 'recycler': (0, 0), 'équipoller': (6, 0), 'acoquiner': (20, 0), 'chaudronner': (33, 0), 'biller': (9, 5), 'historiciser': (1, 0), 'caquer': (1, 0), 'déposer': (6, 0), 'blouser': (6, 0), 'tarabiscoter': (1, 0), 'rocher': (9, 1), 'réagencer': (1, 31), 'taponner': (1, 0), 'percevoir': (10, 42), 'aspecter': (1, 0), 'réseauter': (9, 5), 'déguiser': (0, 0), 'brûler': (6, 0), 'podzoliser': (1, 0), 'polymériser': (7, 0), 'figurer': (6, 0), 'infléchir': (2, 2), 'répercuter': (0, 0), 'déchiffonner': (1, 0), 'périmer': (20, 0), 'déplafonner': (1, 0), 'copiloter': (1, 0), 'rivaliser': (9, 5), 'engrainer': (0, 0), 'poudrer': (0, 0), 'trachéotomiser': (1, 0), 'reboiser': (1, 0), 'diaphragmer': (7, 0), 'canoter': (9, 5), 'défroquer': (6, 0), 'uniformiser': (1, 0), 'déphosphorer': (1, 0), 'regeler': (96, 22), 'reclaper': (1, 0), 'transsuder': (7, 0), 'réticuler': (1, 0), 'déprotéger': (1, 8), 'dématérialiser': (1, 0), 'embrayer': (7, 0), 'zapper': (7, 0), 'aiguiller': (1, 0), 'indenter': (1, 0), 'refonctionner': (9, 5), 'discorder': (9, 5), 'voisiner': (9, 5), 'superviser': (1, 0), 'tourniquer': (9, 5), 'morigéner': (1, 35), 'discipliner': (1, 0), 'gaufrer': (1, 0), 'enverger': (1, 7), 'convoquer': (1, 0), 'prober': (1, 0), 'empocher': (1, 0), 'sous-tendre': (26, 45), 'approuver': (0, 0), 'moucher': (6, 0), 'ficher': (0, 0), 'entrenuire': (74, 123), 'dépriser': (1, 0), 'rééchelonner': (1, 0), 'cartoucher': (9, 5), 'désaffleurer': (1, 0), 'remboîter': (1, 0), 'retuber': (1, 0), 'rewriter': (1, 0), 'déréaliser': (1, 0), 'cambrer': (0, 0), 'engrosser': (1, 0), 'enfuter': (1, 0), 'viander': (32, 0), 'rouir': (24, 2), 'amariner': (0, 0), 'convalider': (33, 0), 'budgéter': (1, 16), 'médicaliser': (1, 0), 'encenser': (6, 0), 'calancher': (9, 5), 'détaler': (9, 5), 'diplômer': (1, 0), 'gasconner': (9, 5), 'élever': (22, 21), 'assoir': (31, 50), 'embarrasser': (0, 0), 'écharper': (0, 0), 'ingurgiter': (1, 0), 'gélatiner': (1, 0), 'rapproprier': (0, 0), 'entre-tuer': (65, 88), 'incrémenter': (1, 0), 'millésimer': (1, 0), 'temporiser': (7, 0), 'surmouler': (1, 0), 'désorienter': (0, 0), 'châtrer': (1, 0), 'alerter': (1, 0), 'piffer': (1, 0), 'abroutir': (11, 2), 'flétrir': (2, 2), 'commercer': (53, 23), 'croutonner': (20, 0), 'dénoyauter': (1, 0), 'joncher': (1, 0), 'voûter': (0, 0), 'prévisualiser': (1, 0), 'blondir': (24, 2), 'sous-payer': (1, 0), 'friper': (0, 0), 'rimer': (7, 0), 'ci-git': (43, 72), 'pavaner': (20, 0), 'poursuivre': (55, 159), 'décoter': (41, 0), 'parqueter': (1, 34), 'étalager': (1, 7), 'goguenarder': (9, 5), 'créditer': (1, 0), 'écanguer': (1, 0), 'lamer': (1, 0), 'abreyer': (0, 1), 'endivisionner': (1, 0), 'expectorer': (7, 0), 'surexprimer': (41, 0), 'fourber': (7, 0), 'chantourner': (1, 0), "s'agir": (8, 175), 'embringuer': (0, 0), 'surexciter': (1, 0), 'emmarger': (1, 7), 'madrigaliser': (9, 5), 'démouler': (1, 0), 'désenvoûter': (1, 0), 'bananer': (1, 0), 'occire': (31, 131), 'bilaner': (9, 5), 'shooter': (6, 0), 'recompresser': (1, 0), 'enfoncer': (6, 31), 'afflouer': (1, 0), 'étriquer': (1, 0), 'pigmenter': (1, 0), 'mollarder': (7, 0), 'slamer': (53, 5), 'caner': (9, 5), 'désenrouer': (1, 0), 'rechercher': (41, 0), 'coopérer': (12, 25), 'esclavagiser': (21, 0), 'rétribuer': (1, 0), 'soliloquer': (9, 5), 'recouvrir': (31, 94), 'entrelouer': (65, 88), 'expliquer': (3, 0), 'fraichir': (16, 32), 'retaper': (0, 0), 'négliger': (0, 7), 'rebattre': (26, 3), 'assermenter': (1, 0), 'avoiner': (1, 0), 'vaciller': (9, 5), 'recomparaître': (43, 79), 'copartager': (1, 7), 'feuler': (9, 5), 'désœuvrer': (1, 1), 'recalculer': (1, 0), 'trémuler': (7, 0), 'décher': (1, 12), 'chouchouter': (1, 0), 'paranoïer': (9, 5), 'préfabriquer': (41, 0), 'entrégorger': (65, 120), 'bigophoner': (9, 5), 'fêler': (0, 0), 'substituer': (0, 0), 'tortiller': (6, 0), 'posséder': (40, 4), 'dénouer': (0, 0), 'craner': (1, 0), 'signifier': (1, 0), 'merdouiller': (9, 5), 'courber': (6, 0), 'handicaper': (33, 0), 'clavarder': (9, 5), 'rester': (99, 0), 'repartir': (35, 87), 'encroumer': (20, 1), 'visionner': (1, 0), 'camper': (32, 0), 'tuer': (6, 0), 'équarrir': (4, 2), 'désembourber': (1, 0), 'encapsuler': (1, 0), 'enraciner': (0, 0), 'exaucer': (0, 31), 'catalyser': (1, 0), 'chevronner': (1, 0), 'pétiller': (9, 5), 'chanter': (41, 0), 'tempérer': (0, 19), 'cataloguer': (1, 0), 'pendouiller': (9, 5), 'instrumentaliser': (1, 0), 'resquiller': (7, 0), 'écorner': (1, 0), 'papillonner': (9, 5), 'rechanter': (1, 0), 'agir': (37, 32), 'corporifier': (0, 0), 'réaffirmer': (1, 0), 'targuer': (20, 0), 'démerder': (20, 0), 'empatter': (1, 0), 'duveter': (20, 34), 'locher': (7, 0), 'ressaisir': (2, 2), 'créner': (1, 35), 'réécrire': (56, 74), 'voleter': (9, 54), 'cisailler': (1, 0), 'musarder': (9, 5), 'juponner': (7, 0), 'reluire': (43, 144), 'déballonner': (20, 0), 'désarrimer': (1, 0), 'luire': (25, 144), 'assembler': (0, 0), 'aplatir': (34, 2), 'entre-détruire': (74, 121), 'grisoller': (9, 5), 'ferler': (1, 0), 'consolider': (0, 0), 'violacer': (0, 31), 'implorer': (1, 0), 'ressemeler': (1, 40), 'désacidifier': (1, 0), 'encombrer': (0, 0), 'enquérir': (17, 24), 'écorer': (1, 0), 'communiquer': (6, 0), 'pecquer': (9, 5), 'remmener': (1, 39), 'décapuchonner': (1, 0), 'perdre': (5, 45), 'trier': (1, 0), 'monter': (84, 0), 'matérialiser': (0, 0), 'éjaculer': (1, 0), 'conjurer': (0, 0), 'ensimer': (33, 0), 'mimer': (1, 0), 'laisser': (0, 0), 'matcher': (7, 0), 'étreindre': (10, 28), 'assoupir': (2, 2), 'rétroagir': (16, 32), 'bucher': (7, 0), 'trancher': (7, 0), 'mouiller': (7, 0), 'conditionner': (1, 0), 'importuner': (1, 0), 'proportionner': (0, 0), 'motionner': (9, 5), 'croquer': (7, 0), 'paître': (73, 157), 'essaimer': (7, 0), 'attarder': (20, 0), 'rechausser': (0, 0), 'recoquiller': (0, 0), 'réorganiser': (0, 0), 'zester': (1, 0), 'éthérifier': (1, 0), 'optimiser': (1, 0), 'radiodiffuser': (1, 0), 'déflaquer': (9, 5), 'coxer': (1, 0), 'contingenter': (1, 0), 'décapiter': (1, 0), 'percer': (7, 31), 'objectiver': (0, 0), 'individualiser': (0, 0), 'injurier': (0, 0), 'crèteler': (1, 99), 'ridiculiser': (0, 0), 'bonimenter': (9, 5), 'égnaffer': (1, 1), 'macler': (7, 0), 'décoder': (1, 0), 'retraire': (26, 11), 'converser': (9, 5), 'chemiser': (1, 0), 'refrapper': (6, 0), 'réensemencer': (1, 31), 'arrenter': (1, 0), 'condenser': (0, 0), 'gouacher': (1, 0), 'esprofonder': (40, 0), 'recuire': (56, 52), 'sérigraphier': (1, 0), 'sombrer': (9, 5), 'harper': (1, 0), 'déplomber': (1, 0), 'noircir': (13, 2), 'grecquer': (1, 0), 'folichonner': (9, 5), 'traumatiser': (1, 0), 'doguer': (7, 0), 'ancrer': (0, 0), 'scénariser': (1, 0), 'lanterner': (7, 0), 'rééquilibrer': (1, 0), 'gorgeonner': (20, 1), 'néantiser': (0, 0), 'réglementer': (1, 0), 'taguer': (7, 0), 'frimer': (7, 0), 'restructurer': (0, 0), 'voler': (6, 0), 'invoquer': (1, 0), 'ramarrer': (1, 0), 'corner': (7, 0), 'alanguir': (2, 2), 'marsouiner': (9, 5), 'émoucher': (1, 0), 'exclure': (5, 83), 'détendre': (31, 45), 'biscuiter': (1, 0), 'fusionner': (7, 0), 'spiraler': (9, 5), 'claboter': (7, 0), 'nébuliser': (1, 0), 'tchatcher': (9, 5), 'rallonger': (6, 7), 'redémolir': (4, 2), 'décevoir': (56, 42), 'fixer': (21, 0), 'créoliser': (0, 0), 'décortiquer': (1, 0), 'déprimer': (6, 0), 'affadir': (2, 2), 'amincir': (13, 2), 'conteneuriser': (1, 0), 'enstérer': (1, 19), 'mâchouiller': (1, 0), 'coéditer': (1, 0), 'recommander': (0, 0), 'dépagnoter': (20, 0), 'lock-outer': (1, 0), 'détresser': (1, 0), 'emmitonner': (1, 0), 'dételer': (7, 40), 'arrimer': (1, 0), 'pindouler': (9, 5), 'accourir': (25, 13), 'décramponner': (1, 0), 'trisser': (6, 0), 'dégalonner': (1, 0), 'recourir': (45, 13), 'gazéifier': (1, 0), 'discrétiser': (1, 0), 'surseoir': (95, 185), 'phaser': (9, 5), 'abattre': (5, 3), 'renaître': (42, 153), 'dépiler': (7, 0), 'appesantir': (2, 2), 'reconnaitre': (31, 14), 'pouponner': (9, 5), 'désambigüiser': (1, 0), 'vulnérabiliser': (1, 0), 'réemprunter': (1, 0), 'ravir': (94, 2), 'zézayer': (9, 5), 'reprographier': (1, 0), 'louer': (0, 0), 'décorer': (7, 0), 'survivre': (104, 187), 'guindailler': (9, 5), 'saveter': (1, 1), 'connaître': (31, 15), 'murger': (20, 7), 'détailler': (1, 0), 'gorger': (0, 7), 'rouiller': (6, 0), 'supplicier': (1, 0), 'escamoter': (0, 0), 'embrancher': (0, 0), 'éterniser': (0, 0), 'déboucler': (1, 0), 'redorer': (1, 0), 'infiltrer': (0, 0), 'défenestrer': (0, 0), 'psychanalyser': (1, 0), 'revomir': (24, 2), 'défolier': (1, 0), 'galérer': (9, 25), 'classifier': (1, 0), 'rutiler': (9, 5), 'miniaturer': (1, 0), 'défringuer': (0, 0), 'acquitter': (0, 0), 'rengorger': (20, 7), 'fleurir': (13, 2), 'déstaliniser': (1, 0), 'grisoler': (9, 5), 'alcoholiser': (1, 1), 'réenchanter': (1, 0), 'endimancher': (0, 0), 'ranimer': (0, 0), 'déterritorialiser': (1, 0), 'adjectiver': (1, 0), 'mallouser': (1, 0), 'baisser': (6, 0), 'féconder': (21, 0), 'écarteler': (1, 22), 'transgresser': (1, 0), 'ramifier': (0, 0), 'branlocher': (1, 0), 'arnaquer': (1, 0), 'itérer': (1, 19), 'bouloter': (7, 0), 'linger': (0, 7), 'slicer': (1, 31), 'rebander': (1, 0), 'décheveler': (0, 40), 'instiller': (1, 0), 'québéciser': (40, 0), 'réordonnancer': (1, 31), 'jocoler': (9, 5), 'dépingler': (1, 0), 'neiger': (54, 154), 'balloter': (7, 0), 'embatre': (26, 116), 'catcher': (9, 5), 'avertir': (51, 2), 'délinéer': (1, 0), 'crounir': (16, 1), 'reprocher': (0, 0), 'prérégler': (1, 112), 'réchampir': (4, 2), 'recoder': (41, 0), 'léviter': (9, 5), 'fader': (1, 0), 'baragouiner': (7, 0), 'ulcérer': (0, 19), 'monder': (1, 0), 'tertiariser': (7, 0), 'ci-gît': (43, 72), 'calepiner': (7, 0), 'galvauder': (6, 0), 'bruiter': (1, 0), 'suicider': (20, 0), 'souchever': (1, 21), 'stresser': (6, 0), 'rugir': (11, 2), 'réenclencher': (0, 0), 'diligenter': (1, 0), "s'abriller": (20, 1), 'ressortir': (73, 87), 'humecter': (0, 0), 'desserrer': (0, 0), 'rembaucher': (1, 0), 'capillotracter': (41, 0), 'subvenir': (63, 44), 'sautiller': (9, 5), 'torréfier': (1, 0), 'fouetter': (7, 0), 'monnayer': (1, 0), 'apurer': (1, 0), 'débiliter': (1, 0), 'découenner': (21, 0), 'déjauger': (9, 47), 'écourter': (1, 0), 'affourager': (1, 7), 'chanstiquer': (7, 0), 'pailler': (1, 0), 'fourmiller': (9, 5), 'savoir': (5, 176), 'auner': (1, 0), 'bûcheronner': (9, 5), 'adapter': (22, 0), 'refouler': (7, 0), 'suspendre': (10, 45), 'ragrandir': (2, 2), 'magouiller': (7, 0), 'rouvrir': (69, 94), 'cascader': (9, 5), 'chartériser': (1, 0), 'replisser': (1, 0), 'dégobiller': (7, 0), 'cibler': (1, 0), 'enfiévrer': (0, 117), 'tranchefiler': (1, 0), 'dévoiser': (0, 0), 'tuberculiniser': (1, 0), 'fliquer': (1, 0), 'lover': (0, 0), 'siffloter': (7, 0), 'véhiculer': (0, 0), 'rapprovisionner': (0, 0), 'pocher': (7, 0), 'perfectionner': (0, 0), 'dédire': (10, 86), 'cabosser': (1, 0), 'différer': (7, 19), 'driller': (1, 0), 'saillir': (43, 110), 'débusquer': (1, 0), 'rescinder': (1, 0), 'anémier': (1, 0), 'toupiner': (9, 5), 'contrindiquer': (1, 0), 'capéer': (9, 5), 'consoner': (9, 5), 'hybrider': (0, 0), 'réchapper': (9, 5), 'pouvoir': (91, 160), 'recéler': (7, 64), 'marginaliser': (0, 0), 'amender': (0, 0), 'versionner': (1, 0), 'maitriser': (0, 0), 'vitaliser': (1, 0), 'militer': (9, 5), 'gueuletonner': (9, 5), 'replacer': (0, 31), 'paramétriser': (41, 0), 'synchroniser': (1, 0), 'chuchoter': (7, 0), 'archiver': (1, 0), 'vendanger': (7, 7), 'enliasser': (1, 0), 'redevenir': (35, 10), 'rouspéter': (9, 56), 'acenser': (1, 0), 'maquetter': (1, 0), 'araser': (1, 0), 'rôder': (9, 5), 'balafrer': (1, 0), 'rectifier': (1, 0), 'halluciner': (1, 0), 'persiller': (1, 0), 'épivarder': (20, 0), 'éroder': (0, 0), 'isoler': (0, 0), 'refixer': (0, 0), 'connaitre': (31, 14), 'maronner': (9, 5), 'blesser': (0, 0), 'somnoler': (9, 5), 'appointir': (4, 2), 'calorifuger': (1, 7), 'remoucher': (0, 0), 'alunir': (16, 2), 'bitter': (1, 0), 'renoncer': (38, 31), 'galonner': (1, 0), 'mâtiner': (1, 0), 'praliner': (1, 0), 'choper': (1, 0), 'adresser': (0, 0), 'désaccoutumer': (0, 0), 'serrer': (6, 0), 'régionaliser': (1, 0), 'entrecroiser': (0, 0), 'vivifier': (1, 0), 'réapparaître': (43, 15), 'morfiler': (1, 0), 'légiférer': (9, 25), 'débrayer': (7, 0), 'valiser': (7, 0), 'déflagrer': (9, 5), 'emballer': (0, 0), 'déraidir': (2, 2), 'déboîter': (6, 0), 'borner': (0, 0), 'broquer': (9, 5), 'internationaliser': (0, 0), 'démagnétiser': (1, 0), 'homologuer': (1, 0), 'proférer': (1, 19), 'éructer': (7, 0), 'chofer': (1, 0), 'remétrer': (1, 1), 'refaire': (31, 89), 'contester': (7, 0), 'scruter': (1, 0), 'taniser': (1, 0), 'dégrever': (1, 21), 'terrifier': (1, 0), 'plisser': (6, 0), 'banquer': (9, 5), 'relaisser': (20, 0), 'garantir': (51, 2), 'attiédir': (2, 2), 'javelliser': (1, 0), 'hongroyer': (1, 6), 'hongrer': (1, 0), 'dépiauter': (1, 0), 'pédaler': (9, 5), 'candidater': (9, 5), 'enrhumer': (0, 0), 'jubiler': (9, 5), 'dessoûler': (6, 0), 'abouler': (6, 0), 'trimbaler': (0, 0), 'subodorer': (1, 0), 'châtier': (0, 0), 'repaitre': (10, 14), 'régaler': (0, 0), 'raccompagner': (1, 0), 'sonrer': (9, 5), 'accorder': (22, 0), 'syncristalliser': (9, 5), 'peigner': (0, 0), 'basaner': (1, 0), 'surprotéger': (1, 8), 'désarticuler': (0, 0), 'pénaliser': (1, 0), 'froncer': (0, 31), 'becquer': (1, 0), 'dépolariser': (1, 0), 'creuser': (6, 0), 'attabler': (0, 0), 'succéder': (29, 18), 'revoter': (7, 0), 'indicer': (1, 31), 'manier': (0, 0), 'allécher': (1, 12), 'déclouer': (1, 0), 'télétransmettre': (26, 29), 'relaver': (7, 0), 'galber': (1, 0), 'déchagriner': (1, 0), 'provisionner': (1, 0), 'ensorceler': (1, 40), 'transfigurer': (0, 0), 'fuser': (9, 5), 'raccrocher': (6, 0), 'réer': (9, 5), 'endiguer': (1, 0), 'remballer': (1, 0), 'pontifier': (9, 5), 'ignifuger': (1, 7), 'hiverner': (7, 0), 'minimiser': (1, 0), 'décroiser': (1, 0), 'noter': (41, 0), 'canoniser': (1, 0), 'décapoter': (1, 0), 'prédestiner': (1, 0), 'bâillonner': (1, 0), 'collectiviser': (1, 0), 'claironner': (7, 0), 'réhydrater': (1, 0), 'remplier': (1, 0), 'ritualiser': (1, 0), 'expérimenter': (7, 0), 'louper': (6, 0), 'désentoiler': (1, 0), 'glaner': (7, 0), 'anoblir': (2, 2), 'quotter': (9, 5), 'bâcher': (1, 0), 'sarter': (1, 0), 'reparaître': (43, 15), 'moufter': (9, 5), 'ânonner': (7, 0), 'reconsolider': (1, 0), 'tanner': (1, 0), 'flexibiliser': (1, 0), 'barrer': (6, 0), 'effleurer': (1, 0), 'esgourder': (1, 0), 'saccader': (1, 0), 'roucouler': (7, 0), 'transiter': (7, 0), 'gaudir': (8, 2), 'repétrir': (11, 2), 'débriefer': (1, 0), 'sabler': (7, 0), 'arriser': (1, 0), 'parachuter': (1, 0), 'accrocher': (6, 0), 'égaliser': (7, 0), 'rissoler': (7, 0), 'dédiaboliser': (1, 0), 'recaler': (1, 0), 'transformer': (0, 0), 'péréquater': (1, 0), 'épeler': (6, 40), 'espérer': (41, 19), 'duplexer': (1, 0), 'désinviter': (1, 0), 'sangler': (0, 0), 'collectionner': (1, 0), 'restaurer': (0, 0), 'clapir': (59, 2), 'hourder': (1, 0), 'décupler': (7, 0), 'fonctionner': (9, 5), 'chariboter': (9, 5), 'temporaliser': (1, 0), 'poter': (9, 5), 'bichonner': (0, 0), 'réverbérer': (0, 19), 'costumer': (0, 0), 'hystériser': (41, 0), 'débander': (6, 0), 'doper': (0, 0), 'déteindre': (73, 28), 'ragrafer': (1, 0), 'retrousser': (0, 0), 'désolidariser': (0, 0), 'gronder': (7, 0), 'aider': (3, 0), 'recouvrer': (1, 0), 'envenimer': (0, 0), 'éternuer': (9, 5), 'tintinnabuler': (9, 5), 'blâmer': (0, 0), 'réévaluer': (1, 0), 'extraire': (50, 11), 'rhabiller': (0, 0), 'gourer': (20, 0), 'redécoller': (6, 0), 'musiquer': (7, 0), 'concourir': (62, 13), 'immatérialiser': (0, 0), 'bourgeonner': (9, 5), 'empêner': (7, 0), 'folkloriser': (1, 0), 'murmurer': (7, 0), 'intersecter': (1, 0), 'vamper': (1, 0), 'conobrer': (1, 0), 'endormir': (5, 103), 'déshumaniser': (0, 0), 'ramper': (9, 5), 'renommer': (1, 0), 'déboutonner': (0, 0), 'décaféiner': (1, 0), 'quitter': (88, 0), 'enficeler': (1, 1), 'statuer': (38, 0), 'toubabiser': (1, 0), 'individuer': (0, 0), 'ronger': (0, 7), 'divulguer': (0, 0), 'jointoyer': (41, 6), 'endêver': (9, 1), 'enfourailler': (0, 1), 'mentir': (72, 146), 'souiller': (1, 0), 'haricoter': (1, 0), 'bêtifier': (6, 0), 'ratiner': (1, 0), 'désencrer': (1, 0), 'emperler': (1, 0), 'enfaîter': (1, 0), 'dire': (31, 105), 'encastrer': (0, 0), 'recoloniser': (1, 0), 'crayonner': (1, 0), 'coraniser': (1, 0), 'incommoder': (1, 0), 'décoffrer': (1, 0), 'chauffer': (6, 0), 'lyser': (1, 0), 'ignorer': (0, 0), 'caillasser': (1, 0), 'repartager': (1, 7), 'échapper': (46, 0), 'friter': (20, 0), 'démutiser': (1, 0), 'procurer': (0, 0), 'absorber': (0, 0), 'naitre': (42, 152), 'retrouver': (40, 0), 'débaucher': (0, 0), 'tyranniser': (1, 0), 'interposer': (0, 0), 'collationner': (7, 0), 'tuberculiser': (1, 0), 'réintroduire': (26, 52), 'gréser': (1, 38), 'peler': (6, 22), 'calmir': (16, 32), 'défricher': (1, 0), 'traquer': (1, 0), 'boutonner': (0, 0), 'développer': (0, 0), 'encarrer': (9, 1), 'dégasoliner': (1, 0), 'copiner': (9, 5), 'déharnacher': (0, 0), 'dévier': (7, 0), 'taquer': (1, 0), 'coexister': (9, 5), 'colletailler': (20, 0), 'quiller': (1, 0), 'rejointoyer': (1, 6), 'cuveler': (1, 40), 'enlier': (1, 0), 'blêmir': (16, 2), 'déterger': (1, 7), 'réassembler': (21, 0), 'défoncer': (0, 31), 'déléaturer': (1, 0), 'délustrer': (1, 0), 'greneler': (1, 40), 'refuser': (3, 0), 'remastériser': (1, 0), 'plasmifier': (1, 0), 'affliger': (0, 7), 'rengainer': (1, 0), 'manipuler': (1, 0), 'éprendre': (17, 46), 'démunir': (2, 2), 'référencer': (21, 31), 'affermer': (1, 0), 'amouracher': (20, 0), 'étiqueter': (1, 34), 'grumeler': (20, 40), 'remployer': (1, 6), 'ramager': (7, 7), 'sursemer': (1, 75), 'fanfaronner': (9, 5), 'coorganiser': (1, 0), 'désenliser': (1, 0), 'embrigader': (0, 0), 'pétarder': (7, 0), 'dérober': (0, 0), 'graffiter': (7, 0), 'halener': (1, 39), 'démonétiser': (1, 0), 'obéir': (14, 2), 'encloitrer': (1, 0), 'primer': (7, 0), 'zigouiller': (1, 0), 'jaffer': (9, 5), 'piger': (7, 7), 'margotter': (9, 5), 'autosuggestionner': (20, 0), 'godailler': (9, 5), 'squeezer': (1, 0), 'entre-nuire': (74, 123), 'contre-profiler': (1, 0), 'phraser': (7, 0), 'enturbanner': (0, 0), 'épanner': (1, 0), 'mangeotter': (1, 0), 'démériter': (9, 5), 'chélater': (41, 0), 'adjoindre': (18, 28), 'refinancer': (7, 31), 'maquignonner': (1, 0), 'engommer': (1, 0), 'assouplir': (2, 2), 'bigrer': (9, 5), 'réduire': (31, 52), 'remparer': (1, 0), 'haubaner': (1, 0), 'borgnoter': (1, 0), 'shunter': (1, 0), 'compisser': (1, 0), 'fâcher': (0, 0), 'rapetasser': (1, 0), 'drainer': (1, 0), 'inculquer': (1, 0), 'dépatouiller': (20, 0), 'clouer': (1, 0), 'paddocker': (20, 0), 'surentrainer': (1, 0), 'rédimer': (0, 0), 'astreindre': (10, 28), 'tronquer': (1, 0), 'palpiter': (9, 5), 'célébrer': (1, 84), 'bifurquer': (9, 5), 'démerger': (1, 7), 'étancher': (1, 0), 'blacklister': (1, 0), 'habiller': (0, 0), 'fieffer': (1, 0), 'dissocier': (0, 0), 'désillusionner': (1, 0), 'expurger': (1, 7), 'épancher': (0, 0), 'bazarder': (1, 0), 'bretonniser': (21, 0), 'enrocher': (1, 0), 'insoler': (1, 0), 'rire': (93, 172), 'sursouffler': (1, 0), 'assassiner': (1, 0), 'replanter': (6, 0), 'acquérir': (31, 24), 'entourlouper': (1, 0), 'cloitrer': (0, 0), 'arrêter': (21, 0), 'schlitter': (1, 0), 'cacher': (0, 0), 'resserrer': (0, 0), 'surstocker': (88, 0), 'embotteler': (1, 40), 'réhabituer': (0, 0), 'ranger': (0, 7), 'prier': (7, 0), 'braquer': (6, 0), 'rebonneter': (20, 1), 'épier': (6, 0), 'pâtir': (16, 32), 'blablater': (9, 5), 'naître': (42, 153), 'illuminer': (0, 0), 'chavirer': (7, 0), 'englober': (1, 0), 'redéfaire': (26, 89), 'empaumer': (1, 0), 'réaléser': (1, 38), 'drayer': (1, 0), 'planer': (7, 0), 'esquicher': (21, 0), 'abrévier': (1, 1), 'coloriser': (1, 0), 'lansquiner': (9, 5), 'décrypter': (1, 0), 'télégraphier': (7, 0), 'briser': (6, 0), 'asticoter': (1, 0), 'relancer': (7, 31), 'calmer': (0, 0), 'effrayer': (0, 0), 'déployer': (0, 6), 'fendiller': (0, 0), 'baluchonner': (0, 1), 'jauger': (6, 7), 'féculer': (1, 0), 'européaniser': (0, 0), 'épargner': (6, 0), 'moucheronner': (9, 5), 'commanditer': (1, 0), 'tordre': (10, 45), 'glousser': (9, 5), 'embecquer': (1, 0), 'égailler': (20, 0), 'empêcher': (0, 0), 'reproduire': (10, 52), 'cloîtrer': (0, 0), 'objurguer': (9, 5), 'préfigurer': (1, 0), 'considérer': (40, 19), 'embrumer': (1, 0), 'clayonner': (1, 0), 'sous-titrer': (1, 0), 'inférioriser': (1, 0), 'radiotélégraphier': (1, 0), 'intégrer': (46, 114), 'triturer': (1, 0), 'rebaptiser': (1, 0), 'malaxer': (1, 0), 'ensaboter': (1, 0), 'carreler': (1, 40), 'esclavager': (1, 7), 'ruminer': (7, 0), 'boursicoter': (9, 5), 'diagnostiquer': (1, 0), 'contre-miner': (1, 0), 'ébosser': (1, 0), 'mangeoter': (1, 0), 'rabouter': (1, 0), 'dépêcher': (0, 0), 'périphraser': (9, 5), 'bruire': (57, 63), 'hachurer': (1, 0), 'dégriser': (0, 0), 'réimposer': (1, 0), 'lorgner': (1, 0), 'sucrer': (6, 0), 'sciotter': (1, 0), 'entraîner': (40, 0), 'ululer': (9, 5), 'autoproclamer': (20, 0), 'exhiber': (0, 0), 'paraitre': (25, 14), 'drageonner': (9, 5), 'déséquilibrer': (1, 0), 'sommer': (33, 0), 'exceller': (9, 5), 'réanalyser': (0, 0), 'échiner': (0, 0), 'requalifier': (0, 0), 'mensurer': (1, 0), 'retisser': (1, 0), 'démâter': (7, 0), 'arraisonner': (1, 0), 'maximaliser': (1, 0), 'catéchiser': (1, 0), 'rainurer': (1, 0), 'recapitaliser': (0, 0), 'emplir': (13, 2), 'rhumer': (1, 0), 'cornaquer': (1, 0), 'défroncer': (1, 31), 'prétexter': (1, 0), 'fédéraliser': (0, 0), 'obvenir': (43, 10), 'bourdonner': (9, 5), 'essentialiser': (21, 0), 'affabuler': (7, 0), 'satiriser': (1, 0), 'rembiner': (32, 0), 'alpaguer': (1, 0), 'escoffier': (1, 0), 'éclisser': (1, 0), 'sous-alimenter': (1, 0), 'haranguer': (1, 0), 'démoraliser': (0, 0), 'bassiner': (1, 0), 'suppléer': (38, 0), 'enviander': (1, 0), 'barber': (0, 0), 'rabaisser': (0, 0), 'raccorder': (0, 0), 'haver': (7, 0), 'entaquer': (1, 0), 'détartrer': (1, 0), 'ravager': (1, 7), 'agender': (1, 0), 'recrépir': (4, 2), 'idéaliser': (0, 0), 'trouver': (21, 0), 'météoriser': (1, 0), 'énucléer': (1, 0), 'doublonner': (9, 5), 'engourdir': (2, 2), 'réentendre': (85, 45), 'atténuer': (0, 0), 'appauvrir': (2, 2), 'engouer': (20, 0), 'évoluer': (9, 5), 'tripler': (7, 0), 'défruiter': (1, 0), 'prouver': (0, 0), 'langer': (1, 7), 'croller': (9, 5), 'réexaminer': (0, 0), 'carillonner': (7, 0), 'concasser': (1, 0), 'régner': (9, 173), 'palangrer': (1, 0), 'entre-égorger': (65, 120), 'dépoitrailler': (0, 0), 'colorier': (1, 0), 'brouillasser': (54, 61), 'enrober': (0, 0), 'démurer': (1, 0), 'argougner': (1, 0), 'cristalliser': (6, 0), 'diffuser': (0, 0), 'régir': (11, 2), 'désoufrer': (41, 0), 'enliser': (0, 0), 'vacciner': (106, 0), 'concaténer': (1, 35), 'taillader': (1, 0), 'abhorrer': (1, 0), 'divorcer': (9, 23), 'écorcher': (0, 0), 'speeder': (7, 0), 'exalter': (0, 0), 'taquiner': (0, 0), 'pouliner': (9, 5), 'précuire': (26, 52), 'regarder': (3, 0), 'vadrouiller': (9, 5), 'désobliger': (1, 7), 'entrapercevoir': (10, 42), 'minifier': (41, 0), 'intérioriser': (1, 0), 'baleiner': (1, 0), 'déranger': (0, 7), 'controuver': (1, 0), 'soutenir': (50, 10), 'civiliser': (0, 0), 'solder': (0, 0), 'séduire': (56, 52), 'affricher': (1, 0), 'empiffrer': (20, 0), 'entre-louer': (65, 88), 'décontaminer': (1, 0), 'prodiguer': (0, 0), 'bagarrer': (32, 0), 'édifier': (7, 0), 'déchristianiser': (0, 0), 'métaphoriser': (1, 0), 'motter': (20, 0), 'diner': (9, 5), 'désenivrer': (7, 0), 'regrossir': (16, 32), 'dresser': (0, 0), 'solidifier': (0, 0), 'copuler': (9, 5), 'bigarrer': (1, 0), 'submerger': (1, 7), 'commuer': (1, 0), 'introniser': (0, 0), 'réveiller': (0, 0), 'résulter': (102, 82), 'détonneler': (1, 40), 'exubérer': (9, 1), 'rabonnir': (24, 2), 'bêcheveter': (1, 34), 'trifouiller': (7, 0), 'déculotter': (0, 0), 'dédouaner': (0, 0), 'mégisser': (1, 0), 'dégivrer': (1, 0), 'vivoter': (9, 5), 'mutiler': (0, 0), 'reterser': (1, 0), 'éprouver': (0, 0), 'sérier': (1, 0), 'sabouler': (0, 0), 'timbrer': (1, 0), 'déviriliser': (1, 0), 'transvider': (1, 0), 'fauter': (9, 5), 'réinfecter': (7, 0), 'dépeigner': (1, 0), 'entrebattre': (17, 124), 'perler': (7, 0), 'raviner': (1, 0), 'fabriquer': (6, 0), 'touiller': (1, 0), 'encaustiquer': (1, 0), 'breveter': (1, 34), 'tuteurer': (1, 0), 'débobiner': (1, 0), 'suralimenter': (0, 0), 'réincarner': (0, 0), 'feignanter': (9, 5), 'intimer': (1, 0), 'désennuyer': (6, 6), 'fainéantiser': (9, 1), 'varloper': (1, 0), 'efflanquer': (0, 0), 'alâchir': (2, 1), 'empoter': (1, 0), 'stagner': (9, 5), 'préinstaller': (92, 0), 'dissoudre': (31, 9), 'sembler': (9, 5), 'remeubler': (1, 0), 'pourfendre': (26, 45), 'desquamer': (7, 0), 'déblayer': (1, 0), 'décruer': (1, 0), 'augurer': (7, 0), 'standardiser': (1, 0), 'alcaliser': (1, 0), 'cuire': (56, 52), 'trimer': (9, 5), 'rafler': (1, 0), 'comprimer': (1, 0), 'déverguer': (1, 0), 'parapher': (1, 0), 'emprésurer': (1, 0), 'conscientiser': (1, 0), 'découler': (12, 5), 'étourdir': (2, 2), 'gironner': (1, 0), 'contre-pousser': (65, 88), 'désactiver': (1, 0), 'cahoter': (7, 0), 'dragéifier': (1, 0), 'poser': (6, 0), 'blottir': (8, 2), 'sauner': (9, 5), 'attraper': (0, 0), 'décruser': (1, 0), 'débarrasser': (6, 0), 'nicher': (6, 0), 'labelliser': (1, 0), 'sénégaliser': (1, 0), 'émanciper': (0, 0), 'plucher': (9, 5), 'bagoter': (9, 5), 'excursionner': (9, 5), 'saigner': (6, 0), 'couturer': (1, 0), 'piaffer': (9, 5), 'masturber': (0, 0), 'faluner': (1, 0), 'engerber': (1, 0), 'dépulper': (1, 0), 'kifer': (1, 0), 'encloîtrer': (1, 0), 'exterminer': (1, 0), 'ressembler': (29, 5), 'efféminer': (0, 0), 'piauler': (9, 5), 'panoramiquer': (9, 5), 'œuvrer': (9, 5), 'rendormir': (10, 103), 'remarcher': (9, 5), 'râbler': (1, 0), 'déclassifier': (0, 0), 'aléser': (1, 38), 'urbaniser': (0, 0), 'ricocher': (9, 5), 'uriner': (7, 0), 'fouler': (0, 0), 'chatter': (53, 5), 'épurer': (0, 0), 'écrouer': (1, 0), 'déforcer': (1, 31), 'fileter': (1, 20), 'manigancer': (0, 31), 'désincarner': (0, 0), 'embrunir': (4, 2), 'billebauder': (9, 5), 'trembloter': (9, 5), 'contrattaquer': (7, 0), 'dépénaliser': (1, 0), 'attaquer': (21, 0), 'sacrifier': (0, 0), 'clacher': (1, 0), 'outrer': (1, 0), 'droper': (7, 0), 'divertir': (15, 2), 'redemander': (1, 0), 'pointiller': (7, 0), 'tonner': (9, 5), 'désétatiser': (1, 0), 'filouter': (7, 0), 'peller': (1, 0), 'encolérer': (0, 0), 'usurper': (7, 0), 'barbifier': (0, 0), 'saquer': (1, 0), 'écarter': (6, 0), 'dégarnir': (2, 2), 'mouliner': (7, 0), 'tasser': (6, 0), 'briller': (9, 5), 'décolleter': (0, 34), 'vampiriser': (1, 0), 'remiser': (0, 0), 'balbutier': (7, 0), 'vaser': (54, 61), 'patter': (1, 0), 'dîner': (9, 5), 'réputer': (1, 0), 'ralentir': (13, 2), 'guillemeter': (1, 34), 'redémarrer': (7, 0), 'forlonger': (1, 7), 'écouler': (0, 0), 'territorialiser': (40, 0), 'mûrir': (7, 2), 'courser': (1, 0), 'déjouer': (1, 0), 'désordonner': (1, 0), 'avérer': (0, 19), 'pactiser': (9, 5), 'pelucher': (9, 5), 'spitter': (1, 0), 'gadgétiser': (1, 0), 'prôner': (7, 0), 'réviser': (7, 0), 'cerner': (33, 0), 'débosseler': (1, 40), 'raquer': (7, 0), 'fagoter': (0, 0), 'conceptualiser': (7, 0), 'périr': (16, 32), 'goualer': (7, 0), 'engeôler': (1, 0), 'germaniser': (6, 0), 'débiner': (0, 0), 'raisonner': (46, 0), 'attacher': (3, 0), 'tourmenter': (0, 0), 'caractériser': (0, 0), 'respectabiliser': (1, 0), 'arranger': (40, 7), 'hannetonner': (7, 0), 'égorger': (0, 7), 'occlure': (26, 139), 'alluvionner': (9, 5), 'dépoussiérer': (1, 19), 'désincarcérer': (1, 19), 'professionnaliser': (0, 0), 'décrier': (1, 0), 'décompresser': (7, 0), 'pommer': (9, 5), 'ricaner': (9, 5), 'rependre': (26, 45), 'embraquer': (1, 0), 'battre': (50, 3), 'extravaser': (0, 0), 'déplanter': (1, 0), 'expier': (0, 0), 'démilitariser': (1, 0), 'susurrer': (7, 0), 'décoloniser': (1, 0), 'ambiancer': (9, 23), 'dépolir': (2, 2), 'maîtriser': (0, 0), 'effilocher': (0, 0), 'gardienner': (41, 0), 'remarquer': (83, 0), 'parloter': (9, 5), 'enivrer': (6, 0), 'chancir': (59, 2), 'enrichir': (34, 2), 'orthographier': (6, 0), 'planifier': (1, 0), 'embaucher': (6, 0), 'multiplexer': (1, 0), 'prosodier': (1, 0), 'délester': (0, 0), 'cofinancer': (1, 31), 'boyauter': (20, 0), 'cantiner': (9, 5), 'empoussiérer': (0, 19), 'damasquiner': (1, 0), 'pantoufler': (9, 5), 'enfreindre': (27, 28), 'enjamber': (7, 0), 'ovaliser': (1, 0), 'morceler': (1, 40), 'démoustiquer': (1, 0), 'récalcitrer': (9, 5), 'rater': (6, 0), 'déboguer': (1, 0), 'motoriser': (1, 0), 'éduquer': (21, 0), 'obséder': (1, 4), 'débâcher': (7, 0), 'rader': (1, 0), 'alangourer': (0, 1), 'enrêner': (1, 0), 'gendarmer': (20, 0), 'zouker': (9, 5), 'effluver': (9, 5), 'décompter': (7, 0), 'escagasser': (40, 0), 'choser': (7, 0), 'titriser': (1, 0), 'surbaisser': (1, 0), 'pirouetter': (9, 5), 'intailler': (1, 0), 'induire': (26, 52), 'chicaner': (46, 0), 'publiciser': (1, 0), 'afficher': (0, 0), 'boursouffler': (0, 0), 'translater': (1, 0), 'couteauner': (1, 0), 'responsabiliser': (1, 0), 'embrasser': (0, 0), 'réassurer': (1, 0), 'ralinguer': (7, 0), 'sablonner': (1, 0), 'habiter': (7, 0), 'cagnarder': (9, 5), 'emmancher': (0, 0), 'délimiter': (1, 0), 'dissoner': (9, 5), 'crêper': (0, 0), 'enguirlander': (1, 0), 'compléter': (0, 16), 'trousser': (0, 0), 'tortorer': (1, 0), 'saucissonner': (7, 0), 'conduire': (5, 52), 'recroller': (9, 5), 'suraller': (9, 5), 'éplucher': (1, 0), 'cautériser': (1, 0), 'allaiter': (7, 0), 'nécroser': (0, 0), 'métaboliser': (1, 0), 'thermoformer': (33, 0), 'défavoriser': (1, 0), 'enquerre': (26, 1), 'vénérer': (1, 19), 'gameler': (0, 40), 'amourer': (1, 0), 'bouffir': (24, 2), 'mobiliser': (0, 0), 'crachouiller': (7, 0), 'champlever': (1, 21), 'adorer': (0, 0), 'déguerpir': (24, 2), 'lasurer': (1, 0), 'remboiter': (1, 0), 'amuïr': (8, 2), 'oxyder': (0, 0), 'pandiculer': (53, 5), 'dénaturer': (0, 0), 'upériser': (1, 0), 'cuver': (7, 0), 'embouter': (1, 0), 'trianguler': (1, 0), 'satisfaire': (90, 89), 'tilter': (7, 0), 'déchoir': (25, 108), 'élonger': (1, 7), 'circonvenir': (26, 10), 'électrolyser': (1, 0), 'emplâtrer': (1, 0), 'treillisser': (1, 0), 'devenir': (35, 10), 'hacher': (1, 0), 'guilleméter': (1, 16), 'distinguer': (6, 0), 'décléricaliser': (1, 0), 'chahuter': (7, 0), 'personnaliser': (1, 0), 'comploter': (23, 0), 'revigorer': (1, 0), 'solliciter': (1, 0), 'extravaguer': (9, 5), 'innover': (7, 0), 'mutualiser': (1, 0), 'noliser': (1, 0), 'tosser': (53, 5), 'pastiquer': (9, 5), 'romaniser': (6, 0), 'dégazonner': (1, 0), 'subir': (11, 2), 'aoûter': (1, 0), 'bobiner': (1, 0), 'paumer': (0, 0), 'nitrifier': (0, 0), 'élider': (0, 0), 'cohériter': (9, 5), 'ingérer': (0, 19), 'abonnir': (2, 2), 'affrioler': (1, 0), 'ambitionner': (1, 0), 'pleuvasser': (54, 61), 'décompacter': (1, 0), 'déglinguer': (0, 0), 'sinuer': (9, 5), 'rougir': (11, 2), 'broyer': (1, 6), 'distancer': (0, 31), 'étayer': (88, 0), 'armorier': (1, 0), 'gélifier': (0, 0), 'collapser': (9, 5), 'relayer': (6, 0), 'coffrer': (1, 0), 'crotter': (6, 0), 'falsifier': (1, 0), 'dauber': (7, 0), 'primariser': (1, 0), 'autonomiser': (0, 0), 'piper': (7, 0), 'incarcérer': (1, 19), 'forlancer': (1, 31), 'prester': (1, 0), 'picorer': (7, 0), 'graticuler': (1, 0), 'manifester': (6, 0), 'délarder': (1, 0), 'bayer': (9, 5), 'croûtonner': (20, 0), 'désaltérer': (0, 19), 'écrouter': (1, 0), 'apatamer': (9, 5), 'enclouer': (1, 0), 'filocher': (7, 0), 'repeigner': (0, 0), 'chlorurer': (1, 0), 'dépocher': (1, 0), 'prévenir': (56, 10), 'vassaliser': (1, 0), 'éculer': (1, 0), 'digitaliser': (1, 0), 'contraindre': (31, 28), 'immigrer': (9, 5), 'conglomérer': (0, 19), 'survendre': (50, 45), 'saboter': (7, 0), 'frire': (73, 133), 'gracier': (1, 0), 'rempoissonner': (1, 0), 'falloir': (76, 129), 'gifler': (1, 0), 'raineter': (1, 34), 'rechigner': (12, 5), 'laver': (0, 0), 'croustiller': (9, 5), 'appéter': (1, 16), 'désavouer': (1, 0), 'louanger': (1, 7), 'effleurir': (16, 32), 'gominer': (20, 0), 'commencer': (60, 31), 'caporaliser': (1, 0), 'encaper': (1, 1), 'bachoter': (9, 5), 'dézinguer': (1, 0), 'thématiser': (1, 0), 'télémétrer': (7, 70), 'suggestionner': (1, 0), 'turluter': (7, 0), 'recalcifier': (1, 0), 'autotomiser': (20, 0), 'rapetisser': (6, 0), 'ensabler': (0, 0), 'bichoter': (54, 55), 'migrer': (9, 5), 'souscrire': (45, 74), 'nordir': (16, 32), 'brouillonner': (7, 0), 'habituer': (0, 0), 'préfixer': (1, 0), 'arçonner': (1, 0), 'privatiser': (1, 0), 'redescendre': (73, 45), 'terreauter': (1, 0), 'questionner': (0, 0), 'disserter': (9, 5), 'boudiner': (1, 0), 'embaluchonner': (1, 0), 'songer': (12, 47), 'moudre': (56, 149), 'picoter': (1, 0), 'bêler': (9, 5), 'talocher': (1, 0), 'réapproprier': (20, 0), 'renouveler': (6, 40), 'voltiger': (9, 47), 'quoailler': (9, 1), 'dépolluer': (1, 0), 'agglutiner': (0, 0), 'tolérer': (0, 19), 'supputer': (1, 0), 'chanfreiner': (1, 0), 'somatiser': (7, 0), 'boubouler': (9, 5), 'asphyxier': (6, 0), 'désassembler': (1, 0), 'japonner': (1, 0), 'embraser': (0, 0), 'emparer': (20, 0), 'combler': (1, 0), 'candir': (8, 2), 'fouger': (9, 47), 'fiabiliser': (1, 0), 'déharder': (1, 0), 'receper': (1, 167), 'ensacher': (1, 0), 'nickeler': (1, 40), 'panneauter': (7, 0), 'appointer': (0, 0), 'créosoter': (1, 0), 'argüer': (38, 0), 'postuler': (7, 0), 'réagir': (14, 32), 'évaporer': (0, 0), 'bénéficier': (58, 5), 'tire-bouchonner': (6, 0), 'repoudrer': (0, 0), 'ternir': (13, 2), 'tarauder': (1, 0), 'argotiser': (9, 5), 'désabuser': (1, 0), 'écrivailler': (9, 5), 'désarchiver': (1, 0), 'bourlinguer': (9, 5), 'dénuder': (0, 0), 'subjuguer': (1, 0), 'bambocher': (9, 5), 'revitaliser': (1, 0), 'farcir': (2, 2), 'foudroyer': (1, 6), 'glavioter': (9, 5), 'aplanir': (2, 2), 'rougeoyer': (9, 51), 'flamber': (7, 0), 'recontracter': (40, 0), 'tecker': (9, 5), 'abouquer': (1, 1), 'poindre': (56, 28), 'désemparer': (7, 0), 'initier': (0, 0), 'délabrer': (0, 0), 'fourcher': (7, 0), 'césariser': (1, 0), 'nécessiter': (33, 0), 'arroser': (0, 0), 'glacer': (6, 31), 'relacer': (1, 31), 'transcoder': (1, 0), 'défalquer': (1, 0), 'recorder': (1, 0), 'broadcaster': (1, 0), 'coutoyer': (1, 6), 'bicher': (9, 5), 'corder': (1, 0), 'magasiner': (7, 0), 'ensoutaner': (1, 0), 'dégainer': (1, 0), 'étalonner': (1, 0), 'écosser': (1, 0), 'envoûter': (1, 0), 'clienter': (1, 0), 'revirer': (9, 5), 'râler': (9, 5), 'étarquer': (1, 0), 'peaufiner': (1, 0), 'reposer': (6, 0), 'russiser': (1, 0), 'désélectionner': (1, 0), 'recoiffer': (0, 0), 'emperruquer': (21, 0), 'déconcubiner': (20, 1), 'carcailler': (9, 5), 'chaluter': (53, 0), 'lister': (1, 0), 'ratisser': (1, 0), 'halkiner': (9, 0), 'allégérir': (26, 1), 'décalcariser': (1, 0), 'disputailler': (9, 5), 'sarmenter': (9, 5), 'explorer': (1, 0), 'contre-sceller': (1, 0), 'renter': (41, 0), 'bâfrer': (7, 0), 'tokeniser': (41, 0), 'résister': (58, 5), 'étrenner': (7, 0), 'contre-plaquer': (1, 0), 'obombrer': (1, 0), 'entre-manger': (65, 120), 'incidenter': (41, 0), 'décrocher': (6, 0), 'natter': (1, 0), 'moucharder': (7, 0), 'déglacer': (1, 31), 'inscrire': (10, 74), 'récrier': (20, 0), 'défretter': (1, 0), 'déboucher': (7, 0), 'manchonner': (1, 0), 'soigner': (6, 0), 'infuser': (7, 0), 'échauler': (1, 0), 'blinquer': (7, 0), 'afférer': (9, 25), 'requinquer': (0, 0), 'repincer': (1, 31), 'appendre': (26, 45), 'embreler': (1, 40), 'revêtir': (10, 115), 'contremander': (1, 0), 'éventer': (0, 0), 'retransformer': (0, 0), 'engorger': (0, 7), "entr'apercevoir": (10, 42), 'torsader': (1, 0), 'désaméricaniser': (21, 0), 'neigeoter': (54, 61), 'tatillonner': (9, 5), 'casse-croûter': (9, 5), 'matouner': (7, 0), 'revacciner': (1, 0), 'abîmer': (0, 0), 'feutrer': (6, 0), 'typiser': (1, 0), 'allégir': (4, 2), 'contrepousser': (65, 88), 'réapprovisionner': (0, 0), 'convoyer': (1, 6), 'processionner': (9, 5), 'empenneler': (1, 40), 'écatir': (4, 2), 'angéliser': (0, 0), 'ripatonner': (9, 1), 'quantifier': (1, 0), 'frayer': (6, 0), 'cafouiller': (9, 5), 'sauvegarder': (1, 0), 'accélérer': (6, 19), 'enflammer': (0, 0), 'verbaliser': (7, 0), 'exécrer': (1, 127), 'cocooner': (41, 0), 'démarquer': (0, 0), 'froidir': (16, 32), 'empiler': (0, 0), 'tamponner': (0, 0), 'baraquer': (7, 0), 'recroitre': (43, 14), 'fredonner': (7, 0), 'écrire': (50, 74), 'démarier': (0, 0), 'frustrer': (1, 0), 'délaisser': (1, 0), 'dépareiller': (1, 0), 'canneler': (1, 40), 'bluffer': (7, 0), 'coconstruire': (5, 52), 'fomenter': (1, 0), 'désulfurer': (1, 0), 'fouiner': (9, 5), 'scissionner': (9, 5), 'alentir': (4, 2), 'chromer': (1, 0), 'résumer': (0, 0), 'abréagir': (16, 2), 'énerver': (0, 0), 'carencer': (1, 31), 'péter': (6, 16), 'autoféconder': (20, 0), 'lamper': (1, 0), 'abécher': (1, 12), 'gîter': (9, 5), 'emmêler': (0, 0), 'réoccuper': (1, 0), 'exciper': (58, 5), 'guillocher': (1, 0), 'mécaniser': (1, 0), 'concéder': (1, 4), 'ostraciser': (1, 0), 'interpeller': (1, 0), 'désenlacer': (1, 31), 'vermiller': (9, 5), 'calomnier': (1, 0), 'enseigner': (0, 0), 'rengracier': (9, 5), 'bouder': (6, 0), 'dévoyer': (20, 6), 'baratter': (1, 0), 'arquebuser': (1, 0), 'remoudre': (26, 149), 'décocher': (1, 0), 'alcooliser': (0, 0), 'pissoter': (9, 5), 'quadrupler': (7, 0), 'encager': (1, 7), 'beloter': (9, 5), 'désorber': (1, 0), 'cacheter': (1, 34), 'focaliser': (0, 0), 'approcher': (3, 0), 'cacaber': (9, 5), 'entredévorer': (65, 88), 'trembler': (9, 5), 'réopérer': (1, 19), 'fulgurer': (7, 0), 'décomplexer': (1, 0), 'parquer': (7, 0), 'entre-heurter': (65, 88), 'foutre': (31, 90), 'mastéguer': (7, 1), 'hausser': (0, 0), 'déparer': (1, 0), 'enfariner': (1, 0), 'amener': (22, 39), 'hancher': (7, 0), 'aberrer': (9, 5), 'puer': (7, 0), 'solmiser': (1, 0), 'saler': (1, 0), 'criser': (9, 5), 'décuivrer': (1, 0), 'gouaper': (9, 5), 'toronner': (1, 0), 'symboliser': (1, 0), 'formoler': (1, 0), 'léser': (1, 38), 'tenonner': (1, 0), 'refabriquer': (1, 0), 'limiter': (0, 0), 'appâter': (1, 0), 'complimenter': (1, 0), 'décalcifier': (0, 0), 'réquisitionner': (1, 0), 'réordonner': (1, 0), 'étrécir': (2, 2), 'fronder': (7, 0), 'ébrouer': (20, 0), 'écorcer': (1, 31), 'tirailler': (7, 0), 'déclore': (26, 109), 'bouter': (1, 0), 'compatir': (61, 32), 'caroubler': (1, 0), 'encourager': (0, 7), 'décompiler': (1, 0), 'ivoiriser': (1, 0), 'absconser': (0, 1), 'toussailler': (9, 5), 'dévalider': (1, 0), 'épanneler': (1, 40), 'priver': (0, 0), 'créneler': (1, 102), 'regrouper': (0, 0), 'commenter': (1, 0), 'meugler': (9, 5), 'rapiner': (9, 5), 'décarrer': (9, 5), 'mucher': (1, 0), 'expliciter': (1, 0), 'harmoniser': (0, 0), 'réveillonner': (9, 5), 'solubiliser': (1, 0), 'chatouiller': (1, 0), 'conférer': (23, 19), 'recoucher': (0, 0), 'scribouiller': (1, 0), 'mener': (7, 39), 'préparer': (22, 0), 'atterrir': (11, 2), 'méduser': (1, 0), 'débecter': (1, 0), 'enrouler': (0, 0), 'baligander': (9, 5), 'démenotter': (33, 0), 'pistonner': (1, 0), 'cokser': (1, 0), 'biter': (1, 0), 'métamorphiser': (1, 0), 'défranciser': (1, 0), 'randonner': (9, 5), 'écheler': (0, 40), 'réfugier': (20, 0), 'encrêper': (1, 0), 'argenter': (0, 0), 'prolétariser': (1, 0), 'délecter': (0, 0), 'riveter': (1, 34), 'invertir': (4, 2), 'asservir': (2, 2), 'surgir': (37, 32), 'inquiéter': (0, 16), 'fouiller': (6, 0), 'sonner': (23, 0), 'troubler': (0, 0), 'chevreter': (9, 54), 'essorer': (0, 0), 'luncher': (9, 5), 'risquer': (0, 0), 'augmenter': (6, 0), 'reclasser': (1, 0), 'déconfire': (26, 86), 'déréguler': (1, 0), 'rayer': (0, 0), 'maquiller': (0, 0), 'complexifier': (0, 0), 'brigander': (7, 0), 'empaler': (0, 0), 'décomprimer': (1, 0), 'débrouiller': (0, 0), 'aller': (39, 36), 'esbroufer': (1, 0), 'judiciariser': (1, 0), 'bordurer': (1, 0), 'double-cliquer': (9, 107), 'absolutiser': (1, 0), 'maugréer': (7, 0), 'sursoir': (95, 186), 'rebouter': (1, 0), 'piner': (7, 0), 'embouquer': (7, 0), 'jargonner': (9, 5), 'tergiverser': (9, 5), 'miniaturiser': (1, 0), 'sustenter': (0, 0), 'racketter': (1, 0), 'nobscuriter': (9, 5), 'automatiser': (1, 0), 'interchanger': (83, 7), 'désoxyder': (1, 0), 'léchouiller': (1, 0), 'désembuer': (1, 0), 'nuer': (1, 0), 'sortir': (5, 87), 'ensuivre': (17, 119), 'insérer': (0, 19), 'chatoyer': (9, 51), 'iconiser': (1, 1), 'vocaliser': (7, 0), 'déconnecter': (1, 0), 'prospecter': (7, 0), 'économiser': (7, 0), 'désintéresser': (0, 0), 'rapporter': (6, 0), 'nidifier': (9, 5), 'réenregistrer': (0, 0), 'relaxer': (0, 0), 'bondir': (37, 32), 'douter': (70, 0), 'rober': (1, 0), 'coproduire': (26, 52), 'disloquer': (0, 0), 'méconnaître': (10, 15), 'camembérer': (9, 25), 'délabyrinther': (1, 0), 'promulguer': (1, 0), 'minuter': (1, 0), 'confiancer': (1, 31), 'moiter': (9, 5), 'chocotter': (1, 0), 'grafigner': (1, 0), 'conserver': (0, 0), 'interpeler': (1, 102), 'remémorer': (0, 0), 'segmenter': (0, 0), 'vitupérer': (7, 19), 'séquestrer': (1, 0), 'fragiliser': (1, 0), 'cingler': (6, 0), 'délirer': (9, 5), 'emmouscailler': (1, 0), 'prédiquer': (1, 0), 'conglutiner': (1, 0), 'engraver': (1, 0), 'élégir': (4, 2), 'lire': (50, 142), 'chiffrer': (6, 0), 'générer': (1, 19), 'envider': (1, 0), 'amurer': (1, 0), 'bafouer': (1, 0), 'exclamer': (20, 0), 'envelopper': (0, 0), 'sourire': (104, 172), 'dissimuler': (0, 0), 'accabler': (0, 0), 'filer': (6, 0), 'nager': (7, 7), 'dégîter': (1, 0), 'présenter': (3, 0), 'radiographier': (1, 0), 'réunifier': (1, 0), 'dessouler': (6, 0), 'hurler': (7, 0), 'épauler': (0, 0), 'aposter': (1, 0), 'déverminer': (1, 0), 'ringarder': (1, 0), 'théoriser': (7, 0), 'trôner': (9, 5), 'cravater': (0, 0), 'narrer': (1, 0), 'berner': (1, 0), 'giboyer': (1, 6), 'baliser': (7, 0), 'regréer': (1, 0), 'renflouer': (1, 0), 'retraverser': (1, 0), 'forligner': (9, 5), 'aliter': (0, 0), 'cuisiner': (7, 0), 'écrabouiller': (1, 0), 'éborgner': (0, 0), 'surhausser': (1, 0), 'pierrer': (1, 0), 'mailler': (7, 0), 'chaîner': (1, 0), 'zyeuter': (1, 0), 'cocotter': (9, 5), 'patouiller': (7, 0), 'gigoter': (9, 5), 'infirmer': (1, 0), 'incomber': (58, 140), 'recéper': (1, 169), 'accaparer': (1, 0), 'blanchir': (13, 2), 'dégrosser': (1, 0), 'visiter': (1, 0), 'décérébrer': (1, 84), 'gober': (1, 0), 'sodomiser': (1, 0), 'discriminer': (1, 0), 'slalomer': (9, 5), 'peloter': (7, 0), 'dépolymériser': (1, 0), 'agioter': (9, 5), 'asseoir': (31, 49), 'poiler': (20, 0), 'subjectiviser': (21, 0), 'homogénéifier': (1, 0), 'certifier': (1, 0), 'disperser': (0, 0), 'désexualiser': (1, 0), 'tétaniser': (0, 0), 'dialectaliser': (1, 0), 'surnoter': (7, 0), 'souvenir': (105, 10), 'dénébuler': (1, 0), 'amidonner': (1, 0), 'minorer': (1, 0), 'jucher': (6, 0), 'friquer': (1, 0), 'frelater': (1, 0), 'préconiser': (1, 0), 'tiquer': (9, 5), 'bouffonner': (9, 5), 'mousser': (9, 5), 'détortiller': (1, 0), 'pétocher': (9, 5), 'appliquer': (0, 0), 'paletter': (1, 0), 'promettre': (50, 29), 'délivrer': (0, 0), 'surajouter': (0, 0), 'paner': (1, 0), 'surchauffer': (1, 0), 'ourdir': (2, 2), 'affourcher': (1, 0), 'scintiller': (9, 5), 'confirmer': (0, 0), 'enficher': (1, 0), 'ovuler': (9, 5), 'rager': (9, 47), 'contreplaquer': (1, 0), 'dessouder': (0, 0), 'épinceler': (1, 40), 'situer': (40, 0), 'assouvir': (2, 2), 'redimensionner': (1, 0), 'distraire': (69, 11), 'dépêtrer': (0, 0), 'désagrafer': (1, 0), 'délisser': (7, 0), 'indigner': (0, 0), 'ponctionner': (1, 0), 'inventer': (6, 0), 'rogner': (7, 0), 'distendre': (10, 45), 'embosser': (0, 0), 'réattribuer': (0, 0), 'exagérer': (6, 19), 'garancer': (1, 31), 'lénifier': (1, 0), 'coloniser': (1, 0), 'caricaturer': (1, 0), 'flingoter': (1, 1), 'forniquer': (9, 5), 'vinaigrer': (1, 0), 'téléviser': (1, 0), 'raviser': (20, 0), 'stratifier': (1, 0), 'escarrifier': (1, 0), 'décaper': (1, 0), 'signaler': (22, 0), 'découper': (0, 0), 'désagencer': (1, 31), 'contreprofiler': (1, 0), 'frisoter': (7, 0), 'maroufler': (1, 0), 'invaginer': (20, 0), 'complexer': (0, 0), 'surjouer': (7, 0), 'clipser': (0, 0), 'lexicaliser': (20, 0), 'gouger': (1, 7), 'enamourer': (20, 0), 'désengrener': (1, 39), 'gonfler': (6, 0), 'postsynchroniser': (1, 0), 'luxer': (0, 0), 'télescoper': (0, 0), 'éditer': (1, 0), 'ébouer': (1, 0), 'perpétrer': (0, 70), 'trotter': (32, 0), 'empercher': (1, 0), 'contre-braquer': (41, 5), 'échardonner': (1, 0), 'artificialiser': (0, 0), 'lubrifier': (1, 0), 'pressentir': (27, 87), 'nucléariser': (1, 0), 'télécopier': (1, 0), 'radouber': (1, 0), 'levretter': (9, 5), 'torpiller': (1, 0), 'accourcir': (24, 2), 'vitrioler': (1, 0), 'crocheter': (1, 20), 'récuser': (0, 0), 'emporter': (0, 0), 'pelleter': (1, 34), 'éluder': (1, 0), 'défaire': (31, 89), 'verglacer': (54, 191), 'pirater': (7, 0), 'déscolariser': (1, 0), 'freiner': (6, 0), 'marxiser': (1, 0), 'abigotir': (10, 1), 'velouter': (0, 0), 'répugner': (38, 0), 'lester': (0, 0), 'frauder': (7, 0), 'stupéfaire': (26, 182), 'redire': (95, 105), 'empeser': (1, 113), 'remporter': (1, 0), 'aborder': (6, 0), 'accroître': (18, 15), 'guérir': (13, 2), 'dénébuliser': (1, 0), 'dédicacer': (1, 31), 'ronsardiser': (9, 5), 'systématiser': (6, 0), 'échancrer': (1, 0), 'grasseyer': (7, 0), 'lamenter': (6, 0), 'évader': (20, 0), 'dégoter': (7, 0), 'déstabiliser': (1, 0), 'bluter': (1, 0), 'dégouliner': (9, 5), 'rempocher': (1, 0), 'mendier': (7, 0), 'coiffer': (0, 0), 'insurger': (20, 7), 'crédibiliser': (1, 0), 'kiffer': (1, 0), 'apercevoir': (31, 42), 'huer': (7, 0), 'abâtardir': (2, 2), 'dragonner': (1, 0), 'vandaliser': (1, 0), 'partitionner': (1, 0), 'désappointer': (1, 0), 'dégraisser': (1, 0), 'égosiller': (20, 0), 'sous-louer': (1, 0), 'blatérer': (9, 25), 'engober': (1, 0), 'voussoyer': (0, 6), 'occasionner': (1, 0), 'muscler': (1, 0), 'retirer': (40, 0), 'agricher': (1, 0), 'tenir': (50, 10), 'maraver': (7, 0), 'hospitaliser': (1, 0), 'relire': (5, 142), 'panteler': (9, 33), 'démastiquer': (1, 0), 'préexister': (9, 5), 'dégriffer': (1, 0), 'indaguer': (9, 5), 'dégingander': (0, 0), 'engueuler': (0, 0), 'préacheter': (1, 20), 'originer': (0, 0), 'homogénéiser': (1, 0), 'arquer': (6, 0), 'écuisser': (1, 0), 'broder': (7, 0), 'réfrigérer': (1, 19), 'amerrir': (16, 2), 'recopier': (1, 0), 'typer': (1, 0), 'dédoubler': (0, 0), 'renfermer': (0, 0), 'mâter': (1, 0), 'décimaliser': (1, 0), 'puiser': (7, 0), 'voyager': (9, 47), 'ensiler': (1, 0), 'apparenter': (0, 0), 'affainéantir': (2, 1), 'croasser': (9, 5), 'bordéliser': (1, 0), 'margauder': (9, 5), 'aviser': (6, 0), 'ligaturer': (1, 0), 'superfinir': (4, 2), 'surmédicaliser': (1, 0), 'empeigner': (1, 0), 'oblitérer': (1, 19), 'supporter': (0, 0), 'culer': (7, 0), 'nominaliser': (1, 0), 'gobeter': (1, 34), 'écrêter': (1, 0), 'chiader': (1, 0), 'épiloguer': (38, 0), 'prohiber': (1, 0), 'rééquiper': (0, 0), 'cicatriser': (6, 0), 'désembrouiller': (41, 0), 'démultiplier': (1, 0), 'contenir': (31, 10), 'annuler': (0, 0), 'émoudre': (26, 149), 'apitoyer': (0, 6), 'désopiler': (0, 0), 'confisquer': (1, 0), 'décorcer': (1, 31), 'évertuer': (20, 0), 'scorifier': (1, 0), 'emmitoufler': (0, 0), 'alkyler': (0, 0), 'reconvertir': (2, 2), 'endiabler': (7, 0), 'fantasmer': (7, 0), 'seconder': (1, 0), 'éparpiller': (0, 0), 'bougonner': (7, 0), 'portraiturer': (1, 0), 'blinder': (6, 0), 'gemmer': (1, 0), 'trépider': (9, 5), 'texturer': (1, 0), 'pyrolyser': (33, 0), 'inhiber': (1, 0), 'désenchaîner': (1, 0), 'ébavurer': (1, 0), 'déflorer': (1, 0), 'remélanger': (21, 7), 'yodler': (9, 5), 'étatiser': (1, 0), 'ponctuer': (1, 0), 'revolvériser': (1, 0), 'titiller': (7, 0), 'zinguer': (1, 0), 'tabler': (58, 5), 'laïusser': (9, 5), 'courtauder': (1, 0), 'hydrogéner': (1, 35), 'friser': (6, 0), 'éloigner': (40, 0), 'cadenasser': (1, 0), 'nominer': (1, 0), 'vaticiner': (9, 5), 'phosphorer': (9, 5), 'forger': (6, 7), 'provoquer': (0, 0), 'pager': (32, 7), 'monologuer': (9, 5), 'reproposer': (6, 0), 'quintessencier': (1, 0), 'hypnotiser': (0, 0), 'tamiser': (7, 0), 'excepter': (1, 0), 'accoster': (0, 0), 'wolophiser': (1, 0), 'souder': (0, 0), 'engraisser': (6, 0), 'trainailler': (9, 5), 'aciseler': (1, 22), 'désaxer': (1, 0), 'voter': (7, 0), 'dénier': (1, 0), 'renvenimer': (1, 0), 'déguster': (1, 0), 'surglacer': (1, 31), 'estropier': (0, 0), 'fulminer': (7, 0), 'désenverguer': (1, 0), 'encercler': (1, 0), 'adhérer': (30, 25), 'parjurer': (20, 0), 'prédéterminer': (1, 0), 'méconnaitre': (10, 14), 'boiser': (1, 0), 'décarcasser': (0, 0), 'rentrayer': (1, 0), 'frouer': (9, 5), 'apiquer': (1, 0), 'déplorer': (1, 0), 'gringuer': (9, 5), 'estimer': (0, 0), 'centraliser': (1, 0), 'palissonner': (1, 0), 'bastionner': (1, 0), 'anticiper': (41, 0), 'virer': (23, 0), 'bouger': (21, 7), 'suer': (7, 0), 'soutirer': (1, 0), 'refaçonner': (1, 0), 'espacer': (0, 31), 'visualiser': (1, 0), 'évincer': (1, 31), 'couder': (1, 0), 'surjaler': (9, 0), 'rider': (0, 0), 'dessaisir': (2, 2), 'décanter': (6, 0), 'plastifier': (1, 0), 'surtaxer': (1, 0), 'déshabituer': (0, 0), 'formater': (1, 0), 'roufler': (7, 0), 'libaniser': (20, 0), 'discourir': (25, 13), 'flamboyer': (9, 51), 'buriner': (1, 0), 'ressouvenir': (17, 10), 'dérouiller': (6, 0), 'relarguer': (1, 0), 'ébraiser': (1, 0), 'renverger': (1, 7), 'encabaner': (1, 0), 'rucher': (1, 0), 'diapasonner': (21, 0), 'trottiner': (9, 5), 'décloisonner': (1, 0), 'radioscoper': (1, 0), 'déficeler': (1, 40), 'rajouter': (1, 0), 'émacier': (0, 0), 'réapprendre': (45, 46), 'codécider': (1, 0), 'affectionner': (1, 0), 'antéposer': (1, 0), 'muer': (6, 0), 'revivre': (73, 171), 'estomper': (0, 0), 'accueillir': (27, 17), 'givrer': (0, 0), 'dansotter': (9, 5), 'pestiférer': (1, 19), 'vernir': (4, 2), 'défiler': (6, 0), 'éveiller': (0, 0), 'truquer': (7, 0), 'mithridatiser': (0, 0), 'transférer': (1, 19), 'coïncider': (9, 5), 'aiguiser': (0, 0), 'catapulter': (1, 0), 'assoiffer': (1, 0), 'accessoiriser': (1, 0), 'emboîter': (0, 0), 'revivifier': (1, 0), 'débenzoler': (1, 0), 'rengager': (6, 7), 'influencer': (1, 31), 'fustiger': (1, 7), 'agoniser': (9, 5), 'siéger': (9, 165), 'contorsionner': (0, 0), 'entabler': (0, 0), 'diéser': (1, 38), 'réconcilier': (0, 0), 'englacer': (1, 31), 'défriper': (1, 0), 'électriser': (1, 0), 'mentionner': (1, 0), 'brillanter': (1, 0), 'déblatérer': (9, 25), 'promotionner': (1, 0), 'harceler': (1, 22), 'raffermir': (2, 2), 'dactylographier': (1, 0), 'griser': (0, 0), 'espoliner': (1, 0), 'carminer': (1, 0), 'persécuter': (1, 0), 'rigidifier': (1, 0), 'payer': (3, 0), 'survolter': (1, 0), 'déshonorer': (0, 0), 'cogner': (19, 0), 'virevolter': (9, 5), 'contracturer': (1, 0), 'usiner': (1, 0), 'désencadrer': (1, 0), 'boucaner': (7, 0), 'affaîter': (1, 0), 'ovationner': (1, 0), 'prioriser': (1, 0), 'cadeauter': (1, 0), 'parodier': (1, 0), 'coquiller': (1, 0), 'apponter': (9, 5), 'recroître': (43, 168), 'publier': (7, 0), 'pomper': (7, 0), 'gargouiller': (9, 5), 'encapuchonner': (0, 0), 'mincir': (37, 32), 'estérifier': (1, 0), 'bibeloter': (9, 5), 'désindenter': (1, 0), 'éviter': (19, 0), 'surcouper': (9, 5), 'décalaminer': (1, 0), 'musquer': (1, 0), 'déquiller': (1, 0), 'déphosphater': (1, 0), 'synthétiser': (7, 0), 'consumer': (0, 0), 'boire': (55, 59), 'adsorber': (1, 0), 'refroidir': (15, 2), 'phagocyter': (1, 0), 'malléabiliser': (1, 0), 'dérailler': (9, 5), 'dégrouiller': (20, 0), 'verrouiller': (0, 0), 'décongestionner': (1, 0), 'mercantiliser': (1, 0), 'remailler': (1, 0), 'former': (3, 0), 'empoisonner': (0, 0), 'pacser': (0, 0), 'reculer': (6, 0), 'orienter': (0, 0), 'bisquer': (9, 5), 'adouber': (7, 0), 'ébouriffer': (1, 0), 'récolter': (0, 0), 'jouxter': (1, 0), 'délignifier': (1, 0), 'déprendre': (17, 46), 'télécharger': (1, 7), 'revouloir': (26, 1), 'stérer': (1, 19), 'surédifier': (1, 0), 'renarder': (9, 5), 'abriver': (9, 1), 'alléger': (0, 8), 'dégonder': (1, 0), 'présélectionner': (1, 0), 'aminer': (9, 5), 'passementer': (1, 0), 'glycériner': (1, 0), 'patiner': (6, 0), 'embuer': (0, 0), 'réjouir': (34, 2), 'affaisser': (0, 0), 'contrepercer': (1, 31), 'assoler': (1, 0), 'réusiner': (1, 0), 'deviner': (0, 0), 'aseptiser': (1, 0), 'amollir': (2, 2), 'solenniser': (1, 0), 'cagner': (9, 5), 'bolcheviser': (1, 0), 'destiner': (0, 0), 'mastiquer': (7, 0), 'noncer': (9, 23), 'déverser': (0, 0), 'chlinguer': (9, 5), 'recacheter': (1, 34), 'diaboliser': (1, 0), 'collecter': (0, 0), 'dénicotiniser': (1, 0), 'glander': (9, 5), 'pouiller': (1, 0), 'tréfiler': (1, 0), 'riper': (7, 0), 'financer': (7, 31), 'équiper': (0, 0), 'plâtrer': (1, 0), 'découvrir': (5, 94), 'fusiller': (1, 0), 'dévirginiser': (1, 0), 'irradier': (6, 0), 'arbitrer': (1, 0), 'escarper': (1, 0), 'toucher': (3, 0), 'découdre': (10, 93), 'clamser': (9, 5), 'anonymiser': (0, 0), 'fuir': (55, 118), 'invectiver': (7, 0), 'désectoriser': (1, 0), 'déféquer': (7, 67), 'frusquer': (0, 0), 'émasculer': (1, 0), 'immoler': (0, 0), 'acculturer': (1, 0), 'saccager': (1, 7), 'acérer': (1, 19), 'repairer': (9, 5), 'arboriser': (9, 5), 'filialiser': (1, 0), 'désaliéner': (1, 35), 'pêcher': (6, 0), 'faucarder': (1, 0), 'herser': (1, 0), 'inspirer': (6, 0), 'contre-vérifier': (41, 0), 'rosir': (24, 2), 'dompter': (1, 0), 'décrépiter': (7, 0), 'brésiller': (6, 0), 'cureter': (1, 34), 'goupiller': (0, 0), 'constitutionnaliser': (1, 0), 'entacher': (1, 0), 'embastionner': (1, 0), 'référer': (29, 19), 'complémenter': (1, 0), 'écluser': (1, 0), 'confiturer': (1, 0), 'terrir': (16, 32), 'palmer': (1, 0), 'engazonner': (1, 0), 'dépraver': (1, 0), 'foéner': (7, 35), 'subroger': (1, 7), 'bouteiller': (1, 0), 'harnacher': (0, 0), 'adjectiviser': (1, 0), 'revérifier': (0, 0), 'arquepincer': (1, 31), 'accroitre': (18, 14), 'recondamner': (1, 0), 'désaccoupler': (1, 0), 'salpêtrer': (1, 0), 'menuiser': (1, 0), 'écoper': (7, 0), 'collatéraliser': (41, 0), 'rappointir': (4, 2), 'défarguer': (1, 1), 'marqueter': (1, 34), 'débrôler': (1, 0), 'éperonner': (0, 0), 'congeler': (0, 22), 'décentraliser': (0, 0), 'résoudre': (31, 174), 'prêter': (6, 0), 'licher': (7, 0), 'broncher': (9, 5), 'diéséliser': (1, 0), 'rassurer': (0, 0), 'ragouter': (1, 0), 'ventiler': (1, 0), 'démeubler': (1, 0), 'chanceler': (9, 33), 'initialer': (1, 0), 'murer': (0, 0), "entr'hiverner": (1, 1), 'chipoter': (9, 5), 'mensualiser': (1, 0), 'épeuler': (1, 0), 'dégourdir': (2, 2), 'ruer': (32, 0), 'choufer': (1, 0), 'chiquer': (7, 0), 'peupler': (0, 0), 'déliter': (0, 0), 'attraire': (26, 1), 'toper': (9, 5), 'santonner': (1, 0), 'consulter': (6, 0), 'napper': (1, 0), 'cambuter': (7, 0), 'ajourer': (1, 0), 'mixer': (1, 0), 'détiser': (1, 1), 'remordre': (26, 45), 'contaminer': (1, 0), 'barricader': (0, 0), 'potentialiser': (1, 0), 'assoner': (9, 5), 'moquer': (0, 0), 'garroter': (1, 0), 'paillassonner': (1, 0), 'marner': (7, 0), 'plaisanter': (7, 0), 'tournicoter': (9, 5), 'joncer': (1, 31), 'pleuvioter': (54, 61), 'resaluer': (1, 0), 'flurer': (1, 1), 'accoutrer': (0, 0), 'désaligner': (1, 0), 'enjuponner': (1, 0), 'faiblir': (37, 32), 'calligraphier': (1, 0), 'jacasser': (9, 5), 'jaboter': (7, 0), 'abotter': (12, 1), 'réinitialiser': (1, 0), 'admonester': (0, 0), 'loquer': (0, 0), 'prophétiser': (7, 0), 'architecturer': (1, 0), 'madéfier': (1, 0), 'parceller': (1, 0), 'amputer': (0, 0), 'réadmettre': (26, 29), 'harasser': (1, 0), 'cafeter': (7, 34), 'slaviser': (1, 0), 'crever': (6, 21), 'baratiner': (7, 0), 'forfaitiser': (1, 0), 'axer': (0, 0), 'barloquer': (9, 5), 'garer': (0, 0), 'dépersonnaliser': (0, 0), 'médailler': (1, 0), 'biquer': (9, 5), 'piquouser': (1, 0), 'encaver': (1, 0), 'déprogrammer': (1, 0), 'défaufiler': (1, 0), 'gréver': (9, 5), 'côtoyer': (0, 6), 'poster': (0, 0), 'radiner': (32, 0), 'embourber': (0, 0), 'réunir': (15, 2), 'ariser': (1, 0), 'fourailler': (7, 0), 'escorter': (1, 0), 'strier': (1, 0), 'skier': (9, 5), 'gabarier': (1, 0), 'orientaliser': (0, 0), 'viabiliser': (1, 0), 'jurer': (6, 0), 'fumiger': (1, 7), 'viser': (23, 0), 'gazer': (7, 0), 'frémir': (37, 32), 'étançonner': (1, 0), 'materner': (1, 0), 'résider': (9, 5), 'transposer': (1, 0), 'renauder': (53, 5), 'faner': (0, 0), 'calcifier': (40, 0), 'prosterner': (0, 0), 'entre-regarder': (65, 88), 'regreffer': (1, 0), 'inspecter': (1, 0), 'marauder': (7, 0), 'surabonder': (9, 5), 'empoissonner': (1, 0), 'défier': (0, 0), 'désaper': (0, 0), 'guetter': (6, 0), 'pastiller': (1, 0), 'nier': (7, 0), 'transiger': (9, 47), 'contextualiser': (1, 0), 'fenestrer': (1, 0), 'déluter': (1, 0), 'trouilloter': (9, 5), 'attifer': (0, 0), 'aheurter': (20, 0), 'capituler': (9, 5), 'refourguer': (1, 0), 'désaffecter': (1, 0), 'crételer': (9, 102), 'coopter': (1, 0), 'contrevenir': (66, 10), 'ensanglanter': (1, 0), 'durcir': (13, 2), 'rassoir': (69, 50), 'exporter': (6, 0), 'interjeter': (1, 34), 'goberger': (20, 7), 'compiler': (1, 0), 'apostasier': (9, 5), 'rediriger': (1, 7), 'reconfirmer': (0, 0), 'commuter': (7, 0), 'surfacer': (7, 31), 'dégravoyer': (1, 6), 'débattre': (18, 3), 'oiseler': (7, 40), 'raccuspoter': (9, 5), 'coupeller': (1, 0), 'benner': (1, 0), 'requestionner': (0, 0), 'surpayer': (1, 0), 'cheminer': (9, 5), 'gratter': (6, 0), 'vanter': (0, 0), 'réaffûter': (1, 0), 'préremplir': (41, 2), 'rôtir': (13, 2), 'agrainer': (1, 0), 'dévitaliser': (1, 0), 'flânocher': (9, 5), 'sténotyper': (1, 0), 'précautionner': (0, 0), 'galvaniser': (1, 0), 'raffoler': (58, 5), 'gratiner': (7, 0), 'repolir': (4, 2), 'dilater': (0, 0), 'barouder': (9, 5), 'constiper': (7, 0), 'renfaîter': (1, 0), 'troussequiner': (1, 0), 'cabotiner': (9, 5), 'nombrer': (1, 0), 'surarmer': (1, 0), 'bouillir': (56, 60), 'plaider': (7, 0), 'avachir': (13, 2), 'youyouter': (9, 5), 'vaquer': (12, 5), 'infantiliser': (1, 0), 'vieillir': (15, 2), 'draguer': (7, 0), 'ouatiner': (1, 0), 'enfanter': (7, 0), 'remonter': (84, 0), 'convulser': (0, 0), 'renvier': (7, 0), 'laïciser': (0, 0), 'mésestimer': (1, 0), 'démêler': (0, 0), 'solifluer': (9, 5), 'massicoter': (1, 0), 'désobéir': (14, 32), 'encoller': (1, 0), 'juger': (64, 7), 'chasser': (41, 0), 'renchérir': (24, 2), 'chicorer': (20, 0), 'louchir': (16, 32), 'insupporter': (20, 0), 'cartonner': (7, 0), 'réfuter': (1, 0), 'façonner': (1, 0), 'connobler': (1, 1), 'suroxyder': (1, 0), 'enfleurer': (1, 0), 'entradmirer': (65, 88), 'annexer': (0, 0), 'abréger': (0, 8), 'festoyer': (1, 6), 'stationner': (9, 5), 'affaler': (0, 0), 'parer': (19, 0), 'batailler': (32, 0), 'compulser': (1, 0), 'gambader': (9, 5), 'écrier': (20, 0), 'affilier': (0, 0), 'vélariser': (1, 0), 'dézipper': (1, 0), 'entre-frapper': (65, 88), 'border': (1, 0), 'militariser': (1, 0), 'abrutir': (15, 2), 'remplumer': (0, 0), 'reparcourir': (4, 2), 'cloner': (1, 0), 'fabuler': (9, 5), 'reformater': (1, 0), 'claveter': (1, 34), 'souffleter': (1, 34), 'factoriser': (1, 0), 'ressusciter': (7, 0), 'alphabétiser': (1, 0), 'doubler': (6, 0), 'ronfler': (9, 5), 'déstocker': (7, 0), 'réassortir': (2, 2), 'flécher': (1, 12), 'innerver': (1, 0), 'ébruter': (1, 0), 'imiter': (1, 0), 'canner': (7, 0), 'exiler': (0, 0), 'polycopier': (1, 0), 'supplémenter': (1, 0), 'désengager': (0, 7), 'refonder': (1, 0), 'jouir': (14, 32), 'empâter': (0, 0), 'détroncher': (9, 5), 'truster': (1, 0), 'diaprer': (1, 0), 'franchiser': (1, 0), 'échographier': (1, 0), 'forjeter': (7, 34), 'sympathiser': (9, 5), 'désemprisonner': (1, 0), 'quittancer': (1, 31), 'miauler': (9, 5), 'déparaffiner': (1, 0), 'flancher': (7, 0), 'auditer': (1, 0), 'rosser': (1, 0), 'décréter': (1, 16), 'mendigoter': (7, 0), 'dessoucher': (1, 0), 'allotir': (4, 2), 'raccuser': (9, 5), 'désembouteiller': (1, 0), 'décrasser': (0, 0), 'autographier': (1, 0), 'bâter': (1, 0), 'capitaliser': (7, 0), 'médicamenter': (1, 0), 'supplanter': (0, 0), 'patcher': (41, 0), 'talquer': (1, 0), 'jointer': (1, 0), 'refermer': (0, 0), 'tympaniser': (1, 0), 'imploser': (9, 5), 'mijoler': (9, 5), 'brillantiner': (1, 0), 'tutoyer': (0, 6), 'manucurer': (1, 0), 'entreposer': (1, 0), 'rêver': (23, 0), 'zouaver': (1, 0), 'statufier': (1, 0), 'graviter': (9, 5), 'désajuster': (1, 0), 'overclocker': (0, 0), 'déléguer': (1, 37), 'hydrofuger': (1, 7), 'spéculer': (9, 5), 'échaumer': (1, 0), 'nipper': (0, 0), 'grisailler': (7, 0), 'daigner': (1, 0), 'marchander': (7, 0), 'dépigmenter': (1, 0), 'affiner': (0, 0), 'cancaner': (9, 5), 'offusquer': (0, 0), 'résonner': (9, 5), 'désexciter': (0, 0), 'implémenter': (33, 0), 'séculariser': (1, 0), 'graniter': (1, 0), 'désalper': (9, 5), 'dessouffler': (1, 0), 'verduniser': (1, 0), 'éjecter': (0, 0), 'ajointer': (1, 0), 'dédramatiser': (7, 0), 'plussoyer': (23, 6), 'entreprendre': (56, 46), 'amalgamer': (0, 0), 'comptabiliser': (1, 0), 'réexporter': (1, 0), 'rondir': (4, 2), 'materniser': (1, 0), 'gommer': (1, 0), 'lutter': (30, 5), 'exécuter': (21, 0), 'grener': (7, 39), 'pacifier': (1, 0), 'carrosser': (1, 0), 'crevasser': (0, 0), 'ralléger': (9, 165), 'influer': (9, 5), 'pembeniser': (1, 0), 'quereller': (0, 0), 'favoriser': (1, 0), 'enluminer': (1, 0), 'macchaber': (20, 1), 'échanger': (0, 7), 'enchtourber': (1, 1), 'vouloir': (50, 192), 'affaiblir': (34, 2), 'lever': (6, 21), 'esquisser': (0, 0), 'interagir': (37, 2), 'trépasser': (9, 5), 'gêner': (0, 0), 'néologiser': (53, 0), 'défourailler': (7, 0), 'anatomiser': (1, 0), 'accolader': (1, 0), 'gravir': (80, 2), 'tuméfier': (0, 0), 'tchatter': (53, 5), 'réciter': (1, 0), 'glorifier': (0, 0), 'pousser': (6, 0), 'transmettre': (5, 29), 'luter': (1, 0), 'lézarder': (6, 0), 'refoutre': (26, 90), 'cracher': (7, 0), 'différencier': (0, 0), 'grandir': (13, 2), 'mitarder': (1, 1), 'spatialiser': (0, 0), 'conseiller': (38, 0), 'haleter': (9, 66), 'déparasiter': (1, 0), 'pindariser': (9, 5), 'girouetter': (9, 5), 'ragoter': (9, 5), 'abricoter': (1, 0), 'réabonner': (0, 0), 'marcher': (53, 5), 'venir': (100, 10), 'ailler': (1, 0), 'gréciser': (1, 0), 'idolâtrer': (40, 0), 'surcontrer': (1, 0), 'extuber': (41, 0), 'croitre': (25, 96), 'semoncer': (1, 31), 'circonstancier': (1, 0), 'brayer': (1, 0), 'précariser': (0, 0), 'paumoyer': (1, 6), 'enlacer': (0, 31), 'rentraire': (26, 1), 'quarderonner': (1, 0), 'enfouiller': (1, 1), 'amoindrir': (2, 2), 'sertir': (4, 2), 'familiariser': (0, 0), 'butter': (1, 0), 'psychiatriser': (1, 0), 'attribuer': (0, 0), 'tresser': (1, 0), 'refacturer': (7, 0), 'vernaliser': (41, 0), 'désenfiler': (1, 0), 'consoler': (6, 0), 'fleurer': (7, 0), 'pessigner': (1, 1), 'dévergonder': (20, 0), 'goinfrer': (32, 0), 'éberluer': (1, 0), 'épontiller': (1, 0), 'déhouiller': (1, 0), 'moulurer': (1, 0), 'polir': (2, 2), 'accoucher': (23, 0), 'trévirer': (1, 0), 'incriminer': (0, 0), 'daguer': (1, 0), 'dorloter': (0, 0), 'tressauter': (9, 5), 'buter': (6, 0), 'aniser': (1, 0), 'ceinturer': (1, 0), 'redevoir': (26, 104), 'dévolter': (1, 0), 'affurer': (1, 0), 'mirer': (0, 0), 'contrebraquer': (41, 5), 'abomber': (9, 5), 'couchailler': (9, 5), 'cogiter': (7, 0), 'corporiser': (1, 0), 'arpéger': (7, 8), 'élimer': (1, 0), 'balayer': (41, 0), 'entredéchirer': (65, 88), 'évacuer': (0, 0), 'colporter': (1, 0), 'revenir': (100, 10), 'raciner': (1, 0), 'excorier': (1, 0), 'gourancer': (20, 1), 'armer': (0, 0), 'horodater': (1, 0), 'chawer': (9, 5), 'modeler': (0, 22), 'encartonner': (1, 0), 'rendre': (50, 45), 'optimaliser': (1, 0), 'congestionner': (0, 0), 'désintégrer': (0, 114), 'élancer': (6, 31), 'marcoter': (1, 0), 'sourdre': (43, 181), 'boulanger': (7, 7), 'entraimer': (65, 88), 'avoyer': (1, 6), 'délover': (1, 0), 'contempler': (0, 0), 'gloser': (23, 0), 'enregistrer': (0, 0), 'comparoir': (43, 80), 'éliminer': (6, 0), 'cautionner': (1, 0), 'liserer': (0, 143), 'natchaver': (9, 5), 'crouler': (9, 5), 'reployer': (1, 6), 'avancer': (3, 31), 'plomber': (0, 0), 'horripiler': (1, 0), 'errer': (9, 5), 'découcher': (9, 5), 'élaguer': (1, 0), 'appréhender': (1, 0), 'déconcentrer': (0, 0), 'parlementer': (9, 5), 'désoxygéner': (1, 35), 'ceindre': (10, 28), 'quêter': (7, 0), 'papilloter': (7, 0), 'alambiquer': (1, 0), 'archaïser': (9, 5), 'bunkeriser': (21, 0), 'ramer': (7, 0), 'fumer': (7, 0), 'éperdre': (17, 45), 'rûter': (9, 107), 'salonguer': (9, 5), 'inventorier': (1, 0), 'mandriner': (1, 0), 'écussonner': (1, 0), 'grognasser': (9, 5), 'mofler': (1, 0), 'pogner': (1, 0), 'clicher': (1, 0), 'affleurer': (7, 0), 'interdire': (5, 86), 'enfaiter': (1, 0), 'mesurer': (3, 0), 'défraichir': (4, 2), 'fiancer': (0, 31), 'exfiltrer': (1, 0), 'menacer': (7, 31), 'chaponner': (1, 0), 'avarier': (0, 0), 'obscurcir': (2, 2), 'camer': (20, 0), 'dérager': (9, 47), 'brandir': (51, 2), 'effacer': (6, 31), 'arpigner': (1, 0), 'rechampir': (4, 2), 'transplanter': (0, 0), 'fantaliser': (20, 0), 'ensemencer': (1, 31), 'desservir': (10, 103), 'mainmettre': (26, 29), 'sous-investir': (13, 2), 'politiser': (0, 0), 'poncer': (1, 31), 'étouper': (1, 0), 'atterrer': (1, 0), 'cendrer': (1, 0), 'becter': (1, 0), 'remblayer': (1, 0), 'auréoler': (0, 0), 'enterrer': (0, 0), 'fuseler': (1, 40), 'coquer': (1, 0), 'soustraire': (10, 11), 'déséchouer': (1, 0), 'remplacer': (0, 31), 'foirer': (9, 5), 'écloper': (1, 0), 'friponner': (7, 0), 'opter': (9, 5), 'grossir': (11, 2), 'transfiler': (1, 0), 'neutraliser': (0, 0), 'percoler': (9, 82), 'chroniquer': (7, 0), 'désentortiller': (1, 0), 'ausculter': (0, 0), 'difformer': (1, 0), 'suggérer': (7, 19), 'épreindre': (26, 1), 'géminer': (1, 0), 'tranquilliser': (0, 0), 'crailler': (9, 5), 'reboutonner': (0, 0), 'canarder': (7, 0), 'tracter': (1, 0), 'échauffer': (0, 0), 'déplisser': (0, 0), 'réinstituer': (40, 0), 'photographier': (1, 0), 'rentoiler': (1, 0), 'resemer': (0, 75), 'codifier': (1, 0), 'assainir': (4, 2), 'tripatouiller': (1, 0), 'redouter': (1, 0), 'griller': (6, 0), 'dessiner': (0, 0), 'empalmer': (1, 0), 'paraffiner': (1, 0), 'iodler': (9, 5), 'épiler': (0, 0), 'désaisonnaliser': (1, 0), 'désigner': (1, 0), 'surgeler': (1, 22), 'riposter': (7, 0), 'fluer': (9, 5), 'détordre': (26, 45), 'surconsommer': (7, 0), 'estiver': (7, 0), 'caloriser': (41, 0), 'centupler': (7, 0), 'chamoiser': (1, 0), 'employer': (22, 6), 'étronçonner': (1, 0), 'ravigoter': (1, 0), 'paisseler': (1, 40), 'tarabuster': (1, 0), 'exhumer': (1, 0), 'désapprovisionner': (1, 0), 'tremper': (6, 0), 'dominer': (6, 0), 'pyrograver': (1, 0), 'circulariser': (40, 0), 'répéter': (6, 16), 'mordancer': (1, 31), 'médiser': (9, 5), 'entonner': (1, 0), 'décomplexifier': (21, 0), 'culbuter': (7, 0), 'anéantir': (15, 2), 'poétiser': (33, 0), 'réétudier': (1, 0), 'geler': (79, 22), 'imprégner': (0, 138), 'habiliter': (1, 0), 'poignarder': (1, 0), 'avoisiner': (0, 0), 'affolir': (16, 1), 'cavalcader': (9, 5), 'pionner': (9, 5), 'claper': (1, 0), 'édulcorer': (1, 0), 'cuiter': (20, 0), 'exaspérer': (0, 19), 'replâtrer': (1, 0), 'relâcher': (6, 0), 'chlorer': (1, 0), 'calquer': (1, 0), 'démordre': (66, 85), 'impressionner': (1, 0), 'bancariser': (1, 0), 'taller': (9, 5), 'bider': (20, 0), 'bidouiller': (7, 0), 'encrasser': (0, 0), 'crapuler': (9, 5), 'dispatcher': (1, 0), 'géolocaliser': (0, 0), 'batifoler': (9, 5), 'acter': (1, 0), 'haïr': (15, 136), 'accointer': (20, 0), 'égoïner': (1, 1), 'zinzinuler': (9, 5), 'torchonner': (1, 0), 'cranter': (1, 0), 'déraser': (1, 0), 'co-encadrer': (41, 0), 'embecqueter': (9, 1), 'stranguler': (1, 0), 'bruler': (6, 0), 'réaligner': (1, 0), 'vaironner': (9, 5), 'débloquer': (7, 0), 'obérer': (0, 19), 'désensabler': (1, 0), 'subsister': (9, 5), 'gauchiser': (40, 0), 'désinformer': (1, 0), 'contrister': (1, 0), 'intituler': (0, 0), 'accidenter': (1, 0), 'alimenter': (22, 0), 'réapparaitre': (43, 14), 'interner': (1, 0), 'confier': (0, 0), 'planchéier': (1, 0), 'évaser': (0, 0), 'chigner': (9, 5), 'silicatiser': (20, 0), 'anagrammer': (41, 0), 'ultrafiltrer': (41, 0), 'quintupler': (7, 0), 'dégeler': (6, 22), 'débâter': (1, 0), 'comprendre': (5, 46), 'conventionner': (1, 0), 'allonger': (6, 7), 'corroder': (1, 0), 'perdurer': (9, 5), 'hameçonner': (1, 0), 'fourrager': (7, 7), 'entre-haïr': (75, 122), 'disposer': (19, 0), 'défigurer': (0, 0), 'députer': (1, 0), 'opprimer': (1, 0), 'germer': (9, 5), 'feuiller': (7, 0), 'nasaliser': (0, 0), 'médire': (66, 26), 'doucher': (0, 0), 'dépatrier': (0, 0), 'présager': (1, 7), 'ciller': (9, 5), 'lourer': (1, 0), 'fausser': (0, 0), 'surpiquer': (1, 0), 'conspuer': (1, 0), 'accroire': (26, 1), 'reconnecter': (0, 0), 'graveler': (7, 40), 'informer': (6, 0), 'autocensurer': (20, 0), 'transporter': (0, 0), 'colloquer': (1, 0), 'trébucher': (7, 0), 'accréter': (21, 16), 'progresser': (9, 5), 'ahaner': (9, 5), 'verbiager': (9, 47), 'tenailler': (1, 0), 'travestir': (2, 2), 'galoper': (7, 0), 'déchevêtrer': (1, 0), 'crasser': (1, 0), 'faciliter': (0, 0), 'rabanter': (1, 0), 'gangrener': (0, 39), 'mégir': (4, 2), 'communier': (9, 5), 'grincer': (9, 23), 'dépolitiser': (0, 0), 'pressuriser': (1, 0), 'bleuter': (1, 0), 'lancequiner': (9, 5), 'dérider': (0, 0), 'revalider': (1, 0), 'arrérager': (32, 7), 'chantonner': (7, 0), 'ganter': (6, 0), 'lyncher': (1, 0), 'endolorir': (4, 2), 'attiger': (7, 7), 'confesser': (0, 0), 'surclasser': (1, 0), 'dégauchir': (4, 2), 'incorporer': (0, 0), 'retâter': (38, 0), 'chabler': (1, 0), 'surtailler': (1, 0), 'prémâcher': (1, 0), 'rencontrer': (40, 0), 'enthousiasmer': (0, 0), 'vibrionner': (9, 5), 'enchaîner': (6, 0), 'torcher': (0, 0), 'indiquer': (1, 0), 'vanner': (7, 0), 'omettre': (26, 29), 'nitrer': (1, 0), 'pasteuriser': (1, 0), 'estrapader': (1, 0), 'cousiner': (9, 5), 'déborder': (6, 0), 'graduer': (1, 0), 'déplumer': (0, 0), 'embellir': (13, 2), 'trompeter': (7, 34), 'ensoufrer': (1, 0), 'trompéter': (7, 16), 'emballoter': (1, 0), 'interfonctionner': (54, 61), 'feindre': (56, 28), 'inoculer': (0, 0), 'trimarder': (7, 0), 'parrainer': (1, 0), 'déterminer': (0, 0), 'trucider': (1, 0), 'saloper': (1, 0), 'racoler': (1, 0), 'déferrer': (1, 0), 'ablatir': (2, 1), 'désencarter': (1, 0), 'crawler': (9, 5), 'picoler': (7, 0), 'consigner': (1, 0), 'claustrer': (0, 0)}
@@ -225,3 +225,93 @@ def mbNprMasNotFem (lMorph):
     if any(NPf.search(s)  for s in lMorph):
         return False
     return any(NPm.search(s)  for s in lMorph)
+
+
+#### MASKS
+
+# Features of a morphology as bits: a bit is set if its regex is found in the morphology.
+# Masks of the dictionary tags are computed once (a morphology is “>stem ” + tag).
+# A list of morphologies gives two masks:
+#   nAny: features found in at least one morphology (for mbXXX)
+#   nAll: features found in all morphologies (for isXXX)
+
+mNom = 1 << 0
+mAdj = 1 << 1
+mAdjNb = 1 << 2
+mNomAdj = 1 << 3
+mNomNotAdj = 1 << 4
+mPpasNomNotAdj = 1 << 5
+mNomVconj = 1 << 6
+mVconj = 1 << 7
+mVconj123 = 1 << 8
+mMG = 1 << 9
+mInv = 1 << 10
+mSg = 1 << 11
+mPl = 1 << 12
+mEpi = 1 << 13
+mMas = 1 << 14
+mFem = 1 << 15
+mNpr = 1 << 16
+mNprMas = 1 << 17
+mNprFem = 1 << 18
+
+_lStringFeatures = [
+    (mNom, ":N"),
+    (mAdj, ":A"),
+    (mMG, ":G"),
+    (mInv, ":i"),
+    (mSg, ":s"),
+    (mPl, ":p"),
+    (mEpi, ":e"),
+    (mMas, ":m"),
+    (mFem, ":f")
+]
+
+_lRegexFeatures = [
+    (mAdjNb, AD),
+    (mNomAdj, NA),
+    (mNomNotAdj, NnotA),
+    (mPpasNomNotAdj, PNnotA),
+    (mNomVconj, NVconj),
+    (mVconj, Vconj),
+    (mVconj123, Vconj123),
+    (mNpr, NP),
+    (mNprMas, NPm),
+    (mNprFem, NPf)
+]
+
+def getMorphMask (sMorph):
+    "returns features of sMorph (morphology or tag) as bits"
+    nMask = 0
+    for nBit, sFeature in _lStringFeatures:
+        if sFeature in sMorph:
+            nMask |= nBit
+    for nBit, zFeature in _lRegexFeatures:
+        if zFeature.search(sMorph):
+            nMask |= nBit
+    return nMask
+
+def checkAgreementMask (nAny1, nAny2):
+    "as checkAgreement, with nAny masks of both lists"
+    # check number agreement
+    if not nAny1 & mInv and not nAny2 & mInv:
+        if nAny1 & mSg and not nAny2 & mSg:
+            return False
+        if nAny1 & mPl and not nAny2 & mPl:
+            return False
+    # check gender agreement
+    if (nAny1 | nAny2) & mEpi:
+        return True
+    if nAny1 & mMas and not nAny2 & mMas:
+        return False
+    if nAny1 & mFem and not nAny2 & mFem:
+        return False
+    return True
+
+def mbNomNotAdjMask (nAny):
+    "as mbNomNotAdj, with nAny mask"
+    return not nAny & mAdj and bool(nAny & mNom)
+
+def mbNprMasNotFemMask (nAny):
+    "as mbNprMasNotFem, with nAny mask"
+    return not nAny & mNprFem and bool(nAny & mNprMas)
@@ -4,14 +4,19 @@ import re
 import sys
 import os
 import traceback
+import itertools
+import importlib
+from bisect import bisect_left
 
-from ..ibdawg import IBDAWG
+from ..dictstack import DictionaryStack
+from ..lemmaindex import LemmaIndex
+from ..packedtable import PackedTable, getTablePath, getSourceChecksum
 from ..echo import echo
 from . import gc_options
 
 
 __all__ = [ "lang", "locales", "pkg", "name", "version", "author", \
-            "load", "parse", "getDictionary", \
+            "load", "parse", "getDictionary", "getDictionaryStack", "getLemmaIndex", "buildLemmaIndex", "buildTables", "loadOverlay", \
             "setOptions", "getOptions", "getOptionsLabels", "resetOptions", \
             "ignoreRule", "resetIgnoreRules" ]
 
@@ -31,22 +36,52 @@ _zBeginOfParagraph = re.compile(u"^\W*")
 _zEndOfParagraph = re.compile(u"\W*$")
 _zNextWord = re.compile(u" +(\w[\w-]*)")
 _zPrevWord = re.compile(u"(\w[\w-]*) +$")
+_zWord1 = re.compile(u"\w[\w-]*")         # words for prevword1
+_zWordN = re.compile(u"[\w%-]+")           # words for prevword
+_dNextWordPatterns = {}                 # precompiled patterns for nextword: n -> regex
 
 # grammar rules and dictionary
 _rules = None
 _dOptions = dict(gc_options.dOpt)       # duplication necessary, to be able to reset to default
 _aIgnoredRules = set()
-_oDict = None
-_dAnalyses = {}                         # cache for data from dictionary
+_oDict = None                           # dictionary stack in use
+_dStacks = {}                           # dictionary stacks already created: tuple of names -> DictionaryStack
+_oLemmaIndex = None                     # optional: lemma -> flexions
+_dAnalyses = {}                         # cache for data from dictionary (the one of the dictionary stack in use)
+_nMaxAnalyses = 5000                    # beyond, _dAnalyses is emptied before parsing a paragraph (morphologies are kept in the compact cache of the stack)
+_dWordOffsets = {}                      # offsets of words of the last text: zWord -> (text, list of starts, list of ends)
+_dTagBit = {}                           # tag field (what follows a “:” in a morphology) -> bit
+_dMorphBits = {}                        # morphology -> bitset of its tag fields
+_dPatternMask = {}                      # pattern -> mask of tag fields, None if the pattern is tested with a regex
+_dPatternResults = {}                   # pattern -> (regex, cache of results: morphology -> bool)
+_dTagMask = {}                          # tag of the dictionaries -> features mask (see cregex)
+_dMorphMask = {}                        # morphology -> features mask (see cregex)
+_dSimilSets = {}                        # word -> phonetically similar words with their bitsets of tag fields and morphologies (see suggSimil), for the dictionary stack in use
+_dStackSimilSets = {}                   # dictionary stack -> its _dSimilSets
+_zPatternLiterals = re.compile(r"^:(?:\(\?:((?:\w|\[\w+\])+(?:\|(?:\w|\[\w+\])+)*)\)|((?:\w|\[\w+\])*))$")
 
 _GLOBALS = globals()
 
 
 #### Parsing
 
-def parse (sText, sCountry="FR", bDebug=False, dOptions=None):
-    "analyses the paragraph sText and returns list of errors"
+def parse (sText, sCountry="FR", bDebug=False, dOptions=None, oDict=None):
+    """analyses the paragraph sText and returns list of errors (oDict: dictionary stack to use instead of the loaded one)
+       the dictionary stack in use is a global state: not to be called from several threads at once"""
+    if oDict and oDict is not _oDict:
+        oPrevDict = _oDict
+        _useDictionary(oDict)
+        try:
+            return parse(sText, sCountry, bDebug, dOptions)
+        finally:
+            _useDictionary(oPrevDict)
     aErrors = None
+    if len(_dAnalyses) > _nMaxAnalyses:
+        _dAnalyses.clear()
+        # caches with morphologies as keys
+        _dMorphBits.clear()
+        _dMorphMask.clear()
+        _dPatternResults.clear()
     sAlt = sText
     dDA = {}
     dOpt = _dOptions  if not dOptions  else dOptions
@@ -60,11 +95,16 @@ def parse (sText, sCountry="FR", bDebug=False, dOptions=None):
         raise
 
     # parse sentences
+    # Rules are applied on each sentence as a string of its own (not on the paragraph with pos and endpos):
+    # patterns with “^” or lookbehind assertions and conditions looking before the match depend on it.
+    # If the paragraph has not been rewritten, the sentence is copied only once.
+    bSameText = sText is sAlt
     for iStart, iEnd in _getSentenceBoundaries(sText):
         if 4 < (iEnd - iStart) < 2000:
             dDA.clear()
             try:
-                _, errs = _proofread(sText[iStart:iEnd], sAlt[iStart:iEnd], iStart, False, dDA, sCountry, dOpt, bDebug)
+                s = sText[iStart:iEnd]
+                _, errs = _proofread(s, s  if bSameText  else sAlt[iStart:iEnd], iStart, False, dDA, sCountry, dOpt, bDebug)
                 aErrors.extend(errs)
             except:
                 raise
@@ -72,6 +112,7 @@ def parse (sText, sCountry="FR", bDebug=False, dOptions=None):
 
 
 def _getSentenceBoundaries (sText):
+    "generator: returns (start, end) of sentences of sText (nothing copied)"
     iStart = _zBeginOfParagraph.match(sText).end()
     for m in _zEndOfSentence.finditer(sText):
         yield (iStart, m.end())
@@ -262,12 +303,20 @@ except ImportError:
     _createError = _createDictError
 
 
-def load ():
-    global _oDict
+def load (lDicName=None):
+    "lDicName: stack of binary dictionaries (main dictionary first), default: french.bdic"
+    global _oLemmaIndex
     try:
-        _oDict = IBDAWG("french.bdic")
+        _useDictionary(getDictionaryStack(lDicName or ["french.bdic"]))
     except:
         traceback.print_exc()
+    if os.path.isfile(_getOverlayPath()):
+        loadOverlay(_getOverlayPath())
+    if os.path.isfile(_getLemmaIndexPath()):
+        try:
+            _oLemmaIndex = LemmaIndex(_getLemmaIndexPath())
+        except:
+            traceback.print_exc()
 
 
 def setOptions (dOpt):
@@ -291,6 +340,91 @@ def getDictionary ():
     return _oDict
 
 
+def _useDictionary (oDict):
+    "sets oDict as the dictionary stack in use (with its caches), or no dictionary if oDict is None"
+    global _oDict
+    global _dAnalyses
+    global _dSimilSets
+    _oDict = oDict
+    if not oDict:
+        _dAnalyses = {}
+        _dSimilSets = {}
+        return
+    if oDict not in _dStackSimilSets:
+        # stack not created by getDictionaryStack: features of its tags
+        for sTag in oDict.getTags():
+            if sTag not in _dTagMask:
+                _dTagMask[sTag] = cr.getMorphMask(sTag)
+        _dStackSimilSets[oDict] = {}
+    _dAnalyses = oDict.dAnalyses
+    _dSimilSets = _dStackSimilSets[oDict]
+
+
+def getDictionaryStack (lDicName):
+    "returns the stack of binary dictionaries lDicName (dictionaries and morphologies cache shared with previous stacks)"
+    tDicName = tuple(lDicName)
+    if tDicName not in _dStacks:
+        _dStacks[tDicName] = DictionaryStack(tDicName)
+        # features of the new tags
+        for sTag in _dStacks[tDicName].getTags():
+            if sTag not in _dTagMask:
+                _dTagMask[sTag] = cr.getMorphMask(sTag)
+    return _dStacks[tDicName]
+
+
+def getLemmaIndex ():
+    "returns the lemma index or None if it has not been built"
+    return _oLemmaIndex
+
+
+def buildLemmaIndex ():
+    "builds the lemma index from the dictionary (to do once)"
+    global _oLemmaIndex
+    _oLemmaIndex = LemmaIndex.build(_oDict, _getLemmaIndexPath())
+
+
+# packed tables of generated data: file name (in _dictionaries), module, variable
+_lPackedTables = [
+    ("french.verbs.tbl", "conj_data", "_dVerb"),
+    ("french.miscplurals.tbl", "mfsp_data", "_dMiscPlur"),
+    ("french.masforms.tbl", "mfsp_data", "_dMasForm"),
+    ("french.phonet.tbl", "phonet_data", "_dWord"),
+]
+
+def buildTables ():
+    "builds the packed tables from the generated data (to do after each update of the generated data)"
+    for sFileName, sModule, sVar in _lPackedTables:
+        dTable = getattr(importlib.import_module("." + sModule, __package__), sVar)
+        oTable = PackedTable.build(dTable, getTablePath(sFileName), getSourceChecksum("." + sModule, __package__))
+        echo(oTable.getInfo(), end="")
+        oTable.close()
+
+
+def _getLemmaIndexPath ():
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "_dictionaries", "french.lemmas")
+
+
+def loadOverlay (spfLexicon):
+    "adds entries of lexicon spfLexicon to the dictionary (without rebuilding it)"
+    try:
+        _oDict.loadOverlay(spfLexicon)
+    except:
+        traceback.print_exc()
+    # the dictionary may be shared by several stacks
+    for oStack in _dStacks.values():
+        oStack.dAnalyses.clear()
+        oStack.oMorphCache.clear()
+    for oStack, dSimilSets in _dStackSimilSets.items():
+        # (stacks given to parse included)
+        oStack.dAnalyses.clear()
+        oStack.oMorphCache.clear()
+        dSimilSets.clear()
+
+
+def _getOverlayPath ():
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "_dictionaries", "french.overlay.lex")
+
+
 def _getRules (bParagraph):
     try:
         if not bParagraph:
@@ -359,10 +493,77 @@ def displayInfo (dDA, tWord):
 
 
 def _storeMorphFromFSA (sWord):
-    "retrieves morphologies list from _oDict -> _dAnalyses"
+    "retrieves morphologies list from _oDict (or its compact cache) -> _dAnalyses"
     global _dAnalyses
-    _dAnalyses[sWord] = _oDict.getMorph(sWord)
-    return True  if _dAnalyses[sWord]  else False
+    lMorph = _oDict.oMorphCache.get(sWord, None)
+    if lMorph is None:
+        lMorph = _oDict.getMorph(sWord)
+        _oDict.oMorphCache[sWord] = lMorph
+    _dAnalyses[sWord] = lMorph
+    return True  if lMorph  else False
+
+
+## morphologies as bitsets of tag fields
+# Most patterns are only “:” + literal alternatives (“:V”, “:[NAQ]”, “:(?:E|G|[13][sp])”…):
+# such a pattern is found in a morphology if a tag field begins with one of the literals, which is tested with a mask.
+# Other patterns are searched with regexes, results are cached.
+
+def _getMorphBits (sMorph):
+    "returns bitset of tag fields of sMorph (new tag fields get a new bit)"
+    nBits = 0
+    for sField in sMorph.split(":")[1:]:
+        if sField not in _dTagBit:
+            _dTagBit[sField] = 1 << len(_dTagBit)
+            # masks must be computed again with this field
+            _dPatternMask.clear()
+        nBits |= _dTagBit[sField]
+    _dMorphBits[sMorph] = nBits
+    return nBits
+
+
+def _getPatternMask (sPattern):
+    "returns mask of tag fields for sPattern, None if it can’t be tested with tag fields"
+    m = _zPatternLiterals.match(sPattern)
+    if not m:
+        return None
+    lLiteral = []
+    for sAlt in (m.group(1) if m.group(1) is not None else m.group(2)).split("|"):
+        lChars = [ sClass or c  for sClass, c in re.findall(r"\[(\w+)\]|(\w)", sAlt) ]
+        lLiteral.extend( "".join(t)  for t in itertools.product(*lChars) )
+    nMask = 0
+    for sField, nBit in _dTagBit.items():
+        if sField.startswith(tuple(lLiteral)):
+            nMask |= nBit
+    return nMask
+
+
+def _searchMorph (sPattern, lMorph, bStrict=False):
+    "returns True if sPattern is found in any morphology of lMorph (in all of them if bStrict)"
+    nMask = _dPatternMask.get(sPattern, -1)
+    if nMask == -1:
+        nMask = _dPatternMask[sPattern] = _getPatternMask(sPattern)
+    if nMask is None:
+        tPattern = _dPatternResults.get(sPattern, None)
+        if not tPattern or len(tPattern[1]) > 10000:
+            tPattern = _dPatternResults[sPattern] = (re.compile(sPattern), {})
+        zPattern, dResults = tPattern
+        for s in lMorph:
+            bFound = dResults.get(s, None)
+            if bFound is None:
+                bFound = dResults[s] = bool(zPattern.search(s))
+            if bFound != bStrict:
+                return bFound
+        return bStrict
+    for s in lMorph:
+        nBits = _dMorphBits.get(s, None)
+        if nBits is None:
+            nBits = _getMorphBits(s)
+            if sPattern not in _dPatternMask:
+                # new tag fields found
+                nMask = _dPatternMask[sPattern] = _getPatternMask(sPattern)
+        if bool(nBits & nMask) != bStrict:
+            return not bStrict
+    return bStrict
 
 
 def morph (dDA, tWord, sPattern, bStrict=True, bNoWord=False):
@@ -374,10 +575,7 @@ def morph (dDA, tWord, sPattern, bStrict=True, bNoWord=False):
     lMorph = dDA[tWord[0]]  if tWord[0] in dDA  else _dAnalyses[tWord[1]]
     if not lMorph:
         return False
-    p = re.compile(sPattern)
-    if bStrict:
-        return all(p.search(s)  for s in lMorph)
-    return any(p.search(s)  for s in lMorph)
+    return _searchMorph(sPattern, lMorph, bool(bStrict))
 
 
 def morphex (dDA, tWord, sPattern, sNegPattern, bNoWord=False):
@@ -388,12 +586,10 @@ def morphex (dDA, tWord, sPattern, sNegPattern, bNoWord=False):
         return False
     lMorph = dDA[tWord[0]]  if tWord[0] in dDA  else _dAnalyses[tWord[1]]
     # check negative condition
-    np = re.compile(sNegPattern)
-    if any(np.search(s)  for s in lMorph):
+    if _searchMorph(sNegPattern, lMorph):
         return False
     # search sPattern
-    p = re.compile(sPattern)
-    return any(p.search(s)  for s in lMorph)
+    return _searchMorph(sPattern, lMorph)
 
 
 def analyse (sWord, sPattern, bStrict=True):
@@ -402,10 +598,7 @@ def analyse (sWord, sPattern, bStrict=True):
         return False
     if not _dAnalyses[sWord]:
         return False
-    p = re.compile(sPattern)
-    if bStrict:
-        return all(p.search(s)  for s in _dAnalyses[sWord])
-    return any(p.search(s)  for s in _dAnalyses[sWord])
+    return _searchMorph(sPattern, _dAnalyses[sWord], bool(bStrict))
 
 
 def analysex (sWord, sPattern, sNegPattern):
@@ -413,12 +606,10 @@ def analysex (sWord, sPattern, sNegPattern):
     if sWord not in _dAnalyses and not _storeMorphFromFSA(sWord):
         return False
     # check negative condition
-    np = re.compile(sNegPattern)
-    if any(np.search(s)  for s in _dAnalyses[sWord]):
+    if _searchMorph(sNegPattern, _dAnalyses[sWord]):
         return False
     # search sPattern
-    p = re.compile(sPattern)
-    return any(p.search(s)  for s in _dAnalyses[sWord])
+    return _searchMorph(sPattern, _dAnalyses[sWord])
 
 
 def stem (sWord):
@@ -430,40 +621,85 @@ def stem (sWord):
     return [ s[1:s.find(" ")]  for s in _dAnalyses[sWord] ]
 
 
+def flexions (sLemma, sPattern=""):
+    "returns list of flexions of sLemma whose tag matches sPattern (None if there is no lemma index)"
+    if not _oLemmaIndex:
+        return None
+    return _oLemmaIndex.getFlexionsWithTag(sLemma, sPattern)
+
+
 ## functions to get text outside pattern scope
 
 # warning: check compile_rules.py to understand how it works
+# Next words: precompiled regexes matched at iStart (no slicing).
+# Previous words: found in an offset table built once per text (the text changes only when rewritten),
+# results are the same as with the regexes _zPrevWord and its n-words version applied on s[:iEnd].
+
+def _getWordOffsets (s, zWord):
+    "returns offset table of words of s (with zWord): (s, list of starts, list of ends)"
+    tOffsets = _dWordOffsets.get(zWord, None)
+    if tOffsets and tOffsets[0] is s:
+        return tOffsets
+    lStart = []
+    lEnd = []
+    for m in zWord.finditer(s):
+        lStart.append(m.start())
+        lEnd.append(m.end())
+    tOffsets = (s, lStart, lEnd)
+    _dWordOffsets[zWord] = tOffsets
+    return tOffsets
+
+
+def _isSpaces (s, iStart, iEnd):
+    "True if s[iStart:iEnd] is not empty and made of spaces only"
+    return iEnd > iStart and s.count(" ", iStart, iEnd) == iEnd - iStart
+
 
 def nextword (s, iStart, n):
     "get the nth word of the input string or empty string"
-    m = re.match(u"( +[\\w%-]+){" + str(n-1) + u"} +([\\w%-]+)", s[iStart:])
+    if n not in _dNextWordPatterns:
+        _dNextWordPatterns[n] = re.compile(u"( +[\\w%-]+){" + str(n-1) + u"} +([\\w%-]+)")
+    m = _dNextWordPatterns[n].match(s, iStart)
     if not m:
         return None
-    return (iStart+m.start(2), m.group(2))
+    return (m.start(2), m.group(2))
 
 
 def prevword (s, iEnd, n):
     "get the (-)nth word of the input string or empty string"
-    m = re.search(u"([\\w%-]+) +([\\w%-]+ +){" + str(n-1) + u"}$", s[:iEnd])
-    if not m:
+    if s[iEnd-1:iEnd] == "\n":
+        # as “$”
+        iEnd -= 1
+    _, lStart, lEnd = _getWordOffsets(s, _zWordN)
+    i = bisect_left(lEnd, iEnd)
+    if i - n < 0:
         return None
-    return (m.start(1), m.group(1))
+    iNextStart = iEnd
+    for j in range(i-1, i-n-1, -1):
+        if not _isSpaces(s, lEnd[j], iNextStart):
+            return None
+        iNextStart = lStart[j]
+    return (lStart[j], s[lStart[j]:lEnd[j]])
 
 
 def nextword1 (s, iStart):
     "get next word (optimization)"
-    m = _zNextWord.match(s[iStart:])
+    m = _zNextWord.match(s, iStart)
     if not m:
         return None
-    return (iStart+m.start(1), m.group(1))
+    return (m.start(1), m.group(1))
 
 
 def prevword1 (s, iEnd):
     "get previous word (optimization)"
-    m = _zPrevWord.search(s[:iEnd])
-    if not m:
+    if s[iEnd-1:iEnd] == "\n":
+        # as “$”
+        iEnd -= 1
+    _, lStart, lEnd = _getWordOffsets(s, _zWord1)
+    i = bisect_left(lEnd, iEnd) - 1
+    if i < 0 or not _isSpaces(s, lEnd[i], iEnd):
         return None
-    return (m.start(1), m.group(1))
+    return (lStart[i], s[lStart[i]:lEnd[i]])
 
 
 def look (s, sPattern, sNegPattern=None):
@@ -502,7 +738,7 @@ def select (dDA, nPos, sWord, sPattern, lDefault=None):
         return True
     if len(_dAnalyses[sWord]) == 1:
         return True
-    lSelect = [ sMorph  for sMorph in _dAnalyses[sWord]  if re.search(sPattern, sMorph) ]
+    lSelect = [ sMorph  for sMorph in _dAnalyses[sWord]  if _searchMorph(sPattern, (sMorph,)) ]
     if lSelect:
         if len(lSelect) != len(_dAnalyses[sWord]):
             dDA[nPos] = lSelect
@@ -522,7 +758,7 @@ def exclude (dDA, nPos, sWord, sPattern, lDefault=None):
         return True
     if len(_dAnalyses[sWord]) == 1:
         return True
-    lSelect = [ sMorph  for sMorph in _dAnalyses[sWord]  if not re.search(sPattern, sMorph) ]
+    lSelect = [ sMorph  for sMorph in _dAnalyses[sWord]  if not _searchMorph(sPattern, (sMorph,)) ]
     if lSelect:
         if len(lSelect) != len(_dAnalyses[sWord]):
             dDA[nPos] = lSelect
@@ -548,6 +784,25 @@ def define (dDA, nPos, lMorph):
 from . import cregex as cr
 
 
+def _getMorphMasks (lMorph):
+    "returns features masks of lMorph: (nAny: features in at least one morphology, nAll: features in all morphologies)"
+    nAny = 0
+    nAll = -1
+    for sMorph in lMorph or ():
+        nMask = _dMorphMask.get(sMorph, None)
+        if nMask is None:
+            # “>stem :tags”: masks of tags are already known, unless the stem contains a colon
+            i = sMorph.find(" ")
+            if sMorph.startswith(">") and ":" not in sMorph[:i] and sMorph[i+1:] in _dTagMask:
+                nMask = _dTagMask[sMorph[i+1:]]
+            else:
+                nMask = cr.getMorphMask(sMorph)
+            _dMorphMask[sMorph] = nMask
+        nAny |= nMask
+        nAll &= nMask
+    return nAny, nAll
+
+
 def rewriteSubject (s1, s2):
     # s1 is supposed to be prn/patr/npr (M[12P])
     if s2 == "lui":
@@ -564,7 +819,7 @@ def rewriteSubject (s1, s2):
         return "ils"
     if s2 == "elle" or s2 == "elles":
         # We don’t check if word exists in _dAnalyses, for it is assumed it has been done before
-        if cr.mbNprMasNotFem(_dAnalyses.get(s1, False)):
+        if cr.mbNprMasNotFemMask(_getMorphMasks(_dAnalyses.get(s1, None))[0]):
             return "ils"
         # si épicène, indéterminable, mais OSEF, le féminin l’emporte
         return "elles"
@@ -574,16 +829,17 @@ def rewriteSubject (s1, s2):
 def apposition (sWord1, sWord2):
     "returns True if nom + nom (no agreement required)"
     # We don’t check if word exists in _dAnalyses, for it is assumed it has been done before
-    return cr.mbNomNotAdj(_dAnalyses.get(sWord2, False)) and cr.mbPpasNomNotAdj(_dAnalyses.get(sWord1, False))
+    return cr.mbNomNotAdjMask(_getMorphMasks(_dAnalyses.get(sWord2, None))[0]) and bool(_getMorphMasks(_dAnalyses.get(sWord1, None))[0] & cr.mPpasNomNotAdj)
 
 
 def isAmbiguousNAV (sWord):
     "words which are nom|adj and verb are ambiguous (except être and avoir)"
     if sWord not in _dAnalyses and not _storeMorphFromFSA(sWord):
         return False
-    if not cr.mbNomAdj(_dAnalyses[sWord]) or sWord == "est":
+    nAny, _ = _getMorphMasks(_dAnalyses[sWord])
+    if not nAny & cr.mNomAdj or sWord == "est":
         return False
-    if cr.mbVconj(_dAnalyses[sWord]) and not cr.mbMG(_dAnalyses[sWord]):
+    if nAny & cr.mVconj and not nAny & cr.mMG:
         return True
     return False
 
@@ -600,7 +856,9 @@ def isAmbiguousAndWrong (sWord1, sWord2, sReqMorphNA, sReqMorphConj):
     a1 = _dAnalyses.get(sWord1, None)
     if not a1:
         return False
-    if cr.checkAgreement(a1, a2) and (cr.mbAdj(a2) or cr.mbAdj(a1)):
+    nAny1, _ = _getMorphMasks(a1)
+    nAny2, _ = _getMorphMasks(a2)
+    if cr.checkAgreementMask(nAny1, nAny2) and (nAny2 & cr.mAdj or nAny1 & cr.mAdj):
         return False
     return True
 
@@ -617,10 +875,12 @@ def isVeryAmbiguousAndWrong (sWord1, sWord2, sReqMorphNA, sReqMorphConj, bLastHo
     a1 = _dAnalyses.get(sWord1, None)
     if not a1:
         return False
-    if cr.checkAgreement(a1, a2) and (cr.mbAdj(a2) or cr.mbAdjNb(a1)):
+    nAny1, nAll1 = _getMorphMasks(a1)
+    nAny2, _ = _getMorphMasks(a2)
+    if cr.checkAgreementMask(nAny1, nAny2) and (nAny2 & cr.mAdj or nAny1 & cr.mAdjNb):
         return False
     # now, we know there no agreement, and conjugation is also wrong
-    if cr.isNomAdj(a1):
+    if nAll1 & cr.mNomAdj:
         return True
     #if cr.isNomAdjVerb(a1): # considered True
     if bLastHopeCond:
@@ -636,7 +896,7 @@ def checkAgreement (sWord1, sWord2):
     a1 = _dAnalyses.get(sWord1, None)
     if not a1:
         return True
-    return cr.checkAgreement(a1, a2)
+    return cr.checkAgreementMask(_getMorphMasks(a1)[0], _getMorphMasks(a2)[0])
 
 
 _zUnitSpecial = re.compile(u"[µ/⁰¹²³⁴⁵⁶⁷⁸⁹Ωℓ·]")
@@ -727,13 +987,28 @@ def getDayWithString (day, month, year):
 
 #### GRAMMAR CHECKING ENGINE PLUGIN: Suggestion mechanisms
 
-from . import conj
-from . import mfsp
-from . import phonet
+class _LazyModule:
+    "generated data module, imported at first use (then the module replaces this object in globals)"
+
+    def __init__ (self, sName):
+        self.sName = sName
+
+    def __getattr__ (self, sAttr):
+        oModule = importlib.import_module("." + self.sName, __package__)
+        globals()[self.sName] = oModule
+        return getattr(oModule, sAttr)
+
+
+# big tables (verbs, masculine and plural forms, similar words) not loaded if suggestions are never needed
+conj = _LazyModule("conj")
+mfsp = _LazyModule("mfsp")
+phonet = _LazyModule("phonet")
 
 
 ## Verbs
 
+_zTenseInMorph = re.compile(" .*?(:(?:Y|I[pqsf]|S[pq]|K|P))")
+
 def suggVerb (sFlex, sWho, funcSugg2=None):
     aSugg = set()
     for sStem in stem(sFlex):
@@ -741,9 +1016,11 @@ def suggVerb (sFlex, sWho, funcSugg2=None):
         if tTags:
             # we get the tense
             aTense = set()
+            sStemMorph = ">" + sStem + " "
             for sMorph in _dAnalyses.get(sFlex, []): # we don’t check if word exists in _dAnalyses, for it is assumed it has been done before
-                for m in re.finditer(sStem+" .*?(:(?:Y|I[pqsf]|S[pq]|K|P))", sMorph):
-                    # stem must be used in regex to prevent confusion between different verbs (e.g. sauras has 2 stems: savoir and saurer)
+                # only morphologies of sStem, to prevent confusion between different verbs (e.g. sauras has 2 stems: savoir and saurer)
+                if sMorph.startswith(sStemMorph):
+                    m = _zTenseInMorph.search(sMorph, len(sStemMorph)-1)
                     if m:
                         if m.group(1) == ":Y":
                             aTense.add(":Ip")
@@ -1056,19 +1333,36 @@ def hasSimil (sWord):
     return phonet.hasSimil(sWord)
 
 
+def _getSimilSet (sWord):
+    "returns tuple of (similar word, bitset of tag fields of all its morphologies, morphologies) for words phonetically similar to sWord"
+    if sWord not in _dSimilSets:
+        lSimil = []
+        for sSimil in phonet.getSimil(sWord):
+            if sSimil not in _dAnalyses:
+                _storeMorphFromFSA(sSimil)
+            lMorph = _dAnalyses.get(sSimil, [])
+            nBits = 0
+            for sMorph in lMorph:
+                nBits |= _dMorphBits.get(sMorph, None) or _getMorphBits(sMorph)
+            lSimil.append((sSimil, nBits, lMorph))
+        _dSimilSets[sWord] = tuple(lSimil)
+    return _dSimilSets[sWord]
+
+
 def suggSimil (sWord, sPattern):
     "return list of words phonetically similar to sWord and whom POS is matching sPattern"
     # we don’t check if word exists in _dAnalyses, for it is assumed it has been done before
-    lSet = phonet.getSimil(sWord)
-    if not lSet:
+    tSimil = _getSimilSet(sWord)
+    if not tSimil:
         return ""
-    aSugg = set()
-    for sSimil in lSet:
-        if sSimil not in _dAnalyses:
-            _storeMorphFromFSA(sSimil)
-        for sMorph in _dAnalyses.get(sSimil, []):
-            if re.search(sPattern, sMorph):
-                aSugg.add(sSimil)
+    nMask = _dPatternMask.get(sPattern, -1)
+    if nMask == -1:
+        nMask = _dPatternMask[sPattern] = _getPatternMask(sPattern)
+    if nMask is None:
+        aSugg = set( sSimil  for sSimil, _, lMorph in tSimil  if _searchMorph(sPattern, lMorph) )
+    else:
+        # a tag field of the pattern in any morphology of the word
+        aSugg = set( sSimil  for sSimil, nBits, _ in tSimil  if nBits & nMask )
     if aSugg:
         return u"|".join(aSugg)
     return ""
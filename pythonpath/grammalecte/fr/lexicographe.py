@@ -6,6 +6,8 @@
 import re
 import traceback
 
+from ..tokenizer import Tokenizer
+
 
 _dTAGS = {  
     ':G': "",
@@ -145,6 +147,11 @@ _dAD = {
 }
 
 
+_zVerbInfo1 = re.compile("(?<=V[1-3])[itpqnmr_eaxz]+")
+_zVerbInfo0 = re.compile("(?<=V0[ea])[itpqnmr_eaxz]+")
+_zNotTagOnly = re.compile("[:;V,]")
+
+
 class Lexicographe:
 
     def __init__ (self, oDict):
@@ -152,6 +159,9 @@ class Lexicographe:
         self._zElidedPrefix = re.compile(u"(?i)^([dljmtsncç]|quoiqu|lorsqu|jusqu|puisqu|qu)['’](.+)")
         self._zCompoundWord = re.compile(u"(?i)(\\w+)-((?:les?|la)-(?:moi|toi|lui|[nv]ous|leur)|t-(?:il|elle|on)|y|en|[mts][’'](?:y|en)|les?|l[aà]|[mt]oi|leur|lui|je|tu|ils?|elles?|on|[nv]ous)$")
         self._zTag = re.compile(u"[:;]\\w[^:;]*")
+        self._lTagLabel = []    # tag id of the dictionary -> (readable tags, True if the stem must be added)
+        self._updateTagLabels()
+        self._oTokenizer = None
 
     def analyzeWord (self, sWord):
         try:
@@ -173,28 +183,66 @@ class Lexicographe:
             if m2:
                 sWord = m2.group(1)
             # Morphologies
-            lMorph = self.oDict.getMorph(sWord)
+            lMorph = self.oDict.getMorphIds(sWord)
+            lTag = self.oDict.lTag
             if len(lMorph) > 1:
                 # sublist
-                aMorph.append( (sWord, [ self.formatTags(s)  for s in lMorph  if ":" in s ]) )
+                aMorph.append( (sWord, [ self.formatTagId(sStem, iTag)  for sStem, iTag in lMorph  if ":" in lTag[iTag] or ":" in sStem ]) )
             elif len(lMorph) == 1:
-                aMorph.append( u"{} : {}".format(sWord, self.formatTags(lMorph[0])) )
+                aMorph.append( u"{} : {}".format(sWord, self.formatTagId(*lMorph[0])) )
             else:
                 aMorph.append( u"{} :  inconnu du dictionnaire".format(sWord) )
             # suffixe d’un mot composé
             if m2:
                 aMorph.append( u"-{} : {}".format(m2.group(2), self._formatSuffix(m2.group(2).lower())) )
             # Verbes
-            aVerb = set([ s[1:s.find(" ")]  for s in lMorph  if ":V" in s ])
+            aVerb = set([ sStem  for sStem, iTag in lMorph  if ":V" in lTag[iTag] or ":V" in sStem ])
             return (aMorph, aVerb)
         except:
             traceback.print_exc()
             return (["#erreur"], None)
 
+    def analyzeText (self, sText):
+        "returns list of (word, start, end, morphologies, verbs) for each word of sText (each different word analyzed once)"
+        if not self._oTokenizer:
+            self._oTokenizer = Tokenizer("fr")
+        dAnalyses = {}
+        lResult = []
+        for sWord, nStart, nEnd in self._oTokenizer.genWords(sText):
+            if sWord not in dAnalyses:
+                dAnalyses[sWord] = self.analyzeWord(sWord)
+            lResult.append((sWord, nStart, nEnd) + dAnalyses[sWord])
+        return lResult
+
     def formatTags (self, sTags):
+        "returns readable tags of morphology sTags (“>stem :tags”)"
+        iSpace = sTags.find(" ")
+        if iSpace < 1 or sTags[iSpace+1:] not in self.oDict.dTagId:
+            return self._formatTags(sTags)
+        return self.formatTagId(sTags[1:iSpace], self.oDict.dTagId[sTags[iSpace+1:]])
+
+    def formatTagId (self, sStem, iTag):
+        "returns readable tags of morphology (sStem, iTag), iTag: tag id of the dictionary"
+        if iTag >= len(self._lTagLabel):
+            # new tags in the overlay
+            self._updateTagLabels()
+        if _zNotTagOnly.search(sStem):
+            # the stem may be modified or read as tags
+            return self._formatTags(">" + sStem + " " + self.oDict.lTag[iTag])
+        sRes, bAddStem = self._lTagLabel[iTag]
+        return sRes + " [{}]".format(sStem)  if bAddStem  else sRes
+
+    def _updateTagLabels (self):
+        "renders readable tags of tags of the dictionary not rendered yet"
+        for sTag in self.oDict.lTag[len(self._lTagLabel):]:
+            sRes = self._formatTags("> " + sTag)
+            bAddStem = sRes.endswith(" []")
+            self._lTagLabel.append((sRes[:-3]  if bAddStem  else sRes, bAddStem))
+
+    def _formatTags (self, sTags):
         sRes = ""
-        sTags = re.sub("(?<=V[1-3])[itpqnmr_eaxz]+", "", sTags)
-        sTags = re.sub("(?<=V0[ea])[itpqnmr_eaxz]+", "", sTags)
+        sTags = _zVerbInfo1.sub("", sTags)
+        sTags = _zVerbInfo0.sub("", sTags)
         for m in self._zTag.finditer(sTags):
             sRes += _dTAGS.get(m.group(0), " [{}]".format(m.group(0)))
         if sRes.startswith(" verbe") and not sRes.endswith("infinitif"):
@@ -1,15 +1,28 @@
 # -*- encoding: UTF-8 -*-
 
+import functools
+
+from ..packedtable import getTable
+
 # list of affix codes
 _lTagMiscPlur = ['1ux', '0x', '2i', '0s|2a', '0s|0es', '0s|1i', '0s|1ies', '2ux', '0s|2en', '0es', '0s|2ina', '0s|1ves', '0s|1e']
 _lTagMasForm = ['1/1s', '4eur/4eurs', '2r/2rs', '1/2ux', '2/2s', '3er/3ers', '2f/2fs', '1', '2x', '3au/3aux', '2u/2us', '3c/3cs', '3x', '3/2', '5ur/5urs', '2', '3au|2/3aux|2s', '3en/3ens', '3ef/3efs', '3n/3ns', '3et/3ets', '5ufou/5ufous', '3u|2/3us|2s', '3s', '4is', '3/3s', '3ek/3eks', '4ès', '4ec/4ecs', '4ux|2']
 
 # dictionary of words with uncommon plurals (-x, -ux, english, latin and italian plurals) and tags to generate them
-_dMiscPlur = {'rational': 0, 'cross-country': 6, 'ripou': 1, 'plumasseau': 1, 'ventail': 7, 'pointal': 0, 'sanatorium': 3, 'recordman': 8, 'rush': 4, 'aveu': 1, 'yeoman': 8, 'rash': 4, 'baliveau': 1, 'nobliau': 1, 'businesswoman': 8, 'corbeau': 1, 'crash': 4, 'pousse-caillou': 1, 'chemineau': 1, 'remix': 9, 'pecorino': 5, 'demi-dieu': 1, 'maquereau': 1, 'rideau': 1, 'gluau': 1, 'non-métal': 0, 'coupeau': 1, 'hobby': 6, 'porte-couteau': 1, 'terreau': 1, 'saumoneau': 1, 'damoiseau': 1, 'smash': 4, 'corail': 7, 'pointeau': 1, 'étourneau': 1, 'coyau': 1, 'pifferaro': 5, 'prélinteau': 1, 'pizzicato': 5, 'franco-provençal': 0, 'brandy': 6, 'coteau': 1, 'cordeau': 1, 'pizzaiolo': 5, 'slash': 4, 'porreau': 1, 'rondeau': 1, 'radeau': 1, 'étau': 1, 'antijeu': 1, 'polycristal': 0, 'vaisseau': 1, 'arbrisseau': 1, 'condottiere': 5, 'lapereau': 1, 'noyau': 1, 'scutum': 3, 'chameau': 1, 'gouttereau': 1, 'canardeau': 1, 'soliveau': 1, 'éfourceau': 1, 'carneau': 1, 'bigarreau': 1, 'ecstasy': 6, 'céteau': 1, 'rousseau': 1, 'tufeau': 1, 'biomatériau': 1, 'dindonneau': 1, 'flambeau': 1, 'réal': 0, 'bonneteau': 1, 'cerneau': 1, 'fontainebleau': 1, 'hobereau': 1, 'traineau': 1, 'chapeau': 1, 'rouleau': 1, 'escabeau': 1, 'sureau': 1, 'caveau': 1, 'ypréau': 1, 'sautereau': 1, 'tourteau': 1, 'chenal': 0, 'flush': 4, 'pianissimo': 5, 'serdeau': 1, 'pinceau': 1, 'wattman': 8, 'matériau': 1, 'surjeu': 1, 'ponceau': 1, 'yachtwoman': 8, 'tuileau': 1, 'gruppetto': 5, 'porte-chapeau': 1, 'mâtereau': 1, 'chanteau': 1, 'numéral': 0, 'arioso': 5, 'relish': 4, 'tonneau': 1, 'bureau': 1, 'microcristal': 0, 'pineau': 1, 'junky': 6, 'anneau': 1, 'fluteau': 1, 'brigandeau': 1, 'boss': 9, 'boucau': 1, 'soprano': 5, 'biseau': 1, 'jet-society': 6, 'vau': 1, 'sulky': 6, 'box': 9, 'fromental': 0, 'lazzarone': 5, 'contresceau': 1, 'houseau': 1, 'bitoniau': 1, 'buggy': 6, 'portemanteau': 1, 'journal': 0, 'policeman': 8, 'fardeau': 1, 'godiveau': 1, 'joyau': 1, 'bigorneau': 1, 'tuyau': 1, 'toccata': 12, 'plateau': 1, 'pare-feu': 1, 'pourceau': 1, 'tableau': 1, 'paonneau': 1, 'haveneau': 1, 'caïeu': 1, 'héronneau': 1, 'confessionnal': 0, 'préau': 1, 'piédestal': 0, 'memorandum': 3, 'chou': 1, 'linteau': 1, 'crève-tonneau': 1, 'esquimau': 1, 'tuffeau': 1, 'symposium': 3, 'superwoman': 8, 'cherry': 6, 'pique-feu': 1, 'outardeau': 1, 'clash': 4, 'biscoteau': 1, 'ranch': 4, 'éditorial': 0, 'télétravail': 7, 'tyranneau': 1, 'tombeau': 1, 'quintal': 0, 'têteau': 1, 'cheveu': 1, 'godelureau': 1, 'hâtereau': 1, 'cuisseau': 1, 'self-made-woman': 8, 'coccus': 2, 'taureau': 1, 'racinal': 0, 'poireau': 1, 'solo': 5, 'bourreau': 1, 'hibou': 1, 'temporal': 0, 'ferry': 6, 'cadeau': 1, 'vœu': 1, 'animal': 0, 'fléau': 1, 'hameau': 1, 'sous-arbrisseau': 1, 'écheveau': 1, 'hirondeau': 1, 'paddy': 6, 'zingaro': 5, 'pectoral': 0, 'tennisman': 8, 'contre-sceau': 1, 'biveau': 1, 'copeau': 1, 'gémeau': 1, 'instrumental': 0, 'idéal': 0, 'quasi-cristal': 0, 'arceau': 1, 'tory': 6, 'grémial': 0, 'curriculum': 3, 'arrière-vassal': 0, 'loqueteau': 1, 'gruau': 1, 'mal': 0, 'snoreau': 1, 'miss': 9, 'bandeau': 1, 'sous-réseau': 1, 'monceau': 1, 'juke-box': 9, 'antirétroviral': 0, 'métal': 0, 'téléjournal': 0, 'tombereau': 1, 'urinal': 0, 'marmenteau': 1, 'fanal': 0, 'orignal': 0, 'gentry': 6, 'xénocristal': 0, 'marsupial': 0, 'exemplum': 3, 'gagman': 8, 'lieu': 1, 'coulisseau': 1, 'tribunal': 0, 'merleau': 1, 'asseau': 1, 'rabat-eau': 1, 'souriceau': 1, 'conneau': 1, 'flûtiau': 1, 'feld-maréchal': 0, 'barreau': 1, 'emporium': 3, 'chrémeau': 1, 'scrogneugneu': 1, 'grizzly': 6, 'paisseau': 1, 'cyclo-cross': 9, 'bush': 4, 'optimum': 3, 'rampeau': 1, 'garden-party': 6, 'fesse-mathieu': 1, 'friponneau': 1, 'ramereau': 1, 'casseau': 1, 'levreau': 1, 'impedimentum': 3, 'panonceau': 1, 'moyeu': 1, 'cuveau': 1, 'bau': 1, 'sénéchal': 0, 'ciseau': 1, 'antislash': 4, 'baggy': 6, 'phénocristal': 0, 'carreau': 1, 'contrefeu': 1, 'oculus': 2, 'équatorial': 0, 'fauconneau': 1, 'majoral': 0, 'rameau': 1, 'processionnal': 0, 'ricercare': 5, 'bestiau': 1, 'bordereau': 1, 'scratch': 4, 'essieu': 1, 'vipéreau': 1, 'faisandeau': 1, 'hors-jeu': 1, 'pipeau': 1, 'flûteau': 1, 'pureau': 1, 'juste-milieu': 1, 'procès-verbal': 0, 'mangonneau': 1, 'cranberry': 6, 'penny': 6, 'passereau': 1, 'taximan': 8, 'yeomanry': 6, 'lobby': 6, 'medium': 3, 'car-ferry': 6, 'jazzman': 8, 'putto': 5, 'body': 6, 'husky': 6, 'carpeau': 1, 'trumeau': 1, 'dégueu': 1, 'criterium': 3, 'tumulus': 2, 'dinghy': 6, 'lorry': 6, 'cheval': 0, 'coupe-feu': 1, 'superman': 8, 'baby': 6, 'couvre-feu': 1, 'pommeau': 1, 'cameraman': 8, 'cerceau': 1, 'phylum': 3, 'brise-copeau': 1, 'tommy': 6, 'barman': 8, 'vipereau': 1, 'eau': 1, 'nanoréseau': 1, 'serpenteau': 1, 'faisanneau': 1, 'arrière-cerveau': 1, 'pastoureau': 1, 'micronoyau': 1, 'émail': 7, 'gemmail': 7, 'troubleau': 1, 'agro-matériau': 1, 'scriptorium': 3, 'match': 4, 'enjeu': 1, 'girafeau': 1, 'hoyau': 1, 'caillou': 1, 'vocero': 5, 'yachtman': 8, 'canal': 0, 'recordwoman': 8, 'cardinal': 0, 'plumeau': 1, 'berceau': 1, 'vermisseau': 1, 'listeau': 1, 'acinus': 2, 'sèche-cheveu': 1, 'taxum': 3, 'ronchonneau': 1, 'rejeu': 1, 'colineau': 1, 'renouveau': 1, 'pieu': 1, 'alleu': 1, 'feu': 1, 'chalumeau': 1, 'clameau': 1, 'vassiveau': 1, 'claveau': 1, 'aloyau': 1, 'bateau': 1, 'râteau': 1, 'veau': 1, 'scenario': 5, 'dieu': 1, 'poètereau': 1, 'vice-amiral': 0, 'sacramental': 0, 'maffioso': 5, 'addendum': 3, 'conoyau': 1, 'gâteau': 1, 'tenniswoman': 8, 'créneau': 1, 'cache-museau': 1, 'ombudsman': 8, 'winch': 4, 'mail-coach': 4, 'fabliau': 1, 'nursery': 6, 'nanomatériau': 1, 'quantum': 3, 'gerzeau': 1, 'yachtswoman': 8, 'baleineau': 1, 'réseau': 1, 'corporal': 0, 'trullo': 5, 'fécial': 0, 'bécasseau': 1, 'ice-shelf': 11, 'agromatériau': 1, 'peau': 1, 'chevreau': 1, 'triclinium': 3, 'penalty': 6, 'prima-donna': 12, 'aisseau': 1, 'official': 0, 'gentleman': 8, 'organeau': 1, 'sherry': 6, 'impresario': 5, 'jeu': 1, 'wallaby': 6, 'coagulum': 3, 'rinceau': 1, 'végétal': 0, 'caniveau': 1, 'desideratum': 3, 'marteau': 1, 'pupazzo': 5, 'neveu': 1, 'poteau': 1, 'hippy': 6, 'enfaiteau': 1, 'ramponeau': 1, 'chéneau': 1, 'traîneau': 1, 'travail': 7, 'trousseau': 1, 'cerveau': 1, 'oppidum': 3, 'ormeau': 1, 'camaïeu': 1, 'château': 1, 'hâtiveau': 1, 'oral': 0, 'manteau': 1, 'columbarium': 3, 'madrigal': 0, 'speech': 4, 'rugbyman': 8, 'barbeau': 1, 'flutiau': 1, 'perchman': 8, 'batardeau': 1, 'monocristal': 0, 'tord-boyau': 1, 'antiviral': 0, 'abdominal': 0, 'milieu': 1, 'vigneau': 1, 'garde-feu': 1, 'boqueteau': 1, 'louveteau': 1, 'oripeau': 1, 'self-made-man': 8, 'sceau': 1, 'touchau': 1, 'guideau': 1, 'erseau': 1, 'zigoteau': 1, 'arcdoubleau': 1, 'enfaîteau': 1, 'jottereau': 1, 'dandy': 6, 'clergyman': 8, 'seau': 1, 'chapiteau': 1, 'sketch': 4, 'moineau': 1, 'yachtsman': 8, 'latifundium': 3, 'hébreu': 1, 'boisseau': 1, 'présidial': 0, 'partita': 12, 'lunch': 4, 'adieu': 1, 'pruneau': 1, 'grumeau': 1, 'lambeau': 1, 'pontuseau': 1, 'businessman': 8, 'fieu': 1, 'microcanal': 0, 'burgau': 1, 'appeau': 1, 'géosynclinal': 0, 'lanterneau': 1, 'liteau': 1, 'faisceau': 1, 'protège-genou': 1, 'jouvenceau': 1, 'oiseau': 1, 'lady': 6, 'renardeau': 1, 'contre-feu': 1, 'désaveu': 1, 'boyau': 1, 'bocal': 0, 'bluteau': 1, 'paparazzo': 5, 'brunch': 4, 'bull-finch': 4, 'niveau': 1, 'jambonneau': 1, 'chaudeau': 1, 'sportsman': 8, 'merbau': 1, 'fuseau': 1, 'bedeau': 1, 'non-lieu': 1, 'mémorial': 0, 'scotch': 4, 'bijou': 1, 'vantail': 7, 'verseau': 1, 'cigogneau': 1, 'tréteau': 1, 'pou': 1, 'moreau': 1, 'faiteau': 1, 'drapeau': 1, 'bardeau': 1, 'lavatory': 6, 'whisky': 6, 'pigeonneau': 1, 'fermail': 7, 'rave-party': 6, 'tire-feu': 1, 'doubleau': 1, 'gerseau': 1, 'stimulus': 2, 'meneau': 1, 'aboteau': 1, 'javeau': 1, 'allume-feu': 1, 'sanctoral': 0, 'ramponneau': 1, 'troupeau': 1, 'perdreau': 1, 'local': 0, 'daleau': 1, 'panneau': 1, 'pintadeau': 1, 'doleau': 1, 'faîteau': 1, 'porte-drapeau': 1, 'soupirail': 7, 'pitch': 4, 'ouvreau': 1, 'vanneau': 1, 'grimpereau': 1, 'speakeasy': 6, 'ruisseau': 1, 'hôpital': 0, 'aboiteau': 1, 'couteau': 1, 'écriteau': 1, 'roseau': 1, 'carbonaro': 5, 'pagus': 2, 'fourreau': 1, 'bravo': 5, 'joujou': 1, 'demi-mal': 0, 'genou': 1, 'libretto': 5, 'arsenal': 0, 'sandwich': 4, 'vousseau': 1, 'épieu': 1, 'fronteau': 1, 'bouleau': 1, 'cristal': 0, 'naseau': 1, 'midshipman': 8, 'fourneau': 1, 'canzone': 5, 'tonlieu': 1, 'hachereau': 1, 'cailleteau': 1, 'proxy': 6, 'grau': 1, 'tasseau': 1, 'hottereau': 1, 'bail': 7, 'museau': 1, 'bihoreau': 1, 'éléphanteau': 1, 'tempo': 5, 'diurnal': 0, 'foramen': 10, 'flash': 4, 'boutefeu': 1, 'fricandeau': 1, 'mafioso': 5, 'monsignore': 5, 'coach': 4, 'vitrail': 7, 'simbleau': 1, 'lionceau': 1, 'chauffe-eau': 1, 'guindeau': 1, 'signal': 0, 'nuraghe': 5, 'courlieu': 1, 'coupe-chou': 1, 'morceau': 1, 'couleuvreau': 1, 'poétereau': 1, 'saute-ruisseau': 1, 'porte-manteau': 1}
+# packed table (french.miscplurals.tbl in _dictionaries) or, if it has not been built, the dictionary of mfsp_data.py
+_dMiscPlur = getTable("french.miscplurals.tbl", ".mfsp_data", "_dMiscPlur", __package__)
 
 # dictionary of feminine forms and tags to generate masculine forms (singular and plural)
-_dMasForm = {'francisante': 0, 'ansée': 0, 'bachelière': 5, 'cambodgienne': 4, 'cordiale': 3, 'akkadienne': 4, 'inconsolée': 0, 'poulaine': 0, 'cintreuse': 2, 'subventionnelle': 4, 'ambiguë': 0, 'anglo-irlandaise': 7, 'américano-israélienne': 4, 'bollywoodienne': 4, 'incontestée': 0, 'proverbiale': 3, 'sémanticienne': 4, 'inchangée': 0, 'professorale': 3, 'cataclysmale': 3, 'apprenante': 0, 'schleue': 0, 'élisabéthaine': 0, 'banqueroutière': 5, 'précordiale': 3, 'manquante': 0, 'antéropostérieure': 0, 'semi-marathonienne': 4, 'populeuse': 8, 'dorsoventrale': 3, 'serveuse': 2, 'paresseuse': 8, 'portoricaine': 0, 'curative': 6, 'palestinienne': 4, 'honteuse': 8, 'déclamatrice': 1, 'labiée': 0, 'tourbillonnante': 0, 'flageolante': 0, 'staphyline': 0, 'allergisante': 0, 'conquérante': 0, 'fascinatrice': 1, 'spatiotemporelle': 4, 'encapuchonnée': 0, 'épiphénoménale': 3, 'hexavalente': 0, 'maquignonne': 4, 'haillonneuse': 8, 'graillonneuse': 8, 'existentielle': 4, 'soleilleuse': 8, 'brûleuse': 2, 'bluette': 4, 'athénienne': 4, 'occurrente': 0, 'fichue': 0, 'aspiratrice': 1, 'créditrice': 1, 'pipière': 5, 'exclusive': 6, 'riboteuse': 2, 'virale': 3, 'franco-macédonienne': 4, 'nationale': 3, 'swahilie': 0, 'fusionnante': 0, 'antidépressive': 6, 'corticosurrénale': 3, 'birationnelle': 4, 'jet-setteuse': 2, 'anglo-saxonne': 4, 'lusitanienne': 4, 'fromagée': 0, 'simultanée': 0, 'rectifieuse': 2, 'coproductrice': 1, 'matonne': 4, 'fouettarde': 0, 'mourante': 0, 'déshumanisante': 0, 'anglo-israélienne': 4, 'tresseuse': 2, 'gréco-romaine': 0, 'décevante': 0, 'édifiante': 0, 'envahissante': 0, 'liminale': 3, 'franco-paraguayenne': 4, 'augmentative': 6, 'non-combattante': 0, 'surfeuse': 2, 'oblongue': 4, 'vaine': 0, 'trempeuse': 2, 'banqueteuse': 2, 'arrangeuse': 2, 'professante': 0, 'victorienne': 4, 'maïeure': 0, 'chevaucheuse': 2, 'péruvienne': 4, 'interministérielle': 4, 'dépanneuse': 2, 'interrogée': 0, 'dévoyée': 0, 'nutritionnelle': 4, 'piaillarde': 0, 'tendeuse': 2, 'superlative': 6, 'accablante': 0, 'téléactrice': 1, 'neuronale': 3, 'trouveuse': 2, 'cachotière': 5, 'staminale': 3, 'marxisante': 0, 'effrontée': 0, 'annoncière': 5, 'enquêtée': 0, 'introublée': 0, 'relevante': 0, 'panarde': 0, 'sauteuse': 2, 'urbaine': 0, 'cohabitante': 0, 'continuelle': 4, 'épateuse': 2, 'coutante': 0, 'citernière': 5, 'shipchandleuse': 2, 'étampeuse': 2, 'pensive': 6, 'desservante': 0, 'sublinguale': 3, 'entraineuse': 2, 'poulotte': 4, 'disgracieuse': 8, 'occupante': 0, 'déracinée': 0, 'puinée': 0, 'agro-environnementale': 3, 'éphésienne': 4, 'sournoise': 7, 'chamoiseuse': 2, 'défensive': 6, 'poudroyante': 0, 'ébaucheuse': 2, 'paniculée': 0, 'tarotée': 0, 'franco-indienne': 4, 'productrice': 1, 'praguoise': 7, 'surbookée': 0, 'récupératrice': 1, 'récréative': 6, 'magdalénienne': 4, 'pennée': 0, 'couillue': 0, 'alsacienne': 4, 'fortifiante': 0, 'artinienne': 4, 'accouveuse': 2, 'butanée': 0, 'préélectorale': 3, 'innovatrice': 1, 'protectionnelle': 4, 'officieuse': 8, 'logisticienne': 4, 'microporeuse': 8, 'récoltante': 0, 'calédonienne': 4, 'ingénue': 0, 'malévolente': 0, 'tardillonne': 4, 'ardue': 0, 'abrasive': 6, 'linière': 5, 'compagnonne': 4, 'représentative': 6, 'chère': 5, 'blésoise': 7, 'accédée': 0, 'anglo-norvégienne': 4, 'flirteuse': 2, 'brossière': 5, 'schwarzienne': 4, 'saturnine': 0, 'baroudeuse': 2, 'précambrienne': 4, 'onciale': 3, 'forestière': 5, 'immortelle': 4, 'assyro-babylonienne': 4, 'numérative': 6, 'lobuleuse': 8, 'blafarde': 0, 'libéro-ligneuse': 8, 'tourtelée': 0, 'séléniteuse': 8, 'effluente': 0, 'expérimentatrice': 1, 'extra-légale': 3, 'admise': 7, 'pulsionnelle': 4, 'gigotée': 0, 'bipennée': 0, 'citronnée': 0, 'tachante': 0, 'dictatoriale': 3, 'trufficultrice': 1, 'cotonneuse': 8, 'céphalée': 0, 'civilisatrice': 1, 'bricoleuse': 2, 'acromiale': 3, 'polyinsaturée': 0, 'quiète': 20, 'survitaminée': 0, 'configurationnelle': 4, 'transuranienne': 4, 'vert-de-grisée': 0, 'tueuse': 2, 'aéropostale': 3, 'heptathlonienne': 4, 'monoparentale': 3, 'rafraichie': 0, 'nazaréenne': 4, 'clairette': 4, 'lésineuse': 2, 'graniteuse': 8, 'incroyante': 0, 'sinusale': 3, 'ilotière': 5, 'pleurnicheuse': 2, 'chevillarde': 0, 'bêlante': 0, 'aquitaine': 0, 'ouzbèke': 26, 'subéquatoriale': 3, 'extorqueuse': 2, 'dominiquaise': 7, 'carabinée': 0, 'exceptionnelle': 4, 'kidnappée': 0, 'liquidatrice': 1, 'dopante': 0, 'perceptuelle': 4, 'exigüe': 10, 'épicentrale': 3, 'kafkaïenne': 4, 'zélatrice': 1, 'néocomienne': 4, 'interhumaine': 0, 'occitane': 0, 'ambitieuse': 8, 'transitive': 6, 'camionneuse': 2, 'coparticipante': 0, 'soumise': 7, 'franco-lettonne': 4, 'incuite': 0, 'pondéreuse': 8, 'piétonne': 4, 'duale': 3, 'ringarde': 0, 'éminente': 0, 'paléoenvironnementale': 3, 'husserlienne': 4, 'coloniale': 3, 'intramodale': 3, 'électro-acousticienne': 4, 'prédigérée': 0, 'bio-industrielle': 4, 'nasarde': 0, 'déverse': 7, 'fileuse': 2, 'niveleuse': 2, 'microbienne': 4, 'déclarative': 6, 'nomenclatrice': 1, 'municipale': 3, 'conciliante': 0, 'préputiale': 0, 'citoyenne': 4, 'aérotransportée': 0, 'offensante': 0, 'dépressive': 6, 'phosphoreuse': 8, 'javeleuse': 2, 'moelleuse': 8, 'appétitive': 6, 'désidérative': 6, 'raboteuse': 8, 'équipière': 5, 'messine': 0, 'panaméenne': 4, 'écraseuse': 2, 'languée': 0, 'raciale': 3, 'coaxiale': 3, 'cisalpine': 0, 'abbevillienne': 4, 'dernière': 5, 'bonzesse': 13, 'participative': 6, 'provisionnelle': 4, 'aurignacienne': 4, 'haute': 0, 'meunière': 5, 'porchère': 5, 'purpurine': 0, 'repentante': 0, 'crawlée': 0, 'arboricultrice': 1, 'timonière': 5, 'millénale': 3, 'plénière': 5, 'inattendue': 0, 'intergouvernementale': 3, 'antéro-ventrale': 3, 'petiote': 0, 'égyptienne': 4, 'effusive': 6, 'électrotechnicienne': 4, 'plasmolysée': 0, 'agonisante': 0, 'interconfessionnelle': 4, 'escompteuse': 2, 'polonaise': 7, 'spoliatrice': 1, 'germinatrice': 1, 'pasticheuse': 2, 'truculente': 0, 'agitante': 0, 'viticultrice': 1, 'ethnocentrée': 0, 'séraphine': 0, 'antimoniée': 0, 'anglo-iranienne': 4, 'mélanésienne': 4, 'méplate': 0, 'sempiternelle': 4, 'épithéliale': 3, 'rosissante': 0, 'spirale': 3, 'verrière': 5, 'chiffreuse': 2, 'neurodégénérative': 6, 'réchauffante': 0, 'enrichissante': 0, 'matraqueuse': 2, 'passionnelle': 4, 'commentatrice': 1, 'désopilante': 0, 'salienne': 4, 'rase': 7, 'brownienne': 4, 'originelle': 4, 'envoyeuse': 2, 'attirante': 0, 'génitale': 3, 'égaliseuse': 2, 'intercostale': 3, 'médico-sociale': 3, 'furette': 4, 'imposeuse': 2, 'fracasseuse': 2, 'cervicale': 3, 'glaiseuse': 8, 'financière': 5, 'polytechnicienne': 4, 'bodybuildée': 0, 'déconcertante': 0, 'nominative': 6, 'rectale': 3, 'dormante': 0, 'exaltée': 0, 'actuarielle': 4, 'roucouleuse': 2, 'récriminatrice': 1, 'jurisprudentielle': 4, 'racleuse': 2, 'blablateuse': 2, 'exténuante': 0, 'grosse': 15, 'paraguayenne': 4, 'planificatrice': 1, 'montagneuse': 8, 'uniformisante': 0, 'marshallaise': 7, 'diplômante': 0, 'ondine': 0, 'consubstantielle': 4, 'ritale': 0, 'captative': 6, 'chicanière': 5, 'complaisante': 0, 'auto-stoppeuse': 2, 'adjudante': 0, 'trisaïeule': 0, 'édulcorante': 0, 'prépondérante': 0, 'purgative': 6, 'sardinière': 5, 'changeante': 0, 'paire': 0, 'clinquante': 0, 'guérisseuse': 2, 'pénale': 3, 'matérielle': 4, 'basculante': 0, 'maudite': 0, 'insoucieuse': 8, 'circonférentielle': 4, 'grenouillante': 0, 'cracheuse': 2, 'contremanifestante': 0, 'adaptatrice': 1, 'suractivée': 0, 'égrotante': 0, 'claudicante': 0, 'rétro-éclairée': 0, 'jamaïquaine': 0, 'lapine': 0, 'fugueuse': 2, 'tarnaise': 7, 'inexistante': 0, 'mercurielle': 4, 'chicaneuse': 2, 'âgée': 0, 'vendeuse': 2, 'pseudodifférentielle': 4, 'ourse': 7, 'balourde': 0, 'supportrice': 1, 'accompagnatrice': 1, 'laborante': 0, 'non-résidente': 0, 'diseuse': 2, 'vachère': 5, 'insermentée': 0, 'empaillée': 0, 'punisseuse': 2, 'inhabitée': 0, 'hydrorésistante': 0, 'hydrolienne': 4, 'truitée': 0, 'lissante': 0, 'capitale': 3, 'pointeuse': 2, 'dérivationnelle': 4, 'tombante': 0, 'maigrichonne': 4, 'décodeuse': 2, 'bote': 0, 'ombellée': 0, 'anglo-hongroise': 7, 'crochue': 0, 'roguée': 0, 'réalisatrice': 1, 'évidente': 0, 'illuviale': 3, 'paumée': 0, 'hyposulfureuse': 8, 'bossue': 0, 'gueularde': 0, 'blondinette': 4, 'inhumée': 0, 'univariante': 0, 'corédactrice': 1, 'aiguilleteuse': 2, 'marnoise': 7, 'spinalienne': 4, 'longévive': 6, 'argilo-siliceuse': 8, 'volatile': 0, 'assujettissante': 0, 'rassasiante': 0, 'avocassière': 5, 'isospectrale': 3, 'flexionnelle': 4, 'extravertie': 0, 'alcalino-terreuse': 8, 'perspective': 6, 'prestidigitatrice': 1, 'caprine': 0, 'contagieuse': 8, 'creuse': 8, 'bissextile': 0, 'découpeuse': 2, 'pacsée': 0, 'microcristalline': 0, 'minaudière': 5, 'gasconne': 4, 'courtisée': 0, 'installatrice': 1, 'haleuse': 2, 'amatrice': 1, 'greffeuse': 2, 'encenseuse': 2, 'discriminatrice': 1, 'oscillocoulissante': 0, 'marcheuse': 2, 'dalleuse': 2, 'grévicultrice': 1, 'fraiche': 23, 'expansive': 6, 'insensée': 0, 'vulnérante': 0, 'interloquée': 0, 'antirétrovirale': 3, 'bambine': 0, 'carcinomateuse': 8, 'équipotente': 0, 'nociceptive': 6, 'irakienne': 4, 'cuiseuse': 2, 'évangélisatrice': 1, 'membraneuse': 8, 'démarqueuse': 2, 'quarteronne': 4, 'infatuée': 0, 'abréviée': 0, 'dominicaine': 0, 'suppliciante': 0, 'compacteuse': 2, 'antidérapante': 0, 'nouménale': 3, 'homoparentale': 3, 'cocontractante': 0, 'hypothético-déductive': 6, 'chômeuse': 2, 'pinailleuse': 2, 'bangladaise': 7, 'polarde': 0, 'houligane': 0, 'désabusée': 0, 'microtonale': 0, 'centésimale': 3, 'partitive': 6, 'palmiséquée': 0, 'chérifienne': 4, 'miraillée': 0, 'culturelle': 4, 'corrompue': 0, 'marqueteuse': 2, 'corroyeuse': 2, 'soignante': 0, 'incorporelle': 4, 'computationnelle': 4, 'voisée': 0, 'scaphandrière': 5, 'géomancienne': 4, 'assertive': 6, 'surannée': 0, 'apaisante': 0, 'chuchoteuse': 2, 'audoise': 7, 'contre-attaquante': 0, 'élavée': 0, 'clavière': 5, 'ferronnière': 5, 'thaïe': 0, 'millerandée': 0, 'polytransfusée': 0, 'harponneuse': 2, 'primale': 3, 'contemplative': 6, 'propositionnelle': 4, 'dépouilleuse': 2, 'aphteuse': 8, 'exploitante': 0, 'rabelaisienne': 4, 'chenue': 0, 'hottentote': 0, 'méditative': 6, 'fistuleuse': 8, 'chamailleuse': 2, 'sablonneuse': 8, 'jouteuse': 2, 'cofondatrice': 1, 'butyreuse': 8, 'infirmière': 5, 'potière': 5, 'archiconnue': 0, 'nivale': 3, 'messagère': 5, 'modernisatrice': 1, 'exaltante': 0, 'toussoteuse': 8, 'samaritaine': 0, 'masticatrice': 1, 'riveraine': 0, 'septennale': 3, 'démersale': 3, 'cabaretière': 5, 'interpariétale': 3, 'suraiguë': 0, 'pluriculturelle': 4, 'championne': 4, 'redistributrice': 1, 'réticuloendothéliale': 3, 'diamantine': 0, 'sous-développée': 0, 'idempotente': 0, 'calvadosienne': 4, 'scrutatrice': 1, 'biliée': 0, 'égocentrée': 0, 'argenteuse': 2, 'julienne': 4, 'outrancière': 5, 'sensitive': 6, 'ralliée': 0, 'ronceuse': 8, 'algébro-différentielle': 4, 'absconse': 7, 'rappelée': 0, 'papuleuse': 8, 'lustrante': 0, 'blanche': 4, 'clabaudeuse': 2, 'trinervée': 0, 'arborescente': 0, 'rigoureuse': 8, 'panseuse': 2, 'coprésidente': 0, 'rationnelle': 4, 'stéphanoise': 7, 'cliveuse': 2, 'exportatrice': 1, 'tartreuse': 8, 'mouleuse': 2, 'louchonne': 4, 'germanopratine': 0, 'ostentatrice': 1, 'blasphématrice': 1, 'exanthémateuse': 8, 'entremetteuse': 2, 'sectionnelle': 4, 'omanaise': 7, 'inébranlée': 0, 'néorurale': 3, 'givrante': 0, 'automnale': 3, 'oisive': 6, 'corruptrice': 1, 'continuatrice': 1, 'tensorielle': 4, 'fastueuse': 8, 'clinicienne': 4, 'confirmative': 6, 'préservatrice': 1, 'trafiquante': 0, 'scrabbleuse': 2, 'roncière': 5, 'opprimante': 0, 'vésiculeuse': 8, 'ferrugineuse': 8, 'embosseuse': 2, 'professionnalisante': 0, 'écrivassière': 5, 'omniprésente': 0, 'résiliente': 0, 'mal-logée': 0, 'caverneuse': 8, 'souveraine': 0, 'captieuse': 8, 'extemporanée': 0, 'brugeoise': 7, 'australo-française': 7, 'chapardeuse': 2, 'aurorale': 3, 'phénoménale': 3, 'discriminative': 6, 'abusive': 6, 'résidente': 0, 'marocaine': 0, 'précieuse': 8, 'basse-courière': 5, 'sommative': 6, 'latérale': 3, 'administratrice': 1, 'terrorisante': 0, 'incrémentale': 3, 'cytogénéticienne': 4, 'prénatale': 0, 'impétigineuse': 8, 'avaleuse': 2, 'nominante': 0, 'embaumeuse': 2, 'achirale': 3, 'fériale': 3, 'bohémienne': 4, 'intérieure': 0, 'secrète': 20, 'omnisciente': 0, 'interventionnelle': 4, 'fainéante': 0, 'transculturelle': 4, 'occlusive': 6, 'amie': 0, 'minimisante': 0, 'luxembourgeoise': 7, 'moireuse': 2, 'écocitoyenne': 4, 'alumineuse': 8, 'jeteuse': 2, 'voiturière': 5, 'peureuse': 8, 'vomitive': 6, 'jacassante': 0, 'vaillante': 0, 'reptilienne': 4, 'grisonne': 4, 'vanisée': 0, 'tinctoriale': 3, 'séparatrice': 1, 'robinetière': 5, 'laïusseuse': 2, 'marathonienne': 4, 'dispose': 7, 'assurée': 0, 'contrattaquante': 0, 'cuissarde': 0, 'autopsiée': 0, 'moricaude': 0, 'ruisselante': 0, 'obédientielle': 4, 'lamelleuse': 8, 'citrine': 0, 'aoutienne': 4, 'tendancieuse': 8, 'valseuse': 2, 'laurée': 0, 'préventrice': 1, 'snobinarde': 0, 'foudroyante': 0, 'abiétine': 0, 'inutilisée': 0, 'pétante': 0, 'calamiteuse': 8, 'dégoutante': 0, 'usurière': 5, 'anecdotière': 5, 'électrice': 1, 'lectrice': 1, 'timoraise': 7, 'déstressante': 0, 'rochassière': 5, 'déserte': 0, 'outsideuse': 2, 'prêcheuse': 2, 'épiscopalienne': 4, 'bullée': 0, 'moutardière': 5, 'ourdisseuse': 2, 'mentale': 3, 'rentière': 5, 'prodigieuse': 8, 'saliveuse': 8, 'étincelante': 0, 'freineuse': 2, 'persulfurée': 0, 'basse': 15, 'expéditrice': 1, 'jacobine': 0, 'contrefaiseuse': 2, 'écrivaillée': 0, 'inessentielle': 4, 'russo-américaine': 0, 'scapulo-humérale': 3, 'chétive': 6, 'compactifiée': 0, 'signalisatrice': 1, 'cingalaise': 7, 'scrotale': 3, 'proximale': 3, 'tombée': 0, 'fouineuse': 2, 'unitarienne': 4, 'métricienne': 4, 'arsenicale': 3, 'parvenue': 0, 'galeuse': 8, 'filleule': 0, 'non-euclidienne': 4, 'franco-allemande': 0, 'racée': 0, 'psychosociale': 3, 'périnatale': 0, 'lippue': 0, 'austro-allemande': 0, 'convolutée': 0, 'discale': 3, 'formeuse': 2, 'suzeraine': 0, 'limoneuse': 8, 'incoordonnée': 0, 'hercheuse': 2, 'lénitive': 6, 'saunière': 5, 'offensée': 0, 'chalonnaise': 7, 'cubitale': 3, 'monaurale': 3, 'autocaravanière': 5, 'écouteuse': 2, 'archimédienne': 4, 'chaude': 0, 'infraliminale': 3, 'engainante': 0, 'gréseuse': 8, 'badine': 0, 'inavouée': 0, 'rouilleuse': 8, 'multinationale': 3, 'crènelée': 0, 'slameuse': 2, 'vexatrice': 1, 'cornemuseuse': 2, 'brinquebalante': 0, 'essoreuse': 2, 'demi-morte': 0, 'co-employeuse': 2, 'orthonormale': 3, 'proto-chrétienne': 4, 'antioxydante': 0, 'uniovulée': 0, 'vacante': 0, 'joueuse': 2, 'vitreuse': 8, 'stibiée': 0, 'flabellée': 0, 'proprioceptive': 6, 'aberrante': 0, 'citadine': 0, 'conjonctive': 6, 'saboteuse': 2, 'avitailleuse': 2, 'ailée': 0, 'prochaine': 0, 'aléseuse': 2, 'silurienne': 4, 'impétueuse': 8, 'parcheminière': 5, 'somnolente': 0, 'nabote': 0, 'bronchodilatatrice': 1, 'présentielle': 4, 'gazeuse': 8, 'altière': 5, 'enfourneuse': 2, 'corallienne': 4, 'limousine': 0, 'dangereuse': 8, 'costarmoricaine': 0, 'syndicale': 3, 'hurdleuse': 2, 'gantière': 5, 'talentueuse': 8, 'adultérine': 0, 'dative': 6, 'totipotente': 0, 'naine': 0, 'rhabdomancienne': 4, 'débrouillarde': 0, 'paraverbale': 3, 'lettreuse': 2, 'mycorhizienne': 4, 'bourgeonnante': 0, 'décanale': 3, 'coéternelle': 4, 'aiguilleuse': 2, 'faiblarde': 0, 'condruzienne': 4, 'bruyante': 0, 'biculturelle': 4, 'cessante': 0, 'gageuse': 2, 'urgonienne': 4, 'infamante': 0, 'filtreuse': 2, 'tuilière': 5, 'privative': 6, 'pattue': 0, 'jaillissante': 0, 'américano-canadienne': 4, 'réformatrice': 1, 'extra-conjugale': 3, 'rapeuse': 2, 'assomptive': 6, 'déverbale': 3, 'fougueuse': 8, 'épinglière': 5, 'aspirante': 0, 'intéressée': 0, 'antédiluvienne': 4, 'ostrogothe': 0, 'moraliseuse': 2, 'quadrivalente': 0, 'cornue': 0, 'connotative': 6, 'glandée': 0, 'coopérante': 0, 'lunée': 0, 'australe': 3, 'cajoleuse': 2, 'persifleuse': 2, 'fouteuse': 2, 'obéissante': 0, 'réplétive': 6, 'veilleuse': 2, 'creuseuse': 2, 'pro-européenne': 4, 'anglo-australienne': 4, 'débutante': 0, 'charançonnée': 0, 'minéralisante': 0, 'planeuse': 2, 'consule': 0, 'microprogrammée': 0, 'imprécatrice': 1, 'commerçante': 0, 'indiscriminée': 0, 'ramollissante': 0, 'impaire': 0, 'féline': 0, 'vaudoue': 0, 'cicéronienne': 4, 'officielle': 4, 'déposante': 0, 'réductive': 6, 'bottière': 5, 'momentanée': 0, 'digitale': 3, 'verbale': 3, 'uninominale': 3, 'requérante': 0, 'votante': 0, 'rusée': 0, 'froufrouteuse': 8, 'racketteuse': 2, 'embêtante': 0, 'organophosphorée': 0, 'péronière': 5, 'verviétoise': 7, 'révolue': 0, 'générationnelle': 4, 'ennemie': 0, 'autoréférentielle': 4, 'diaconale': 3, 'contadine': 0, 'intersubjective': 6, 'observante': 0, 'malplaisante': 0, 'costumière': 5, 'incivile': 0, 'investisseuse': 2, 'subexponentielle': 4, 'ambleuse': 2, 'dérobeuse': 2, 'locatrice': 1, 'testimoniale': 3, 'maniaco-dépressive': 6, 'horizontale': 3, 'hurlante': 0, 'skateuse': 2, 'dresseuse': 2, 'laitée': 0, 'sébacée': 0, 'circonvoisine': 0, 'amuseuse': 2, 'instructrice': 1, 'foxée': 0, 'observationnelle': 4, 'pignorative': 6, 'aboyante': 0, 'ultraplate': 0, 'luciférienne': 4, 'insurrectionnelle': 4, 'infractionnelle': 4, 'cartonnière': 5, 'recluse': 7, 'pleurante': 0, 'anesthésiante': 0, 'préœdipienne': 4, 'bourguignonne': 4, 'vétérane': 0, 'caoutchoutière': 5, 'tombale': 3, 'moissonneuse': 2, 'éhontée': 0, 'basketteuse': 2, 'oblitératrice': 1, 'ambassadrice': 1, 'serpentine': 0, 'criméenne': 4, 'iléo-cæcale': 3, 'pivotante': 0, 'circadienne': 4, 'gazée': 0, 'discoïdale': 3, 'paneuropéenne': 4, 'agrarienne': 4, 'matinière': 5, 'malodorante': 0, 'barcelonaise': 7, 'susmentionnée': 0, 'allitérative': 6, 'traditionnelle': 4, 'oscillobattante': 0, 'média-planneuse': 2, 'accapareuse': 2, 'blonde': 0, 'intercontinentale': 3, 'compétitrice': 1, 'tiquetée': 0, 'délirante': 0, 'flagorneuse': 2, 'empêcheuse': 2, 'embaucheuse': 2, 'infralittorale': 3, 'irritante': 0, 'voisine': 0, 'retardée': 0, 'houspilleuse': 2, 'busquée': 0, 'téléconseillère': 5, 'substitutive': 6, 'énonciatrice': 1, 'postformée': 0, 'sûre': 0, 'ascendante': 0, 'improbative': 6, 'épistolière': 5, 'berneuse': 2, 'cérémonieuse': 8, 'gommeuse': 8, 'transformante': 0, 'sinisante': 0, 'synagogale': 3, 'culturale': 3, 'proaméricaine': 0, 'pressureuse': 2, 'grossissante': 0, 'atomicienne': 4, 'binominale': 3, 'non-figurative': 6, 'coréenne': 4, 'antiseigneuriale': 3, 'ardoisière': 5, 'inclusive': 6, 'implosive': 6, 'expropriée': 0, 'sectorielle': 4, 'surcapitalisante': 0, 'saignante': 0, 'chinoise': 7, 'anorectale': 3, 'mésothéliale': 3, 'captatrice': 1, 'périgourdine': 0, 'grinçante': 0, 'objective': 6, 'boycotteuse': 2, 'anglo-égyptienne': 4, 'douée': 0, 'branleuse': 2, 'confirmande': 0, 'arabo-palestinienne': 4, 'ravisseuse': 2, 'voyeuse': 2, 'rocailleuse': 8, 'éthiopienne': 4, 'fusante': 0, 'admirative': 6, 'gagneuse': 2, 'naufrageuse': 2, 'importatrice': 1, 'décentralisatrice': 1, 'unisexuelle': 4, 'dionysienne': 4, 'foliée': 0, 'antinaturelle': 4, 'patente': 0, 'verte': 0, 'trayeuse': 2, 'uropygiale': 3, 'médicoprofessionnelle': 4, 'quinaude': 0, 'révoquée': 0, 'tripière': 5, 'lexicale': 3, 'recouvreuse': 2, 'obstinée': 0, 'legendrienne': 4, 'préromane': 0, 'barguigneuse': 2, 'bambocheuse': 2, 'transfusionnelle': 4, 'participante': 0, 'sulfureuse': 8, 'carnée': 0, 'alépine': 0, 'néocoloniale': 3, 'équatoguinéenne': 4, 'socio-professionnelle': 4, 'néo-calédonienne': 4, 'fraîchissante': 0, 'engagée': 0, 'sourde': 0, 'wagnérienne': 4, 'mandante': 0, 'timorée': 0, 'franco-italienne': 4, 'rivale': 3, 'lozérienne': 4, 'sarcomateuse': 8, 'fuyante': 0, 'vergetée': 0, 'machinatrice': 1, 'divulgatrice': 1, 'polyamoureuse': 2, 'ricinée': 0, 'inaboutie': 0, 'youpine': 0, 'détergente': 0, 'trochantérienne': 4, 'déplaisante': 0, 'réclamante': 0, 'trapue': 0, 'batteuse': 2, 'draconienne': 4, 'ricanante': 0, 'pluripotente': 0, 'ébavureuse': 2, 'rhinopharyngienne': 4, 'reluisante': 0, 'dépréciative': 6, 'ressasseuse': 2, 'malaisienne': 4, 'pseudo-riemannienne': 4, 'confidentielle': 4, 'merdeuse': 8, 'courtisane': 0, 'maritale': 3, 'molletonneuse': 8, 'tadjike': 0, 'économétricienne': 4, 'quémandeuse': 2, 'instantanée': 0, 'connaturelle': 4, 'odoriférante': 0, 'senestrée': 0, 'peccante': 0, 'transnationale': 3, 'pérennante': 0, 'palissonneuse': 2, 'vivificatrice': 1, 'débosseleuse': 2, 'malaimée': 0, 'frangeante': 0, 'laïcarde': 0, 'boucheuse': 2, 'méticuleuse': 8, 'ambroisienne': 4, 'noethérienne': 4, 'exagératrice': 1, 'carminative': 6, 'subéreuse': 8, 'fulgurante': 0, 'rôtisseuse': 2, 'iridiée': 0, 'buandière': 5, 'bombeuse': 2, 'soularde': 0, 'contrélectromotrice': 1, 'réceptive': 6, 'américano-mexicaine': 0, 'scabieuse': 8, 'meublante': 0, 'théologale': 3, 'borosilicatée': 0, 'colloïdale': 3, 'récolteuse': 2, 'bantoue': 0, 'grasse': 15, 'confucéenne': 4, 'semi-publique': 11, 'furibonde': 0, 'politico-financière': 5, 'rentrante': 0, 'consanguine': 0, 'grimaçante': 0, 'phylloxérienne': 4, 'faïencière': 5, 'syndiquée': 0, 'profileuse': 2, 'cellérière': 5, 'inscrite': 0, 'aoûtienne': 4, 'pantouflière': 5, 'fangeuse': 8, 'soixante-huitarde': 0, 'alliée': 0, 'nonpareille': 4, 'adjutrice': 1, 'encline': 0, 'colossale': 3, 'traficoteuse': 2, 'flagellante': 0, 'archère': 5, 'antiinfectieuse': 8, 'perlinguale': 3, 'indicative': 6, 'favorisante': 0, 'sursaturante': 0, 'transpadane': 0, 'suburbaine': 0, 'pénienne': 4, 'challengeuse': 2, 'mexico-américaine': 0, 'blessée': 0, 'fessière': 5, 'empaffée': 0, 'différentiée': 0, 'gentillette': 4, 'chichiteuse': 8, 'ambigüe': 10, 'marguillière': 5, 'plumeuse': 8, 'singulative': 6, 'pataugeuse': 2, 'déchevelante': 0, 'denticulée': 0, 'palière': 5, 'subnormale': 3, 'brouteuse': 2, 'immunodéficiente': 0, 'saccarine': 0, 'faramineuse': 8, 'descendeuse': 2, 'tapageuse': 2, 'incomprise': 7, 'dîneuse': 2, 'aiglonne': 4, 'fouetteuse': 2, 'guillotinée': 0, 'oscillante': 0, 'panetière': 5, 'persécutante': 0, 'lorraine': 0, 'esquintante': 0, 'serricultrice': 1, 'tendancielle': 4, 'hachischine': 0, 'bretteuse': 2, 'maléficieuse': 8, 'marmitonne': 4, 'ultra-marine': 0, 'intellectuelle': 4, 'auspicieuse': 8, 'familiale': 3, 'séropositive': 6, 'philosophale': 0, 'dickensienne': 4, 'marémotrice': 1, 'impérative': 6, 'transcaucasienne': 4, 'stripteaseuse': 2, 'goutteuse': 8, 'doseuse': 2, 'poplitée': 0, 'vanuatuane': 0, 'encaisseuse': 2, 'ramoneuse': 2, 'indistincte': 0, 'opérée': 0, 'sibérienne': 4, 'gravitante': 0, 'conditionneuse': 2, 'ragoûtante': 0, 'sous-jacente': 0, 'artérielle': 4, 'franco-brésilienne': 4, 'chambreuse': 2, 'mastoïdienne': 4, 'albigeoise': 7, 'sagittale': 3, 'retraite': 0, 'afro-cubaine': 0, 'sacrificatrice': 1, 'constructive': 6, 'studieuse': 8, 'musulmane': 0, 'gymnasienne': 4, 'lessiveuse': 2, 'claquette': 4, 'zurichoise': 7, 'souricière': 5, 'bienveillante': 0, 'bâfreuse': 2, 'visigothe': 0, 'moghole': 0, 'mathématicienne': 4, 'agaillardie': 0, 'serbo-monténégrine': 0, 'inconvenante': 0, 'salvatrice': 1, 'prévalente': 0, 'interpellative': 6, 'répurgatrice': 1, 'cosplayeuse': 2, 'vicariante': 0, 'khmère': 5, 'franco-algérienne': 4, 'émailleuse': 2, 'jéjunale': 3, 'mocharde': 0, 'ombreuse': 8, 'aînée': 0, 'contenante': 0, 'effractive': 6, 'productive': 6, 'diluvienne': 4, 'nazie': 0, 'dépaysante': 0, 'éléphantine': 0, 'staffeuse': 2, 'dessiccatrice': 1, 'caissonnée': 0, 'avantagée': 0, 'franco-ukrainienne': 4, 'fiévreuse': 8, 'surgénératrice': 1, 'magicienne': 4, 'chevalière': 5, 'performante': 0, 'surreprésentée': 0, 'hexagonale': 3, 'dorso-ventrale': 3, 'afocale': 3, 'farinière': 5, 'socinienne': 4, 'gastroduodénale': 3, 'parieuse': 2, 'aboyeuse': 2, 'inondée': 0, 'prétentieuse': 8, 'balzane': 0, 'anglo-irakienne': 4, 'graphiteuse': 8, 'lyonnaise': 7, 'intouchée': 0, 'tibiotarsienne': 4, 'liante': 0, 'introductrice': 1, 'oppositionnelle': 4, 'laponne': 4, 'acescente': 0, 'marécageuse': 8, 'distillatrice': 1, 'monténégrine': 0, 'hébergeuse': 2, 'bassinante': 0, 'émulsifiante': 0, 'mérovingienne': 4, 'pétocharde': 0, 'fessue': 0, 'illuminante': 0, 'discrète': 20, 'bouillante': 0, 'pellagreuse': 8, 'céphalorachidienne': 4, 'rénovatrice': 1, 'confondante': 0, 'chiropraticienne': 4, 'zélandaise': 7, 'attitudinale': 3, 'transneptunienne': 4, 'radio-amatrice': 1, 'suppurée': 0, 'étalière': 5, 'moustachue': 0, 'glucosée': 0, 'pimpante': 0, 'arménienne': 4, 'suicidée': 0, 'perverse': 7, 'hardeuse': 2, 'sépulcrale': 3, 'desséchante': 0, 'dévote': 0, 'pelleteuse': 2, 'notariale': 3, 'décagonale': 3, 'pluvionivale': 3, 'lente': 0, 'inéprouvée': 0, 'arabo-musulmane': 0, 'khalifale': 3, 'bahaïe': 0, 'ininterrompue': 0, 'dentelière': 5, 'anglo-française': 7, 'assiégée': 0, 'mauricienne': 4, 'spongieuse': 8, 'heptagonale': 3, 'italo-néerlandaise': 7, 'parkinsonienne': 4, 'contre-maîtresse': 13, 'longuéenne': 4, 'peloteuse': 2, 'sergente': 0, 'codominante': 0, 'variolée': 0, 'aversive': 6, 'milicienne': 4, 'platonicienne': 4, 'astucieuse': 8, 'séante': 0, 'aréneuse': 8, 'taupière': 5, 'corrigeuse': 2, 'assommée': 0, 'déchétarienne': 4, 'inintéressante': 0, 'grainière': 5, 'souahélie': 0, 'propulsive': 6, 'tellurienne': 4, 'exigeante': 0, 'ponceuse': 8, 'doctorale': 3, 'stoloniale': 3, 'menteuse': 2, 'croquignolette': 4, 'pure': 0, 'granuleuse': 8, 'chercheuse': 2, 'saugrenue': 0, 'précancéreuse': 8, 'organisationnelle': 4, 'pointue': 0, 'moustérienne': 4, 'russo-japonaise': 7, 'lamellée': 0, 'colicitante': 0, 'kalmouke': 0, 'incorporatrice': 1, 'structurale': 3, 'tourbière': 5, 'bonimenteuse': 2, 'garçonne': 4, 'plurinationale': 3, 'malvenue': 0, 'variationnelle': 4, 'garante': 0, 'aptienne': 4, 'stimulante': 0, 'survive': 6, 'héliomarine': 0, 'verdurière': 5, 'scribouillarde': 0, 'transmetteuse': 2, 'gratteuse': 2, 'siliqueuse': 8, 'plongeante': 0, 'postsérielle': 4, 'discursive': 6, 'interalliée': 0, 'cotidale': 3, 'suppliante': 0, 'sulpicienne': 4, 'franco-provençale': 3, 'éclaboussante': 0, 'intimidée': 0, 'trekkeuse': 2, 'membrée': 0, 'concertante': 0, 'flemmarde': 0, 'ismaélienne': 4, 'obtuse': 7, 'séquestrante': 0, 'ivoirienne': 4, 'sélénienne': 4, 'immunosuppressive': 6, 'maigrelette': 4, 'antibourgeoise': 7, 'sotte': 4, 'goguenarde': 0, 'défoliatrice': 1, 'acheuléenne': 4, 'aristotélicienne': 4, 'égalisatrice': 1, 'parafiscale': 3, 'cafarde': 0, 'crue': 0, 'emberlificoteuse': 2, 'régressive': 6, 'frémissante': 0, 'initiée': 0, 'repoussante': 0, 'fondante': 0, 'fictionnelle': 4, 'délibérante': 0, 'vaincue': 0, 'dodelinante': 0, 'audiovisuelle': 4, 'judéo-allemande': 0, 'volante': 0, 'uropygienne': 4, 'assidue': 0, 'azimutale': 3, 'allodiale': 3, 'tibétaine': 0, 'multi-catégorielle': 4, 'ethnico-religieuse': 8, 'hypernerveuse': 8, 'tenancière': 5, 'variétale': 3, 'prélatine': 0, 'retorse': 7, 'finisseuse': 2, 'controlatérale': 3, 'indéhiscente': 0, 'passive': 6, 'relaxée': 0, 'mendigote': 0, 'trancheuse': 2, 'blanchissante': 0, 'conarde': 0, 'cornélienne': 4, 'intendante': 0, 'exultante': 0, 'mûrie': 0, 'solutréenne': 4, 'interviewée': 0, 'surprotectrice': 1, 'adoptante': 0, 'namibienne': 4, 'picarde': 0, 'aérodynamicienne': 4, 'préposée': 0, 'coquine': 0, 'pèquenotte': 4, 'triennale': 3, 'sociale': 3, 'facilitatrice': 1, 'profitante': 0, 'marrante': 0, 'proviseure': 0, 'arrangeante': 0, 'chaisière': 5, 'synoviale': 3, 'conventuelle': 4, 'indo-européenne': 4, 'circassienne': 4, 'lâcheuse': 2, 'demandeuse': 2, 'mystifiante': 0, 'adversative': 6, 'autoadhésive': 6, 'beethovénienne': 4, 'séquestrée': 0, 'choquante': 0, 'déligneuse': 2, 'rouergate': 0, 'rocheuse': 8, 'exubérante': 0, 'chirurgienne': 4, 'annotatrice': 1, 'trigéminée': 0, 'miraculée': 0, 'thoraco-abdominale': 3, 'médulleuse': 8, 'diagnostiqueuse': 2, 'surfaceuse': 2, 'professeure': 0, 'auboise': 7, 'comparante': 0, 'hurluberlue': 0, 'valdoisienne': 4, 'thoracoabdominale': 3, 'émergée': 0, 'trophomicrobienne': 4, 'inférovariée': 0, 'abottée': 0, 'libanaise': 7, 'demi-entière': 5, 'germée': 0, 'démobilisatrice': 1, 'diluviale': 3, 'décompteuse': 2, 'assourdissante': 0, 'fournisseuse': 2, 'autosuffisante': 0, 'supratemporale': 0, 'intéressante': 0, 'concurrente': 0, 'laceuse': 2, 'poivrière': 5, 'peccamineuse': 8, 'policière': 5, 'maffieuse': 8, 'suprahumaine': 0, 'aviveuse': 2, 'anabolisante': 0, 'héraultaise': 7, 'skieuse': 2, 'sensationnelle': 4, 'désinsectiseuse': 2, 'prudente': 0, 'perpétuelle': 4, 'costaude': 0, 'catarrheuse': 8, 'conjurée': 0, 'métallière': 5, 'temporale': 3, 'directoriale': 3, 'auditive': 6, 'affriolante': 0, 'inexpérimentée': 0, 'chaloupée': 0, 'dédoubleuse': 2, 'sereine': 0, 'saccarinée': 0, 'comportementale': 3, 'caudale': 3, 'paranormale': 3, 'givreuse': 8, 'feue': 0, 'basilicale': 3, 'vénusienne': 4, 'poignante': 0, 'sasseuse': 2, 'embarrassée': 0, 'ultrarésistante': 0, 'canotière': 5, 'macédonienne': 4, 'glutineuse': 8, 'bâtisseuse': 2, 'trottinante': 0, 'buronnière': 5, 'pharmacienne': 4, 'rhodanienne': 4, 'torse': 7, 'pénitentiale': 3, 'factuelle': 4, 'coticée': 0, 'résistive': 6, 'agrafeuse': 2, 'permanente': 0, 'primo-délinquante': 0, 'frappeuse': 2, 'ivoirine': 0, 'illuminatrice': 1, 'omnidirectionnelle': 4, 'technicocommerciale': 3, 'mate': 0, 'maladive': 6, 'interjective': 6, 'dragueuse': 2, 'slavisante': 0, 'truande': 0, 'arachnoïdienne': 4, 'socio-éducative': 6, 'repasseuse': 2, 'venteuse': 8, 'extrovertie': 0, 'vermoulue': 0, 'cyclonale': 3, 'éclaireuse': 2, 'inconsidérée': 0, 'gypseuse': 8, 'clivante': 0, 'calmante': 0, 'caricaturale': 3, 'démonstrative': 6, 'autogérée': 0, 'ougrienne': 4, 'ovulée': 0, 'préimprimée': 0, 'francilienne': 4, 'tridimensionnelle': 4, 'roubaisienne': 4, 'coercitive': 6, 'golfeuse': 2, 'ramendeuse': 2, 'malaise': 7, 'non-violente': 0, 'interprofessionnelle': 4, 'reçue': 0, 'confiante': 0, 'endurante': 0, 'bractéale': 3, 'grandiloquente': 0, 'scoriacée': 0, 'fusionnelle': 4, 'coéditrice': 1, 'vitelline': 0, 'médusante': 0, 'arlésienne': 4, 'ivoirière': 5, 'conative': 6, 'néo-hébridaise': 7, 'anticonjoncturelle': 4, 'traineuse': 2, 'extra-professionnelle': 4, 'caresseuse': 2, 'interpersonnelle': 4, 'boulevardière': 5, 'lapone': 0, 'limeuse': 2, 'cartusienne': 4, 'aigrette': 4, 'radicante': 0, 'compteuse': 2, 'intertropicale': 3, 'percheronne': 4, 'rwandaise': 7, 'voltairienne': 4, 'sanglante': 0, 'diamétrale': 3, 'prétoriale': 3, 'sympathisante': 0, 'industrieuse': 8, 'solsticiale': 3, 'bivariante': 0, 'virevoltante': 0, 'régularisante': 0, 'poussive': 6, 'péteuse': 8, 'potelée': 0, 'noiraude': 0, 'concrescente': 0, 'reboiseuse': 2, 'centralisatrice': 1, 'acadienne': 4, 'communicative': 6, 'pailleuse': 8, 'finlandaise': 7, 'pronominale': 3, 'contragestive': 6, 'modérée': 0, 'coaccusée': 0, 'grelotante': 0, 'recéleuse': 2, 'dépravée': 0, 'surmultipliée': 0, 'koweïtienne': 4, 'habitante': 0, 'rubiconde': 0, 'cristallinienne': 4, 'dealeuse': 2, 'copulatrice': 1, 'hydrothermale': 3, 'crépitante': 0, 'fossoyeuse': 2, 'impatiente': 0, 'sertisseuse': 2, 'indochinoise': 7, 'dompteuse': 2, 'soûlarde': 0, 'multidimensionnelle': 4, 'tarée': 0, 'diadémée': 0, 'anténatale': 0, 'rétrosternale': 3, 'mystificatrice': 1, 'nantaise': 7, 'naïve': 6, 'forgeronne': 4, 'claudélienne': 4, 'censoriale': 3, 'fuxéenne': 4, 'canneuse': 2, 'laqueuse': 8, 'ressemeleuse': 2, 'meurtrière': 5, 'cacaoyère': 5, 'patricienne': 4, 'fendeuse': 2, 'aérospatiale': 3, 'pérégrine': 0, 'nette': 4, 'pinçarde': 0, 'grassmannienne': 4, 'smaragdine': 0, 'fraîche': 24, 'scrofuleuse': 8, 'bermudienne': 4, 'siamoise': 7, 'fagnarde': 0, 'prédominante': 0, 'hispanisante': 0, 'contre-amirale': 3, 'écorchée': 0, 'parcimonieuse': 8, 'pestilente': 0, 'principale': 3, 'surrénalienne': 4, 'implorante': 0, 'inquestionnée': 0, 'exposante': 0, 'confectionneuse': 2, 'post-doctorante': 0, 'baragouineuse': 2, 'harceleuse': 2, 'crémeuse': 8, 'buissonnière': 5, 'purifiante': 0, 'structurelle': 4, 'ferroutière': 5, 'miséricordieuse': 8, 'élaboratrice': 1, 'prémenstruelle': 4, 'persécutive': 6, 'onduleuse': 8, 'angoissée': 0, 'extrême-orientale': 3, 'râpeuse': 8, 'paumière': 5, 'dératiseuse': 2, 'averdonaise': 7, 'prémontrée': 0, 'gesticulatrice': 1, 'phosphorescente': 0, 'corsetière': 5, 'rotulienne': 4, 'élégante': 0, 'diffusionnelle': 4, 'informelle': 4, 'sexuée': 0, 'néo-nazie': 0, 'sinusoïdale': 3, 'levée': 0, 'thanatopractrice': 1, 'lieutenante': 0, 'ensommeillée': 0, 'vitruvienne': 4, 'interpolatrice': 1, 'mugissante': 0, 'caleuse': 2, 'plucheuse': 8, 'artérioscléreuse': 8, 'correspondancière': 5, 'ultraconfidentielle': 4, 'impertinente': 0, 'veineuse': 8, 'obsessionnelle': 4, 'polyhandicapée': 0, 'godillante': 0, 'onguiculée': 0, 'prévenante': 0, 'obligeante': 0, 'paulienne': 4, 'dribleuse': 2, 'expatriée': 0, 'générale': 3, 'identificatrice': 1, 'défibreuse': 2, 'curiale': 3, 'attentionnée': 0, 'collaborative': 6, 'exorbitante': 0, 'responsoriale': 3, 'mesmérienne': 4, 'retourneuse': 2, 'dansante': 0, 'gerbante': 0, 'adsorbante': 0, 'rigolarde': 0, 'arillée': 0, 'rotative': 6, 'gouleyante': 0, 'cliente': 0, 'domoticienne': 4, 'mordue': 0, 'inuite': 0, 'chevaline': 0, 'consistoriale': 3, 'vulcanienne': 4, 'palée': 0, 'déflectrice': 1, 'bondieusarde': 0, 'inapprivoisée': 0, 'fumerolienne': 4, 'codébitrice': 1, 'stayeuse': 2, 'ichoreuse': 8, 'éclairante': 0, 'taxative': 6, 'suppurante': 0, 'attentive': 6, 'apicale': 3, 'baptiseuse': 2, 'vérifieuse': 2, 'zonale': 3, 'croupale': 3, 'traumatisée': 0, 'tribale': 3, 'mutante': 0, 'cunicultrice': 1, 'réveilleuse': 2, 'germinative': 6, 'insurgée': 0, 'examinatrice': 1, 'inexplorée': 0, 'bichromatée': 0, 'squirrheuse': 8, 'germano-polonaise': 7, 'franco-tunisienne': 4, 'pelvienne': 4, 'parapétrolière': 5, 'constituante': 0, 'vociférante': 0, 'gente': 0, 'neurovégétative': 6, 'ionisante': 0, 'démesurée': 0, 'consomptive': 6, 'compulsionnelle': 4, 'communisante': 0, 'conceptrice': 1, 'déguenillée': 0, 'italienne': 4, 'bufflonne': 4, 'lorentzienne': 4, 'certificatrice': 1, 'aborale': 3, 'narbonnaise': 7, 'pavillonnée': 0, 'locomotive': 6, 'militante': 0, 'drômoise': 7, 'farineuse': 8, 'remuante': 0, 'binoclarde': 0, 'slavonne': 4, 'torrentielle': 4, 'pourchasseuse': 2, 'impromptue': 0, 'néolamarckienne': 4, 'intercotidale': 3, 'telle': 4, 'compréhensive': 6, 'cacaotée': 0, 'hindie': 0, 'cryoconductrice': 1, 'évadée': 0, 'agnate': 0, 'fréquentative': 6, 'illuminée': 0, 'implosée': 0, 'oursonne': 4, 'arroseuse': 2, 'cruelle': 4, 'armurée': 0, 'approvisionneuse': 2, 'pourrissante': 0, 'tricarde': 0, 'arrimeuse': 2, 'daubeuse': 2, 'hémolysante': 0, 'malotrue': 0, 'itérative': 6, 'sous-vireuse': 2, 'comburante': 0, 'solennelle': 4, 'traitante': 0, 'permanencière': 5, 'échangeuse': 2, 'prolétarienne': 4, 'markovienne': 4, 'vocifératrice': 1, 'franco-panaméenne': 4, 'pouponnée': 0, 'réquisitoriale': 3, 'codificatrice': 1, 'indifférente': 0, 'ratière': 5, 'procréative': 6, 'activatrice': 1, 'calculeuse': 8, 'infractrice': 1, 'sous-préfectorale': 3, 'tyrrhénienne': 4, 'baladodiffuseuse': 2, 'initiale': 3, 'vraie': 0, 'modalisatrice': 1, 'boiseuse': 2, 'multigraduée': 0, 'informulée': 0, 'avionneuse': 2, 'désinhibitrice': 1, 'montreuse': 2, 'émolliente': 0, 'affouagée': 0, 'moutonneuse': 8, 'inaccentuée': 0, 'haussière': 5, 'effileuse': 2, 'céréalière': 5, 'soigneuse': 8, 'inharmonieuse': 8, 'crocodilienne': 4, 'paysanne': 4, 'capée': 0, 'habituelle': 4, 'ressuscitée': 0, 'pyroligneuse': 8, 'normative': 6, 'westphalienne': 4, 'mandchoue': 0, 'bourrue': 0, 'libérienne': 4, 'hyperboréenne': 4, 'comtale': 3, 'bergère': 5, 'linéale': 3, 'renchérisseuse': 2, 'couenneuse': 8, 'inhérente': 0, 'islandaise': 7, 'skiffeuse': 2, 'assommante': 0, 'tracassière': 5, 'remonteuse': 2, 'défranchie': 0, 'fulminante': 0, 'intégrale': 3, 'florencée': 0, 'pasteurisatrice': 1, 'bénigne': 19, 'populacière': 5, 'follette': 4, 'estivale': 3, 'anticléricale': 3, 'escaladeuse': 2, 'bordée': 0, 'relationnelle': 4, 'grippale': 3, 'édentée': 0, 'dynamiteuse': 2, 'péquenaude': 0, 'portative': 6, 'pourrisseuse': 2, 'argilacée': 0, 'horrifiante': 0, 'lacuneuse': 8, 'sonneuse': 2, 'intermodale': 3, 'grenadière': 5, 'brosseuse': 2, 'casuelle': 4, 'adamantine': 0, 'reportrice': 1, 'bolivienne': 4, 'repentie': 0, 'vergetière': 5, 'sculptrice': 1, 'procédurale': 3, 'lacrymale': 3, 'crédirentière': 5, 'sénestrée': 0, 'anglo-brésilienne': 4, 'magasinière': 5, 'affineuse': 2, 'socio-culturelle': 4, 'groenlandaise': 7, 'recenseuse': 2, 'fripière': 5, 'alluviale': 3, 'deviseuse': 2, 'lactée': 0, 'champée': 0, 'zazoue': 0, 'malheureuse': 8, 'réanimatrice': 1, 'madrinienne': 4, 'croupissante': 0, 'lettonne': 4, 'intempérante': 0, 'cataméniale': 3, 'dérivative': 6, 'immunosupprimée': 0, 'revivifiante': 0, 'nigéro-congolaise': 7, 'cylindro-ogivale': 3, 'corrélationnelle': 4, 'rugueuse': 8, 'émoustillante': 0, 'mixolydienne': 4, 'moussue': 0, 'illettrée': 0, 'péroreuse': 2, 'infirmative': 6, 'sororale': 3, 'bobineuse': 2, 'fascée': 0, 'paperassière': 5, 'dispensatrice': 1, 'joaillère': 5, 'dépravante': 0, 'inassujettie': 0, 'verticillée': 0, 'présidente': 0, 'maricultrice': 1, 'accréditive': 6, 'crouteuse': 8, 'catégorielle': 4, 'unipotente': 0, 'bourgeoise': 7, 'tortueuse': 8, 'luronne': 4, 'préjudicielle': 4, 'commerciale': 3, 'désinentielle': 4, 'fibreuse': 8, 'inductrice': 1, 'ferromagnésienne': 4, 'pétrée': 0, 'hermitienne': 4, 'détaillante': 0, 'franchisée': 0, 'allumeuse': 2, 'médicochirurgicale': 3, 'feutrante': 0, 'rébarbative': 6, 'pensante': 0, 'étalonnière': 5, 'agissante': 0, 'coalescente': 0, 'vairée': 0, 'méditerranée': 0, 'filiale': 3, 'formative': 6, 'prosociale': 3, 'motrice': 1, 'norroise': 7, 'estimatrice': 1, 'circonciseuse': 2, 'distributrice': 1, 'manganeuse': 8, 'post-prandiale': 3, 'congruente': 0, 'falote': 0, 'monodirectionnelle': 4, 'sèche': 28, 'impressive': 6, 'marseillaise': 7, 'soûlote': 0, 'primatiale': 3, 'floue': 0, 'marinière': 5, 'désorganisatrice': 1, 'tutoyeuse': 2, 'moyenâgeuse': 8, 'vieillotte': 4, 'gobeletière': 5, 'infectée': 0, 'dindonnière': 5, 'feuillue': 0, 'millésimale': 3, 'efflorescente': 0, 'bordière': 5, 'papoue': 0, 'curieuse': 8, 'collaboratrice': 1, 'intragénérationnelle': 4, 'multicanale': 3, 'parqueteuse': 2, 'rétentrice': 1, 'cybermilitante': 0, 'sous-intendante': 0, 'portante': 0, 'camérière': 5, 'dormitive': 6, 'unisexuée': 0, 'fricasseuse': 2, 'focale': 3, 'refondatrice': 1, 'négative': 6, 'vice-rectrice': 1, 'vendéenne': 4, 'eusociale': 3, 'laineuse': 8, 'génitrice': 1, 'pentue': 0, 'fondue': 0, 'franco-équatorienne': 4, 'chleue': 0, 'ouateuse': 8, 'renonciatrice': 1, 'intacte': 0, 'boscotte': 4, 'têtue': 0, 'restauratrice': 1, 'précise': 7, 'environnementale': 3, 'commençante': 0, 'fusilière': 5, 'aguicheuse': 2, 'inféconde': 0, 'riveuse': 2, 'étiqueteuse': 2, 'piailleuse': 2, 'burineuse': 2, 'fouleuse': 2, 'stupéfiante': 0, 'animale': 3, 'tubérisée': 0, 'italianisante': 0, 'beauceronne': 4, 'béguine': 0, 'herborisée': 0, 'cylindreuse': 2, 'immunodéprimée': 0, 'rupine': 0, 'pistonnée': 0, 'maraîchère': 5, 'préencollée': 0, 'semi-conductrice': 1, 'co-orbitale': 3, 'péronéo-tibiale': 3, 'amiantée': 0, 'cornéenne': 4, 'asinienne': 4, 'débauchée': 0, 'inopinée': 0, 'séricicultrice': 1, 'habituée': 0, 'désapprobatrice': 1, 'proprette': 4, 'flingueuse': 2, 'soyeuse': 8, 'snifeuse': 2, 'autoreproductrice': 1, 'philippienne': 4, 'ferrailleuse': 2, 'érysipélateuse': 8, 'abrupte': 0, 'débourreuse': 2, 'rhumatisante': 0, 'péjorative': 6, 'chocolatière': 5, 'impérieuse': 8, 'teenageuse': 2, 'bancale': 0, 'fovéale': 3, 'procureuse': 2, 'noyauteuse': 2, 'craquante': 0, 'antirationnelle': 4, 'coqueleuse': 8, 'tagueuse': 2, 'cordière': 5, 'chagrine': 0, 'ordovicienne': 4, 'costaricaine': 0, 'criante': 0, 'transsexuelle': 4, 'galoisienne': 4, 'photosensibilisante': 0, 'casquettière': 5, 'irrigante': 0, 'indélicate': 0, 'canadienne': 4, 'baigneuse': 2, 'sélectrice': 1, 'coralline': 0, 'penaude': 0, 'tangente': 0, 'stoïcienne': 4, 'matinale': 3, 'cézannienne': 4, 'auxiliatrice': 1, 'mongole': 0, 'pyroxylée': 0, 'explétive': 6, 'oxycarbonée': 0, 'menine': 0, 'pharyngale': 3, 'dandinante': 0, 'famennoise': 7, 'coalisée': 0, 'interruptive': 6, 'illustrative': 6, 'aléoutienne': 4, 'maigriotte': 4, 'herscheuse': 2, 'regrattière': 5, 'franco-islandaise': 7, 'environnante': 0, 'entéro-rénale': 3, 'ressortissante': 0, 'biinfinie': 0, 'basselissière': 5, 'monacale': 3, 'minorante': 0, 'médiale': 3, 'soupirante': 0, 'injurieuse': 8, 'superfine': 0, 'malencontreuse': 8, 'périclitante': 0, 'snipeuse': 2, 'préprogrammée': 0, 'bienvoulue': 0, 'tapissière': 5, 'décente': 0, 'crémée': 0, 'organochlorée': 0, 'postnatale': 0, 'lampassée': 0, 'baudelairienne': 4, 'sacrale': 3, 'égressive': 6, 'inaugurale': 3, 'interpelée': 0, 'vexante': 0, 'bienvenue': 0, 'télédéclarante': 0, 'mondaine': 0, 'amnistiée': 0, 'dateuse': 2, 'enthousiasmante': 0, 'chanvrière': 5, 'moutonnière': 5, 'étancheuse': 2, 'micacée': 0, 'contaminante': 0, 'verseuse': 2, 'lassante': 0, 'nippone': 0, 'pourprine': 0, 'pantoise': 7, 'sino-tibétaine': 0, 'florentine': 0, 'cotutrice': 1, 'papesse': 13, 'suceuse': 2, 'modifiante': 0, 'résiduelle': 4, 'séduisante': 0, 'proliférative': 6, 'renforçante': 0, 'gestuelle': 4, 'dento-faciale': 3, 'lupercale': 3, 'paillarde': 0, 'capricante': 0, 'margeuse': 2, 'forte': 0, 'isolée': 0, 'blogueuse': 2, 'instrumentale': 3, 'subversive': 6, 'fuligineuse': 8, 'annale': 3, 'incitante': 0, 'coiffeuse': 2, 'foisonnante': 0, 'sensuelle': 4, 'évènementielle': 4, 'houblonnière': 5, 'épaisse': 15, 'embouteilleuse': 2, 'gifleuse': 2, 'brocheuse': 2, 'déserteuse': 2, 'anti-infectieuse': 8, 'chenillée': 0, 'bissectrice': 1, 'huissière': 5, 'jappeuse': 2, 'autopilotée': 0, 'faîtière': 5, 'collégienne': 4, 'tracassante': 0, 'multifamiliale': 3, 'industrielle': 4, 'attrayante': 0, 'interculturelle': 4, 'asphalteuse': 2, 'immédiate': 0, 'faucardeuse': 2, 'protéagineuse': 8, 'convoiteuse': 8, 'glaneuse': 2, 'pondératrice': 1, 'noduleuse': 8, 'contre-productive': 6, 'anversoise': 7, 'gagnante': 0, 'croissante': 0, 'doctrinale': 3, 'rafraîchissante': 0, 'ultra-courte': 0, 'monoclinale': 3, 'pro-occidentale': 3, 'braillarde': 0, 'morbilleuse': 8, 'suffisante': 0, 'mercière': 5, 'élicitrice': 1, 'désireuse': 8, 'pitaude': 0, 'chirurgicale': 3, 'exaspérée': 0, 'cuproammoniacale': 3, 'héritière': 5, 'magnésienne': 4, 'digressive': 6, 'antituberculeuse': 8, 'intersyndicale': 3, 'ignifugeante': 0, 'unificatrice': 1, 'polarisante': 0, 'bêcheuse': 2, 'bustière': 5, 'pelliculeuse': 8, 'traqueuse': 2, 'lutécienne': 4, 'déwattée': 0, 'encaveuse': 2, 'mecquoise': 7, 'locale': 3, 'atterrante': 0, 'fontainière': 5, 'sous-qualifiée': 0, 'transcutanée': 0, 'vétilleuse': 8, 'sensibilisante': 0, 'lugeuse': 2, 'allaitante': 0, 'crurale': 3, 'réunionnaise': 7, 'saintongeaise': 7, 'claironnante': 0, 'accrocheuse': 2, 'tutrice': 1, 'zingueuse': 2, 'rougeaude': 0, 'désolante': 0, 'sinistrée': 0, 'grimpeuse': 2, 'dissuasive': 6, 'franco-polonaise': 7, 'pétrolière': 5, 'lancinante': 0, 'ligulée': 0, 'libournaise': 7, 'télémétreuse': 2, 'calorifugeuse': 2, 'thessalonicienne': 4, 'tambourineuse': 2, 'pestiférée': 0, 'ouralienne': 4, 'licière': 5, 'saisonnière': 5, 'griotte': 4, 'gourmande': 0, 'vétillarde': 0, 'excipée': 0, 'payse': 7, 'trépassée': 0, 'piaffante': 0, 'recouvrante': 0, 'lionnée': 0, 'subaigüe': 10, 'tordante': 0, 'échauffée': 0, 'circonstancielle': 4, 'antigouvernementale': 3, 'auto-référentielle': 4, 'coliqueuse': 8, 'pernicieuse': 8, 'traversière': 5, 'esbroufeuse': 2, 'digestive': 6, 'acoquinante': 0, 'cautérisante': 0, 'intrigante': 0, 'encartoucheuse': 2, 'gouteuse': 8, 'provocatrice': 1, 'effrayante': 0, 'isolante': 0, 'hensélienne': 4, 'questionneuse': 2, 'échantillonneuse': 2, 'ensileuse': 2, 'néoformée': 0, 'modulante': 0, 'photoémettrice': 1, 'yézidie': 0, 'fâcheuse': 8, 'toulousaine': 0, 'séditieuse': 8, 'néo-grammairienne': 4, 'indienne': 4, 'pieuse': 8, 'galopante': 0, 'albanaise': 7, 'tomenteuse': 8, 'exterminatrice': 1, 'religieuse': 8, 'virilocale': 3, 'footballeuse': 2, 'emballeuse': 2, 'glosso-pharyngienne': 4, 'rémunératrice': 1, 'officiante': 0, 'chleuhe': 0, 'contrefactrice': 1, 'empailleuse': 2, 'curarisante': 0, 'relanceuse': 2, 'unisériée': 0, 'glossopharyngienne': 4, 'orientale': 3, 'censuelle': 4, 'concise': 7, 'périorale': 0, 'brancardière': 5, 'vérificatrice': 1, 'colorante': 0, 'tâtonnante': 0, 'étripée': 0, 'résonatrice': 1, 'sermonneuse': 2, 'amareyeuse': 2, 'navale': 0, 'tropézienne': 4, 'profanatrice': 1, 'dispersive': 6, 'plurielle': 4, 'chavilloise': 7, 'estuarienne': 4, 'invoquée': 0, 'charnelle': 4, 'limonière': 5, 'frictionnelle': 4, 'mystérieuse': 8, 'neurochirurgicale': 3, 'fédératrice': 1, 'mexicaine': 0, 'prégnante': 0, 'mycénienne': 4, 'revendicatrice': 1, 'collectionneuse': 2, 'envinée': 0, 'excessive': 6, 'conférencière': 5, 'entendante': 0, 'ajusteuse': 2, 'cantinière': 5, 'sadducéenne': 4, 'tubulée': 0, 'appétissante': 0, 'enguichée': 0, 'libidineuse': 8, 'polynomiale': 3, 'satineuse': 2, 'anglo-allemande': 0, 'loco-régionale': 3, 'allocatrice': 1, 'brève': 18, 'jouissante': 0, 'tessellée': 0, 'moqueuse': 2, 'vaurienne': 4, 'asexuée': 0, 'syntacticienne': 4, 'néolibérale': 3, 'géotechnicienne': 4, 'minotière': 5, 'motivatrice': 1, 'informative': 6, 'épineuse': 8, 'komsomole': 0, 'massacreuse': 2, 'paléo-environnementale': 3, 'affreuse': 8, 'maçonne': 4, 'redentée': 0, 'jacassière': 5, 'inconstitutionnelle': 4, 'conchylicultrice': 1, 'défavorisée': 0, 'mamelue': 0, 'bétonnière': 5, 'prépalatale': 3, 'inappréciée': 0, 'baptismale': 3, 'cérulée': 0, 'païenne': 4, 'crackeuse': 2, 'rosacée': 0, 'pavimenteuse': 8, 'baleinière': 5, 'coucheuse': 2, 'prenante': 0, 'migrante': 0, 'embusquée': 0, 'caméléonienne': 4, 'inverseuse': 2, 'vagissante': 0, 'recrue': 0, 'matutinale': 3, 'imbue': 0, 'autorégulatrice': 1, 'bougonne': 4, 'multilobée': 0, 'chambrière': 5, 'tigresse': 13, 'mitrale': 3, 'austro-hongroise': 7, 'iroquoise': 7, 'démone': 0, 'ultra-confidentielle': 4, 'disqualifiée': 0, 'factrice': 1, 'lilliputienne': 4, 'tortureuse': 2, 'joggeuse': 2, 'cruentée': 0, 'bidirectionnelle': 4, 'nipponne': 4, 'décrocheuse': 2, 'muséale': 3, 'simplette': 4, 'est-allemande': 0, 'componée': 0, 'jongleuse': 2, 'antisportive': 6, 'égarée': 0, 'triomphale': 3, 'ragoutante': 0, 'tarsale': 3, 'rhino-pharyngée': 0, 'pharisienne': 4, 'dévotieuse': 8, 'significative': 6, 'gigantale': 3, 'piocheuse': 2, 'antidéflagrante': 0, 'carreautée': 0, 'auto-adhésive': 6, 'vaseuse': 8, 'psychologisante': 0, 'gastroœsophagienne': 4, 'paulinienne': 4, 'omnipotente': 0, 'sanglotante': 0, 'opalescente': 0, 'pro-active': 6, 'tourneuse': 2, 'lambine': 0, 'conquise': 7, 'vanillée': 0, 'crevarde': 0, 'triphasée': 0, 'transylvaine': 0, 'cæcale': 3, 'pompeuse': 8, 'crêpière': 5, 'saccharine': 0, 'couverte': 0, 'préformatée': 0, 'tardive': 6, 'excrémentielle': 4, 'traductionnelle': 4, 'œstrale': 3, 'pseudo-membraneuse': 8, 'révulsive': 6, 'valentine': 0, 'épilaryngienne': 4, 'acupunctrice': 1, 'carpettière': 5, 'piquée': 0, 'enivrante': 0, 'judicieuse': 8, 'flexueuse': 8, 'avaricieuse': 8, 'résolutive': 6, 'fanatiseuse': 2, 'passeuse': 2, 'discompteuse': 2, 'vibrante': 0, 'non-inscrite': 0, 'verdelette': 4, 'phosphorée': 0, 'râlante': 0, 'optative': 6, 'vectrice': 1, 'rémanente': 0, 'porracée': 0, 'cuivreuse': 8, 'multivaluée': 0, 'fransquillonne': 4, 'câbleuse': 2, 'élagueuse': 2, 'régulatrice': 1, 'rougeoleuse': 8, 'mortifiante': 0, 'fasciée': 0, 'opératrice': 1, 'envoûtante': 0, 'homofocale': 3, 'lauréate': 0, 'redistributive': 6, 'axonale': 3, 'hyoïdienne': 4, 'brûlée': 0, 'ferreuse': 8, 'résistante': 0, 'invitante': 0, 'simienne': 4, 'urgente': 0, 'chérie': 0, 'chorale': 0, 'incommodante': 0, 'crépisseuse': 2, 'salpêtreuse': 8, 'tombeuse': 2, 'camerounaise': 7, 'farfelue': 0, 'locomotrice': 1, 'alimentatrice': 1, 'équilibrante': 0, 'tamoule': 0, 'élue': 0, 'survirante': 0, 'décourageante': 0, 'précuite': 0, 'effleurie': 0, 'éducative': 6, 'bas-jointée': 0, 'haschichée': 0, 'péléenne': 4, 'coruscante': 0, 'précolombienne': 4, 'étireuse': 2, 'notatrice': 1, 'régleuse': 2, 'absidale': 3, 'abénaquise': 7, 'cocue': 0, 'putassière': 5, 'avalancheuse': 8, 'extensive': 6, 'excitée': 0, 'fœtale': 3, 'lourdaude': 0, 'américano-iranienne': 4, 'bouleversante': 0, 'parfumeuse': 2, 'papilionacée': 0, 'volitionnelle': 4, 'tenante': 0, 'épagneule': 0, 'post-soixante-huitarde': 0, 'tremblante': 0, 'chevauchante': 0, 'plumetée': 0, 'caressante': 0, 'accorte': 0, 'décortiqueuse': 2, 'fricoteuse': 2, 'pochetronne': 4, 'chalengeuse': 2, 'polypeuse': 8, 'oiseuse': 8, 'lascive': 6, 'ondoyante': 0, 'bocagère': 5, 'béatifiante': 0, 'sino-américaine': 0, 'sanctifiée': 0, 'voteuse': 2, 'indo-malaise': 7, 'faillie': 0, 'aérienne': 4, 'envoûteuse': 2, 'oiselière': 5, 'agro-industrielle': 4, 'agricultrice': 1, 'poursuivante': 0, 'gouacheuse': 2, 'sécurisante': 0, 'staturopondérale': 3, 'chtonienne': 4, 'chloreuse': 8, 'radoteuse': 2, 'sondée': 0, 'galopine': 0, 'ventrale': 3, 'orale': 3, 'introvertie': 0, 'imageuse': 2, 'écoutante': 0, 'marguillère': 5, 'orpailleuse': 2, 'ceinturière': 5, 'agressive': 6, 'amazonienne': 4, 'ukrainienne': 4, 'incorrecte': 0, 'ministérielle': 4, 'sérieuse': 8, 'intersexuelle': 4, 'légiférée': 0, 'régularisatrice': 1, 'germano-autrichienne': 4, 'pervertisseuse': 2, 'avenue': 0, 'toxi-infectieuse': 8, 'fière': 5, 'incisive': 6, 'tatoueuse': 2, 'microgrenue': 0, 'retombante': 0, 'ghanéenne': 4, 'inefficiente': 0, 'autorisatrice': 1, 'quadrisaïeule': 0, 'leveuse': 2, 'aventureuse': 8, 'copernicienne': 4, 'infinitésimale': 3, 'ludo-éducative': 6, 'lipschitzienne': 4, 'rustaude': 0, 'tuvaluane': 0, 'ano-rectale': 3, 'profiteuse': 2, 'puînée': 0, 'nivo-pluviale': 3, 'receleuse': 2, 'démoulante': 0, 'licenciée': 0, 'adjointe': 0, 'homoxylée': 0, 'néogrecque': 25, 'innovante': 0, 'présomptive': 6, 'montueuse': 8, 'conversationnelle': 4, 'patronne': 4, 'autopropulsée': 0, 'récollette': 4, 'gardiane': 0, 'ambrienne': 4, 'interruptrice': 1, 'scripturale': 3, 'antécédente': 0, 'cambrienne': 4, 'débordante': 0, 'réfringente': 0, 'classieuse': 8, 'ténébreuse': 8, 'boiteuse': 8, 'insinuative': 6, 'encaissante': 0, 'décompensée': 0, 'colauréate': 0, 'reloue': 0, 'franco-japonaise': 7, 'évacuatrice': 1, 'amollissante': 0, 'plaignarde': 0, 'resquilleuse': 2, 'quiescente': 0, 'lupuline': 0, 'herbeuse': 8, 'franco-bolivienne': 4, 'codirectrice': 1, 'coureuse': 2, 'cérémonielle': 4, 'entrepreneuse': 2, 'dostoïevskienne': 4, 'compacte': 0, 'inaccomplie': 0, 'ambiante': 0, 'héritée': 0, 'suppléante': 0, 'vésicale': 3, 'sous-directrice': 1, 'exécutive': 6, 'larmoyeuse': 2, 'crieuse': 2, 'rédactionnelle': 4, 'veuve': 6, 'baissière': 5, 'sabordeuse': 2, 'onctueuse': 8, 'maternelle': 4, 'surproductrice': 1, 'embauchée': 0, 'guêpière': 5, 'payeuse': 2, 'fonceuse': 2, 'cléricale': 3, 'solénoïdale': 3, 'redresseuse': 2, 'trijumelle': 9, 'fatigante': 0, 'médiate': 0, 'arrivante': 0, 'agenouillée': 0, 'pisseuse': 8, 'prédicatrice': 1, 'dénutrie': 0, 'désobéissante': 0, 'coagulatrice': 1, 'vectorielle': 4, 'nilpotente': 0, 'parmesane': 0, 'intimidante': 0, 'récriminée': 0, 'épanouissante': 0, 'tour-opératrice': 1, 'assamaise': 7, 'mâtine': 0, 'autosomale': 3, 'trifoliolée': 0, 'ensemblière': 5, 'scabreuse': 8, 'herniée': 0, 'jugale': 3, 'armoriale': 3, 'manifestante': 0, 'culminante': 0, 'postpalatale': 3, 'érectrice': 1, 'coursonne': 4, 'tamisière': 5, 'belgo-congolaise': 7, 'pertinente': 0, 'racoleuse': 2, 'bâloise': 7, 'transcendantale': 3, 'mahoraise': 7, 'broussarde': 0, 'encadrante': 0, 'négrière': 5, 'modélisatrice': 1, 'pardonnante': 0, 'inégalée': 0, 'réticente': 0, 'éluviale': 3, 'saunante': 0, 'fastigiée': 0, 'littorale': 3, 'raccrocheuse': 2, 'gambienne': 4, 'conchylienne': 4, 'bannie': 0, 'israélo-palestinienne': 4, 'enveloppeuse': 2, 'loueuse': 2, 'protutrice': 1, 'innommée': 0, 'magnanière': 5, 'raffineuse': 2, 'décimale': 3, 'antilibérale': 3, 'suggestive': 6, 'turbocompressée': 0, 'multiconfessionnelle': 4, 'velue': 0, 'poivrote': 0, 'bissexuée': 0, 'belliqueuse': 8, 'besogneuse': 8, 'mammalienne': 4, 'damnée': 0, 'nettoyeuse': 2, 'vénézuélienne': 4, 'élogieuse': 8, 'albumineuse': 8, 'jeunotte': 4, 'étonnante': 0, 'thermohaline': 0, 'antiacarienne': 4, 'sphénoïdale': 3, 'tabulatrice': 1, 'stoppeuse': 2, 'bénisseuse': 2, 'abstruse': 7, 'salissante': 0, 'accordée': 0, 'inespérée': 0, 'réductrice': 1, 'chaînetière': 5, 'équatorienne': 4, 'citatrice': 1, 'galvaniseuse': 2, 'dialogueuse': 2, 'pseudomembraneuse': 8, 'phalanstérienne': 4, 'énergisante': 0, 'uxorilocale': 3, 'paludéenne': 4, 'squatteuse': 2, 'addisonienne': 4, 'chansonnière': 5, 'distale': 3, 'viverrine': 0, 'mussive': 6, 'gratuite': 0, 'grandelette': 4, 'girondine': 0, 'méditante': 0, 'pénitente': 0, 'expéditive': 6, 'hawaïenne': 4, 'réprobatrice': 1, 'poitevine': 0, 'approximative': 6, 'gigoteuse': 2, 'pyrotechnicienne': 4, 'olfactive': 6, 'dégraisseuse': 2, 'dépliante': 0, 'somalie': 0, 'déshydratante': 0, 'inquisitive': 6, 'régulière': 5, 'dispersante': 0, 'pousseuse': 2, 'méditerranéenne': 4, 'interagissante': 0, 'gémissante': 0, 'ressemblante': 0, 'tisseuse': 2, 'trimestrielle': 4, 'tiraillante': 0, 'plurale': 3, 'radieuse': 8, 'sourceuse': 2, 'potinière': 5, 'dédaigneuse': 8, 'luisante': 0, 'cordelière': 5, 'patiente': 0, 'arnaqueuse': 2, 'humérale': 3, 'potagère': 5, 'diserte': 0, 'torturante': 0, 'gênante': 0, 'antéroventrale': 3, 'quilleuse': 2, 'désinscrite': 0, 'lesbienne': 4, 'rétienne': 4, 'infante': 0, 'exténuée': 0, 'prébendée': 0, 'codeuse': 2, 'constrictive': 6, 'suspensive': 6, 'combattante': 0, 'irrésolue': 0, 'sétacée': 0, 'isarienne': 4, 'indépassée': 0, 'mi-partie': 0, 'ligueuse': 2, 'impunie': 0, 'bi-active': 6, 'compétente': 0, 'intoxiquée': 0, 'électorale': 3, 'vermeille': 4, 'charbonnière': 5, 'libéroligneuse': 8, 'filante': 0, 'alcalescente': 0, 'chialeuse': 2, 'psychosensorimotrice': 1, 'clapotante': 0, 'condylienne': 4, 'anticoncurrentielle': 4, 'sacchareuse': 8, 'factieuse': 8, 'mystico-religieuse': 8, 'pétrisseuse': 2, 'papillonnante': 0, 'ultra-légère': 5, 'nautonière': 5, 'contrastante': 0, 'extraterritoriale': 3, 'amicale': 3, 'poisseuse': 8, 'brideuse': 2, 'inquiétante': 0, 'harangueuse': 2, 'rubéoleuse': 8, 'sylvicultrice': 1, 'marbreuse': 2, 'saisissante': 0, 'retraitée': 0, 'bretonnante': 0, 'alcalifiante': 0, 'sénégambienne': 4, 'végane': 0, 'batelée': 0, 'deutérée': 0, 'subordonnée': 0, 'adéquate': 0, 'troqueuse': 2, 'toilière': 5, 'malouine': 0, 'colorectale': 3, 'accastilleuse': 2, 'inégale': 3, 'comminutive': 6, 'grognarde': 0, 'directrice': 1, 'subaérienne': 4, 'sous-dominante': 0, 'camée': 0, 'carentielle': 4, 'baptisée': 0, 'bretonne': 4, 'congestive': 6, 'pâteuse': 8, 'pucelle': 9, 'grognonne': 4, 'battante': 0, 'nocive': 6, 'couvrante': 0, 'couperosée': 0, 'fabuleuse': 8, 'compatissante': 0, 'tympanale': 3, 'cadrante': 0, 'cumularde': 0, 'médaillée': 0, 'plumassière': 5, 'pédaleuse': 2, 'payante': 0, 'fausse': 12, 'zénithale': 3, 'colonisée': 0, 'priante': 0, 'fuyarde': 0, 'surlignante': 0, 'dormeuse': 2, 'anti-seigneuriale': 3, 'décisionnelle': 4, 'cigarettière': 5, 'périe': 0, 'impétrante': 0, 'brouillonne': 4, 'essencière': 5, 'accueillante': 0, 'adnée': 0, 'emboutisseuse': 2, 'planétésimale': 3, 'conduite': 0, 'chapitrale': 3, 'confuse': 7, 'sub-saharienne': 4, 'œuvée': 0, 'afro-brésilienne': 4, 'fermentative': 6, 'asphyxiante': 0, 'postprandiale': 3, 'virile': 0, 'distractive': 6, 'fine': 0, 'vicariale': 3, 'errante': 0, 'esseulée': 0, 'nicaraguayenne': 4, 'officinale': 3, 'sous-occipitale': 3, 'stative': 6, 'stéréorégulière': 5, 'sélective': 6, 'déloyale': 3, 'hexadécimale': 3, 'agitée': 0, 'réémergente': 0, 'observantine': 0, 'fuguée': 0, 'grand-ducale': 3, 'crânienne': 4, 'sous-cutanée': 0, 'théologienne': 4, 'marbrière': 5, 'tremblée': 0, 'croassante': 0, 'usagée': 0, 'anglo-pakistanaise': 7, 'accusée': 0, 'annonceuse': 2, 'croissantière': 5, 'déferlante': 0, 'gueuse': 8, 'alevinière': 5, 'préconçue': 0, 'bienheureuse': 8, 'incessante': 0, 'énergéticienne': 4, 'inversive': 6, 'crâneuse': 2, 'australo-américaine': 0, 'nivernaise': 7, 'rousse': 12, 'vassale': 3, 'paqueteuse': 2, 'tintinnabulante': 0, 'tractrice': 1, 'trainante': 0, 'ablative': 6, 'burelée': 0, 'maquilleuse': 2, 'compressive': 6, 'danseuse': 2, 'orthogonale': 3, 'éteigneuse': 2, 'bajocienne': 4, 'vice-première': 5, 'glabrescente': 0, 'andorrane': 0, 'nécrosante': 0, 'soudanaise': 7, 'commémorative': 6, 'chevelée': 0, 'corrodante': 0, 'saligote': 0, 'actuelle': 4, 'lubrificatrice': 1, 'tournoyante': 0, 'gauchisante': 0, 'fixative': 6, 'glycosylée': 0, 'mûrissante': 0, 'badaude': 0, 'expulsive': 6, 'pigeonnante': 0, 'pullulante': 0, 'médicosociale': 3, 'bilieuse': 8, 'rieuse': 2, 'artisane': 0, 'prorogative': 6, 'sociétale': 3, 'agrandisseuse': 2, 'bimbelotière': 5, 'noueuse': 8, 'charmeuse': 2, 'trémulante': 0, 'atténuante': 0, 'harassante': 0, 'beugleuse': 2, 'amère': 5, 'paraphernale': 3, 'striduleuse': 8, 'rectificatrice': 1, 'chargée': 0, 'prééminente': 0, 'découvreuse': 2, 'réhabilitatrice': 1, 'surgie': 0, 'reconstructive': 6, 'transformationnelle': 4, 'équivariante': 0, 'cadette': 4, 'oléagineuse': 8, 'dissolvante': 0, 'kleinienne': 4, 'bufflesse': 13, 'vicieuse': 8, 'drôlesse': 13, 'exécutrice': 1, 'glaciale': 3, 'verglaçante': 0, 'réviseuse': 2, 'pulsante': 0, 'auto-immune': 0, 'vibrationnelle': 4, 'silicatée': 0, 'perceuse': 2, 'compograveuse': 2, 'engraisseuse': 2, 'gaullienne': 4, 'exhaustive': 6, 'remblayeuse': 2, 'neurocognitive': 6, 'bondissante': 0, 'ramasseuse': 2, 'silencieuse': 8, 'flegmoneuse': 8, 'bouffeuse': 2, 'monoflorale': 3, 'analysante': 0, 'injuriée': 0, 'boréale': 3, 'disjonctive': 6, 'universelle': 4, 'mucilagineuse': 8, 'engrêlée': 0, 'méningée': 0, 'faunesse': 13, 'anglo-polonaise': 7, 'bougresse': 13, 'plutonienne': 4, 'mitrée': 0, 'narratrice': 1, 'spéculative': 6, 'mesureuse': 2, 'sino-vietnamienne': 4, 'smicarde': 0, 'ostracée': 0, 'exorbitée': 0, 'urticante': 0, 'consommatrice': 1, 'chuintante': 0, 'déclarante': 0, 'parchemineuse': 8, 'moyen-orientale': 3, 'abrutisseuse': 2, 'contributrice': 1, 'rejetonne': 4, 'cirière': 5, 'taraudeuse': 2, 'dentée': 0, 'punitive': 6, 'obsessive': 6, 'transrhénane': 0, 'perlière': 5, 'remontante': 0, 'piégeuse': 8, 'alliacée': 0, 'omnipuissante': 0, 'mécréante': 0, 'prostrée': 0, 'éburnée': 0, 'ricaneuse': 2, 'brabançonne': 4, 'boulangère': 5, 'volumatrice': 1, 'argentière': 5, 'abornée': 0, 'cimmérienne': 4, 'déséquilibrante': 0, 'ci-jointe': 0, 'indicielle': 4, 'enficelée': 0, 'lombricultrice': 1, 'franco-hongroise': 7, 'ratiocinante': 0, 'écrivaine': 0, 'crawleuse': 2, 'alitée': 0, 'incubatrice': 1, 'injectrice': 1, 'phlegmoneuse': 8, 'iléale': 3, 'coquebine': 0, 'zambienne': 4, 'épicontinentale': 3, 'branlante': 0, 'bestiale': 3, 'travailleuse': 2, 'exclamative': 6, 'libyenne': 4, 'romande': 0, 'diffamante': 0, 'hollywoodienne': 4, 'entarteuse': 2, 'arracheuse': 2, 'épicycloïdale': 3, 'babillarde': 0, 'routière': 5, 'croustillante': 0, 'multifactorielle': 4, 'impardonnée': 0, 'châtelaine': 0, 'répétitive': 6, 'vielleuse': 8, 'romancière': 5, 'essentielle': 4, 'intersectorielle': 4, 'grelottante': 0, 'croupie': 0, 'sous-équipée': 0, 'interactionnelle': 4, 'bretillienne': 4, 'ultra-résistante': 0, 'avilissante': 0, 'algale': 3, 'raquetière': 5, 'potencée': 0, 'directe': 0, 'cordonnière': 5, 'vicomtale': 3, 'dilatatrice': 1, 'photoréceptrice': 1, 'non-alignée': 0, 'situationnelle': 4, 'pénarde': 0, 'géorgienne': 4, 'dilatante': 0, 'péagère': 5, 'sourcière': 5, 'dentellière': 5, 'capitulée': 0, 'végétalienne': 4, 'multifonctionnelle': 4, 'bessonne': 4, 'caloyère': 5, 'recto-sigmoïdienne': 4, 'sumérienne': 4, 'codétenue': 0, 'chançarde': 0, 'cellophanée': 0, 'droite': 0, 'écrue': 0, 'grattante': 0, 'euthanasiée': 0, 'irréfutée': 0, 'maboule': 0, 'cégésimale': 3, 'acclamatrice': 1, 'tannante': 0, 'actionnariale': 3, 'calabraise': 7, 'écorcheuse': 2, 'monodimensionnelle': 4, 'médicolégale': 3, 'puncheuse': 2, 'visqueuse': 8, 'protohistorienne': 4, 'gauloise': 7, 'mateuse': 2, 'inquisitrice': 1, 'hâtive': 6, 'noircissante': 0, 'fordienne': 4, 'nulle': 4, 'jugeuse': 2, 'historisante': 0, 'rolleuse': 2, 'brisante': 0, 'surfondue': 0, 'habilleuse': 2, 'béate': 0, 'inanimée': 0, 'transalpine': 0, 'courbatue': 0, 'rebouteuse': 2, 'agropastorale': 3, 'décisive': 6, 'répulsive': 6, 'affaiblissante': 0, 'qatarienne': 4, 'éprouvante': 0, 'ionienne': 4, 'barbelée': 0, 'pêchue': 0, 'nourricière': 5, 'collectrice': 1, 'faciale': 3, 'sablo-argileuse': 2, 'occipitale': 3, 'correctionnelle': 4, 'entrainante': 0, 'qualitative': 6, 'incapacitante': 0, 'crucifiée': 0, 'indignée': 0, 'inexpliquée': 0, 'campeuse': 2, 'provocante': 0, 'bourdonnante': 0, 'transgénérationnelle': 4, 'néphridienne': 4, 'seule': 0, 'ordinatrice': 1, 'transversale': 3, 'bijective': 6, 'stadière': 5, 'scarieuse': 8, 'métayère': 5, 'gélifiante': 0, 'recruteuse': 2, 'métamérisée': 0, 'cultivatrice': 1, 'rougeoyante': 0, 'psycho-éducatrice': 1, 'pollueuse': 2, 'orientatrice': 1, 'bibeloteuse': 2, 'plurimodale': 3, 'innée': 0, 'préorale': 3, 'falsificatrice': 1, 'malchanceuse': 8, 'enfantine': 0, 'plaine': 0, 'mi-lourde': 0, 'componentielle': 4, 'haute-lissière': 5, 'titubante': 0, 'calqueuse': 2, 'pupitreuse': 2, 'antibactérienne': 4, 'rubanière': 5, 'pectorale': 3, 'indésirée': 0, 'constringente': 0, 'préalpine': 0, 'psychosensorielle': 4, 'traçante': 0, 'violeuse': 2, 'stertoreuse': 8, 'oratorienne': 4, 'aquacultrice': 1, 'prooccidentale': 3, 'bavarde': 0, 'photo-oxydative': 6, 'alfatière': 5, 'effervescente': 0, 'dorienne': 4, 'coassante': 0, 'laciniée': 0, 'ogresse': 13, 'patriciale': 3, 'équisingulière': 5, 'inexpiée': 0, 'trépignante': 0, 'enseignante': 0, 'inspiratrice': 1, 'putative': 6, 'italo-albanaise': 7, 'creusoise': 7, 'fiérote': 0, 'interférente': 0, 'chahuteuse': 2, 'ronde': 0, 'inséminatrice': 1, 'aliénée': 0, 'valvée': 0, 'apicultrice': 1, 'obstétricienne': 4, 'acridienne': 4, 'déférente': 0, 'alternative': 6, 'juridictionnelle': 4, 'trappeuse': 2, 'lanceuse': 2, 'radicale': 3, 'tufière': 5, 'capiteuse': 8, 'précautionneuse': 8, 'cassante': 0, 'nullarde': 0, 'buccale': 3, 'courageuse': 8, 'sous-préfète': 20, 'romane': 0, 'abêtissante': 0, 'tarbaise': 7, 'prénasalisée': 0, 'délinquantielle': 4, 'tâcheronne': 4, 'mégissière': 5, 'envouteuse': 2, 'pénicillée': 0, 'émeutière': 5, 'skippeuse': 2, 'encalminée': 0, 'tibéto-birmane': 0, 'ombrageuse': 8, 'conserveuse': 2, 'abductrice': 1, 'bien-pensante': 0, 'bretessée': 0, 'empalée': 0, 'puéricultrice': 1, 'larmoyante': 0, 'tempétueuse': 8, 'boitillante': 0, 'adjectivale': 3, 'anglo-italienne': 4, 'avare': 0, 'adjacente': 0, 'corticospinale': 3, 'remplaçante': 0, 'savoisienne': 4, 'dalmatienne': 4, 'blette': 4, 'subjuguante': 0, 'griffonneuse': 2, 'fanatisante': 0, 'bûcheuse': 2, 'césarienne': 4, 'subliminale': 3, 'orthonormée': 0, 'pignoufe': 0, 'acharnée': 0, 'antimusulmane': 0, 'talibane': 0, 'sino-japonaise': 7, 'pulvérulente': 0, 'saleuse': 2, 'galicienne': 4, 'suturale': 3, 'éditrice': 1, 'judéo-espagnole': 0, 'antimicrobienne': 4, 'divalente': 0, 'interlocutrice': 1, 'impédante': 0, 'dodécaphasée': 0, 'proscrite': 0, 'répondante': 0, 'remueuse': 2, 'cracovienne': 4, 'qualifiée': 0, 'bégüe': 10, 'hélicicultrice': 1, 'bourrative': 6, 'manipulatrice': 1, 'cultuelle': 4, 'vrillante': 0, 'désintégrative': 6, 'douteuse': 8, 'paradoxale': 3, 'muscardine': 0, 'interraciale': 3, 'sucrante': 0, 'décérébrée': 0, 'trinidadienne': 4, 'rouée': 0, 'fuégienne': 4, 'déréelle': 4, 'ducale': 3, 'déléguée': 0, 'envoyée': 0, 'assyrienne': 4, 'allusive': 6, 'romanichelle': 4, 'post-doctorale': 3, 'exécutante': 0, 'aldine': 0, 'réitérative': 6, 'mafflue': 0, 'parquetière': 5, 'résignée': 0, 'choupinette': 4, 'cumulatrice': 1, 'massacrante': 0, 'limitante': 0, 'franco-cubaine': 0, 'confiseuse': 2, 'maorie': 0, 'drue': 0, 'intraartérielle': 4, 'conservatrice': 1, 'rectorale': 3, 'dégressive': 6, 'tranchante': 0, 'rafraichissante': 0, 'cocréatrice': 1, 'maréchale': 3, 'interprétatrice': 1, 'fonctorielle': 4, 'démineuse': 2, 'emphysémateuse': 8, 'vestigiale': 3, 'possédante': 0, 'quarte': 0, 'mutuelle': 4, 'antinationale': 3, 'bosseuse': 2, 'échéante': 0, 'adolescente': 0, 'pédocriminelle': 4, 'châtreuse': 2, 'paysagée': 0, 'pythagoricienne': 4, 'bloquante': 0, 'timbrée': 0, 'ratée': 0, 'impure': 0, 'irréalisée': 0, 'bissau-guinéenne': 4, 'incultivée': 0, 'sacrificielle': 4, 'létale': 3, 'ponctuelle': 4, 'cisailleuse': 2, 'pâlissante': 0, 'concernée': 0, 'incandescente': 0, 'défonceuse': 2, 'radio-électricienne': 4, 'purulente': 0, 'tuniquée': 0, 'méridionale': 3, 'menaçante': 0, 'clermontoise': 7, 'assimilante': 0, 'oblate': 0, 'maxwellienne': 4, 'angoisseuse': 8, 'envahisseuse': 2, 'événementielle': 4, 'accaparante': 0, 'flamboyante': 0, 'nasale': 3, 'sous-peuplée': 0, 'soûlante': 0, 'contestatrice': 1, 'fourbue': 0, 'tumultueuse': 8, 'quadriennale': 3, 'multirésistante': 0, 'magnétomotrice': 1, 'havraise': 7, 'embrigadée': 0, 'capacitive': 6, 'castillonnaise': 7, 'climatisante': 0, 'foncière': 5, 'sensorielle': 4, 'nubienne': 4, 'lysosomale': 3, 'gabonaise': 7, 'martyre': 0, 'néoromane': 0, 'fourchue': 0, 'finale': 0, 'post-natale': 0, 'géomaticienne': 4, 'rondouillarde': 0, 'jolie': 0, 'arrobase': 7, 'monumentale': 3, 'ouvrante': 0, 'éloquente': 0, 'magnétiseuse': 2, 'américano-australienne': 4, 'hydroxylée': 0, 'globetrotteuse': 2, 'rédemptrice': 1, 'loirétaine': 0, 'défective': 6, 'nue': 0, 'vultueuse': 8, 'hispano-américaine': 0, 'puissante': 0, 'insoupçonnée': 0, 'adorée': 0, 'présidiale': 3, 'reconventionnelle': 4, 'affûteuse': 2, 'zonière': 5, 'péripatéticienne': 4, 'néodarwinienne': 4, 'sélacienne': 4, 'vernale': 3, 'glapissante': 0, 'grimaude': 0, 'épileuse': 2, 'drupacée': 0, 'métalliseuse': 2, 'bergsonienne': 4, 'prénormale': 3, 'cauteleuse': 8, 'malfaisante': 0, 'amusante': 0, 'hégélienne': 4, 'informaticienne': 4, 'anglo-néerlandaise': 7, 'pisteuse': 2, 'conceptuelle': 4, 'népalaise': 7, 'bourgeonneuse': 8, 'colzatière': 5, 'galonnière': 5, 'interorbitale': 3, 'guillerette': 4, 'suréminente': 0, 'champignonneuse': 8, 'retreinte': 0, 'indéfinie': 0, 'vagabonde': 0, 'apéritive': 6, 'neuve': 6, 'manchote': 0, 'délatrice': 1, 'imparfaite': 0, 'binaurale': 3, 'anglo-autrichienne': 4, 'fasciculée': 0, 'constructrice': 1, 'voluptueuse': 8, 'rampante': 0, 'marmottante': 0, 'préexistante': 0, 'législatrice': 1, 'suédoise': 7, 'bootleggeuse': 2, 'démente': 0, 'monocomposante': 0, 'solidienne': 4, 'anthropisée': 0, 'roussillonnaise': 7, 'ottonienne': 4, 'proeuropéenne': 4, 'vosgienne': 4, 'rayonnante': 0, 'précontrainte': 0, 'justifiante': 0, 'confédératrice': 1, 'saumonée': 0, 'grisante': 0, 'berçante': 0, 'créancière': 5, 'prussienne': 4, 'hébraïsante': 0, 'cannoise': 7, 'disposante': 0, 'gredine': 0, 'agnelle': 9, 'hypophosphoreuse': 8, 'asturienne': 4, 'gouailleuse': 2, 'rectrice': 1, 'désobligeante': 0, 'carotidienne': 4, 'tubarde': 0, 'sauvée': 0, 'fiancée': 0, 'fromagère': 5, 'malveillante': 0, 'toupilleuse': 2, 'projectivisée': 0, 'hindoustanie': 0, 'préconsciente': 0, 'coracobrachiale': 3, 'ardoiseuse': 8, 'caoutchouteuse': 8, 'usuelle': 4, 'franco-luxembourgeoise': 7, 'inacceptée': 0, 'extraforte': 0, 'sécante': 0, 'hypersensitive': 6, 'spinorielle': 4, 'calière': 5, 'exquise': 7, 'érythréenne': 4, 'maugréante': 0, 'buissonnante': 0, 'rétrospective': 6, 'indiscrète': 20, 'entreteneuse': 2, 'bilabiée': 0, 'importune': 0, 'lésinante': 0, 'consensuelle': 4, 'déstructurante': 0, 'ammoniaquée': 0, 'lunettière': 5, 'rougissante': 0, 'bouchère': 5, 'rubigineuse': 8, 'intraépithéliale': 3, 'barbotine': 0, 'divagatrice': 1, 'pharyngienne': 4, 'dévastatrice': 1, 'polynésienne': 4, 'saillante': 0, 'potentielle': 4, 'bio-ingénieure': 0, 'seyante': 0, 'laplacienne': 4, 'vue': 0, 'solliciteuse': 2, 'hallstattienne': 4, 'méchante': 0, 'médullo-surrénale': 0, 'pseudoriemannienne': 4, 'riemannienne': 4, 'évocatrice': 1, 'guerrière': 5, 'didacticienne': 4, 'paludière': 5, 'malgracieuse': 8, 'finno-ougrienne': 4, 'cabotine': 0, 'sigillée': 0, 'démouleuse': 2, 'mahousse': 15, 'batelière': 5, 'décoratrice': 1, 'ployante': 0, 'lépreuse': 8, 'inusuelle': 4, 'tourangelle': 9, 'murissante': 0, 'pharyngée': 0, 'psycho-affective': 6, 'tchatteuse': 2, 'stéréosélective': 6, 'cliquetante': 0, 'orageuse': 8, 'gélatineuse': 8, 'fictive': 6, 'horripilante': 0, 'opaline': 0, 'cléchée': 0, 'procédurière': 5, 'indoue': 0, 'conjointe': 0, 'inappropriée': 0, 'antirépublicaine': 0, 'haussmannienne': 4, 'constitutive': 6, 'violette': 4, 'oculomotrice': 1, 'pâtissière': 5, 'justificative': 6, 'limbourgeoise': 7, 'acquéreuse': 2, 'oasienne': 4, 'italo-éthiopienne': 4, 'homogénéisatrice': 1, 'évaluative': 6, 'déciduale': 3, 'cicatrisante': 0, 'cicatricielle': 4, 'siennoise': 7, 'inconsciente': 0, 'égrisée': 0, 'blasonneuse': 2, 'sternocléidomastoïdienne': 4, 'maldivienne': 4, 'tailleuse': 2, 'vannière': 5, 'organomagnésienne': 4, 'instauratrice': 1, 'agresseuse': 2, 'subconsciente': 0, 'tabletière': 5, 'zoroastrienne': 4, 'eurafricaine': 0, 'courante': 0, 'contremaitresse': 13, 'tamile': 0, 'lacérante': 0, 'déperlante': 0, 'nécromancienne': 4, 'fraisicultrice': 1, 'animatrice': 1, 'quadrilatérale': 3, 'moniale': 3, 'marchante': 0, 'amochée': 0, 'globalisante': 0, 'melonnée': 0, 'papillotante': 0, 'lombo-sacrée': 0, 'quadrimestrielle': 4, 'communale': 3, 'hondurienne': 4, 'préfectorale': 3, 'pyriteuse': 8, 'routinière': 5, 'superovariée': 0, 'papouasienne': 4, 'extracorporelle': 4, 'métatarsienne': 4, 'démerdarde': 0, 'saccharinée': 0, 'inadaptée': 0, 'pacifiante': 0, 'gêneuse': 2, 'médiaplanneuse': 2, 'inadéquate': 0, 'abondante': 0, 'fiscale': 3, 'dévonienne': 4, 'indécente': 0, 'matrimoniale': 3, 'épicurienne': 4, 'tristounette': 4, 'rutilante': 0, 'personnelle': 4, 'aventurière': 5, 'menuisière': 5, 'partante': 0, 'malinoise': 7, 'zaïroise': 7, 'fluente': 0, 'malpolie': 0, 'neutralisante': 0, 'rhumatismale': 3, 'indivise': 7, 'bourbeuse': 8, 'souffleuse': 2, 'odorante': 0, 'malawienne': 4, 'monologueuse': 2, 'capverdienne': 4, 'réfrigérante': 0, 'associée': 0, 'anglaise': 7, 'prépositionnelle': 4, 'bringée': 0, 'vindicative': 6, 'idéale': 3, 'dégradante': 0, 'réversale': 3, 'équato-guinéenne': 4, 'appellative': 6, 'furfuracée': 0, 'impondérée': 0, 'vipérine': 0, 'étouffeuse': 2, 'beylicale': 3, 'sanguinolente': 0, 'metteuse': 2, 'intersidérale': 3, 'sujette': 4, 'instinctive': 6, 'ardéchoise': 7, 'laminale': 3, 'dano-islandaise': 7, 'fumée': 0, 'rempailleuse': 2, 'tempéramentale': 3, 'inusitée': 0, 'chaîneuse': 2, 'spécieuse': 8, 'sino-indonésienne': 4, 'belle': 16, 'shampouineuse': 2, 'douloureuse': 8, 'colombine': 0, 'ourleuse': 2, 'lignagère': 5, 'franco-surinamaise': 7, 'chausseuse': 2, 'bringuebalante': 0, 'adulatrice': 1, 'clémente': 0, 'agroenvironnementale': 3, 'concentreuse': 2, 'continentale': 3, 'phéniquée': 0, 'saupoudreuse': 2, 'ardennaise': 7, 'insolente': 0, 'décidue': 0, 'contrastive': 6, 'assoiffée': 0, 'systématicienne': 4, 'migratrice': 1, 'dialecticienne': 4, 'non-engagée': 0, 'trachéenne': 4, 'américano-néo-zélandaise': 7, 'audioorale': 3, 'inachevée': 0, 'crétoise': 7, 'herbue': 0, 'suante': 0, 'politicienne': 4, 'fréquente': 0, 'natale': 0, 'inaperçue': 0, 'nonchalante': 0, 'magnétisante': 0, 'passante': 0, 'refoulée': 0, 'paquetée': 0, 'effective': 6, 'prescriptrice': 1, 'mitoyenne': 4, 'ailière': 5, 'affamée': 0, 'envieuse': 8, 'brouilleuse': 2, 'vigilante': 0, 'transcaspienne': 4, 'onéreuse': 8, 'phylogénéticienne': 4, 'périurbaine': 0, 'barbante': 0, 'temporisatrice': 1, 'corrélative': 6, 'ronchonneuse': 2, 'autoéquilibrante': 0, 'laborantine': 0, 'hollandaise': 7, 'abrutie': 0, 'stéroïdienne': 4, 'pommetée': 0, 'électroménagère': 5, 'dominatrice': 1, 'boursicotière': 5, 'étrangleuse': 2, 'super-légère': 5, 'plastifiante': 0, 'toroïdale': 3, 'crooneuse': 2, 'génoise': 7, 'surie': 0, 'guichetière': 5, 'dissolue': 0, 'centrale': 3, 'diffamatrice': 1, 'philippine': 0, 'auriculotemporale': 3, 'interzonale': 3, 'spectatrice': 1, 'pompière': 5, 'grenobloise': 7, 'terrière': 5, 'crollée': 0, 'nord-américaine': 0, 'lotisseuse': 2, 'tambourinante': 0, 'freinante': 0, 'fortraite': 0, 'italo-autrichienne': 4, 'demie': 0, 'luminescente': 0, 'hackeuse': 2, 'fantomale': 3, 'désaltérante': 0, 'doctorante': 0, 'interstitielle': 4, 'parsie': 0, 'détorse': 7, 'frontale': 3, 'cranio-faciale': 3, 'décervelée': 0, 'photograveuse': 2, 'permacultrice': 1, 'non-croyante': 0, 'riante': 0, 'interprétative': 6, 'ruineuse': 8, 'amortisseuse': 2, 'condescendante': 0, 'inappliquée': 0, 'kényane': 0, 'renifleuse': 2, 'approbatrice': 1, 'cap-hornière': 5, 'carreleuse': 2, 'affectueuse': 8, 'libératrice': 1, 'feutrière': 5, 'peluchée': 0, 'germinale': 3, 'relectrice': 1, 'insondée': 0, 'prurigineuse': 8, 'trapézoïdale': 3, 'jouisseuse': 2, 'zouloue': 0, 'musicale': 3, 'intéroceptive': 6, 'ultramarine': 0, 'biophysicienne': 4, 'étasunienne': 4, 'rabattue': 0, 'vice-chancelière': 5, 'îlotière': 5, 'claire': 0, 'psychoaffective': 6, 'colporteuse': 2, 'amibienne': 4, 'hastée': 0, 'pompéienne': 4, 'métropolitaine': 0, 'réflexive': 6, 'écureuse': 2, 'issante': 0, 'garibaldienne': 4, 'abonnée': 0, 'domienne': 4, 'neuromotrice': 1, 'adimensionnelle': 4, 'anodine': 0, 'ravissante': 0, 'aéroréfrigérante': 0, 'friande': 0, 'montréalaise': 7, 'lénifiante': 0, 'secoureuse': 2, 'continue': 0, 'auto-excitatrice': 1, 'ricaine': 0, 'indélibérée': 0, 'proche-orientale': 3, 'franco-argentine': 0, 'soulaude': 0, 'égale': 3, 'mutilante': 0, 'masquante': 0, 'nippo-coréenne': 4, 'développante': 0, 'gainière': 5, 'académicienne': 4, 'furonculeuse': 8, 'régalienne': 4, 'émanée': 0, 'aménageuse': 2, 'transfuseuse': 2, 'caravanière': 5, 'encadreuse': 2, 'malthusienne': 4, 'quérulente': 0, 'intoxicante': 0, 'néogrammairienne': 4, 'franco-marocaine': 0, 'fraternelle': 4, 'gouvernementale': 3, 'trompeuse': 2, 'californienne': 4, 'recolleuse': 2, 'bedonnante': 0, 'lycéenne': 4, 'querelleuse': 2, 'farceuse': 2, 'succédanée': 0, 'angoreuse': 8, 'paralysante': 0, 'barbadienne': 4, 'orofaciale': 3, 'driveuse': 2, 'chyprée': 0, 'différenciatrice': 1, 'excédante': 0, 'impermanente': 0, 'tritiée': 0, 'tarpéienne': 4, 'mésopotamienne': 4, 'atonale': 3, 'gauchère': 5, 'hussarde': 0, 'wisigothe': 0, 'architecturale': 3, 'techniverrière': 5, 'mendélienne': 4, 'exemplative': 6, 'sénescente': 0, 'insatisfaite': 0, 'contextuelle': 4, 'papoteuse': 2, 'réjouissante': 0, 'abjecte': 0, 'violente': 0, 'chauffante': 0, 'préretraitée': 0, 'permissive': 6, 'vireuse': 8, 'démolisseuse': 2, 'balbutiante': 0, 'auriculo-temporale': 3, 'désarçonnante': 0, 'préhistorienne': 4, 'camarguaise': 7, 'hydratante': 0, 'tolérante': 0, 'répartitrice': 1, 'rewriteuse': 2, 'pateline': 0, 'vicésimale': 3, 'affranchie': 0, 'alphabétiseuse': 2, 'concomitante': 0, 'iridescente': 0, 'grecque': 25, 'correspondante': 0, 'égéenne': 4, 'sérielle': 4, 'agrienvironnementale': 0, 'foliacée': 0, 'incertaine': 0, 'franco-autrichienne': 4, 'chevrotante': 0, 'myélinisée': 0, 'jovienne': 4, 'varappeuse': 2, 'disséqueuse': 2, 'rescapée': 0, 'traversante': 0, 'ladine': 0, 'bise': 7, 'carbonée': 0, 'malayo-polynésienne': 4, 'hindoue': 0, 'synchroniseuse': 2, 'anticonceptionnelle': 4, 'renvoyée': 0, 'garçonnière': 5, 'porteuse': 2, 'infichue': 0, 'référentielle': 4, 'nourrissante': 0, 'anticipatrice': 1, 'anodiseuse': 2, 'auscultatrice': 1, 'cybernéticienne': 4, 'normande': 0, 'prairiale': 3, 'italo-espagnole': 0, 'presciente': 0, 'conseilleuse': 2, 'assortisseuse': 2, 'surpuissante': 0, 'philistine': 0, 'bégayante': 0, 'convoquée': 0, 'survireuse': 2, 'fermante': 0, 'télémécanicienne': 4, 'chanoinesse': 13, 'monopolisante': 0, 'algonquienne': 4, 'frappante': 0, 'bio-indicatrice': 1, 'libertine': 0, 'parraineuse': 2, 'rituelle': 4, 'intransigeante': 0, 'rangeuse': 2, 'préhospitalière': 5, 'effilocheuse': 2, 'benoite': 0, 'lobulée': 0, 'permaculturelle': 4, 'bilobée': 0, 'badigeonneuse': 2, 'grondeuse': 2, 'carnassière': 5, 'affligeante': 0, 'mouillante': 0, 'sacerdotale': 3, 'méliorative': 6, 'gastro-œsophagienne': 4, 'scriptrice': 1, 'soussignée': 0, 'calomnieuse': 8, 'acconière': 5, 'frustrée': 0, 'volleyeuse': 2, 'halogénée': 0, 'énarquienne': 4, 'recombinante': 0, 'patagonne': 4, 'ronfleuse': 2, 'spammeuse': 2, 'bruissante': 0, 'recrudescente': 0, 'italo-française': 7, 'populicultrice': 1, 'moralisatrice': 1, 'capitalisante': 0, 'dessiccative': 6, 'hypotensive': 6, 'loqueteuse': 8, 'grandissante': 0, 'indirecte': 0, 'susvisée': 0, 'pétéchiale': 3, 'fontenière': 5, 'lombosacrée': 0, 'crevante': 0, 'nuncupative': 6, 'violoneuse': 8, 'cocardière': 5, 'odieuse': 8, 'pistoleuse': 2, 'pyrograveuse': 2, 'tourbeuse': 8, 'séronégative': 6, 'intimidatrice': 1, 'employeuse': 2, 'niaise': 7, 'losangée': 0, 'administrée': 0, 'cascadeuse': 2, 'unidimensionnelle': 4, 'franco-québécoise': 7, 'joviale': 3, 'notariée': 0, 'ronflante': 0, 'invertébrée': 0, 'lampante': 0, 'varioleuse': 8, 'suiffeuse': 8, 'parurière': 5, 'hydraulicienne': 4, 'frustrante': 0, 'acheteuse': 2, 'introspective': 6, 'automaticienne': 4, 'compilatrice': 1, 'pétanqueuse': 2, 'descriptrice': 1, 'trilatérale': 3, 'dépassante': 0, 'eczémateuse': 8, 'suédée': 0, 'triumvirale': 3, 'cybercriminelle': 4, 'faneuse': 2, 'galbante': 0, 'gérante': 0, 'immorale': 3, 'glorifiante': 0, 'récitatrice': 1, 'vivifiante': 0, 'prieure': 0, 'manieuse': 2, 'craqueuse': 2, 'salvadorienne': 4, 'revenante': 0, 'froufroutante': 0, 'restringente': 0, 'vacillante': 0, 'éveilleuse': 2, 'khâgneuse': 8, 'réactive': 6, 'hachichée': 0, 'mytilicultrice': 1, 'affolante': 0, 'pro-américaine': 0, 'réconfortante': 0, 'déroulante': 0, 'hautelissière': 5, 'sympodiale': 3, 'hagarde': 0, 'érubescente': 0, 'trilobée': 0, 'siliceuse': 8, 'acineuse': 8, 'associatrice': 1, 'masculine': 0, 'soûlaude': 0, 'reconstructrice': 1, 'mélangeuse': 2, 'gentille': 4, 'susurrante': 0, 'léonine': 0, 'antisudorale': 3, 'protectrice': 1, 'ambianceuse': 2, 'communicationnelle': 4, 'printanière': 5, 'bimensuelle': 4, 'diligente': 0, 'hertzienne': 4, 'huronne': 4, 'autoréalisatrice': 1, 'argentine': 0, 'alvine': 0, 'fluorescente': 0, 'scandaleuse': 8, 'surexcitante': 0, 'roumie': 0, 'procrastinatrice': 1, 'gironde': 0, 'comédienne': 4, 'grugeuse': 2, 'suboptimale': 3, 'auto-adaptative': 6, 'ménine': 0, 'sensibilisatrice': 1, 'supermassive': 6, 'envoutante': 0, 'binationale': 3, 'négligente': 0, 'cinglante': 0, 'médiopalatale': 3, 'nord-coréenne': 4, 'autostoppeuse': 2, 'coupeuse': 2, 'sure': 0, 'écuyère': 5, 'embrasseuse': 2, 'cespiteuse': 8, 'anatolienne': 4, 'exacte': 0, 'zéphyrienne': 4, 'noblaillonne': 4, 'instigatrice': 1, 'imitatrice': 1, 'ultérieure': 0, 'rabouilleuse': 2, 'coulante': 0, 'interférentielle': 4, 'libidinale': 3, 'bismarckienne': 4, 'semi-finie': 0, 'rééducatrice': 1, 'morte': 0, 'normalisatrice': 1, 'boyaudière': 5, 'autocollante': 0, 'accentuelle': 4, 'proportionnelle': 4, 'saturnienne': 4, 'graduelle': 4, 'esthétisante': 0, 'hyperglycémiante': 0, 'débilitante': 0, 'louvoyante': 0, 'pénicillinorésistante': 0, 'latinisante': 0, 'coxofémorale': 3, 'pondeuse': 2, 'crapoteuse': 8, 'débitrice': 1, 'spirante': 0, 'judaïsante': 0, 'anormale': 3, 'récursive': 6, 'isolatrice': 1, 'rétive': 6, 'chevelue': 0, 'axonaise': 7, 'ânesse': 13, 'anarchisante': 0, 'bookmakeuse': 2, 'ethnoculturelle': 4, 'geôlière': 5, 'vivrée': 0, 'chromeuse': 2, 'mesquine': 0, 'fringante': 0, 'lasse': 15, 'péronéotibiale': 3, 'pronostiqueuse': 2, 'dispatcheuse': 2, 'stressante': 0, 'sphinctérienne': 4, 'courtoise': 7, 'antidreyfusarde': 0, 'confessionnelle': 4, 'perturbative': 6, 'post-coloniale': 3, 'japonaise': 7, 'tétragonale': 3, 'pourfendeuse': 2, 'magistrate': 0, 'franco-néerlandaise': 7, 'assombrissante': 0, 'anthraciteuse': 8, 'avalante': 0, 'cagneuse': 8, 'incrustatrice': 1, 'cognitive': 6, 'gesticulée': 0, 'percluse': 7, 'incrémentielle': 4, 'divagante': 0, 'irrévélée': 0, 'recourante': 0, 'consécutive': 6, 'besantée': 0, 'rhinopharyngée': 0, 'sautillante': 0, 'fixatrice': 1, 'fluette': 4, 'inattentive': 6, 'palpitante': 0, 'jouissive': 6, 'désastreuse': 8, 'française': 7, 'croulante': 0, 'handicapante': 0, 'formalisante': 0, 'sahélienne': 4, 'kolkhozienne': 4, 'franco-uruguayenne': 4, 'désabonnée': 0, 'explicative': 6, 'bélizienne': 4, 'mixeuse': 2, 'confabulatrice': 1, 'excrétrice': 1, 'abuseuse': 2, 'fibrilleuse': 8, 'endocrânienne': 4, 'olécranienne': 4, 'catégorisante': 0, 'guillotineuse': 2, 'béarnaise': 7, 'résolvante': 0, 'estampeuse': 2, 'impériale': 3, 'mineure': 0, 'ferro-magnésienne': 4, 'russo-israélienne': 4, 'grise': 7, 'irréelle': 4, 'inimaginée': 0, 'nigérienne': 4, 'inchoative': 6, 'antipodale': 3, 'latifoliée': 0, 'ergative': 6, 'émancipatrice': 1, 'négrillonne': 4, 'adlérienne': 4, 'singulière': 5, 'euryhaline': 0, 'divorcée': 0, 'corrective': 6, 'liftière': 5, 'sensée': 0, 'horticultrice': 1, 'traverse': 7, 'londonienne': 4, 'extéroceptive': 6, 'bagarreuse': 2, 'croupière': 5, 'piaffeuse': 2, 'dévolutive': 6, 'laide': 0, 'gribouilleuse': 2, 'insurgente': 0, 'surveillante': 0, 'inconséquente': 0, 'interrogatrice': 1, 'maraude': 0, 'graissante': 0, 'décrépite': 0, 'tiercée': 0, 'bégayeuse': 2, 'épépineuse': 2, 'cintrière': 5, 'mentholée': 0, 'thermicienne': 4, 'ovée': 0, 'végétale': 3, 'frutescente': 0, 'facétieuse': 8, 'verruqueuse': 8, 'bibliotechnicienne': 4, 'diophantienne': 4, 'thaïlandaise': 7, 'camouflante': 0, 'gibeline': 0, 'manilleuse': 2, 'féconde': 0, 'perceptrice': 1, 'sursalée': 0, 'cocompacte': 0, 'acculturative': 6, 'algonkine': 0, 'distincte': 0, 'tentatrice': 1, 'frileuse': 8, 'nucale': 3, 'boisselière': 5, 'inéduquée': 0, 'cloacale': 3, 'microfibrée': 0, 'manchoise': 7, 'façonneuse': 2, 'occlusale': 3, 'décussée': 0, 'pitchoune': 0, 'précédente': 0, 'élévatrice': 1, 'percutanée': 0, 'palmipartie': 0, 'insinuante': 0, 'éthérée': 0, 'coraco-brachiale': 3, 'soufie': 0, 'autoritative': 6, 'mycélienne': 4, 'braillante': 0, 'pétrifiante': 0, 'parnassienne': 4, 'lacanienne': 4, 'manufacturière': 5, 'néo-romane': 0, 'mercaticienne': 4, 'urticarienne': 4, 'superlourde': 0, 'daronne': 4, 'opprimée': 0, 'crucifiante': 0, 'vice-présidente': 0, 'commutative': 6, 'déterminative': 6, 'hurleuse': 2, 'tonifiante': 0, 'nouvelle': 16, 'bouquineuse': 2, 'consultrice': 1, 'exploitée': 0, 'gangréneuse': 8, 'manuelle': 4, 'législative': 6, 'antivénéneuse': 8, 'susdénommée': 0, 'paraphraseuse': 2, 'enfileuse': 2, 'postdoctorale': 3, 'dénigreuse': 2, 'immolatrice': 1, 'hongreuse': 2, 'transilienne': 4, 'ptérygoïdienne': 4, 'managériale': 3, 'goémonière': 5, 'préardennaise': 7, 'plane': 0, 'plurinominale': 3, 'républicaine': 0, 'cartonneuse': 8, 'baie': 0, 'beurrière': 5, 'salariale': 3, 'entrante': 0, 'unilatérale': 3, 'toquarde': 0, 'jointeuse': 2, 'capillicultrice': 1, 'palliative': 6, 'doyenne': 4, 'cristallière': 5, 'gravitationnelle': 4, 'quadragésimale': 3, 'envoûtée': 0, 'douillette': 4, 'éparse': 7, 'zinzoline': 0, 'métacarpienne': 4, 'liliacée': 0, 'inférentielle': 4, 'neurosensorielle': 4, 'photo-émettrice': 1, 'prédatée': 0, 'saburrale': 3, 'perturbatrice': 1, 'visitatrice': 1, 'vagale': 3, 'médico-sportive': 6, 'saligaude': 0, 'transcriptionnelle': 4, 'gaie': 0, 'féculente': 0, 'gréco-latine': 0, 'serpigineuse': 8, 'transamazonienne': 4, 'immanente': 0, 'bavaroise': 7, 'socioprofessionnelle': 4, 'dévalorisante': 0, 'bolivarienne': 4, 'absolue': 0, 'électromécanicienne': 4, 'locorégionale': 3, 'franco-albanaise': 7, 'spumeuse': 8, 'inexpressive': 6, 'coffreuse': 2, 'trouillarde': 0, 'résineuse': 8, 'fœto-maternelle': 4, 'suppurative': 6, 'infradienne': 4, 'outaouaise': 7, 'branquignole': 0, 'herbagère': 5, 'renégate': 0, 'autolissante': 0, 'intransitive': 6, 'apparitrice': 1, 'chauvine': 0, 'teinte': 0, 'presseuse': 2, 'bureauticienne': 4, 'phocéenne': 4, 'taularde': 0, 'isoclinale': 3, 'tonnante': 0, 'mal-aimée': 0, 'biscaïenne': 4, 'vénielle': 4, 'francienne': 4, 'bhoutanaise': 7, 'brune': 0, 'ménapienne': 4, 'cooccupante': 0, 'amasseuse': 2, 'benjamine': 0, 'paternelle': 4, 'biennale': 3, 'cuniculicultrice': 1, 'unitive': 6, 'recarburée': 0, 'historiale': 3, 'extradée': 0, 'argumentée': 0, 'sempervirente': 0, 'successive': 6, 'liliale': 3, 'nageuse': 2, 'affligée': 0, 'exerçante': 0, 'narcotrafiquante': 0, 'causative': 6, 'laryngée': 0, 'bonne': 4, 'botteleuse': 2, 'bigote': 0, 'assiégeante': 0, 'adoratrice': 1, 'sélecte': 0, 'salésienne': 4, 'commutatrice': 1, 'boursière': 5, 'grondante': 0, 'sanscrite': 0, 'dissimulatrice': 1, 'antillaise': 7, 'conduiseuse': 2, 'reconstituante': 0, 'bien-voulue': 0, 'arséniée': 0, 'affétée': 0, 'apiéceuse': 2, 'interactive': 6, 'racheteuse': 2, 'tatillonne': 4, 'trifaciale': 3, 'germano-danoise': 7, 'broyeuse': 2, 'rénale': 3, 'trachéale': 3, 'chiromancienne': 4, 'croqueuse': 2, 'fervente': 0, 'betteravière': 5, 'antiaérienne': 4, 'rentoileuse': 2, 'auto-évaluante': 0, 'vésicante': 0, 'amputée': 0, 'emmanchée': 0, 'paridigitidée': 0, 'entraînante': 0, 'teneuse': 2, 'chancelière': 5, 'préindustrielle': 4, 'chantante': 0, 'bobinière': 5, 'mondiale': 3, 'donjonnée': 0, 'gratifiante': 0, 'entêtante': 0, 'allumée': 0, 'sauve': 6, 'heureuse': 8, 'péribuccale': 3, 'levageuse': 2, 'coextensive': 6, 'pinceuse': 2, 'zélée': 0, 'transsibérienne': 4, 'adjudicatrice': 1, 'graffiteuse': 2, 'invalidante': 0, 'lorgneuse': 2, 'câblière': 5, 'chiropractrice': 1, 'véhémente': 0, 'antiréflexive': 6, 'vaccinée': 0, 'pontifiante': 0, 'prénuptiale': 3, 'chartreuse': 8, 'enculeuse': 2, 'causale': 3, 'thermorésistante': 0, 'épandeuse': 2, 'éditoriale': 3, 'médiatrice': 1, 'vicomtesse': 13, 'portière': 5, 'achemineuse': 2, 'intergénérationnelle': 4, 'empoignante': 0, 'bâilleuse': 2, 'non-fumeuse': 2, 'conoïdale': 3, 'régénératrice': 1, 'hypertensive': 6, 'argilo-limoneuse': 2, 'barlongue': 4, 'acousticienne': 4, 'rengagée': 0, 'perforante': 0, 'transsaharienne': 4, 'pantouflarde': 0, 'babyboumeuse': 2, 'liechtensteinoise': 7, 'flagrante': 0, 'gazouilleuse': 2, 'pharamineuse': 8, 'froissante': 0, 'roumaine': 0, 'drummeuse': 2, 'ambulancière': 5, 'raconteuse': 2, 'bimodale': 3, 'gibbeuse': 8, 'côtière': 5, 'glandeuse': 2, 'cloueuse': 2, 'buffetière': 5, 'gélive': 6, 'régale': 0, 'orchestrale': 3, 'excluante': 0, 'gazière': 5, 'turbosoufflante': 0, 'surhumaine': 0, 'malsonnante': 0, 'revendeuse': 2, 'immunostimulante': 0, 'pédégée': 0, 'rinceuse': 2, 'pileuse': 8, 'rancunière': 5, 'insidieuse': 8, 'folle': 22, 'pentavalente': 0, 'pelletière': 5, 'rétropéritonéale': 3, 'suroxygénée': 0, 'évaluatrice': 1, 'décontractante': 0, 'manuéline': 0, 'insulino-dépendante': 0, 'piémontaise': 7, 'domaniale': 3, 'astreignante': 0, 'sidéenne': 4, 'coordonnatrice': 1, 'culpabilisante': 0, 'aérodigestive': 6, 'émigrée': 0, 'engendreuse': 2, 'piroguière': 5, 'déménageuse': 2, 'néo-platonicienne': 4, 'psychophysicienne': 4, 'idéomotrice': 1, 'vendue': 0, 'raquettière': 5, 'affainéantie': 0, 'façadière': 5, 'incarnate': 0, 'lamifiée': 0, 'frugale': 3, 'mignarde': 0, 'influente': 0, 'improbatrice': 1, 'fromentale': 3, 'batracienne': 4, 'inarticulée': 0, 'inspectrice': 1, 'censière': 5, 'généreuse': 8, 'russo-suédoise': 7, 'éternelle': 4, 'charbonneuse': 8, 'euclidienne': 4, 'fallacieuse': 8, 'palatine': 0, 'chaudronnière': 5, 'arienne': 4, 'primitive': 6, 'haschichine': 0, 'autoportante': 0, 'quarante-huitarde': 0, 'ventée': 0, 'rejointoyeuse': 2, 'gaffeuse': 2, 'dégoulinante': 0, 'antithyroïdienne': 4, 'lagrangienne': 4, 'améliorante': 0, 'complexuelle': 4, 'réfléchissante': 0, 'boutonneuse': 8, 'spacieuse': 8, 'irrespectueuse': 8, 'coquillière': 5, 'délassante': 0, 'éblouissante': 0, 'capitoline': 0, 'défectueuse': 8, 'affixale': 3, 'ecclésiale': 3, 'schisteuse': 8, 'phrygienne': 4, 'covendeuse': 2, 'auto-adjointe': 0, 'outrageante': 0, 'démultiplicatrice': 1, 'éclusière': 5, 'viscérale': 3, 'escaliéteuse': 2, 'chargeuse': 2, 'moralisante': 0, 'relieuse': 2, 'aéroportée': 0, 'promotionnelle': 4, 'berrichonne': 4, 'saponacée': 0, 'presbytérienne': 4, 'boratée': 0, 'vérificative': 6, 'furieuse': 8, 'coffretière': 5, 'bifonctionnelle': 4, 'décroissante': 0, 'apostate': 0, 'capétienne': 4, 'fourreuse': 2, 'psychosexuelle': 4, 'fertilisatrice': 1, 'briseuse': 2, 'palatale': 3, 'sédative': 6, 'thermopropulsive': 6, 'arminienne': 4, 'médico-légale': 3, 'pentagonale': 3, 'ornaise': 7, 'immune': 0, 'orpheline': 0, 'miroitée': 0, 'exfoliante': 0, 'défourneuse': 2, 'giletière': 5, 'réflective': 6, 'investigatrice': 1, 'institutrice': 1, 'mutilée': 0, 'pilo-sébacée': 0, 'fréquentielle': 4, 'pélasgienne': 4, 'postale': 3, 'intimée': 0, 'locrienne': 4, 'flagellatrice': 1, 'physicienne': 4, 'rechigneuse': 8, 'multidécennale': 3, 'drôlette': 4, 'catégoriale': 0, 'pierreuse': 8, 'jardinière': 5, 'rhodienne': 4, 'burundaise': 7, 'belligérante': 0, 'verdissante': 0, 'tanzanienne': 4, 'demeurée': 0, 'excitatrice': 1, 'prévisionnelle': 4, 'mortelle': 4, 'urétérale': 3, 'sentimentale': 3, 'placette': 4, 'pubienne': 4, 'caractérisante': 0, 'changeuse': 2, 'transcriptrice': 1, 'septembrale': 3, 'peléenne': 4, 'bétonneuse': 2, 'rectosigmoïdienne': 4, 'bâtonnière': 5, 'abotée': 0, 'railleuse': 2, 'turco-mongole': 0, 'menue': 0, 'inexperte': 0, 'positive': 6, 'remettante': 0, 'antifiscale': 3, 'tradeuse': 2, 'digitée': 0, 'parisienne': 4, 'poirée': 0, 'émergente': 0, 'malendurante': 0, 'penseuse': 2, 'délicate': 0, 'vitrioleuse': 2, 'sud-africaine': 0, 'semestrielle': 4, 'lamarckienne': 4, 'brocanteuse': 2, 'vantarde': 0, 'houillère': 5, 'conjugale': 3, 'savoyarde': 0, 'psycho-sensori-motrice': 1, 'acceptante': 0, 'altérative': 6, 'prédécédée': 0, 'férale': 3, 'scribouilleuse': 2, 'créative': 6, 'brute': 0, 'dégénérée': 0, 'épuisante': 0, 'thébaine': 0, 'quinte': 0, 'radioélectricienne': 4, 'dinandière': 5, 'électrisante': 0, 'tensioactive': 6, 'râleuse': 2, 'cristallisante': 0, 'cambiale': 3, 'roborative': 6, 'refendeuse': 2, 'écœurante': 0, 'neurochirurgienne': 4, 'somptueuse': 8, 'recréatrice': 1, 'palmilobée': 0, 'capucine': 0, 'pâlichonne': 4, 'électromotrice': 1, 'extra-sensorielle': 4, 'abrutissante': 0, 'crapuleuse': 8, 'canardière': 5, 'épieuse': 2, 'érudite': 0, 'péri-urbaine': 0, 'affriquée': 0, 'brunette': 4, 'chaînière': 5, 'stridulante': 0, 'corégente': 0, 'hellénisante': 0, 'insouciante': 0, 'anglo-canadienne': 4, 'suiveuse': 2, 'radine': 0, 'récente': 0, 'rétroactive': 6, 'cémenteuse': 8, 'mosellane': 0, 'continente': 0, 'claustrale': 3, 'ennuyante': 0, 'embrouilleuse': 2, 'touffue': 0, 'ajaccienne': 4, 'aumônière': 5, 'souriante': 0, 'aryenne': 4, 'gomorrhéenne': 4, 'hachischée': 0, 'occidentale': 3, 'obligée': 0, 'presbytérale': 3, 'dodécagonale': 3, 'idiote': 0, 'variqueuse': 8, 'pendarde': 0, 'wagonnière': 5, 'canoteuse': 2, 'placeuse': 2, 'urcéolée': 0, 'assimilative': 6, 'concordante': 0, 'suffocante': 0, 'autobloquante': 0, 'globe-trotteuse': 2, 'commensale': 3, 'autonettoyante': 0, 'systémicienne': 4, 'bimestrielle': 4, 'inexacte': 0, 'allante': 0, 'inconditionnée': 0, 'aimée': 0, 'boulotte': 4, 'frisquette': 4, 'expiratrice': 1, 'annuelle': 4, 'anglo-finlandaise': 7, 'inductive': 6, 'méprisante': 0, 'jaunette': 4, 'mauvaise': 7, 'acquittée': 0, 'bombante': 0, 'attachée': 0, 'promise': 7, 'perdante': 0, 'crétine': 0, 'ligneuse': 8, 'invendue': 0, 'wolofe': 0, 'désambiguïsatrice': 1, 'limonadière': 5, 'additionneuse': 2, 'sarrasine': 0, 'geignante': 0, 'immotivée': 0, 'extravagante': 0, 'circinée': 0, 'fêlée': 0, 'incestueuse': 8, 'équine': 0, 'buguée': 0, 'équidimensionnelle': 4, 'annihilante': 0, 'essuyeuse': 2, 'subjacente': 0, 'puerpérale': 3, 'faucheuse': 2, 'archiépiscopale': 3, 'stomisée': 0, 'axiale': 3, 'amicrobienne': 4, 'modificatrice': 1, 'chantourneuse': 2, 'matriarcale': 3, 'retentissante': 0, 'couchante': 0, 'droguée': 0, 'contrefactuelle': 4, 'hypertendue': 0, 'microsomale': 3, 'meurtrissante': 0, 'rhodiée': 0, 'rêveuse': 2, 'gloussante': 0, 'pédicellée': 0, 'cuisante': 0, 'patoisante': 0, 'ensellée': 0, 'commettante': 0, 'térébrante': 0, 'coulissante': 0, 'extrahumaine': 0, 'caribéenne': 4, 'prometteuse': 2, 'essonnienne': 4, 'contributive': 6, 'danoise': 7, 'porcelainière': 5, 'gladiatrice': 1, 'aubaine': 0, 'languissante': 0, 'partenariale': 3, 'tricennale': 3, 'attablée': 0, 'nombreuse': 8, 'jaïne': 0, 'transcendante': 0, 'salonnarde': 0, 'intelligente': 0, 'défunte': 0, 'détrousseuse': 2, 'usitée': 0, 'microsomiale': 3, 'grumeleuse': 8, 'talqueuse': 8, 'humaine': 0, 'emprunteuse': 2, 'cotylédonée': 0, 'superviseuse': 2, 'définissante': 0, 'mouflette': 4, 'langagière': 5, 'diminutive': 6, 'déchiqueteuse': 2, 'porcine': 0, 'routeuse': 2, 'exagérative': 6, 'décemvirale': 3, 'mûre': 0, 'insonorisante': 0, 'crétacée': 0, 'pratiquante': 0, 'iléocæcale': 3, 'conformationnelle': 4, 'arriérée': 0, 'sirupeuse': 8, 'chocolatée': 0, 'pyrénéenne': 4, 'aliénatrice': 1, 'gitane': 0, 'évacuante': 0, 'immaculée': 0, 'agrippante': 0, 'bolbécaise': 7, 'détonante': 0, 'dupeuse': 2, 'américano-turque': 11, 'euskarienne': 4, 'marronne': 4, 'bredouillante': 0, 'rarescente': 0, 'hennuyère': 5, 'sanieuse': 8, 'profective': 6, 'nauséeuse': 8, 'dépurative': 6, 'agneline': 0, 'gardeuse': 2, 'duveteuse': 8, 'cortico-spinale': 3, 'casseuse': 2, 'codante': 0, 'sous-officière': 5, 'algérienne': 4, 'longuette': 4, 'latino-américaine': 0, 'intra-utérine': 0, 'adragante': 0, 'pubescente': 0, 'bouilleuse': 2, 'peule': 0, 'ensorcelante': 0, 'préfète': 20, 'antimorale': 3, 'occasionnelle': 4, 'astrale': 3, 'phylloxérée': 0, 'routarde': 0, 'floricultrice': 1, 'coutelière': 5, 'contrite': 0, 'galvaudeuse': 8, 'bailleresse': 14, 'lointaine': 0, 'guindailleuse': 2, 'parfaite': 0, 'diphasée': 0, 'alourdissante': 0, 'corrosive': 6, 'artificière': 5, 'ulcérative': 6, 'stockeuse': 2, 'chineuse': 2, 'contrôleuse': 2, 'connecticienne': 4, 'surrénale': 3, 'répétitrice': 1, 'connivente': 0, 'préceptorale': 3, 'blousante': 0, 'aviatrice': 1, 'préconisatrice': 1, 'inconnue': 0, 'couillonne': 4, 'présentatrice': 1, 'aguichante': 0, 'détentrice': 1, 'enculée': 0, 'croisetée': 0, 'cantonnière': 5, 'icarienne': 4, 'argumentative': 6, 'chapelière': 5, 'ovarienne': 4, 'caritative': 6, 'quêteuse': 2, 'grésillante': 0, 'jouale': 0, 'rudérale': 3, 'radionavigante': 0, 'employée': 0, 'batifoleuse': 2, 'casernière': 5, 'imparipennée': 0, 'centrifugeuse': 2, 'grisonnante': 0, 'turriculée': 0, 'salariée': 0, 'portugaise': 7, 'débardeuse': 2, 'boueuse': 8, 'quadridimensionnelle': 4, 'matelassière': 5, 'sapientiale': 3, 'comploteuse': 2, 'insistante': 0, 'engazonneuse': 2, 'plongeuse': 2, 'pacificatrice': 1, 'dorsale': 3, 'inhalatrice': 1, 'filamenteuse': 8, 'ignée': 0, 'bisexuée': 0, 'dégrossisseuse': 2, 'langoustière': 5, 'perforatrice': 1, 'hitlérienne': 4, 'ampliatrice': 1, 'luxurieuse': 8, 'interrogative': 6, 'jargonnante': 0, 'retraitante': 0, 'anévrismale': 3, 'médicamenteuse': 8, 'subtile': 0, 'suspecte': 0, 'pèlerine': 0, 'cagoulée': 0, 'arobase': 7, 'estonienne': 4, 'délégatrice': 1, 'propagatrice': 1, 'lésionnelle': 4, 'anamorphosée': 0, 'arbitrale': 3, 'goulue': 0, 'connée': 0, 'franco-péruvienne': 4, 'survivante': 0, 'représentante': 0, 'développementale': 3, 'télétravailleuse': 2, 'barrémienne': 4, 'zostérienne': 4, 'cérébrale': 3, 'propharmacienne': 4, 'bluffante': 0, 'intentionnelle': 4, 'packageuse': 2, 'gourde': 0, 'endormante': 0, 'amphibienne': 4, 'transpirante': 0, 'arthurienne': 4, 'germano-chinoise': 7, 'palatiale': 3, 'tractive': 6, 'partielle': 4, 'involucrée': 0, 'botoxée': 0, 'salivante': 0, 'rugissante': 0, 'franco-canadienne': 4, 'uro-génitale': 3, 'providentielle': 4, 'attributive': 6, 'sanguine': 0, 'inexécutée': 0, 'batésienne': 4, 'bisannuelle': 4, 'capitularde': 0, 'chienne': 4, 'baiseuse': 2, 'méniscale': 3, 'panaméricaine': 0, 'égypto-américaine': 0, 'huppée': 0, 'dissolutive': 6, 'pharaonne': 4, 'antireligieuse': 8, 'englobante': 0, 'famée': 0, 'maitresse': 13, 'déportée': 0, 'monocamérale': 3, 'éreintante': 0, 'extractive': 6, 'linguale': 3, 'relapse': 7, 'souffrante': 0, 'quadrifoliée': 0, 'grutière': 5, 'fornicatrice': 1, 'dialectale': 3, 'intrusive': 6, 'saccareuse': 8, 'myxœdémateuse': 8, 'chaleureuse': 8, 'amplective': 6, 'mongolienne': 4, 'oppressive': 6, 'bienaimée': 0, 'vaccinale': 3, 'éruptive': 6, 'dialogale': 3, 'équipementière': 5, 'expédiente': 0, 'nodale': 3, 'co-encadrante': 0, 'franco-vénézuélienne': 4, 'coactive': 6, 'taquine': 0, 'savoureuse': 8, 'lavoisienne': 4, 'psychochirurgienne': 4, 'royale': 3, 'transactionnelle': 4, 'mogole': 0, 'ignorante': 0, 'collégiale': 3, 'gaumaise': 7, 'gobeuse': 2, 'sous-frutescente': 0, 'régionale': 3, 'privatrice': 1, 'remorqueuse': 2, 'hégirienne': 4, 'vicinale': 3, 'wesleyenne': 4, 'dahoméenne': 4, 'stridente': 0, 'confusionnelle': 4, 'fixeuse': 2, 'déstabilisatrice': 1, 'catalane': 0, 'coracoïdienne': 4, 'plombière': 5, 'immatérielle': 4, 'éveillée': 0, 'amplificatrice': 1, 'meuleuse': 2, 'jointive': 6, 'monstrueuse': 8, 'allumettière': 5, 'gaveuse': 2, 'vergée': 0, 'magouilleuse': 2, 'connective': 6, 'renforçatrice': 1, 'niaiseuse': 8, 'replète': 20, 'métrosexuelle': 4, 'ambivalente': 0, 'dimensionnelle': 4, 'mélangeante': 0, 'ciliée': 0, 'hessienne': 4, 'bourrelière': 5, 'gaufreuse': 2, 'pleine': 0, 'abdominale': 3, 'clubbeuse': 2, 'interpellatrice': 1, 'chryséléphantine': 0, 'filmeuse': 2, 'motivante': 0, 'indifférenciée': 0, 'aveuglante': 0, 'univalente': 0, 'avenante': 0, 'benoîte': 0, 'étalonneuse': 2, 'farfouilleuse': 2, 'allurée': 0, 'préfacière': 5, 'charretière': 5, 'épierreuse': 2, 'vénéneuse': 8, 'australienne': 4, 'pluvieuse': 8, 'colitigante': 0, 'suppresseuse': 2, 'zende': 0, 'bavante': 0, 'méritante': 0, 'insulinodépendante': 0, 'internée': 0, 'étameuse': 2, 'opérationnelle': 4, 'fournière': 5, 'préfrontale': 3, 'sorcière': 5, 'aggravante': 0, 'patrilocale': 3, 'épargnante': 0, 'sous-clavière': 5, 'israélienne': 4, 'flamingante': 0, 'avocate': 0, 'fignoleuse': 2, 'prudentielle': 4, 'invariante': 0, 'polyphasée': 0, 'multicomposante': 0, 'trichineuse': 8, 'coxo-fémorale': 3, 'soulote': 0, 'sanctionnée': 0, 'bradeuse': 2, 'avaliseuse': 2, 'caucasienne': 4, 'coadjutrice': 1, 'surprenante': 0, 'bouffonne': 4, 'uligineuse': 8, 'grandette': 4, 'levantine': 0, 'photoconductrice': 1, 'copartageante': 0, 'coordinatrice': 1, 'abatteuse': 2, 'constante': 0, 'oléo-protéagineuse': 2, 'junonienne': 4, 'sterno-cléido-mastoïdienne': 4, 'carburière': 5, 'épicière': 5, 'prospective': 6, 'secouante': 0, 'abélianisée': 0, 'manouvrière': 5, 'inspirante': 0, 'phonocaptrice': 1, 'criminelle': 4, 'déchirante': 0, 'contentieuse': 8, 'rotationnelle': 4, 'bénédictine': 0, 'antérieure': 0, 'salpingienne': 4, 'addictive': 6, 'carieuse': 8, 'bidonnante': 0, 'coauteure': 0, 'chthonienne': 4, 'formière': 5, 'sabine': 0, 'staminée': 0, 'polluante': 0, 'mi-close': 7, 'clairvoyante': 0, 'cratérisée': 0, 'courrière': 5, 'tourmenteuse': 2, 'achéenne': 4, 'mensongère': 5, 'indolente': 0, 'coassociée': 0, 'contre-intuitive': 6, 'doubleuse': 2, 'amygdalienne': 4, 'barbue': 0, 'diffuse': 7, 'pourvoyeuse': 2, 'cadreuse': 2, 'siccative': 6, 'régénérante': 0, 'nuageuse': 8, 'bleue': 0, 'vieillissante': 0, 'aigrie': 0, 'persane': 0, 'vitupératrice': 1, 'zodiacale': 3, 'récessive': 6, 'sénégalaise': 7, 'latente': 0, 'glottale': 3, 'cobelligérante': 0, 'huronienne': 4, 'étrangère': 5, 'stationnée': 0, 'shakespearienne': 4, 'bien-aimée': 0, 'obsidionale': 3, 'liégeuse': 8, 'éco-environnementale': 0, 'larvée': 0, 'nymphale': 3, 'imprimante': 0, 'ordurière': 5, 'maltaise': 7, 'invitée': 0, 'prostituée': 0, 'informatrice': 1, 'coulée': 0, 'rasante': 0, 'démarcheuse': 2, 'apéritrice': 1, 'gouvernante': 0, 'antitumorale': 3, 'surréelle': 4, 'fourmillante': 0, 'mensuelle': 4, 'féringienne': 4, 'délitescente': 0, 'détacheuse': 2, 'dévoreuse': 2, 'pénicillino-résistante': 0, 'minimexée': 0, 'dégravelante': 0, 'invasive': 6, 'essénienne': 4, 'palefrenière': 5, 'flavescente': 0, 'pliante': 0, 'balzacienne': 4, 'déprédatrice': 1, 'aqueuse': 8, 'fidélisante': 0, 'corporelle': 4, 'anglo-américaine': 0, 'chaudronnée': 0, 'lancéolée': 0, 'suborneuse': 2, 'mayennaise': 7, 'cérémoniale': 0, 'arrogante': 0, 'rouette': 4, 'mitrailleuse': 2, 'originale': 3, 'infectante': 0, 'dictatrice': 1, 'postulante': 0, 'caillouteuse': 8, 'tapeuse': 2, 'haineuse': 8, 'formelle': 4, 'giboyeuse': 8, 'receveuse': 2, 'rostrale': 3, 'lobotomisante': 0, 'totalisante': 0, 'détimbrée': 0, 'états-unienne': 4, 'subintrante': 0, 'exemptée': 0, 'chatteuse': 2, 'obsolescente': 0, 'discordante': 0, 'oreillarde': 0, 'rouspéteuse': 2, 'multiconductrice': 1, 'voltigeuse': 2, 'nattière': 5, 'coiffante': 0, 'loucheuse': 2, 'défilante': 0, 'calibreuse': 2, 'denchée': 0, 'capitée': 0, 'baconienne': 4, 'autrichienne': 4, 'oniromancienne': 4, 'gantelée': 0, 'pluriannuelle': 4, 'vertigineuse': 8, 'innominée': 0, 'houlomotrice': 1, 'roboticienne': 4, 'incidentelle': 4, 'perruquière': 5, 'clicheuse': 2, 'quotidienne': 4, 'électroacousticienne': 4, 'frumentacée': 0, 'azerbaïdjanaise': 7, 'sporulée': 0, 'remémorative': 6, 'bitonale': 3, 'taïwanaise': 7, 'veinarde': 0, 'décanteuse': 2, 'log-normale': 3, 'taurine': 0, 'particulière': 5, 'aisée': 0, 'insomnieuse': 8, 'sri-lankaise': 7, 'tuberculeuse': 8, 'jersiaise': 7, 'pelucheuse': 8, 'rhétienne': 4, 'bactérienne': 4, 'multiplicatrice': 1, 'révisionnelle': 4, 'crolée': 0, 'assonancée': 0, 'inorganisée': 0, 'gradée': 0, 'géocacheuse': 2, 'appalachienne': 4, 'patronale': 3, 'commandante': 0, 'plaisante': 0, 'tupie': 0, 'visiteuse': 2, 'vasarde': 0, 'manichéenne': 4, 'chtarbée': 0, 'socio-esthéticienne': 4, 'victorieuse': 8, 'parapharmacienne': 4, 'carottière': 5, 'sainte': 0, 'miroitière': 5, 'insuffisante': 0, 'antivénérienne': 4, 'broussailleuse': 8, 'subite': 0, 'mutilatrice': 1, 'buvetière': 5, 'furtive': 6, 'successorale': 3, 'verbeuse': 8, 'infructueuse': 8, 'tisserande': 0, 'intersexuée': 0, 'nerveuse': 8, 'énervante': 0, 'louvette': 4, 'rouennière': 5, 'anticonstitutionnelle': 4, 'lourde': 0, 'prochinoise': 7, 'inconsistante': 0, 'spectrale': 3, 'multiplicative': 6, 'couteuse': 8, 'biostatisticienne': 4, 'cristallophyllienne': 4, 'civile': 0, 'sclérale': 3, 'libérale': 3, 'corporative': 6, 'inattaquée': 0, 'moins-disante': 0, 'centauresse': 13, 'arbalétrière': 5, 'proliférante': 0, 'confessante': 0, 'touranienne': 4, 'intertidale': 3, 'peuhle': 0, 'distributive': 6, 'sorteuse': 2, 'rabattante': 0, 'européenne': 4, 'choroïdienne': 4, 'vaccinatrice': 1, 'chatte': 4, 'conjoncturelle': 4, 'agglomérante': 0, 'soulonne': 4, 'connaisseuse': 2, 'berceuse': 2, 'sexuelle': 4, 'marmoréenne': 4, 'paléochrétienne': 4, 'écornifleuse': 2, 'fureteuse': 2, 'clapoteuse': 8, 'baraquée': 0, 'modulatrice': 1, 'bichonneuse': 2, 'crénelée': 0, 'tréflée': 0, 'innocentée': 0, 'sternale': 3, 'gliale': 3, 'clunisienne': 4, 'sommitale': 3, 'infuse': 7, 'volumineuse': 8, 'procuratrice': 1, 'hétérosexuelle': 4, 'journaleuse': 8, 'mobilière': 5, 'franco-anglaise': 7, 'éducationnelle': 4, 'grignoteuse': 2, 'libéralisante': 0, 'guetteuse': 2, 'laie': 0, 'biinvariante': 0, 'métisse': 15, 'tocarde': 0, 'colleteuse': 2, 'souscriptrice': 1, 'pascalienne': 4, 'guérissante': 0, 'diagnosticienne': 4, 'brunisseuse': 2, 'planante': 0, 'cribleuse': 2, 'rennaise': 7, 'zigzagante': 0, 'ânière': 5, 'décalvante': 0, 'poméranienne': 4, 'villageoise': 7, 'maintenicienne': 4, 'indonésienne': 4, 'psychométricienne': 4, 'afflictive': 6, 'jordanienne': 4, 'clarificatrice': 1, 'claveleuse': 8, 'micronésienne': 4, 'gloutonne': 4, 'djiboutienne': 4, 'plaqueuse': 2, 'saint-simonienne': 4, 'entreprenante': 0, 'brouillassée': 0, 'thésarde': 0, 'zimbabwéenne': 4, 'négociatrice': 1, 'herbacée': 0, 'accordeuse': 2, 'empoisonneuse': 2, 'ingressive': 6, 'compassionnelle': 4, 'amnistiante': 0, 'réactionnelle': 4, 'évaginée': 0, 'dépeceuse': 2, 'assistée': 0, 'ratiocineuse': 2, 'octogonale': 3, 'passée': 0, 'trisannuelle': 4, 'télévisuelle': 4, 'angoissante': 0, 'monocristalline': 0, 'soustractive': 6, 'palmatilobée': 0, 'astéroïdale': 3, 'inopérante': 0, 'fractale': 0, 'simonienne': 4, 'ansérine': 0, 'brésilienne': 4, 'hypothéticodéductive': 6, 'soûle': 0, 'tordue': 0, 'monoclonale': 3, 'autoentrepreneuse': 2, 'intumescente': 0, 'gutturale': 3, 'vivrière': 5, 'ourlienne': 4, 'inférieure': 0, 'ocreuse': 8, 'raccompagnatrice': 1, 'sourcilière': 5, 'quinée': 0, 'foraminée': 0, 'lainière': 5, 'écharneuse': 2, 'bienfaitrice': 1, 'caséeuse': 8, 'nécessitante': 0, 'multidirectionnelle': 4, 'landaise': 7, 'équidistante': 0, 'captante': 0, 'pustuleuse': 8, 'postindustrielle': 4, 'détachante': 0, 'abstractive': 6, 'adjudicative': 6, 'enquiquineuse': 2, 'rhomboïdale': 3, 'abolitive': 6, 'biannuelle': 4, 'homosexuelle': 4, 'paraxiale': 3, 'papale': 3, 'abaissante': 0, 'armurière': 5, 'chafouine': 0, 'caféière': 5, 'voyageuse': 2, 'autopunitive': 6, 'septentrionale': 3, 'barisienne': 4, 'baby-boomeuse': 2, 'incomplète': 20, 'saline': 0, 'penchante': 0, 'anti-ministérielle': 4, 'fluocompacte': 0, 'accrescente': 0, 'algocultrice': 1, 'comtesse': 13, 'bucco-génitale': 3, 'seconde': 0, 'crasseuse': 8, 'garnisseuse': 2, 'mariale': 3, 'pauvrette': 4, 'esthéticienne': 4, 'spatiale': 3, 'montoise': 7, 'godichonne': 4, 'transandine': 0, 'sarmenteuse': 8, 'bovine': 0, 'nictitante': 0, 'canoniale': 3, 'ensacheuse': 2, 'louangeuse': 2, 'célibattante': 0, 'discutailleuse': 2, 'ocellée': 0, 'réflectrice': 1, 'extrudeuse': 2, 'focalisante': 0, 'psychomotricienne': 4, 'loseuse': 2, 'pistillée': 0, 'bouletée': 0, 'paniquante': 0, 'heaumière': 5, 'malentendante': 0, 'rémoise': 7, 'opticienne': 4, 'orléanaise': 7, 'rythmicienne': 4, 'grêleuse': 8, 'dévaliseuse': 2, 'polytraumatisée': 0, 'hiératisée': 0, 'spitante': 0, 'émotive': 6, 'dépendeuse': 2, 'anticipative': 6, 'appropriatrice': 1, 'cistercienne': 4, 'phosphatière': 5, "baha'ie": 0, 'catholicisante': 0, 'maraichine': 0, 'pigeonne': 4, 'euphorisante': 0, 'coccygienne': 4, 'rassurante': 0, 'ravineuse': 8, 'transocéanienne': 4, 'linnéenne': 4, 'trottante': 0, 'archétypale': 3, 'butineuse': 2, 'truqueuse': 2, 'orfévrée': 0, 'défoliante': 0, 'pleurale': 3, 'courtille': 4, 'duodécimale': 3, 'souffreteuse': 8, 'sino-australienne': 4, 'déformatrice': 1, 'fêtarde': 0, 'existante': 0, 'nigériane': 0, 'logicielle': 4, 'probabilisée': 0, 'disputeuse': 2, 'néronienne': 4, 'anticancéreuse': 8, 'attenante': 0, 'handballeuse': 2, 'fomenteuse': 2, 'italo-américaine': 0, 'luxuriante': 0, 'monofonctionnelle': 4, 'dartreuse': 8, 'retrayante': 0, 'rurbaine': 0, 'journalière': 5, 'retordeuse': 2, 'planteuse': 2, 'attrapeuse': 2, 'stomacale': 3, 'fécondante': 0, 'bidimensionnelle': 4, 'quincaillère': 5, 'gemmeuse': 2, 'flicarde': 0, 'rédactrice': 1, 'stabilisatrice': 1, 'dominante': 0, 'novatrice': 1, 'fondatrice': 1, 'chiridienne': 4, 'équipollente': 0, 'auriculée': 0, 'fluidifiante': 0, 'perturbante': 0, 'barbette': 4, 'lydienne': 4, 'glissante': 0, 'gondolière': 5, 'incompétente': 0, 'farinacée': 0, 'distinctive': 6, 'amarile': 0, 'bosnienne': 4, 'tricheuse': 2, 'encodeuse': 2, 'assaillante': 0, 'rotatrice': 1, 'recercelée': 0, 'rabâcheuse': 2, 'affluente': 0, 'blêmissante': 0, 'rubescente': 0, 'festive': 6, 'emmerdeuse': 2, 'surencombrée': 0, 'avant-courrière': 5, 'cotisante': 0, 'puritaine': 0, 'matricielle': 4, 'trachéotomisée': 0, 'diagonale': 3, 'balayeuse': 2, 'toiletteuse': 2, 'récognitive': 6, 'alcoolodépendante': 0, 'cotonnière': 5, 'ingrate': 0, 'présomptueuse': 8, 'marquise': 7, 'alcoolorésistante': 0, 'brodeuse': 2, 'soiffarde': 0, 'violatrice': 1, 'saigneuse': 8, 'culottière': 5, 'interreliée': 0, 'semoulière': 5, 'médicinale': 3, 'maxillofaciale': 3, 'thyristorisée': 0, 'quincaillière': 5, 'conteuse': 2, 'audacieuse': 8, 'bancheuse': 2, 'draineuse': 2, 'socioéducative': 6, 'théâtreuse': 8, 'minéralisatrice': 1, 'triathlonienne': 4, 'lingère': 5, 'acquisitive': 6, 'multivariée': 0, 'biduale': 3, 'tordeuse': 2, 'protégée': 0, 'loculée': 0, 'obturatrice': 1, 'unifoliée': 0, 'promotrice': 1, 'moribonde': 0, 'glaucomateuse': 8, 'rebmane': 0, 'hypercorrecte': 0, 'surfine': 0, 'segmentale': 3, 'avienne': 4, 'hibernale': 3, 'nauséabonde': 0, 'assurantielle': 4, 'thermidorienne': 4, 'tokharienne': 4, 'folioteuse': 2, 'facturière': 5, 'immémoriale': 3, 'franco-indonésienne': 4, 'basanée': 0, 'primordiale': 3, 'zozoteuse': 2, 'microlocale': 3, 'contreproductive': 6, 'renardée': 0, 'champenoise': 7, 'décrypteuse': 2, 'pédonculée': 0, 'rhétoricienne': 4, 'contiguë': 0, 'alcalinoterreuse': 8, 'opposée': 0, 'radioamatrice': 1, 'dépenaillée': 0, 'pyrrhonienne': 4, 'impulsive': 6, 'malvenante': 0, 'zwanzeuse': 2, 'semainière': 5, 'immobilière': 5, 'ascensionnelle': 4, 'jacasseuse': 2, 'insoumise': 7, 'vespérale': 3, 'seulette': 4, 'gymnasiale': 3, 'éducatrice': 1, 'troyenne': 4, 'cruciale': 3, 'diffusive': 6, 'soufflée': 0, 'gingivale': 3, 'criailleuse': 2, 'séminale': 3, 'ripailleuse': 2, 'roulottière': 5, 'exinscrite': 0, 'caissière': 5, 'poupine': 0, 'pragoise': 7, 'fruitière': 5, 'coquillère': 5, 'socioaffective': 6, 'euroise': 7, 'rémouleuse': 2, 'possessionnelle': 4, 'mononucléée': 0, 'surproductive': 6, 'surabondante': 0, 'bastillée': 0, 'coupée': 0, 'austronésienne': 4, 'redoublante': 0, 'pastorienne': 4, 'émotteuse': 2, 'assaillie': 0, 'pétulante': 0, 'missilière': 5, 'groupeuse': 2, 'mentonnière': 5, 'pendue': 0, 'déliquescente': 0, 'choyée': 0, 'subséquente': 0, 'brillante': 0, 'croustilleuse': 8, 'chainetière': 5, 'processive': 6, 'pitchounette': 4, 'funérale': 3, 'taulière': 5, 'peinarde': 0, 'totalisatrice': 1, 'tronçonneuse': 2, 'parlante': 0, 'immersive': 6, 'extra-humaine': 0, 'préfixale': 3, 'coronale': 3, 'métreuse': 2, 'coadministratrice': 1, 'balinaise': 7, 'trésorière': 5, 'haveuse': 2, 'compensatrice': 1, 'corrézienne': 4, 'fermentante': 0, 'folichonne': 4, 'pulsative': 6, 'oxydoréductrice': 1, 'chondrocostale': 3, 'oppositive': 6, 'tahitienne': 4, 'hachichine': 0, 'méridienne': 4, 'papilleuse': 8, 'cohéritière': 5, 'loyale': 3, 'enfroquée': 0, 'cireuse': 8, 'bigleuse': 8, 'stricte': 0, 'transpositrice': 1, 'pascale': 0, 'albuginée': 0, 'bisimpliciale': 3, 'subjonctive': 6, 'alvéolée': 0, 'atrière': 5, 'nécessiteuse': 8, 'convaincue': 0, 'énervée': 0, 'anticyclonale': 3, 'syrienne': 4, 'adaptative': 6, 'contingente': 0, 'présente': 0, 'bikeuse': 2, 'intraveineuse': 8, 'copieuse': 8, 'excellente': 0, 'cyberdépendante': 0, 'patriarcale': 3, 'boulinière': 5, 'accusatrice': 1, 'poltronne': 4, 'banlieusarde': 0, 'empotée': 0, 'inentamée': 0, 'occitanienne': 4, 'incrustante': 0, 'anguleuse': 8, 'bahreïnie': 0, 'binomiale': 3, 'attractrice': 1, 'innocente': 0, 'laryngienne': 4, 'dégénérative': 6, 'phalangienne': 4, 'casinotière': 5, 'lavante': 0, 'ozonée': 0, 'programmatrice': 1, 'luthérienne': 4, 'ordolibérale': 0, 'genevoise': 7, 'fondamentale': 3, 'clandestine': 0, 'olympienne': 4, 'enchaînée': 0, 'pondérale': 3, 'finistérienne': 4, 'soupière': 5, 'hyperémotive': 6, 'contremaîtresse': 13, 'pollicitante': 0, 'psychosomaticienne': 4, 'accusative': 6, 'cachottière': 5, 'houleuse': 8, 'flaireuse': 2, 'opérative': 6, 'compositionnelle': 4, 'meulière': 5, 'antipersonnelle': 4, 'désherbante': 0, 'évoluée': 0, 'irradiante': 0, 'plaignante': 0, 'alexandrine': 0, 'ambulante': 0, 'augustine': 0, 'franco-afghane': 0, 'rondelette': 4, 'bayésienne': 4, 'bruineuse': 8, 'piqueuse': 8, 'expulsée': 0, 'kanake': 0, 'éclateuse': 2, 'camuse': 7, 'déponente': 0, 'infernale': 3, 'déperditive': 6, 'réacquise': 7, 'nébuleuse': 8, 'paroissienne': 4, 'soûlonne': 4, 'inventrice': 1, 'syncopale': 3, 'eulérienne': 4, 'redondante': 0, 'fortunée': 0, 'post-industrielle': 4, 'bitumineuse': 8, 'espionne': 4, 'suspicieuse': 8, 'érythémateuse': 8, 'performative': 6, 'tréfileuse': 2, 'vermiculée': 0, 'petite': 0, 'armatrice': 1, 'estroprogestative': 6, 'épigée': 0, 'quartzeuse': 8, 'psychoéducatrice': 1, 'tellureuse': 8, 'dissipative': 6, 'béquillarde': 0, 'coadaptatrice': 1, 'anticoagulante': 0, 'augurale': 3, 'amoureuse': 8, 'chroniqueuse': 2, 'pustulée': 0, 'minette': 4, 'rongeuse': 2, 'abandonnatrice': 1, 'conglomérale': 3, 'apprêteuse': 2, 'danubienne': 4, 'celto-romaine': 0, 'tropho-microbienne': 4, 'psychomotrice': 1, 'abondée': 0, 'branchue': 0, 'déductive': 6, 'régénérative': 6, 'anticlinale': 3, 'rameuse': 8, 'polissonne': 4, 'galetteuse': 8, 'pfaffienne': 4, 'inclémente': 0, 'ténue': 0, 'franco-pakistanaise': 7, 'nargueuse': 2, 'aligneuse': 2, 'azérie': 0, 'amante': 0, 'surnaturelle': 4, 'expropriatrice': 1, 'hesbignonne': 4, 'napolitaine': 0, 'désignative': 6, 'partiale': 3, 'entière': 5, 'thermorégulatrice': 1, 'martienne': 4, 'bonnetière': 5, 'malsaine': 0, 'faignante': 0, 'bistrotière': 5, 'restante': 0, 'rétractrice': 1, 'oblative': 6, 'teinturière': 5, 'prostitutionnelle': 4, 'ammoniacée': 0, 'sartrienne': 4, 'radioactive': 6, 'séreuse': 8, 'résonante': 0, 'obsédée': 0, 'castratrice': 1, 'viseuse': 8, 'agioteuse': 2, 'thermisée': 0, 'colombienne': 4, 'autobronzante': 0, 'moulante': 0, 'contraposée': 0, 'clavelée': 0, 'possessive': 6, 'calomniatrice': 1, 'iodurée': 0, 'péridurale': 3, 'antifrançaise': 7, 'formosane': 0, 'soldeuse': 2, 'fécale': 3, 'ethmoïdale': 3, 'phonéticienne': 4, 'non-initiée': 0, 'prêtresse': 13, 'gazetière': 5, 'chapée': 0, 'anglo-japonaise': 7, 'modificative': 6, 'tremblotante': 0, 'édificatrice': 1, 'supra-humaine': 0, 'asexuelle': 4, 'parapublique': 11, 'psychoactive': 6, 'ravaudeuse': 2, 'pleurarde': 0, 'incirconcise': 7, 'athéromateuse': 8, 'mobilisante': 0, 'liquidative': 6, 'saônoise': 7, 'mignonnette': 4, 'suractive': 6, 'sultane': 0, 'arborisée': 0, 'grimacière': 5, 'équatoriale': 3, 'aigrelette': 4, 'futée': 0, 'américano-européenne': 4, 'mal-baisée': 0, 'frondeuse': 2, 'colonelle': 4, 'appelée': 0, 'acuminée': 0, 'mordeuse': 2, 'placière': 5, 'insaturée': 0, 'observatrice': 1, 'détraquée': 0, 'toscane': 0, 'endocrinienne': 4, 'velouteuse': 8, 'gâcheuse': 2, 'labiodentale': 3, 'mécatronicienne': 4, 'renaissante': 0, 'anglicane': 0, 'dentofaciale': 3, 'extraprofessionnelle': 4, 'salante': 0, 'batailleuse': 2, 'attractive': 6, 'écaillère': 5, 'extrémale': 3, 'subalpine': 0, 'écorceuse': 2, 'expressive': 6, 'dilapidatrice': 1, 'frotteuse': 2, 'parenthésée': 0, 'brailleuse': 2, 'cagoularde': 0, 'huitrière': 5, 'samarienne': 4, 'mildiousée': 0, 'contentive': 6, 'reproductrice': 1, 'puante': 0, 'faitière': 5, 'confédérative': 6, 'décalcifiante': 0, 'proéminente': 0, 'pillarde': 0, 'persévérante': 0, 'inactuelle': 4, 'wallonne': 4, 'résurrectionnelle': 4, 'épicrânienne': 4, 'expectorante': 0, 'jambière': 5, 'teufeuse': 2, 'oppressante': 0, 'dépréciatrice': 1, 'persécutrice': 1, 'mormone': 0, 'teutonne': 4, 'poissonneuse': 8, 'irrésignée': 0, 'bichonne': 4, 'émigrante': 0, 'archéenne': 4, 'cutanée': 0, 'brunissante': 0, 'vigésimale': 3, 'biquette': 4, 'tuante': 0, 'nilo-saharienne': 4, 'affine': 0, 'bicarrée': 0, 'tridentine': 0, 'dentue': 0, 'préceptrice': 1, 'barboteuse': 2, 'absorbante': 0, 'chevrière': 5, 'intracontinentale': 3, 'télévendeuse': 2, 'dravidienne': 4, 'éliminatrice': 1, 'jaboteuse': 2, 'contrebandière': 5, 'vigoureuse': 8, 'corticale': 3, 'solfatarienne': 4, 'membrue': 0, 'superlégère': 5, 'verdoyante': 0, 'buissonneuse': 8, 'fascisante': 0, 'pékinée': 0, 'fibromateuse': 8, 'pénétrante': 0, 'aigüe': 10, 'sévrienne': 4, 'centrafricaine': 0, 'ganguée': 0, 'dynamisante': 0, 'vitrificatrice': 1, 'diluante': 0, 'jennérienne': 4, 'figurante': 0, 'chaineuse': 2, 'imposante': 0, 'turgescente': 0, 'œdipienne': 4, 'convolutive': 6, 'éclopée': 0, 'franco-finlandaise': 7, 'préférentielle': 4, 'qualiticienne': 4, 'américano-néerlandaise': 7, 'décalqueuse': 2, 'bêtifiante': 0, 'osculatrice': 1, 'quantitative': 6, 'officière': 5, 'admonitrice': 1, 'poilue': 0, 'sismale': 3, 'hallucinante': 0, 'récapitulative': 6, 'verticale': 3, 'siffleuse': 2, 'chronométreuse': 2, 'archaïsante': 0, 'accidentée': 0, 'indépendante': 0, 'discontinue': 0, 'stabilisante': 0, 'accidentelle': 4, 'berlinoise': 7, 'gonflante': 0, 'iridienne': 4, 'sportive': 6, 'vénérienne': 4, 'équivalente': 0, 'monitrice': 1, 'inoffensive': 6, 'cévenole': 0, 'fluviale': 3, 'survolante': 0, 'judéo-chrétienne': 4, 'retardatrice': 1, 'expropriante': 0, 'vive': 6, 'processionnelle': 4, 'bredouilleuse': 2, 'jupitérienne': 4, 'franco-colombienne': 4, 'négro-africaine': 0, 'équitante': 0, 'concurrentielle': 4, 'vieille': 29, 'appareilleuse': 2, 'balafrée': 0, 'charnue': 0, 'cloutière': 5, 'superprédatrice': 1, 'nouveau-née': 0, 'antidétonante': 0, 'aciéreuse': 8, 'empileuse': 2, 'comitiale': 3, 'semi-manufacturée': 0, 'audioguidée': 0, 'pressante': 0, 'sommeilleuse': 8, 'guinéenne': 4, 'jointoyeuse': 2, 'mercurienne': 4, 'caulescente': 0, 'extra-forte': 0, 'lutteuse': 2, 'inquiète': 20, 'locutrice': 1, 'tumescente': 0, 'festoyeuse': 2, 'brutale': 3, 'optimale': 3, 'austro-française': 7, 'cartésienne': 4, 'militaro-industrielle': 4, 'instante': 0, 'prédécoupée': 0, 'liseuse': 2, 'babylonienne': 4, 'subulée': 0, 'cochère': 5, 'circumnavigatrice': 1, 'suppressive': 6, 'géopoliticienne': 4, 'pinéale': 3, 'rajeunisseuse': 2, 'médiévale': 3, 'ambrosienne': 4, 'saucissonneuse': 2, 'hyperréelle': 4, 'obtentrice': 1, 'absorptive': 6, 'séculière': 5, 'tousseuse': 2, 'crayeuse': 8, 'déchiffreuse': 2, 'intestine': 0, 'calleuse': 8, 'envoutée': 0, 'mosaïquée': 0, 'conversive': 6, 'incompréhensive': 6, 'carotteuse': 2, 'toxiinfectieuse': 8, 'confédérée': 0, 'pectinée': 0, 'catalogueuse': 2, 'rhino-pharyngienne': 4, 'vascularisée': 0, 'massicotière': 5, 'décélérée': 0, 'camphrée': 0, 'soldate': 0, 'forcenée': 0, 'ouvreuse': 2, 'oratrice': 1, 'rapporteuse': 2, 'enrouleuse': 2, 'liquidienne': 4, 'pétillante': 0, 'écumeuse': 8, 'prévaricatrice': 1, 'indiscutée': 0, 'cloisonnante': 0, 'mailleuse': 2, 'virilisante': 0, 'traîtreuse': 8, 'coécrite': 0, 'abbatiale': 3, 'semencière': 5, 'bourdonneuse': 2, 'luxueuse': 8, 'bêtatesteuse': 2, 'endivière': 5, 'haschischine': 0, 'primesautière': 5, 'usufruitière': 5, 'vulgarisatrice': 1, 'entrepreneuriale': 3, 'accompagnante': 0, 'trainarde': 0, 'marmotteuse': 2, 'anoblissante': 0, 'outragée': 0, 'mulâtresse': 13, 'cueilleuse': 2, 'psychostimulante': 0, 'piscicultrice': 1, 'pilosébacée': 0, 'mort-née': 0, 'tchadienne': 4, 'anti-aérienne': 4, 'boguée': 0, 'interlinguale': 3, 'bijoutière': 5, 'concessive': 6, 'éclatante': 0, 'inélégante': 0, 'tapante': 0, 'multinucléée': 0, 'zappeuse': 2, 'coépouse': 8, 'chaussante': 0, 'caponne': 4, 'tacticienne': 4, 'prépensionnée': 0, 'franco-roumaine': 0, 'briqueteuse': 2, 'rosière': 5, 'polytonale': 3, 'subsidiante': 0, 'miroitante': 0, 'retoucheuse': 2, 'reproductive': 6, 'componctueuse': 8, 'chagrinante': 0, 'voleuse': 2, 'percussive': 6, 'thermodynamicienne': 4, 'shampooineuse': 2, 'chelléenne': 4, 'mollassonne': 4, 'impatientante': 0, 'fécondatrice': 1, 'catarrhale': 3, 'bêtabloquante': 0, 'munichoise': 7, 'indo-aryenne': 4, 'dépensière': 5, 'cristalline': 0, 'nîmoise': 7, 'queutarde': 0, 'assoupissante': 0, 'paroissiale': 3, 'monophasée': 0, 'cigarière': 5, 'recasquante': 0, 'arrondisseuse': 2, 'fielleuse': 8, 'japonisante': 0, 'pesteuse': 8, 'agri-environnementale': 0, 'doucereuse': 8, 'viciatrice': 1, 'nommée': 0, 'grammairienne': 4, 'aïeule': 0, 'plombeuse': 8, 'partouzeuse': 2, 'banale': 3, 'irraisonnée': 0, 'prosternée': 0, 'composteuse': 2, 'sustentatrice': 1, 'combative': 6, 'javanaise': 7, 'sous-pubienne': 4, 'chilienne': 4, 'gobeline': 0, 'bismuthée': 0, 'biactive': 6, 'itinérante': 0, 'chipoteuse': 2, 'ottomane': 0, 'bigoudène': 17, 'artificielle': 4, 'rabatteuse': 2, 'sémillante': 0, 'sodée': 0, 'approbative': 6, 'enrhumée': 0, 'défricheuse': 2, 'dodue': 0, 'heideggerienne': 4, 'enchainée': 0, 'paralysée': 0, 'intermittente': 0, 'altérante': 0, 'chrismale': 3, 'sud-coréenne': 4, 'gardoise': 7, 'distancielle': 4, 'gradeuse': 2, 'hernieuse': 8, 'nitrificatrice': 1, 'centralienne': 4, 'nanisante': 0, 'succenturiée': 0, 'doucette': 4, 'sabotière': 5, 'sénatoriale': 3, 'résurgente': 0, 'éboueuse': 2, 'chrétienne': 4, 'grenue': 0, 'sensorimotrice': 1, 'épurative': 6, 'glaçante': 0, 'uvale': 3, 'dérangeuse': 2, 'joufflue': 0, 'biphasée': 0, 'seychelloise': 7, 'pêcheuse': 2, 'angineuse': 8, 'attendrissante': 0, 'sénatrice': 1, 'parpaillote': 0, 'resarcelée': 0, 'métaxiale': 3, 'disciplinée': 0, 'votive': 6, 'causeuse': 2, 'ostréicultrice': 1, 'invocatrice': 1, 'supranormale': 3, 'ondulante': 0, 'covalente': 0, 'danienne': 4, 'prospectrice': 1, 'gazonneuse': 8, 'bifocale': 3, 'thermocollante': 0, 'mécontente': 0, 'affabulatrice': 1, 'consternante': 0, 'trivalente': 0, 'tranquillisante': 0, 'meusienne': 4, 'coïncidente': 0, 'inconditionnelle': 4, 'régisseuse': 2, 'sarthoise': 7, 'supercavitante': 0, 'spiritueuse': 8, 'espagnole': 0, 'précitée': 0, 'spécificative': 6, 'herborisatrice': 1, 'écrasante': 0, 'duodénale': 3, 'wallingante': 0, 'musicienne': 4, 'marqueuse': 2, 'acidifiante': 0, 'médicalisante': 0, 'encroûtante': 0, 'basse-lissière': 5, 'majorante': 0, 'postulatrice': 1, 'miauleuse': 2, 'ultracourte': 0, 'rappeuse': 2, 'tonitruante': 0, 'nasillarde': 0, 'natoufienne': 4, 'contraignante': 0, 'immodérée': 0, 'métaphysicienne': 4, 'cancanière': 5, 'qatarie': 0, 'brigadière': 5, 'nestorienne': 4, 'extra-européenne': 4, 'swahélie': 0, 'avicultrice': 1, 'ouvrière': 5, 'réorganisatrice': 1, 'carbonylée': 0, 'triomphatrice': 1, 'inentendue': 0, 'transmutatrice': 1, 'pétrinienne': 4, 'accommodatrice': 1, 'cacaotière': 5, 'jungienne': 4, 'buteuse': 2, 'offensive': 6, 'piquante': 0, 'magistrale': 3, 'consolatrice': 1, 'vénitienne': 4, 'psychoéducative': 6, 'accoucheuse': 2, 'gondolante': 0, 'ambisexuée': 0, 'rimailleuse': 2, 'démonteuse': 2, 'constitutionnelle': 4, 'panière': 5, 'huîtrière': 5, 'turonienne': 4, 'adscrite': 0, 'protéinée': 0, 'prématurée': 0, 'résultative': 6, 'vitrière': 5, 'dégraissante': 0, 'mauritanienne': 4, 'bucheuse': 2, 'émulatrice': 1, 'canulante': 0, 'québécoise': 7, 'dominée': 0, 'coobligée': 0, 'relative': 6, 'impartiale': 3, 'antécambrienne': 4, 'indéchiffrée': 0, 'conspiratrice': 1, 'effrénée': 0, 'raccommodeuse': 2, 'jubilante': 0, 'chassieuse': 8, 'zététicienne': 4, 'faiblissante': 0, 'dineuse': 2, 'devancière': 5, 'conservative': 6, 'exploratrice': 1, 'loculeuse': 8, 'verglacée': 0, 'antinazie': 0, 'bêta-bloquante': 0, 'autoadaptative': 6, 'discourtoise': 7, 'perçante': 0, 'glaceuse': 8, 'pomicultrice': 1, 'vénale': 3, 'palléale': 3, 'protonée': 0, 'essayeuse': 2, 'politico-sociale': 3, 'nuitarde': 0, 'prête': 0, 'bûcheronne': 4, 'nominale': 3, 'participiale': 3, 'affidée': 0, 'infranationale': 3, 'bouillonnante': 0, 'lyrée': 0, 'encolleuse': 2, 'ligérienne': 4, 'dénigrante': 0, 'arithméticienne': 4, 'videuse': 2, 'géniale': 3, 'incitative': 6, 'estimative': 6, 'abyssine': 0, 'afghano-pakistanaise': 7, 'sienne': 4, 'castillane': 0, 'complète': 20, 'nicheuse': 2, 'imbrûlée': 0, 'expectante': 0, 'créatrice': 1, 'anglo-chinoise': 7, 'chancelante': 0, 'palmatiséquée': 0, 'argilosiliceuse': 8, 'caquetante': 0, 'agroforestière': 5, 'composeuse': 2, 'nycthémérale': 3, 'coûtante': 0, 'effarante': 0, 'inaltérée': 0, 'sauveuse': 2, 'opportune': 0, 'matineuse': 8, 'archiprêtresse': 13, 'alcyonienne': 4, 'galvanisante': 0, 'rétrécissante': 0, 'confédérale': 3, 'blondine': 0, 'braseuse': 2, 'hongroyeuse': 2, 'imitative': 6, 'antihermitienne': 4, 'légère': 5, 'malfaitrice': 1, 'casanière': 5, 'accélératrice': 1, 'flippante': 0, 'non-voyante': 0, 'relayeuse': 2, 'ineffective': 6, 'endettée': 0, 'cancéreuse': 8, 'frisotante': 0, 'rockeuse': 2, 'adjective': 6, 'transgressive': 6, 'chartraine': 0, 'bipartie': 0, 'légale': 3, 'bienpensante': 0, 'clocharde': 0, 'vilipendeuse': 2, 'conchoïdale': 3, 'compositrice': 1, 'franco-française': 7, 'diététicienne': 4, 'chauffeuse': 2, 'dotale': 3, 'fabulatrice': 1, 'désagrégeante': 0, 'rassembleuse': 2, 'inconquise': 7, 'imprécise': 7, 'vasodilatatrice': 1, 'fraudeuse': 2, 'laxative': 6, 'chiante': 0, 'exilée': 0, 'squirreuse': 8, 'guivrée': 0, 'grognante': 0, 'argumentatrice': 1, 'péquenotte': 4, 'cartilagineuse': 8, 'agréeuse': 2, 'délocalisante': 0, 'taboue': 0, 'semi-développée': 0, 'hypochloreuse': 8, 'levrettée': 0, 'ancestrale': 3, 'rabroueuse': 2, 'goudronneuse': 8, 'gâteuse': 8, 'adénovirale': 3, 'euscarienne': 4, 'arabisante': 0, 'mésiale': 3, 'byzantine': 0, 'décurrente': 0, 'intercurrente': 0, 'cardinale': 3, 'récurrente': 0, 'ombrienne': 4, 'téléopératrice': 1, 'automotrice': 1, 'sulfurisée': 0, 'ébouriffante': 0, 'antiadhésive': 6, 'dégourdissante': 0, 'équarrisseuse': 2, 'conjonctivale': 3, 'entérorénale': 3, 'alcoolo-résistante': 0, 'sinapisée': 0, 'néonazie': 0, 'béotienne': 4, 'caloporteuse': 2, 'soule': 0, 'sénatorienne': 4, 'tutorale': 0, 'épatante': 0, 'flambante': 0, 'ourdoue': 0, 'raisonnante': 0, 'animalière': 5, 'surcomposée': 0, 'disparue': 0, 'allumetière': 5, 'fourragère': 5, 'charentaise': 7, 'adhésive': 6, 'tourterelle': 9, 'mulassière': 5, 'préadolescente': 0, 'maladroite': 0, 'adoptive': 6, 'cycloïdale': 3, 'marieuse': 2, 'offrante': 0, 'commise': 7, 'nivéale': 3, 'excommuniée': 0, 'contraventionnelle': 4, 'virtuelle': 4, 'filtrante': 0, 'démêlante': 0, 'brasseuse': 2, 'morutière': 5, 'débarbante': 0, 'poissonnière': 5, 'géante': 0, 'intervenante': 0, 'voyante': 0, 'jurassienne': 4, 'désœuvrée': 0, 'limougeaude': 0, 'tondue': 0, 'réale': 3, 'ammoniacale': 3, 'bardeuse': 2, 'primodélinquante': 0, 'intraeuropéenne': 4, 'dépénalisante': 0, 'pentathlonienne': 4, 'bourbonienne': 4, 'réhydratante': 0, 'surinformée': 0, 'courtaude': 0, 'valencienne': 4, 'coxale': 3, 'chaldéenne': 4, 'intra-européenne': 4, 'naisseuse': 2, 'énonciative': 6, 'tridentée': 0, 'strombolienne': 4, 'albuminée': 0, 'versificatrice': 1, 'mésadaptée': 0, 'pélagienne': 4, 'possessionnée': 0, 'réprouvée': 0, 'infortunée': 0, 'cogneuse': 2, 'roulante': 0, 'coquelucheuse': 8, 'chieuse': 2, 'grignarde': 0, 'restrictive': 6, 'sclérosante': 0, 'gallinacée': 0, 'outrecuidante': 0, 'malteuse': 2, 'chélatrice': 1, 'obstétricale': 3, 'salonnière': 5, 'tanneuse': 2, 'désespérante': 0, 'nietzschéenne': 4, 'validatrice': 1, 'dénicheuse': 2, 'cordée': 0, 'indécise': 7, 'crémière': 5, 'injustifiée': 0, 'confiturière': 5, 'goûteuse': 8, 'accommodante': 0, 'araméenne': 4, 'russienne': 4, 'postérieure': 0, 'obséquieuse': 8, 'éplorée': 0, 'protubérante': 0, 'circonspecte': 0, 'empaqueteuse': 2, 'imprimitive': 6, 'consultante': 0, 'récidivante': 0, 'intracérébrale': 3, 'gestante': 0, 'transpartisane': 0, 'dentale': 3, 'dépendante': 0, 'huileuse': 8, 'enfançonne': 4, 'canado-américaine': 0, 'abyssinienne': 4, 'crispante': 0, 'laitière': 5, 'rigoleuse': 2, 'encombrante': 0, 'non-directive': 6, 'bidouilleuse': 2, 'foreuse': 2, 'griffeuse': 2, 'assistante': 0, 'récitante': 0, 'contre-électromotrice': 1, 'interdimensionnelle': 4, 'coïnculpée': 0, 'coexistante': 0, 'codétentrice': 1, 'crapoussine': 0, 'trafiqueuse': 2, 'humiliante': 0, 'reminéralisante': 0, 'amaigrissante': 0, 'géohistorienne': 4, 'châtelperronienne': 4, 'ornementale': 3, 'coorbitale': 3, 'triomphante': 0, 'gazouillante': 0, 'concluante': 0, 'contreperçante': 0, 'épuratrice': 1, 'coopératrice': 1, 'artificieuse': 8, 'éburonne': 4, 'terrifiante': 0, 'afro-américaine': 0, 'interfaciale': 0, 'elzévirienne': 4, 'développeuse': 2, 'cimentière': 5, 'exponentielle': 4, 'sous-maîtresse': 13, 'bathyale': 3, 'diplômée': 0, 'russo-chinoise': 7, 'téléconduite': 0, 'transfiguratrice': 1, 'lituanienne': 4, 'bafouilleuse': 2, 'anglo-espagnole': 0, 'latitudinale': 3, 'immigrante': 0, 'nutritive': 6, 'stratificationnelle': 4, 'rétinienne': 4, 'mortaiseuse': 2, 'newtonienne': 4, 'coemployeuse': 2, 'réduplicative': 6, 'vrombissante': 0, 'épaississante': 0, 'unguéale': 3, 'franciscaine': 0, 'bulleuse': 8, 'néerlandaise': 7, 'transfinie': 0, 'réfugiée': 0, 'profuse': 7, 'virginale': 3, 'béguë': 0, 'rôdeuse': 2, 'céphalo-rachidienne': 4, 'marketeuse': 2, 'correcte': 0, 'carmélitaine': 0, 'ultrafine': 0, 'incitatrice': 1, 'conducto-convective': 6, 'censée': 0, 'étourdissante': 0, 'agrégée': 0, 'sincipitale': 3, 'ardente': 0, 'cinghalaise': 7, 'radiotélévisée': 0, 'destinatrice': 1, 'thermale': 3, 'audio-visuelle': 4, 'pistarde': 0, 'moucheuse': 2, 'testatrice': 1, 'intolérante': 0, 'hypnotiseuse': 2, 'flottante': 0, 'photoreportrice': 1, 'prétorienne': 4, 'vocalisatrice': 1, 'litigieuse': 8, 'polarisatrice': 1, 'hivernale': 3, 'sorbonnarde': 0, 'potestative': 6, 'meneuse': 2, 'sacramentelle': 4, 'diédrale': 3, 'sondeuse': 2, 'substantive': 6, 'performeuse': 2, 'négociante': 0, 'anglo-suédoise': 7, 'critiqueuse': 2, 'croûteuse': 8, 'différentielle': 4, 'saurisseuse': 2, 'fruitée': 0, 'armoricaine': 0, 'coorganisatrice': 1, 'brûlante': 0, 'antibiorésistante': 0, 'lactéale': 3, 'saharienne': 4, 'dérangeante': 0, 'galante': 0, 'exploiteuse': 2, 'émouvante': 0, 'réceptrice': 1, 'feignante': 0, 'cadastrale': 3, 'cursive': 6, 'efficiente': 0, 'embarrassante': 0, 'aigrettée': 0, 'révolutive': 6, 'oiseleuse': 2, 'moyenne': 4, 'contractante': 0, 'grillette': 4, 'amirale': 3, 'inhibée': 0, 'conjecturale': 3, 'transfrontalière': 5, 'franco-irakienne': 4, 'matifiante': 0, 'celluleuse': 8, 'plaisancière': 5, 'vile': 0, 'inemployée': 0, 'annonciatrice': 1, 'convertisseuse': 2, 'fondeuse': 2, 'kosovare': 0, 'cybersquatteuse': 2, 'concupiscente': 0, 'succulente': 0, 'multiculturelle': 4, 'plurilatérale': 3, 'biparentale': 3, 'inertielle': 4, 'cuisinière': 5, 'autoévaluante': 0, 'appréhensive': 6, 'chéloïdienne': 4, 'flapie': 0, 'balancière': 5, 'aquicultrice': 1, 'plurivalente': 0, 'associative': 6, 'murale': 3, 'photorésistante': 0, 'mandarine': 0, 'anticommutative': 6, 'vinificatrice': 1, 'richarde': 0, 'courtière': 5, 'pipeuse': 2, 'hypotendue': 0, 'mécanicienne': 4, 'concessionnelle': 4, 'embryonnée': 0, 'rêvasseuse': 2, 'hamiltonienne': 4, 'démonstratrice': 1, 'horodatrice': 1, 'dauphinoise': 7, 'abeillère': 5, 'fomentatrice': 1, 'arachnéenne': 4, 'théière': 5, 'craniofaciale': 3, 'mal-famée': 0, 'préparatrice': 1, 'consolante': 0, 'mictionnelle': 4, 'coronarienne': 4, 'sonnante': 0, 'bluffeuse': 2, 'boucholeuse': 2, 'soufreuse': 2, 'embue': 0, 'franco-libanaise': 7, 'court-vêtue': 0, 'unidirectionnelle': 4, 'éradicatrice': 1, 'postière': 5, 'déodorante': 0, 'émondeuse': 2, 'boudeuse': 2, 'flatteuse': 2, 'codemanderesse': 14, 'prétendante': 0, 'portale': 3, 'euro-méditerranéenne': 4, 'highlandeuse': 2, 'adiposogénitale': 3, 'hormonale': 3, 'pocharde': 0, 'mélodieuse': 8, 'socialisatrice': 1, 'institutionnelle': 4, 'maxillo-faciale': 3, 'claquante': 0, 'coparentale': 3, 'archi-fausse': 12, 'traceuse': 2, 'polylexicale': 3, 'herminée': 0, 'ronchonne': 4, 'sommatrice': 1, 'protestante': 0, 'primoaccédante': 0, 'sacro-sainte': 0, 'marteleuse': 2, 'extérieure': 0, 'affamante': 0, 'célébrante': 0, 'simplificatrice': 1, 'nancéienne': 4, 'azotée': 0, 'enlumineuse': 2, 'spiralée': 0, 'distrayante': 0, 'harcelante': 0, 'angevine': 0, 'saoule': 0, 'escrimeuse': 2, 'versaillaise': 7, 'inviteuse': 2, 'intestinale': 3, 'pakistanaise': 7, 'expérimentale': 3, 'ultra-plate': 0, 'roturière': 5, 'éjective': 6, 'latine': 0, 'rogneuse': 2, 'inamicale': 3, 'bulbeuse': 8, 'végétative': 6, 'convoyeuse': 2, 'vocationnelle': 4, 'jambée': 0, 'érosive': 6, 'barytée': 0, 'disetteuse': 8, 'gouelle': 4, 'gouverneure': 0, 'avantageuse': 8, 'greffière': 5, 'coagulante': 0, 'interastrale': 3, 'artésienne': 4, 'semi-ouvrée': 0, 'minorative': 6, 'cubaine': 0, 'mareyeuse': 2, 'flambeuse': 2, 'acuponctrice': 1, 'intracrânienne': 4, 'biquotidienne': 4, 'gothe': 0, 'florale': 3, 'malséante': 0, 'contente': 0, 'mienne': 4, 'gallo-romane': 0, 'musarde': 0, 'hyperfocale': 3, 'américano-danoise': 7, 'conclusive': 6, 'mireuse': 2, 'variante': 0, 'insultée': 0, 'visionneuse': 2, 'spiroïdale': 3, 'trisectrice': 1, 'traînarde': 0, 'licencieuse': 8, 'lysosomiale': 3, 'assimilatrice': 1, 'fourvoyante': 0, 'déblayeuse': 2, 'douanière': 5, 'parodontale': 3, 'cardiale': 3, 'geignarde': 0, 'rétroéclairée': 0, 'tarsienne': 4, 'opacifiante': 0, 'franco-turque': 11, 'fameuse': 8, 'cartomancienne': 4, 'morbihannaise': 7, 'excitante': 0, 'applaudisseuse': 2, 'affréteuse': 2, 'inimitée': 0, 'excito-motrice': 1, 'équinoxiale': 3, 'malavisée': 0, 'sauvagine': 0, 'blessante': 0, 'flétrissante': 0, 'fruiticultrice': 1, 'pudibonde': 0, 'américaine': 0, 'graveleuse': 8, 'ultraviolette': 4, 'maximale': 3, 'flacheuse': 8, 'architravée': 0, 'amorale': 3, 'diocésaine': 0, 'vésico-utérine': 0, 'carpicultrice': 1, 'germaine': 0, 'écolière': 5, 'hardie': 0, 'tondeuse': 2, 'anesthésiée': 0, 'adulescente': 0, 'bilatérale': 3, 'pesante': 0, 'naufragée': 0, 'dégénérescente': 0, 'cossue': 0, 'simulatrice': 1, 'perquisitionnée': 0, 'vitale': 3, 'biréfringente': 0, 'copulative': 6, 'juteuse': 8, 'trochléenne': 4, 'nosocomiale': 3, 'semi-précieuse': 8, 'approchante': 0, 'bassecourière': 5, 'finnoise': 7, 'mielleuse': 8, 'caramélée': 0, 'harkie': 0, 'tunisienne': 4, 'régatière': 5, 'paonne': 4, 'bienséante': 0, 'classificatrice': 1, 'néo-zélandaise': 7, 'luthière': 5, 'échevinale': 3, 'marchandeuse': 2, 'bicipitale': 3, 'frioulane': 0, 'bouseuse': 8, 'éventée': 0, 'banquière': 5, 'déclinante': 0, 'murie': 0, 'céréalicultrice': 1, 'lisseuse': 2, 'sauveteuse': 2, 'paripennée': 0, 'stanneuse': 8, 'pétersbourgeoise': 7, 'hiatale': 3, 'globale': 3, 'ruminante': 0, 'anglo-danoise': 7, 'auvergnate': 0, 'dipneumonée': 0, 'bordelaise': 7, 'buccogénitale': 3, 'déchaumeuse': 2, 'anxieuse': 8, 'laotienne': 4, 'tonale': 0, 'obsédante': 0, 'raideuse': 2, 'caractérielle': 4, 'lanugineuse': 8, 'chaosienne': 4, 'oléfiante': 0, 'iranienne': 4, 'acéteuse': 8, 'préemballée': 0, 'néocorticale': 3, 'théoricienne': 4, 'territoriale': 3, 'échauffante': 0, 'chatoyante': 0, 'outrageuse': 8, 'écotée': 0, 'flexitarienne': 4, 'louviéroise': 7, 'dirimante': 0, 'tripatouilleuse': 2, 'enfonceuse': 2, 'mornée': 0, 'passionnée': 0, 'humorale': 3, 'délictueuse': 8, 'translative': 6, 'inviolée': 0, 'antéro-postérieure': 0, 'tricamérale': 3, 'discuteuse': 2, 'dure': 0, 'crêpelée': 0, 'liquéfiante': 0, 'native': 6, 'vernisseuse': 2, 'inscrivante': 0, 'pluridimensionnelle': 4, 'transférentielle': 4, 'semeuse': 2, 'gardienne': 4, 'justicière': 5, 'galopeuse': 2, 'rouanne': 4, 'convergente': 0, 'parachutale': 3, 'convaincante': 0, 'traumatisante': 0, 'rhénane': 0, 'princesse': 13, 'somalienne': 4, 'méprisée': 0, 'auto-réalisatrice': 1, 'déconstruisante': 0, 'interdépendante': 0, 'norvégienne': 4, 'intertextuelle': 4, 'légumineuse': 8, 'insignifiante': 0, 'ennéagonale': 3, 'stalinienne': 4, 'organisatrice': 1, 'contraceptive': 6, 'pataphysicienne': 4, 'hallucinée': 0, 'vasculeuse': 8, 'hydrurée': 0, 'sondagière': 5, 'seigneuriale': 3, 'agglutinante': 0, 'pommée': 0, 'tradipraticienne': 4, 'bifurquée': 0, 'infiltrée': 0, 'villafranchienne': 4, 'effaceuse': 2, 'naissante': 0, 'synanthérée': 0, 'oulipienne': 4, 'omnipraticienne': 4, 'processuelle': 4, 'pipelette': 4, 'haline': 0, 'mouvante': 0, 'turbulente': 0, 'intrarachidienne': 4, 'aiguiseuse': 2, 'explosive': 6, 'léonarde': 0, 'enjambeuse': 2, 'nord-vietnamienne': 4, 'coupante': 0, 'néo-libérale': 3, 'formatrice': 1, 'revendicative': 6, 'raquetteuse': 2, 'sortante': 0, 'caporale': 3, 'peseuse': 2, 'programmeuse': 2, 'lumineuse': 8, 'préventive': 6, 'chipeuse': 2, 'hyposodée': 0, 'superordonnée': 0, 'pastilleuse': 2, 'babysitteuse': 2, 'numérale': 3, 'contuse': 7, 'grappilleuse': 2, 'inhumaine': 0, 'baladeuse': 2, 'cogniticienne': 4, 'carpienne': 4, 'québecoise': 7, 'pécheresse': 14, 'inoubliée': 0, 'américano-irlandaise': 7, 'cambrioleuse': 2, 'vogoule': 0, 'assureuse': 2, 'stipitée': 0, 'soulante': 0, 'photocompositrice': 1, 'surdouée': 0, 'collatérale': 3, 'privée': 0, 'conductive': 6, 'fragrante': 0, 'plâtreuse': 8, 'percheuse': 2, 'échiquéenne': 4, 'publique': 11, 'martiale': 3, 'marmiteuse': 8, 'explosée': 0, 'dysfonctionnelle': 4, 'asociale': 3, 'bioluminescente': 0, 'gréeuse': 2, 'féculière': 5, 'stylisticienne': 4, 'pantropicale': 3, 'certaine': 0, 'pythienne': 4, 'regardeuse': 2, 'tourière': 5, 'fesseuse': 2, 'osseuse': 8, 'comateuse': 8, 'khédivale': 3, 'hydrominérale': 3, 'exempte': 0, 'féroïenne': 4, 'coréalisatrice': 1, 'sclérifiante': 0, 'uruguayenne': 4, 'légumière': 5, 'délibérative': 6, 'vapoteuse': 2, 'trotteuse': 2, 'consultative': 6, 'brulante': 0, 'franco-espagnole': 0, 'sableuse': 8, 'clonale': 3, 'additionnelle': 4, 'manœuvrière': 5, 'absolutive': 6, 'sibilante': 0, 'gonzesse': 13, 'interpellée': 0, 'trifouilleuse': 2, 'bivaluée': 0, 'floconneuse': 8, 'dénominative': 6, 'pétrarquisante': 0, 'longue': 4, 'arêtière': 5, 'circulante': 0, 'herculéenne': 4, 'eurodéputée': 0, 'fricative': 6, 'téléassistante': 0, 'fongueuse': 8, 'scrupuleuse': 8, 'écocertifiée': 0, 'braqueuse': 2, 'inexaucée': 0, 'socioculturelle': 4, 'amodiatrice': 1, 'géophysicienne': 4, 'disruptive': 6, 'polylobée': 0, 'grande': 0, 'rapiate': 0, 'vaudoise': 7, 'abélienne': 4, 'parqueuse': 2, 'goitreuse': 8, 'arénacée': 0, 'extrafine': 0, 'trébuchante': 0, 'multispectrale': 3, 'largueuse': 2, 'relutive': 6, 'manageuse': 2, 'archidiocésaine': 0, 'marcescente': 0, 'kinoise': 7, 'ancienne': 4, 'pronatrice': 1, 'charronne': 4, 'respectueuse': 8, 'affixée': 0, 'chanteuse': 2, 'solière': 5, 'exhilarante': 0, 'froussarde': 0, 'drainante': 0, 'piqueniqueuse': 2, 'rancuneuse': 8, 'torrentueuse': 8, 'prêteuse': 2, 'brumeuse': 8, 'germano-américaine': 0, 'pétroleuse': 2, 'émotionnelle': 4, 'résultante': 0, 'boraine': 0, 'harmonieuse': 8, 'bourdonnée': 0, 'lithinée': 0, 'illative': 6, 'haïtienne': 4, 'profonde': 0, 'actrice': 1, 'chouineuse': 2, 'attristante': 0, 'cabote': 0, 'parleuse': 2, 'inopportune': 0, 'insultante': 0, 'parachutée': 0, 'cafetière': 5, 'vaginale': 3, 'renouvelante': 0, 'fonctionnelle': 4, 'irako-syrienne': 4, 'pataude': 0, 'ariégeoise': 7, 'myrmidone': 0, 'glougloutante': 0, 'transparente': 0, 'preneuse': 2, 'bonnarde': 0, 'experte': 0, 'joaillière': 5, 'cathédrale': 3, 'lécheuse': 2, 'australo-néo-zélandaise': 7, 'alizée': 0, 'lamaneuse': 2, 'tavernière': 5, 'égayante': 0, 'sud-vietnamienne': 4, 'muette': 4, 'cafteuse': 2, 'saine': 0, 'pétiolée': 0, 'épidurale': 3, 'couvreuse': 2, 'venante': 0, 'fragilisante': 0, 'résomptive': 6, 'prestigieuse': 8, 'affronteuse': 2, 'ensorceleuse': 2, 'fructicultrice': 1, 'marneuse': 8, 'historienne': 4, 'hacheuse': 2, 'déstabilisante': 0, 'piétonnière': 5, 'sanctificatrice': 1, 'agrammaticale': 3, 'démentielle': 4, 'anti-microbienne': 4, 'corailleuse': 2, 'würmienne': 4, 'sommeillante': 0, 'équilibreuse': 2, 'hircine': 0, 'séparative': 6, 'hervienne': 4, 'accréditrice': 1, 'pleurnicharde': 0, 'chuchotante': 0, 'dispendieuse': 8, 'carrée': 0, 'scandalisée': 0, 'maligne': 19, 'lézarde': 0, 'botswanaise': 7, 'désarmante': 0, 'détractrice': 1, 'slalomeuse': 2, 'dégivrante': 0, 'bileuse': 8, 'extra-territoriale': 3, 'friponne': 4, 'montagnarde': 0, 'affective': 6, 'modale': 3, 'astrophysicienne': 4, 'écopaysagère': 5, 'océanienne': 4, 'galiléenne': 4, 'affranchisseuse': 2, 'indicatrice': 1, 'bédouine': 0, 'préoccupante': 0, 'gravettienne': 4, 'répugnante': 0, 'pollinisatrice': 1, 'excrémenteuse': 8, 'jetsetteuse': 2, 'divinatrice': 1, 'moutonnante': 0, 'gustative': 6, 'tétanisante': 0, 'syncytiale': 3, 'certifiante': 0, 'navigatrice': 1, 'tumorale': 3, 'laborieuse': 8, 'coursière': 5, 'révoltante': 0, 'lacédémonienne': 4, 'néozélandaise': 7, 'plâtrière': 5, 'alkylante': 0, 'adoucissante': 0, 'intégrodifférentielle': 4, 'subtropicale': 3, 'maltraitante': 0, 'manducatrice': 1, 'ébouleuse': 8, 'figurative': 6, 'compulsive': 6, 'picturale': 3, 'donatrice': 1, 'haversienne': 4, 'confraternelle': 4, 'pyramidée': 0, 'erronée': 0, 'néo-grecque': 25, 'modelante': 0, 'cinglée': 0, 'faisandière': 5, 'synodale': 3, 'pygméenne': 4, 'éolienne': 4, 'maïsicultrice': 1, 'inconstante': 0, 'haïe': 0, 'abrogative': 6, 'moussante': 0, 'lieuse': 2, 'ventrue': 0, 'supraconductrice': 1, 'soudière': 5, 'inconventionnelle': 4, 'fléchissante': 0, 'débatteuse': 2, 'nominatrice': 1, 'assonante': 0, 'autotractée': 0, 'hasardeuse': 8, 'miraculeuse': 8, 'tullière': 5, 'pariétale': 3, 'apprentie': 0, 'dolosive': 6, 'pluvio-nivale': 3, 'renarde': 0, 'bernardine': 0, 'communarde': 0, 'maximisatrice': 1, 'pâlotte': 4, 'terraquée': 0, 'géothermale': 3, 'boutonnière': 5, 'courte': 0, 'coléreuse': 8, 'pourchassée': 0, 'concitoyenne': 4, 'décérébrante': 0, 'décadente': 0, 'recycleuse': 2, 'commune': 0, 'ferblantière': 5, 'logeuse': 2, 'idéelle': 4, 'hérissonne': 4, 'comparatrice': 1, 'séductrice': 1, 'diverse': 7, 'décapante': 0, 'prégénitale': 3, 'putrescente': 0, 'bananière': 5, 'distributionnelle': 4, 'musculeuse': 8, 'afférente': 0, 'frisonne': 4, 'générative': 6, 'regimbeuse': 2, 'maroquinière': 5, 'blagueuse': 2, 'braconnière': 5, 'patineuse': 2, 'tripoteuse': 2, 'antébrachiale': 3, 'consciencieuse': 8, 'révélatrice': 1, 'tamiseuse': 2, 'kantienne': 4, 'furibarde': 0, 'cantonaise': 7, 'caducifoliée': 0, 'tournante': 0, 'transitionnelle': 4, 'contemptrice': 1, 'réactrice': 1, 'joyeuse': 8, 'neurale': 3, 'romanisante': 0, 'infoutue': 0, 'rectificative': 6, 'gluante': 0, 'engageante': 0, 'œdémateuse': 8, 'intuitive': 6, 'éburnéenne': 4, 'biseauteuse': 2, 'percutante': 0, 'affouagère': 5, 'marginale': 3, 'côtelée': 0, 'inexploitée': 0, 'lianescente': 0, 'dampmartoise': 7, 'cogérante': 0, 'ultramontaine': 0, 'hibernante': 0, 'feinteuse': 2, 'revive': 6, 'inter-institutionnelle': 4, 'défenderesse': 14, 'féminisante': 0, 'distante': 0, 'phéromonale': 3, 'neuroendocrinienne': 4, 'désodorisante': 0, 'matelote': 0, 'keynésienne': 4, 'enquiquinante': 0, 'spatio-temporelle': 4, 'expansée': 0, 'semi-chenillée': 0, 'tripartie': 0, 'lilloise': 7, 'agrégative': 6, 'intégrante': 0, 'calandreuse': 2, 'museuse': 2, 'florissante': 0, 'réfractrice': 1, 'blanchisseuse': 2, 'déficiente': 0, 'onusienne': 4, 'planquée': 0, 'massière': 5, 'miséreuse': 8, 'clitoridienne': 4, 'valaisanne': 4, 'abdomino-génitale': 3, 'sélectionneuse': 2, 'méfiante': 0, 'incontrôlée': 0, 'ensevelisseuse': 2, 'labiale': 3, 'malandreuse': 8, 'népérienne': 4, 'morfondue': 0, 'songeuse': 2, 'mosane': 0, 'venimeuse': 8, 'inhabituelle': 4, 'diablesse': 13, 'informationnelle': 4, 'fluctuante': 0, 'monovalente': 0, 'intruse': 7, 'révérende': 0, 'gammée': 0, 'covariante': 0, 'truffière': 5, 'pétreuse': 8, 'rachidienne': 4, 'blédarde': 0, 'détartrante': 0, 'terminale': 3, 'régente': 0, 'franco-québecoise': 7, 'irrigatrice': 1, 'grassouillette': 4, 'ombilicale': 3, 'vanneuse': 2, 'aéronavale': 0, 'gravillonneuse': 2, 'colleuse': 2, 'astringente': 0, 'vilaine': 0, 'cousine': 0, 'boutiquière': 5, 'irradiée': 0, 'embobineuse': 2, 'marchande': 0, 'cyclopéenne': 4, 'subsaharienne': 4, 'électroluminescente': 0, 'colo-rectale': 3, 'nidificatrice': 1, 'valeureuse': 8, 'apprivoiseuse': 2, 'mordicante': 0, 'autocentrée': 0, 'incidente': 0, 'masseuse': 2, 'artisanale': 3, 'succincte': 0, 'affadissante': 0, 'hyperactive': 6, 'plisseuse': 2, 'rafraîchie': 0, 'biscornue': 0, 'gazonnante': 0, 'supplétive': 6, 'nigaude': 0, 'étudiante': 0, 'borélienne': 4, 'échafaudeuse': 2, 'magrébine': 0, 'illégale': 3, 'organicienne': 4, 'parastatale': 3, 'multivalente': 0, 'traîneuse': 2, 'écailleuse': 8, 'irrotationnelle': 4, 'aimantine': 0, 'singapourienne': 4, 'sadico-anale': 3, 'roublarde': 0, 'boulonnière': 5, 'soupeuse': 2, 'chlorophyllienne': 4, 'antiaméricaine': 0, 'imbrulée': 0, 'clignotante': 0, 'cagote': 0, 'idéo-motrice': 1, 'levronne': 4, 'fleurissante': 0, 'emballante': 0, 'brochante': 0, 'électropositive': 6, 'névrosée': 0, 'contredisante': 0, 'uncinée': 0, 'priseuse': 2, 'saisonnale': 3, 'pouilleuse': 8, 'contigüe': 10, 'testeuse': 2, 'liquoreuse': 8, 'postcoloniale': 3, 'panafricaine': 0, 'désespérée': 0, 'anti-sous-marine': 0, 'captivante': 0, 'chainière': 5, 'totale': 3, 'étuveuse': 2, 'élastiquée': 0, 'traquée': 0, 'buveuse': 2, 'carillonnante': 0, 'éplucheuse': 2, 'prédictive': 6, 'plante': 0, 'baveuse': 8, 'rouleautée': 0, 'dissidente': 0, 'attentionnelle': 4, 'gallicane': 0, 'déviatrice': 1, 'beuglante': 0, 'cramoisie': 0, 'pareille': 4, 'légitimée': 0, 'intentionnée': 0, 'croquante': 0, 'durale': 3, 'logicienne': 4, 'incontinente': 0, 'cheloue': 0, 'bouquetière': 5, 'poussine': 0, 'mieux-disante': 0, 'sous-calibrée': 0, 'discoureuse': 2, 'hélicoïdale': 3, 'muscinale': 3, 'xiphoïdienne': 4, 'dégonflarde': 0, 'bobeuse': 2, 'fidjienne': 4, 'soupçonneuse': 8, 'bisonne': 4, 'andine': 0, 'abêtifiée': 0, 'rubéfiante': 0, 'concédante': 0, 'locative': 6, 'infondée': 0, 'fémorale': 3, 'opulente': 0, 'mirobolante': 0, 'translationnelle': 4, 'bitumeuse': 8, 'jaunissante': 0, 'ligamenteuse': 8, 'acéricultrice': 1, 'irréfléchie': 0, 'persistante': 0, 'stagnante': 0, 'spinale': 3, 'franco-américaine': 0, 'tôlière': 5, 'dominicale': 3, 'chatouilleuse': 2, 'vineuse': 8, 'batifolante': 0, 'sahraouie': 0, 'motarde': 0, 'dénotationnelle': 4, 'matheuse': 8, 'astronauticienne': 4, 'immigrée': 0, 'sandalière': 5, 'autoexcitatrice': 1, 'bénissante': 0, 'azoteuse': 8, 'robineuse': 8, 'mousseuse': 8, 'sabreuse': 2, 'contrariante': 0, 'brunéienne': 4, 'fanfaronne': 4, 'paroxysmale': 3, 'canine': 0, 'unifamiliale': 3, 'gambadeuse': 2, 'érugineuse': 8, 'dolente': 0, 'ci-incluse': 7, 'orwellienne': 4, 'dégustatrice': 1, 'néoconservatrice': 1, 'justificatrice': 1, 'frontalière': 5, 'préteuse': 2, 'statisticienne': 4, 'terreuse': 8, 'improductive': 6, 'bissexuelle': 4, 'sidérante': 0, 'minotte': 4, 'détersive': 6, 'poursuiteuse': 2, 'charognarde': 0, 'affileuse': 2, 'genouillée': 0, 'consentante': 0, 'sous-lieutenante': 0, 'ramenarde': 0, 'russo-mongole': 0, 'communicante': 0, 'infréquentée': 0, 'pilleuse': 2, 'belgo-luxembourgeoise': 7, 'trifoliée': 0, 'campinoise': 7, 'aidante': 0, 'hypersustentatrice': 1, 'protochrétienne': 4, 'enragée': 0, 'considérative': 6, 'néolatine': 0, 'répondeuse': 2, 'charmante': 0, 'mantelée': 0, 'revancharde': 0, 'cahotante': 0, 'crevetticultrice': 1, 'élyséenne': 4, 'lettone': 0, 'cupro-ammoniacale': 3, 'supérieure': 0, 'transpyrénéenne': 4, 'radiante': 0, 'nippo-américaine': 0, 'lamartinienne': 4, 'migraineuse': 8, 'imagière': 5, 'contractuelle': 4, 'frôleuse': 2, 'vasomotrice': 1, 'conne': 4, 'carcérale': 3, 'enchérisseuse': 2, 'épilatrice': 1, 'irréligieuse': 8, 'bronzière': 5, 'ténorisante': 0, 'stuporeuse': 8, 'inquisitoriale': 3, 'calculatrice': 1, 'algéroise': 7, 'télé-actrice': 1, 'caussenarde': 0, 'molle': 22, 'agaçante': 0, 'congolaise': 7, 'supranationale': 3, 'amérindienne': 4, 'duelle': 4, 'immunisée': 0, 'paraveineuse': 8, 'franco-iranienne': 4, 'normalienne': 4, 'carolingienne': 4, 'neigeuse': 8, 'enfoirée': 0, 'faïencée': 0, 'lavandière': 5, 'imploratrice': 1, 'guignole': 0, 'durative': 6, 'disproportionnelle': 4, 'archetière': 5, 'franco-danoise': 7, 'avoisinante': 0, 'quercitrine': 0, 'ronronnante': 0, 'frisante': 0, 'confidente': 0, 'amorceuse': 2, 'doucheuse': 2, 'coopérative': 6, 'lessivielle': 4, 'hockeyeuse': 2, 'rénitente': 0, 'droitière': 5, 'oscillo-coulissante': 0, 'fériée': 0, 'biosourcée': 0, 'impotente': 0, 'surdéterminante': 0, 'guignarde': 0, 'princière': 5, 'préquelle': 4, 'seuillée': 0, 'trépidante': 0, 'complétive': 6, 'bouchonnière': 5, 'éleveuse': 2, 'markéteuse': 2, 'éreinteuse': 2, 'fraichissante': 0, 'finaude': 0, 'oxydante': 0, 'sud-américaine': 0, 'romaine': 0, 'ismaïlienne': 4, 'néandertalienne': 4, 'théâtrale': 3, 'auditrice': 1, 'tabacultrice': 1, 'charcutière': 5, 'zonarde': 0, 'quadripartie': 0, 'tienne': 4, 'dinosaurienne': 4, 'réticulo-endothéliale': 3, 'déconnante': 0, 'rebondissante': 0, 'véreuse': 8, 'filandreuse': 8, 'ergoteuse': 2, 'fumerollienne': 4, 'palladienne': 4, 'significatrice': 1, 'non-comparante': 0, 'inintelligente': 0, 'biacuminée': 0, 'urogénitale': 3, 'adjuvante': 0, 'aromatisante': 0, 'aromaticienne': 4, 'transcanadienne': 4, 'instinctuelle': 4, 'multicatégorielle': 4, 'technico-commerciale': 3, 'morveuse': 8, 'élective': 6, 'zootechnicienne': 4, 'cooccurrente': 0, 'endogée': 0, 'bateleuse': 2, 'bienfaisante': 0, 'polygonale': 3, 'maraichère': 5, 'débaucheuse': 2, 'traductrice': 1, 'bi-invariante': 0, 'cafardeuse': 8, 'urétrale': 3, 'hiémale': 3, 'régnante': 0, 'augustale': 3, 'saxonne': 4, 'progressive': 6, 'incréée': 0, 'sentencieuse': 8, 'antidiagonale': 3, 'donneuse': 2, 'blairelle': 9, 'félonne': 4, 'olivacée': 0, 'brulée': 0, 'matriceuse': 2, 'accornée': 0, 'hypogée': 0, 'adipeuse': 8, 'alternante': 0, 'écervelée': 0, 'antigrippale': 3, 'subrogée': 0, 'designeuse': 2, 'décapeuse': 2, 'préenregistrée': 0, 'descriptive': 6, 'minoenne': 4, 'professionnelle': 4, 'agenceuse': 2, 'mangeuse': 2, 'darwinienne': 4, 'rotacée': 0, 'sulfateuse': 2, 'abougrie': 0, 'rajeunissante': 0, 'phonatrice': 1, 'sucrière': 5, 'raveuse': 2, 'appaméenne': 4, 'permutante': 0, 'irritative': 6, 'salmonicultrice': 1, 'céruléenne': 4, 'minérale': 3, 'sous-durale': 3, 'déshonorante': 0, 'triviale': 3, 'fastidieuse': 8, 'réelle': 4, 'dévideuse': 2, 'irienne': 4, 'irrégulière': 5, 'marxienne': 4, 'russo-italienne': 4, 'malintentionnée': 0, 'bisaïeule': 0, 'anémiante': 0, 'soudeuse': 2, 'strasbourgeoise': 7, 'rimeuse': 2, 'saducéenne': 4, 'acrimonieuse': 8, 'nazillonne': 4, 'rôtie': 0, 'miellée': 0, 'anfractueuse': 8, 'révérencieuse': 8, 'sous-maitresse': 13, 'inexercée': 0, 'assassine': 0, 'néoplatonicienne': 4, 'proactive': 6, 'lamineuse': 2, 'photocopieuse': 2, 'cornière': 5, 'correctrice': 1, 'sicilienne': 4, 'mâcheuse': 2, 'nuptiale': 3, 'résonnante': 0, 'lignifiante': 0, 'mélaminée': 0, 'injonctive': 6, 'scripte': 0, 'surirradiée': 0, 'viagère': 5, 'oscillo-battante': 0, 'commandeuse': 2, 'rossarde': 0, 'abréviative': 6, 'peltée': 0, 'spécificatrice': 1, 'divergente': 0, 'efféminée': 0, 'extraeuropéenne': 4, 'causante': 0, 'suborbitale': 3, 'affameuse': 2, 'avorteuse': 2, 'conflictuelle': 4, 'sudorale': 3, 'bâcleuse': 2, 'liégeoise': 7, 'volitive': 6, 'amplifiante': 0, 'débroussailleuse': 2, 'consistante': 0, 'astacicultrice': 1, 'abstinente': 0, 'bivitelline': 0, 'sagittée': 0, 'introductive': 6, 'centennale': 3, 'démystificatrice': 1, 'camarde': 0, 'disubstituée': 0, 'stercorale': 3, 'vivante': 0, 'horsaine': 0, 'tiqueuse': 2, 'bandante': 0, 'enduiseuse': 2, 'poussiéreuse': 8, 'russo-allemande': 0, 'pékinoise': 7, 'dépapillée': 0, 'surjacente': 0, 'terrienne': 4, 'lyncheuse': 2, 'folkeuse': 8, 'impensée': 0, 'varoise': 7, 'génuflectrice': 1, 'opposante': 0, 'désosseuse': 2, 'phénicienne': 4, 'hâbleuse': 2, 'boulette': 4, 'curatrice': 1, 'pleureuse': 2, 'pouparde': 0, 'instructive': 6, 'sibylline': 0, 'poinçonneuse': 2, 'séquanaise': 7, 'écumante': 0, 'ébouquetée': 0, 'asservissante': 0, 'torturée': 0, 'immunotolérante': 0, 'antibrouillée': 0, 'dératée': 0, 'illustratrice': 1, 'cosméticienne': 4, 'mendiante': 0, 'inguinale': 3, 'immunodépressive': 6, 'égoutière': 5, 'gameuse': 2, 'prépotente': 0, 'rouquine': 0, 'antisociale': 3, 'sabéenne': 4, 'dépoussiérante': 0, 'subaiguë': 0, 'compétitive': 6, 'frisottante': 0, 'oublieuse': 8, 'new-yorkaise': 7, 'rosicrucienne': 4, 'oubliée': 0, 'jeûneuse': 2, 'avouée': 0, 'prédicative': 6, 'haïsseuse': 2, 'implanteuse': 2, 'autoadjointe': 0, 'électronicienne': 4, "prud'homale": 3, 'transformatrice': 1, 'imprévue': 0, 'soudaine': 0, 'étouffante': 0, 'charpentière': 5, 'contemporaine': 0, 'texturale': 3, 'impayée': 0, 'ivrognesse': 13, 'surplombante': 0, 'tibiale': 3, 'ravine': 0, 'radiocommandée': 0, 'débirentière': 5, 'plagale': 3, 'rizicultrice': 1, 'gigotante': 0, 'reviviscente': 0, 'dessinatrice': 1, 'mozambicaine': 0, 'amandée': 0, 'rhizocarpée': 0, 'poursuiveuse': 2, 'adiposo-génitale': 3, 'déconneuse': 2, 'postdoctorante': 0, 'prohibitive': 6, 'fermière': 5, 'infectieuse': 8, 'tripolitaine': 0, 'adhérente': 0, 'proudhonienne': 4, 'austro-américaine': 0, 'grenadine': 0, 'conditionnelle': 4, 'rémittente': 0, 'italo-africaine': 0, 'actancielle': 4, 'stendhalienne': 4, 'analysée': 0, 'hypercontinentale': 3, 'faubourienne': 4, 'égrillarde': 0, 'féale': 3, 'congénitale': 3, 'colistière': 5, 'basochienne': 4, 'interreligieuse': 8, 'jargonneuse': 8, 'orchestratrice': 1, 'respective': 6, 'exaspérante': 0, 'cendreuse': 8, 'provinciale': 3, 'birmane': 0, 'resplendissante': 0, 'gravatière': 5, 'imperméabilisante': 0, 'parentérale': 3, 'cadavéreuse': 8, 'jonctionnelle': 4, 'praticienne': 4, 'magyare': 0, 'électroportative': 6, 'malapprise': 7, 'imméritée': 0, 'privilégiée': 0, 'mitochondriale': 3, 'partageuse': 8, 'surinamaise': 7, 'procréatrice': 1, 'déhiscente': 0, 'corinthienne': 4, 'primo-accédante': 0, 'titularisée': 0, 'béante': 0, 'soufflante': 0, 'soutireuse': 2, 'sinuée': 0, 'cochonne': 4, 'périlleuse': 8, 'dauphine': 0, 'carrossière': 5, 'oxycoupeuse': 2, 'mécheuse': 8, 'finissante': 0, 'colmarienne': 4, 'électricienne': 4, 'fibrineuse': 8, 'monoskieuse': 2, 'divertissante': 0, 'sifflotante': 0, 'équipotentielle': 4, 'défiante': 0, 'inactive': 6, 'divine': 0, 'capricieuse': 8, 'élingueuse': 2, 'spirituelle': 4, 'persécutée': 0, 'hydrocarbonée': 0, 'progestative': 6, 'prétentiarde': 0, 'nantie': 0, 'superficielle': 4, 'naturelle': 4, 'fertilisante': 0, 'operculée': 0, 'israélo-américaine': 0, 'appauvrissante': 0, 'enductrice': 1, 'utriculeuse': 8, 'navetteuse': 2, 'alizéenne': 4, 'cheminote': 0, 'autoroutière': 5, 'abracadabrante': 0, 'néo-conservatrice': 1, 'enquêteuse': 2, 'contramirale': 3, 'assesseure': 0, 'glaireuse': 8, 'concrète': 20, 'bruiteuse': 2, 'intempestive': 6, 'pagayeuse': 2, 'lombarde': 0, 'câline': 0, 'brouillardeuse': 8, 'perdue': 0, 'pastorale': 3, 'limitative': 6, 'graveuse': 2, 'malienne': 4, 'dérivante': 0, 'tontinière': 5, 'papillonneuse': 2, 'urineuse': 8, 'fédérative': 6, 'incantatrice': 1, 'audiencière': 5, 'surnageante': 0, 'ultraconservatrice': 1, 'cahoteuse': 8, 'malicieuse': 8, 'intercommunale': 3, 'crustale': 3, 'froide': 0, 'languedocienne': 4, 'joliette': 4, 'fabricante': 0, 'capésienne': 4, 'massive': 6, 'mordante': 0, 'contrarotative': 6, 'sus-jacente': 0, 'avignonnaise': 7, 'suppliciée': 0, 'plantureuse': 8, 'évanouissante': 0, 'patronnière': 5, 'franco-suédoise': 7, 'complimenteuse': 2, 'glorieuse': 8, 'irrévérencieuse': 8, 'généticienne': 4, 'orgueilleuse': 8, 'ciseleuse': 2, 'douce': 8, 'majestueuse': 8, 'mollette': 4, 'une': 0, 'perceptive': 6, 'internationale': 3, 'dépourvue': 0, 'dédaléenne': 4, 'humiliée': 0, 'minutieuse': 8, 'présidentielle': 4, 'moyée': 0, 'monnayeuse': 2, 'bavochée': 0, 'canalisatrice': 1, 'fondée': 0, 'rageuse': 2, 'empoisonnante': 0, 'arsénieuse': 8, 'tubéracée': 0, 'polyvalente': 0, 'serpentante': 0, 'inexprimée': 0, 'efférente': 0, 'perfective': 6, 'cabochée': 0, 'malfamée': 0, 'thermocollée': 0, 'première': 5, 'ultralibérale': 3, 'hémorroïdale': 3, 'désertifiante': 0, 'sphéroïdale': 3, 'hennissante': 0, 'développée': 0, 'hautaine': 0, 'socio-affective': 6, 'subsistante': 0, 'prévenue': 0, 'nettoyante': 0, 'optionnelle': 4, 'muletière': 5, 'saucière': 5, 'sinueuse': 8, 'gaspilleuse': 2, 'rouleuse': 2, 'dorée': 0, 'bodybuildeuse': 2, 'maîtresse': 13, 'traitreuse': 8, 'laryngale': 3, 'vivandière': 5, 'incurieuse': 8, 'dirigeante': 0, 'désavantageuse': 8, 'campagnarde': 0, 'impuissante': 0, 'lubrifiante': 0, 'spontanée': 0, 'fendante': 0, 'beauvaisienne': 4, 'classeuse': 2, 'graduée': 0, 'godilleuse': 2, 'inhibitrice': 1, 'boursicoteuse': 2, 'provirale': 3, 'décolleteuse': 2, 'rétractive': 6, 'cananéenne': 4, 'suivante': 0, 'débarrasseuse': 2, 'lotoise': 7, 'échiquetée': 0, 'santonnière': 5, 'involutive': 6, 'almandine': 0, 'murmurante': 0, 'pulpeuse': 8, 'snowboardeuse': 2, 'dévergondée': 0, 'empaleuse': 2, 'incongrue': 0, 'endothéliale': 3, 'candidate': 0, 'agitatrice': 1, 'classicisante': 0, 'lettrée': 0, 'rurale': 3, 'bicamérale': 3, 'professe': 27, 'égorgeuse': 2, 'impersonnelle': 4, 'univitelline': 0, 'interro-négative': 6, 'stérilisante': 0, 'éperdue': 0, 'juive': 6, 'amélioratrice': 1, 'testacée': 0, 'plaintive': 6, 'coéquipière': 5, 'résinière': 5, 'délictuelle': 4, 'booléenne': 4, 'ballante': 0, 'dysendocrinienne': 4, 'surale': 3, 'imparidigitée': 0, 'suffragante': 0, 'fugitive': 6, 'noire': 0, 'croisée': 0, 'antiministérielle': 4, 'napoléonienne': 4, 'délinquante': 0, 'subspontanée': 0, 'alcalinisante': 0, 'majeure': 0, 'veveysanne': 4, 'contemplatrice': 1, 'imperfective': 6, 'référente': 0, 'denteleuse': 2, 'hyaline': 0, 'orante': 0, 'podcasteuse': 2, 'raseuse': 2, 'puérile': 0, 'persiffleuse': 2, 'coûteuse': 8, 'fouinarde': 0, 'obstructive': 6, 'casquante': 0, 'médicale': 3, 'melliflue': 0, 'tribunitienne': 4, 'pionne': 4, 'déformante': 0, 'périnéale': 3, 'ribosomale': 3, 'contrefaisante': 0, 'agente': 0, 'monomotrice': 1, 'costaricienne': 4, 'maïeuticienne': 4, 'amiénoise': 7, 'staturo-pondérale': 3, 'handicapée': 0, 'vichyssoise': 7, 'thyroïdienne': 4, 'montante': 0, 'cardeuse': 2, 'fractionnelle': 4, 'défaillante': 0, 'butinante': 0, 'tentante': 0, 'médailleuse': 2, 'esclavonne': 4, 'cyberdélinquante': 0, 'nécromante': 0, 'féodale': 3, 'unipersonnelle': 4, 'exciseuse': 2, 'indigente': 0, 'phraseuse': 2, 'franco-haïtienne': 4, 'fofolle': 21, 'halotolérante': 0, 'ségrégative': 6, 'co-auteure': 0, 'adextrée': 0, 'guyanienne': 4, 'pareuse': 2, 'bourreuse': 2, 'haschischée': 0, 'racinienne': 4, 'inapaisée': 0, 'anévrysmale': 3, 'neuro-endocrinienne': 4, 'interosseuse': 8, 'héraclitéenne': 4, 'plaideuse': 2, 'guadeloupéenne': 4, 'convective': 6, 'révérencielle': 4, 'navigante': 0, 'belgo-néerlandaise': 7, 'super-lourde': 0, 'murine': 0, 'époxydée': 0, 'crayonneuse': 8, 'sabbathienne': 4, 'faisane': 0, 'spumescente': 0, 'déneigeuse': 2, 'couseuse': 2, 'hypertextuelle': 4, 'extrarénale': 3, 'hominisée': 0, 'infinie': 0, 'flasheuse': 2, 'libertarienne': 4, 'connarde': 0, 'polisseuse': 2, 'diffuseuse': 2, 'patriotarde': 0, 'galloise': 7, 'essorante': 0, 'ginguette': 4, 'calomniée': 0, 'préservative': 6, 'releveuse': 2, 'anale': 3, 'triboluminescente': 0, 'bicarbonatée': 0, 'décideuse': 2, 'foraine': 0, 'estivante': 0, 'narquoise': 7, 'amidonnière': 5, 'madrée': 0, 'probante': 0, 'lustreuse': 2, 'verveuse': 8, 'marquante': 0, 'leadeuse': 2, 'démaquillante': 0, 'cérébelleuse': 8, 'susdite': 0, 'transcontinentale': 3, 'antenaise': 7, 'levalloisienne': 4, 'cohérente': 0, 'sanctifiante': 0, 'contondante': 0, 'qualificative': 6, 'épiscopale': 3, 'combattive': 6, 'pharmacodépendante': 0, 'définitionnelle': 4, 'nitreuse': 8, 'convalescente': 0, 'médisante': 0, 'résidentielle': 4, 'reconquérante': 0, 'bronchiteuse': 8, 'juxtaposante': 0, 'commissurale': 3, 'hyperconnectée': 0, 'plieuse': 2, 'contre-manifestante': 0, 'départementale': 3, 'décorative': 6, 'communicatrice': 1, 'tensio-active': 6, 'communiante': 0, 'alléchante': 0, 'discriminante': 0, 'foulonnière': 5, 'laudanisée': 0, 'troublante': 0, 'progénitrice': 1, 'économico-sociale': 3, 'modeleuse': 2, 'prédatrice': 1, 'factitive': 6, 'évasive': 6, 'inassouvie': 0, 'arbustive': 6, 'épinceteuse': 2, 'nominée': 0, 'éthicienne': 4, 'choisisseuse': 2, 'celtisante': 0, 'frottante': 0, 'usinière': 5, 'gastro-intestinale': 3, 'maquisarde': 0, 'merveilleuse': 8, 'abortive': 6, 'monovariante': 0, 'améliorative': 6, 'morale': 3, 'déchargeuse': 2, 'montpelliéraine': 0, 'débitante': 0, 'cavaleuse': 2, 'kirghize': 7, 'barbichue': 0, 'factorielle': 4, 'impécunieuse': 8, 'superstitieuse': 8, 'vérolée': 0, 'labio-dentale': 3, 'innomée': 0, 'faraude': 0, 'taiseuse': 8, 'anglo-normande': 0, 'pèquenaude': 0, 'émotionnante': 0, 'succombante': 0, 'conductrice': 1, 'dégoûtante': 0, 'suintante': 0, 'ptoléméenne': 4, 'converse': 7, 'interurbaine': 0, 'dénonciatrice': 1, 'lutéale': 3, 'mémorielle': 4, 'collective': 6, 'énumérative': 6, 'agatisée': 0, 'surintendante': 0, 'laveuse': 2, 'hivernante': 0, 'brigantine': 0, 'mularde': 0, 'mutine': 0, 'pénalisante': 0, 'frimeuse': 2, 'navrante': 0, 'oléoprotéagineuse': 8, 'scléreuse': 8, 'délurée': 0, 'ovoïdale': 3, 'maniacodépressive': 6, 'argileuse': 8, 'façonnière': 5, 'parenchymateuse': 8, 'altitudinale': 3, 'géopotentielle': 4, 'angolaise': 7, 'plébéienne': 4, 'poreuse': 8, 'ahurie': 0, 'laudative': 6, 'surqualifiée': 0, 'surdéterminée': 0, 'tétravalente': 0, 'dérégulatrice': 1, 'poudreuse': 8, 'fréjusienne': 4, 'invaincue': 0, 'rhizomateuse': 8, 'bronzeuse': 2, 'fédérale': 3, 'subrogative': 6, 'arsine': 0, 'catcheuse': 2, 'pluviale': 3, 'rastafarienne': 4, 'immunocompétente': 0, 'plasticienne': 4, 'dépossédée': 0, 'interronégative': 6, 'bourgeoisiale': 3, 'trine': 0, 'areligieuse': 8, 'malaisée': 0, 'branchiale': 3, 'vergogneuse': 8, 'antiguaise': 7, 'suraigüe': 10, 'localisante': 0, 'lucrative': 6, 'obscure': 0, 'étroite': 0, 'inspirée': 0, 'pique-niqueuse': 2, 'bloqueuse': 2, 'touchante': 0, 'laudatrice': 1, 'devineuse': 2, 'désuète': 20, 'époustouflante': 0, 'vasouillarde': 0, 'alpine': 0, 'interféconde': 0, 'positionnelle': 4, 'moulineuse': 2, 'flatulente': 0, 'réverbérante': 0, 'corpulente': 0, 'imaginative': 6, 'affirmative': 6, 'conséquente': 0, 'expirante': 0, 'trigonale': 3, 'tapineuse': 2, 'applicatrice': 1, 'gastro-duodénale': 3, 'dénaturante': 0, 'franchouillarde': 0, 'illimitée': 0, 'hongkongaise': 7, 'costale': 3, 'glorificatrice': 1, 'littératrice': 1, 'fascinante': 0, 'ludoéducative': 6, 'laideronne': 4, 'amylacée': 0, 'reconnaissante': 0, 'chiqueuse': 2, 'néo-natale': 0, 'illuminative': 6, 'dévoratrice': 1, 'future': 0, 'flosculeuse': 8, 'dubitative': 6, 'barakie': 0, 'maousse': 15, 'ostrogote': 0, 'chemisière': 5, 'fuchsienne': 4, 'fissurale': 3, 'gestationnelle': 4, 'maraudeuse': 2, 'papelarde': 0, 'formante': 0, 'nivopluviale': 3, 'échotière': 5, 'décongestive': 6, 'encroutante': 0, 'auto-équilibrante': 0, 'gueulante': 0, 'rouennaise': 7, 'korrigane': 0, 'œstroprogestative': 6, 'abréviatrice': 1, 'hadale': 3, 'grilladine': 0, 'villeuse': 8, 'châtaine': 0, 'gersoise': 7, 'pyramidale': 3, 'niqueuse': 2, 'impulsionnelle': 4, 'jaugeuse': 2, 'émissive': 6, 'grisouteuse': 8, 'franchiseuse': 2, 'ingénieuse': 8, 'consonante': 0, 'néonatale': 0, 'écrivailleuse': 2, 'ainée': 0, 'encrouée': 0, 'bruinée': 0, 'doreuse': 2, 'indisciplinée': 0, 'monteuse': 2, 'prudhommale': 3, 'sarroise': 7, 'tatare': 0, 'caveuse': 2, 'sous-traitante': 0, 'laiteuse': 8, 'sécrétrice': 1, 'graisseuse': 8, 'aconière': 5, 'démarcative': 6, 'partouzarde': 0, 'normale': 3, 'effectrice': 1, 'paysagère': 5, 'sourcilleuse': 8, 'paulicienne': 4, 'fichante': 0, 'grammaticale': 3, 'franco-vietnamienne': 4, 'scoute': 0, 'gisante': 0, 'balisticienne': 4, 'bouffante': 0, 'surette': 4, 'polycristalline': 0, 'ravigotante': 0, 'fautrice': 1, 'incrusteuse': 2, 'shogounale': 3, 'notificative': 6, 'fatale': 0, 'niçoise': 7, 'absente': 0, 'suprasegmentale': 3, 'hercynienne': 4, 'pensionnée': 0, 'couarde': 0, 'mariée': 0, 'parigote': 0, 'passementière': 5, 'réto-romane': 0, 'glomérulée': 0, 'concubine': 0, 'excavatrice': 1, 'quinteuse': 8, 'chalande': 0, 'concourante': 0, 'comtoise': 7, 'importante': 0, 'sifflante': 0, 'criarde': 0, 'démoralisante': 0, 'saoudienne': 4, 'surjective': 6, 'perse': 7, 'faustienne': 4, 'visuelle': 4, 'géométrale': 3, 'scintillante': 0, 'offreuse': 2, 'cantonale': 3, 'prétranchée': 0, 'récréationnelle': 4, 'agrotechnicienne': 4, 'pontificale': 3, 'bénite': 0, 'dreyfusarde': 0, 'révoltée': 0, 'bucheronne': 4, 'décathlonienne': 4, 'superflue': 0, 'crissante': 0, 'fraiseuse': 2, 'forgeuse': 2, 'sexagésimale': 3, 'huguenote': 0, 'grainetière': 5, 'sculpturale': 3, 'aimante': 0, 'bengalie': 0, 'livreuse': 2, 'déhontée': 0, 'rebutante': 0, 'ordonnancière': 5, 'sous-marine': 0, 'havanaise': 7, 'aérostière': 5, 'collante': 0, 'pionnière': 5, 'sablière': 5, 'pédiculée': 0, 'râteleuse': 2, 'ouest-allemande': 0, 'grenadienne': 4, 'hyperthyroïdienne': 4, 'plate': 0, 'saint-cyrienne': 4, 'signifiante': 0, 'microlocalisée': 0, 'malvoyante': 0, 'multinomiale': 3, 'composante': 0, 'vauclusienne': 4, 'squameuse': 8, 'fouilleuse': 2, 'suffixale': 3, 'dissipatrice': 1, 'vaticinatrice': 1, 'détoxifiante': 0, 'comparative': 6, 'perfoliée': 0, 'damasquineuse': 2, 'détenue': 0, 'vocale': 3, 'pultacée': 0, 'pansue': 0, 'sommelière': 5, 'carrière': 5, 'médiane': 0, 'conciliatrice': 1, 'vengeresse': 14, 'diffluente': 0, 'hebdomadière': 5, 'dévolue': 0, 'différente': 0, 'botteuse': 2, 'spéculatrice': 1, 'béninoise': 7, 'impénitente': 0, 'tyrolienne': 4, 'attachante': 0, 'démotivante': 0, 'servante': 0, 'rationalisante': 0, 'tibio-tarsienne': 4, 'viveuse': 2, 'africaine': 0, 'nord-africaine': 0, 'admiratrice': 1, 'grimpante': 0, 'toxicodépendante': 0, 'vaporeuse': 8, 'extralégale': 3, 'anomale': 3, 'décennale': 3, 'dynamicienne': 4, 'discutante': 0, 'relictuelle': 4, 'sémioticienne': 4, 'fistulisante': 0, 'aragonaise': 7, 'milanaise': 7, 'psycho-éducative': 6, 'impubliée': 0, 'vicennale': 3, 'muqueuse': 8, 'marnaise': 7, 'usante': 0, 'aveyronnaise': 7, 'divise': 7, 'toarcienne': 4, 'paramédicale': 3, 'ergotée': 0, 'azuréenne': 4, 'interinstitutionnelle': 4, 'gesticulante': 0, 'jalouse': 8, 'vacharde': 0, 'avertisseuse': 2, 'maraîchine': 0, 'gerbeuse': 2, 'campignienne': 4, 'familière': 5, 'tireuse': 2, 'craintive': 6, 'frétillante': 0, 'exiguë': 0, 'rançonneuse': 2, 'infinitive': 6, 'mobilisatrice': 1, 'hôtelière': 5, 'chitineuse': 8, 'délicieuse': 8, 'affleurante': 0, 'captive': 6, 'surenchérisseuse': 2, 'grenailleuse': 2, 'déterminante': 0, 'désinfectrice': 1, 'éléphante': 0, 'loupiote': 0, 'anglo-indienne': 4, 'vietnamienne': 4, 'carillonneuse': 2, 'réitérante': 0, 'bastiaise': 7, 'amincissante': 0, 'loubarde': 0, 'ogivale': 3, 'pénitentielle': 4, 'bi-dimensionnelle': 4, 'guillocheuse': 2, 'ilienne': 4, 'antigravitationnelle': 4, 'traînante': 0, 'horlogère': 5, 'pincharde': 0, 'défileuse': 2, 'huilière': 5, 'ongulée': 0, 'inauguratrice': 1, 'décatisseuse': 2, 'rétreinte': 0, 'festivalière': 5, 'équationnelle': 4, 'morfale': 0, 'unilobée': 0, 'emmerdante': 0, 'baylienne': 4, 'intervieweuse': 2, 'boriquée': 0, 'nutricière': 5, 'pointilleuse': 8, 'objectale': 3, 'irrévérente': 0, 'surpeuplée': 0, 'appréciative': 6, 'qualifiante': 0, 'brelandière': 5, 'découverte': 0, 'ribaude': 0, 'interindividuelle': 4, 'grouillante': 0, 'étourdie': 0, 'hétéroparentale': 3, 'agrandissante': 0, 'tressaillante': 0, 'bagnarde': 0, 'délibérée': 0, 'imminente': 0, 'lactescente': 0, 'répressive': 6, 'usagère': 5, 'réglante': 0, 'hypoglycémiante': 0, 'sacrosainte': 0, 'extrasensorielle': 4, 'dissonante': 0, 'entraîneuse': 2, 'guyanaise': 7, 'ovine': 0, 'involutée': 0, 'utérine': 0, 'onglée': 0, 'définitive': 6, 'périapicale': 3, 'centreuse': 2, 'coulombienne': 4, 'menstruelle': 4, 'subjective': 6, 'arpenteuse': 2, 'préhilbertienne': 4, 'ampoulée': 0, 'inventive': 6, 'prévoyante': 0, 'utilisatrice': 1, 'bourlingueuse': 2, 'attaquante': 0, 'imprévoyante': 0, 'saturante': 0, 'difficultueuse': 8, 'enrageante': 0, 'grogneuse': 2, 'flamande': 0, 'billetée': 0, 'interrégionale': 3, 'dijonnaise': 7, 'castrale': 3, 'bi-infinie': 0, 'désinfectante': 0, 'passionnante': 0, 'chasséenne': 4, 'flammée': 0, 'fautive': 6, 'généralisatrice': 1, 'spatulée': 0, 'basale': 3, 'prôneuse': 2, 'téléprospectrice': 1, 'foireuse': 8, 'marsupiale': 3, 'baratineuse': 2, 'dominotière': 5, 'robinétière': 5, 'dissociative': 6, 'thésauriseuse': 2, 'pétaradante': 0, 'herseuse': 2, 'ultra-violette': 4, 'reprise': 7, 'œsophagienne': 4, 'aiguë': 0, 'ragréeuse': 2, 'manadière': 5, 'déroutante': 0, 'sidérale': 3, 'affolée': 0, 'bouvière': 5, 'spéciale': 3, 'technicienne': 4, 'boutante': 0, 'initiatrice': 1, 'aliénante': 0, 'radio-active': 6, 'applicative': 6, 'daltonienne': 4, 'poseuse': 2, 'voltigeante': 0, 'composée': 0, 'reposante': 0, 'théodosienne': 4, 'directive': 6, 'cressicultrice': 1, 'sniffeuse': 2, 'soudante': 0, 'sanskrite': 0, 'hargneuse': 8, 'globuleuse': 8, 'parentale': 3, 'jobarde': 0, 'contrevenante': 0, 'millimétrée': 0, 'intemporelle': 4, 'frangine': 0, 'vidienne': 4, 'providente': 0, 'gaillarde': 0, 'foutrale': 0, 'revigorante': 0, 'dissociatrice': 1, 'incarnadine': 0, 'drapière': 5, 'débineuse': 2, 'sécheuse': 2, 'jeunette': 4, 'hauturière': 5, 'adventive': 6, 'boxeuse': 2, 'enregistreuse': 2, 'oléicultrice': 1, 'ougandaise': 7, 'tendineuse': 8, 'incohérente': 0, 'indulgente': 0, 'cocréancière': 5, 'greneuse': 2, 'électronégative': 6, 'évolutive': 6, 'autoporteuse': 2, 'orienteuse': 2, 'inétendue': 0, 'redondée': 0, 'ombiliquée': 0, 'émettrice': 1, 'rhéto-romane': 0, 'dérouleuse': 2, 'fructueuse': 8, 'cérumineuse': 8, 'travestie': 0, 'lunetière': 5, 'saure': 0, 'tchatcheuse': 2, 'deltoïdienne': 4, 'conormale': 3, 'bordante': 0, 'trieuse': 2, 'maghrébine': 0, 'récifale': 3, 'marine': 0, 'plastiqueuse': 2, 'imprudente': 0, 'détectrice': 1, 'écossaise': 7, 'cauchemardeuse': 8, 'miteuse': 8, 'viennoise': 7, 'louis-philipparde': 0, 'cédante': 0, 'narrative': 6, 'vasoconstrictrice': 1, 'multilatérale': 3, 'épinceuse': 2, 'cérébro-spinale': 3, 'namuroise': 7, 'rassise': 7, 'intensive': 6, 'fumeuse': 8, 'papetière': 5, 'diapositive': 6, 'ponantaise': 7, 'bêta-testeuse': 2, 'dalembertienne': 4, 'psychotechnicienne': 4, 'administrative': 6, 'démoralisatrice': 1, 'pasteurienne': 4, 'langoureuse': 8, 'chasseuse': 2, 'pestilentielle': 4, 'bâtarde': 0, 'sacrifiée': 0, 'bambocharde': 0, 'teigneuse': 8, 'passagère': 5, 'gangreneuse': 8, 'escamoteuse': 2, 'finassière': 5, 'émulsive': 6, 'quadrilobée': 0, 'possédée': 0, 'colonisatrice': 1, 'négatrice': 1, 'crépue': 0, 'irrassasiée': 0, 'synclinale': 3, 'dribbleuse': 2, 'promeneuse': 2, 'fluorée': 0, 'désoxydante': 0, 'minière': 5, 'modératrice': 1, 'griffue': 0, 'satisfaisante': 0, 'limitatrice': 1, 'opérante': 0, 'prisonnière': 5, 'inoccupée': 0, 'bruxelloise': 7, 'toulonnaise': 7, 'palpébrale': 3, 'tricoteuse': 2, 'directionnelle': 4, 'canonnière': 5, 'ordonnatrice': 1, 'bivalente': 0, 'susjacente': 0, 'biomédicale': 3, 'proclamatrice': 1, 'médullosurrénale': 3, 'fermentée': 0, 'inécoutée': 0, 'sarcleuse': 2, 'excitomotrice': 1, 'nasilleuse': 2, 'assainisseuse': 2, 'genrée': 0, 'fouisseuse': 2, 'enveloppante': 0, 'revitalisante': 0, 'endêvée': 0, 'strip-teaseuse': 2, 'gamine': 0, 'descendante': 0, 'gaussienne': 4, 'facultative': 6, 'relaxante': 0, 'chiffonnière': 5, 'polyfonctionnelle': 4, 'prépositive': 6, 'irlandaise': 7, 'machinale': 3, 'radiale': 3, 'projective': 6, 'saccageuse': 2, 'guerroyeuse': 2, 'chanceuse': 8, 'déchue': 0, 'antivenimeuse': 8, 'bronzante': 0, 'déviante': 0, 'malletière': 5, 'vertébrée': 0, 'demi-fine': 0, 'footeuse': 8, 'appréciatrice': 1, 'serine': 0, 'tragédienne': 4, 'adroite': 0, 'coprocureuse': 2, 'oxydative': 6, 'tangentielle': 4, 'expiatrice': 1, 'moulinière': 5, 'fortuite': 0, 'bridgeuse': 2, 'substantielle': 4, 'affuteuse': 2, 'grincheuse': 8, 'radiative': 6, 'attardée': 0, 'ulcéreuse': 8, 'fabricatrice': 1, 'vitaminée': 0, 'antichrétienne': 4, 'présanctifiée': 0, 'inapparente': 0, 'ahurissante': 0, 'bilabiale': 3, 'disculpée': 0, 'baronne': 4, 'interannuelle': 4, 'jacobienne': 4, 'extinctrice': 1, 'mafieuse': 8, 'mistonne': 4, 'extraconjugale': 3, 'poissarde': 0, 'fleuronnée': 0, 'afficheuse': 2, 'individuelle': 4, 'fracassante': 0, 'dévorante': 0, 'vitrificative': 6, 'texane': 0, 'émiratie': 0, 'bisexuelle': 4, 'frauduleuse': 8, 'immunisante': 0, 'versante': 0, 'impolie': 0, 'léopardée': 0, 'antigivrante': 0, 'audio-orale': 3, 'antitussive': 6, 'archipresbytérale': 3, 'diviseuse': 2, 'togolaise': 7, 'glisseuse': 2, 'lookée': 0, 'indue': 0, 'plombante': 0, 'oscillatrice': 1, 'déshéritée': 0, 'intra-artérielle': 4, 'kiosquière': 5, 'prévôtale': 3, 'condamnée': 0, 'picoreuse': 2, 'layetière': 5, 'prédiffusée': 0, 'longitudinale': 3, 'vice-championne': 4, 'califale': 3, 'tallée': 0, 'thermopropulsée': 0, 'pépiante': 0, 'extra-fine': 0, 'improvisatrice': 1, 'coutumière': 5, 'biscottière': 5, 'martiniquaise': 7, 'soucieuse': 8, 'vieillarde': 0, 'surréservée': 0, 'socialisante': 0, 'tuyauteuse': 2, 'foutue': 0, 'trembleuse': 2, 'avant-dernière': 5, 'polyédrale': 3, 'orbitale': 3, 'héliograveuse': 2, 'interdépartementale': 3, 'belgo-allemande': 0, 'adverbiale': 3, 'brachiale': 3, 'charolaise': 7, 'raisonneuse': 2, 'régressée': 0, 'salinière': 5, 'civilisationnelle': 4, 'congrue': 0, 'regardante': 0, 'tubuleuse': 8, 'usurpatrice': 1, 'freinatrice': 1, 'cérébrospinale': 3, 'cokéfiante': 0, 'intrafamiliale': 3, 'apostrophée': 0, 'hilarante': 0, 'ménagère': 5, 'cymbalière': 5, 'normée': 0, 'sectatrice': 1, 'impudente': 0, 'transhumante': 0, 'compromettante': 0, 'scieuse': 2, 'brumale': 3, 'parente': 0, 'hongroise': 7, 'manuscrite': 0, 'exorciseuse': 2, 'imaginale': 3, 'ampliative': 6, 'textuelle': 4, 'engreneuse': 2, 'cortico-surrénale': 3, 'soudanienne': 4, 'randonneuse': 2, 'alezane': 0, 'parotidienne': 4, 'téléspectatrice': 1, 'bledarde': 0, 'colossienne': 4, 'lignarde': 0, 'persuasive': 6, 'grivoise': 7, 'mandarinale': 3, 'monopoleuse': 2, 'entôleuse': 2, 'transporteuse': 2, 'lionne': 4, 'insatisfaisante': 0, 'ellipsoïdale': 3, 'tubéreuse': 8, 'intervertébrale': 3, 'désincitative': 6, 'appontée': 0, 'moutonnée': 0, 'gallo-romaine': 0, 'terre-neuvienne': 4, 'permienne': 4, 'déprimante': 0, 'franco-mexicaine': 0, 'notionnelle': 4, 'ventripotente': 0, 'munificente': 0, 'roselière': 5, 'impaludée': 0, 'casserolière': 5, 'débraillée': 0, 'polluposteuse': 2, 'néocalédonienne': 4, 'génératrice': 1, 'pelliculée': 0, 'roucoulante': 0, 'infecte': 0, 'délégante': 0, 'frissonnante': 0, 'criblière': 5, 'décolorante': 0, 'annulatrice': 1, 'imperforée': 0, 'adoptée': 0, 'renversante': 0, 'freudienne': 4, 'impressionnante': 0, 'ankylosante': 0, 'littérale': 3, 'peigneuse': 2, 'grossière': 5, 'atemporelle': 4, 'remplisseuse': 2, 'ultralégère': 5, 'active': 6, 'destructrice': 1, 'matrilocale': 3, 'coprésente': 0, 'monofocale': 3, 'lavandicultrice': 1, 'estropiée': 0, 'groupale': 3, 'tutorielle': 4, 'kazakhe': 0, 'cossarde': 0, 'partisane': 0, 'jamaïcaine': 0, 'géodésienne': 4, 'jaseuse': 2, 'structurante': 0, 'dimissoriale': 3, 'rétrovirale': 3, 'temporelle': 4, 'lustrale': 3, 'abasourdissante': 0, 'monopolisatrice': 1, 'vadrouilleuse': 2, 'irrationnelle': 4, 'convulsive': 6, 'matoise': 7, 'anglo-portugaise': 7, 'non-belligérante': 0, 'inouïe': 0, 'vermineuse': 8, 'parolière': 5, 'conjuratrice': 1, 'débourgeoisée': 0, 'compendieuse': 8, 'contrintuitive': 6, 'apollinienne': 4, 'murrhine': 0, 'piétinante': 0, 'endoctrinée': 0, 'hilbertienne': 4, 'afghane': 0, 'couturière': 5, 'alarmante': 0, 'consciente': 0, 'rhabilleuse': 2, 'indéterminée': 0, 'inhospitalière': 5, 'inculpée': 0, 'bonifiante': 0, 'déterreuse': 2, 'savante': 0, 'apparente': 0, 'injective': 6, 'destructive': 6, 'franco-coréenne': 4, 'himalayenne': 4, 'ultra-libérale': 3, 'chirale': 3, 'scapulohumérale': 3, 'annulative': 6, 'récalcitrante': 0, 'repreneuse': 2, 'sublétale': 3, 'ennuyeuse': 8, 'gracieuse': 8, 'désambigüisatrice': 1, 'glanduleuse': 8, 'antipaludéenne': 4, 'noceuse': 2, 'croyante': 0, 'smurfeuse': 2, 'abyssale': 3, 'révolutée': 0, 'posturale': 3, 'septale': 3, 'hideuse': 8, 'interpellante': 0, 'taxatrice': 1, 'gémisseuse': 2, 'rescindante': 0, 'séquentielle': 4, 'conventionnelle': 4, 'ophidienne': 4, 'alcaline': 0, 'quinquennale': 3, 'vacancière': 5, 'hyperfine': 0, 'intersectionnelle': 4, 'vertébrale': 3, 'tabatière': 5, 'cabocharde': 0, 'médico-professionnelle': 4, 'gringolée': 0, 'enleveuse': 2, 'inaccoutumée': 0, 'insubordonnée': 0, 'minimale': 3, 'ossue': 0, 'franco-chilienne': 4, 'médicosportive': 6, 'conviviale': 3, 'antivirale': 3, 'dénoyauteuse': 2, 'moucharde': 0, 'prescriptive': 6, 'extinctive': 6, 'consortiale': 3, 'trameuse': 2, 'gourmée': 0, 'exhortative': 6, 'équilatérale': 3, 'kidnappeuse': 2, 'appelante': 0, 'fruitarienne': 4, 'cap-verdienne': 4, 'yvelinoise': 7, 'hésitante': 0, 'haletante': 0, 'indomptée': 0, 'surcostale': 3, 'égreneuse': 2, 'rimbaldienne': 4, 'algonquine': 0, 'tamponneuse': 2, 'bahamienne': 4, 'évanescente': 0, 'ordinale': 3, 'enchanteresse': 14, 'stimulatrice': 1, 'shamane': 0, 'rate': 0, 'vicelarde': 0, 'inabritée': 0, 'localisatrice': 1, 'décapitée': 0, 'khédiviale': 3, 'barreuse': 2, 'cagnarde': 0, 'piteuse': 8, 'sikhe': 0, 'accoupleuse': 2, 'extensionnelle': 4, 'cohésive': 6, 'stérilisatrice': 1, 'politicarde': 0, 'malnutrie': 0, 'additive': 6, 'multiraciale': 3, 'maïorale': 3, 'exémateuse': 8, 'jumelle': 9, 'surcompensatrice': 1, 'tempérante': 0, 'déprimée': 0, 'ondée': 0, 'foulante': 0, 'assembleuse': 2, 'mucronée': 0, 'rigoise': 7, 'subordonnante': 0, 'déflagrante': 0, 'fourrière': 5, 'éventuelle': 4, 'scélérate': 0, 'individualisante': 0, 'eurasienne': 4, 'bousilleuse': 2, 'virulente': 0, 'grasseyante': 0, 'coquette': 4, 'vendangeuse': 2, 'pendante': 0, 'comorienne': 4, 'croissantée': 0, 'savonnière': 5, 'enjôleuse': 2, 'tortue': 0, 'susnommée': 0, 'ébarbeuse': 2, 'augustinienne': 4, 'mahométane': 0, 'cumulative': 6, 'provençale': 3, 'gargotière': 5, 'expectative': 6, 'agencière': 5, 'allemande': 0, 'cavalière': 5, 'valorisante': 0, 'éminatie': 0, 'imprimeuse': 2, 'simpliciale': 3, 'rechignée': 0, 'multimodale': 3, 'formicante': 0, 'coquilleuse': 2, 'attacheuse': 2, 'absidiale': 3, 'feuillardière': 5, 'vaniteuse': 8, 'inédite': 0, 'turque': 11, 'autodestructrice': 1, 'inobservée': 0, 'chronoséquentielle': 4, 'jardineuse': 8, 'teilleuse': 2, 'estudiantine': 0, 'volailleuse': 2, 'députée': 0, 'superattractive': 6, 'périœsophagienne': 4, 'auto-entrepreneuse': 2, 'défenseure': 0, 'dilutive': 6, 'goménolée': 0, 'végétarienne': 4, 'souillarde': 0, 'contaminatrice': 1, 'prométhéenne': 4, 'vomérienne': 4, 'serrurière': 5, 'picoleuse': 2, 'poilante': 0, 'glénoïdale': 3, 'savonneuse': 8, 'dameuse': 2, 'réparatrice': 1, 'verrée': 0, 'antiamarile': 0, 'plaidante': 0, 'patrouilleuse': 2, 'combinarde': 0, 'ultradienne': 4, 'outilleuse': 2, 'flâneuse': 2, 'accédante': 0, 'barbouilleuse': 2, 'grégorienne': 4, 'pédieuse': 8, 'brestoise': 7, 'îlienne': 4, 'purificatrice': 1, 'paniquarde': 0, 'méconiale': 3, 'druidesse': 13, 'élusive': 6, 'gambadante': 0, 'vigneronne': 4, 'mésenchymateuse': 8, 'géospatiale': 3, 'rageante': 0, 'idéalisatrice': 1, 'fumante': 0, 'interdigitale': 3, 'ignominieuse': 8, 'extractrice': 1, 'graffeuse': 2, 'marrie': 0, 'endiamantée': 0, 'encourageante': 0, 'superchampionne': 4, 'bruleuse': 2, 'filonienne': 4, 'santoméenne': 4, 'tropicale': 3, 'auteure': 0, 'inépuisée': 0, 'interprétante': 0, 'patrimoniale': 3, 'shogunale': 3, 'mudéjare': 0, 'vertueuse': 8, 'trichinée': 0, 'antiliante': 0, 'faiseuse': 2, 'hospitalière': 5, 'féminine': 0, 'perforelieuse': 2, 'mignonne': 4, 'aminée': 0, 'souterraine': 0, 'médico-chirurgicale': 3, 'jurée': 0, 'prompte': 0, 'transafricaine': 0, 'tuberculée': 0, 'conseillère': 5, 'pédante': 0, 'endormeuse': 2, 'meilleure': 0, 'dénotative': 6, 'sprinteuse': 2, 'sauvageonne': 4, 'franco-norvégienne': 4, 'épilogueuse': 2, 'réconciliatrice': 1, 'briarde': 0, 'halitueuse': 8, 'inhibitive': 6, 'pochtronne': 4, 'pharaonienne': 4, 'nitrifiante': 0, 'carthaginoise': 7, 'péritonéale': 3, 'intercantonale': 3, 'ravageuse': 2, 'octale': 3, 'finasseuse': 2, 'pantelante': 0, 'néohébridaise': 7, 'chamane': 0, 'exclue': 0}
+# packed table (french.masforms.tbl in _dictionaries) or, if it has not been built, the dictionary of mfsp_data.py
+_dMasForm = getTable("french.masforms.tbl", ".mfsp_data", "_dMasForm", __package__)
 
+# affix codes split once: target (“:m:s”, “:m:p”, “:p”) -> list of tuples of suffix codes (same indexes as lists of affix codes)
+_dTargetSfx = {
+    ":m:s": [ tuple(sSfx[:sSfx.find("/")].split("|"))  if "/" in sSfx  else tuple(sSfx.split("|"))  for sSfx in _lTagMasForm ],
+    ":m:p": [ tuple(sSfx[sSfx.find("/")+1:].split("|"))  if "/" in sSfx  else tuple(sSfx.split("|"))  for sSfx in _lTagMasForm ],
+    ":p": [ tuple(sSfx.split("|"))  for sSfx in _lTagMiscPlur ],
+}
+_dTargetDict = { ":m:s": _dMasForm, ":m:p": _dMasForm, ":p": _dMiscPlur }
 
 
 def isFemForm (sWord):
@@ -18,9 +31,7 @@ def isFemForm (sWord):
 
 def getMasForm (sWord, bPlur):
     "returns masculine form with feminine form"
-    if sWord in _dMasForm:
-        return [ _modifyStringWithSuffixCode(sWord, sTag)  for sTag in _whatSuffixCodes(sWord, bPlur) ]
-    return []
+    return list(_derive(sWord, ":m:p"  if bPlur  else ":m:s"))
 
 def hasMiscPlural (sWord):
     "returns True if sWord exists in dPlurMisc"
@@ -28,18 +39,28 @@ def hasMiscPlural (sWord):
 
 def getMiscPlural (sWord):
     "returns plural form with singular form"
-    if sWord in _dMiscPlur:
-        return [ _modifyStringWithSuffixCode(sWord, sTag)  for sTag in _lTagMiscPlur[_dMiscPlur[sWord]].split("|") ]
-    return []
-
-def _whatSuffixCodes (sWord, bPlur):
-    "necessary only for dMasFrom"
-    sSfx = _lTagMasForm[_dMasForm[sWord]]
-    if "/" in sSfx:
-        if bPlur:
-            return sSfx[sSfx.find("/")+1:].split("|")
-        return sSfx[:sSfx.find("/")].split("|")
-    return sSfx.split("|")
+    return list(_derive(sWord, ":p"))
+
+def derive (sWord, sTarget):
+    "returns list of forms of sWord for sTarget: “:m:s” or “:m:p” (masculine forms of a feminine form), “:p” (uncommon plurals)"
+    return list(_derive(sWord, sTarget))
+
+def deriveMany (lWord, sTarget):
+    "returns dictionary: word of lWord -> list of its forms for sTarget (see derive), words without such forms omitted"
+    dForms = {}
+    for sWord in lWord:
+        tForms = _derive(sWord, sTarget)
+        if tForms:
+            dForms[sWord] = list(tForms)
+    return dForms
+
+@functools.lru_cache(maxsize=4096)
+def _derive (sWord, sTarget):
+    "returns tuple of forms of sWord for sTarget (see derive)"
+    iTag = _dTargetDict[sTarget].get(sWord, None)
+    if iTag is None:
+        return ()
+    return tuple( _modifyStringWithSuffixCode(sWord, sSfx)  for sSfx in _dTargetSfx[sTarget][iTag] )
 
 def _modifyStringWithSuffixCode (sWord, sSfx):
     "returns sWord modified by sSfx"
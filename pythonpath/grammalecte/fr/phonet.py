@@ -4,10 +4,13 @@
 
 import re
 
+from ..packedtable import getTable
+
 
 ## generated data
 
-_dWord = {'face': 77, 'trafiquent': 210, 'tain': 197, 'sait': 187, 'vis': 220, 'doigts': 66, 'crient': 58, 'satire': 183, 'eaux': 12, 'centon': 39, 'soies': 189, 'boit': 21, 'archer': 9, 'bâille': 15, 'père': 169, 'gazent': 94, 'lis': 110, 'côte': 54, 'bûtes': 28, 'bouts': 25, 'ni': 135, 'partit': 149, 'tien': 203, 'reines': 167, 'hauteurs': 13, 'cirrhes': 49, 'déceler': 63, 'serres': 40, 'allait': 4, 'gauss': 97, 'dé': 62, 'porc': 160, 'cendre': 37, 'valaient': 215, 'lac': 107, 'loup': 112, 'celles': 36, 'quant': 31, 'sennes': 38, 'amènent': 5, 'aires': 1, 'briquent': 27, 'craque': 56, 'sotte': 184, 'aux': 12, 'chiquent': 45, 'pansés': 146, 'compte': 52, 'murent': 134, 'hérauts': 102, 'puis': 176, 'viols': 221, 'mal': 119, 'viol': 221, 'mie': 127, 'a': 0, 'dues': 68, 'suis': 196, 'archée': 9, 'vends': 217, 'peu': 152, 'sein': 186, 'prêt': 172, 'céleris': 35, 'toc': 204, 'nids': 135, 'seaux': 195, 'chant': 43, 'où': 140, 'tient': 203, 'craques': 56, 'gazes': 94, 'mouds': 133, 'porcs': 160, 'butent': 28, 'toque': 204, 'hé': 72, 'lisse': 109, 'baille': 15, 'signe': 60, 'travaille': 211, 'poignée': 156, 'vil': 219, 'nôtres': 137, 'sole': 190, 'maures': 130, 'cerfs': 40, 'sent': 182, 'moue': 133, 'ports': 160, 'calcules': 30, 'boxent': 26, 'fêtes': 81, 'étends': 74, 'rappel': 165, 'antres': 7, 'pris': 173, 'calculs': 30, 'emplois': 70, 'poing': 158, 'bourg': 24, 'bar': 17, 'mures': 134, 'maints': 115, 'fort': 88, 'faites': 81, 'val': 214, 'ha': 0, 'pots': 150, 'vingt': 213, 'pansé': 146, 'fois': 86, 'thym': 197, 'laquent': 107, 'piquent': 171, 'cygnes': 60, 'messe': 126, 'tir': 202, 'desceller': 63, 'panses': 145, 'messes': 126, 'sert': 40, 'faits': 81, 'bayes': 15, 'pensées': 146, 'roques': 166, 'lice': 109, 'diagnostiques': 64, 'fours': 90, 'tin': 197, 'mord': 130, 'content': 52, 'gènes': 95, 'tint': 197, 'pensés': 146, 'flique': 85, 'cent': 182, 'mètre': 118, 'arrêtent': 10, 'aille': 2, 'troques': 212, 'cèle': 36, 'cirre': 49, 'faces': 77, 'baye': 15, 'rêne': 167, 'briques': 27, 'laid': 108, 'oublies': 141, 'coups': 55, 'mas': 114, 'bals': 16, 'cendres': 37, 'cap': 32, 'relai': 177, 'chrême': 57, 'avaient': 14, 'comptent': 52, 'port': 160, 'fond': 87, 'cal': 29, 'tiquent': 201, 'gène': 95, 'cens': 182, 'ma': 114, 'malles': 119, 'colle': 51, 'mère': 124, 'ton': 206, 'taure': 207, 'allés': 4, 'golfe': 96, 'pousses': 164, 'sottes': 184, 'mûres': 134, 'signales': 188, 'cottes': 54, 'silices': 48, 'soie': 189, 'gosse': 97, 'mords': 130, 'dais': 62, 'Seine': 38, 'pries': 173, 'mettre': 118, 'fabriquant': 76, 'vers': 218, 'camps': 31, 'aile': 3, 'pois': 157, 'soutiens': 193, 'mers': 124, 'mer': 124, 'sires': 49, 'van': 217, 'laques': 107, 'était': 75, 'sire': 49, 'mante': 120, 'ceint': 186, 'voir': 223, 'renvoies': 178, 'poids': 157, 'réveille': 180, 'loch': 111, 'aillent': 2, 'parie': 148, 'es': 72, 'cri': 58, 'dés': 62, 'loque': 111, 'saine': 38, 'show': 44, 'trafic': 210, 'mûre': 134, 'ai': 72, 'mâts': 114, 'luths': 113, 'butes': 28, 'bard': 17, 'thyms': 197, 'aller': 4, 'tous': 209, 'vans': 217, 'tant': 198, 'boss': 23, 'étain': 73, 'sont': 192, 'lient': 110, 'scènes': 38, 'laids': 108, 'tors': 207, 'but': 28, 'boîte': 22, 'boue': 25, 'renvois': 178, 'sers': 40, 'thon': 206, 'ville': 219, 'films': 83, 'doit': 66, 'sceau': 195, 'couds': 55, 'vint': 213, 'film': 83, 'beaux': 20, 'boues': 25, 'khôls': 51, 'marcs': 122, 'mois': 132, 'rennes': 167, 'bricks': 27, 'allers': 4, 'mythes': 128, 'vallée': 215, 'heures': 103, 'lut': 113, 'relayent': 177, 'coq': 53, 'desseller': 63, 'il': 104, 'mur': 134, 'points': 158, 'bars': 17, 'prix': 173, 'teinte': 199, 'fassent': 77, 'fut': 91, 'valent': 214, 'flic': 85, 'colles': 51, 'volent': 224, 'paires': 169, 'cracks': 56, 'étant': 74, 'ils': 104, 'mont': 129, 'poings': 158, 'héro': 102, 'troque': 212, 'choques': 46, 'toits': 205, 'nies': 135, 'troc': 212, 'teints': 197, 'feins': 84, 'tond': 206, 'fête': 81, 'sets': 42, 'cilices': 48, 'luttent': 113, 'teintent': 199, 'signalent': 188, 'hauts': 12, 'pairs': 169, 'auteur': 13, 'haut': 12, 'pores': 160, 'quand': 31, 'files': 82, 'tout': 208, 'peux': 152, 'éteint': 73, 'son': 192, 'fonds': 87, 'bas': 18, 'haute': 101, 'roc': 166, 'seau': 195, 'kraks': 56, 'chants': 43, 'lai': 108, 'allée': 4, 'cerf': 40, 'vols': 224, 'oublie': 141, 'main': 115, 'site': 50, 'poignet': 156, 'trocs': 212, 'basilics': 19, 'Paris': 148, 'allais': 4, 'sen': 38, 'menthes': 120, 'cents': 182, 'cène': 38, 'crème': 57, 'tins': 197, 'laits': 108, 'saints': 186, 'thons': 206, 'chaux': 44, 'mort': 130, 'moues': 133, 'pensé': 146, 'caches': 33, 'camp': 31, 'boîtes': 22, 'peines': 170, 'poix': 157, 'fût': 91, 'rouent': 181, 'vins': 213, 'comptes': 52, 'vallées': 215, 'satires': 183, 'lits': 110, 'paries': 148, 'suies': 196, 'ses': 187, 'diagnostics': 64, 'violes': 221, 'barrent': 17, 'six': 47, 'avez': 14, 'cires': 49, 'tiens': 203, 'emploie': 70, 'chaud': 44, 'choc': 46, 'îles': 104, 'faîte': 81, 'tousses': 209, 'amen': 5, 'signes': 60, 'jeûnes': 105, 'scythe': 50, 'pouah': 157, 'étaient': 75, 'selles': 36, 'pu': 174, 'sautent': 184, 'basilic': 19, 'khans': 31, 'forts': 88, 'jeunes': 105, 'laque': 107, 'selleries': 35, 'ail': 2, 'les': 108, 'étang': 74, 'celle': 36, 'fous': 89, 'sang': 182, 'coke': 53, 'haussent': 100, 'louent': 112, 'polissoir': 159, 'loues': 112, 'suie': 196, 'dus': 68, 'pusse': 175, 'paire': 169, 'crèmes': 57, 'maître': 118, 'bailles': 15, 'travaillent': 211, 'travail': 211, 'sot': 195, 'tons': 206, 'pennes': 170, 'tic': 201, 'parient': 148, 'pool': 161, 'mis': 127, 'for': 88, 'heure': 103, 'basilique': 19, 'halles': 99, 'sols': 190, 'pics': 171, 'bourres': 24, 'col': 51, 'pue': 174, 'polissoirs': 159, 'ère': 1, 'fasse': 77, 'buttent': 28, 'réveillent': 180, 'elle': 3, 'lacs': 107, 'fers': 78, 'prît': 173, 'voie': 222, 'marquent': 123, 'soutient': 193, 'antre': 7, 'mûrs': 134, 'sangs': 182, 'pouces': 164, 'peau': 150, 'pals': 168, 'tores': 207, 'coqs': 53, 'penses': 145, 'au': 12, 'roue': 181, 'emploies': 70, 'cèles': 36, 'fliques': 85, 'grès': 98, 'fliquent': 85, 'serrent': 40, 'cote': 54, 'archets': 9, 'ceins': 186, 'pique': 171, 'tend': 198, 'maintient': 116, 'arêtes': 10, 'cilice': 48, 'fus': 91, 'maintiens': 116, 'calculent': 30, 'par': 147, 'perd': 169, 'savons': 185, 'roux': 181, 'or': 139, 'tord': 207, 'marais': 121, 'renvoie': 178, 'dînent': 65, 'saules': 190, 'mure': 134, 'pou': 162, 'partie': 149, 'plis': 154, 'contes': 52, 'lissent': 109, 'hotte': 101, 'visses': 220, 'golfs': 96, 'maux': 131, 'mares': 122, 'vice': 220, 'boite': 22, 'nient': 135, 'archet': 9, 'dynes': 65, 'bâilles': 15, 'ans': 6, 'sois': 189, 'peut': 152, 'mors': 130, 'foies': 86, 'cou': 55, 'cache': 33, 'verre': 218, 'hausses': 100, 'aie': 72, 'poils': 155, 'nid': 135, 'pal': 168, 'appelle': 8, 'ceints': 186, 'aies': 72, 'ferrent': 78, 'hausse': 100, 'dont': 67, 'hôte': 101, 'pêne': 170, 'coques': 53, 'signent': 60, 'aire': 1, 'chiques': 45, 'vainc': 213, 'toussent': 209, 'parent': 147, 'noie': 136, 'fonts': 87, 'réveilles': 180, 'ô': 12, 'lies': 110, 'bute': 28, 'pouls': 162, 'scie': 47, 'du': 68, 'noies': 136, 'santons': 39, 'voies': 222, 'vaincs': 213, 'nie': 135, 'peins': 142, 'panse': 145, 'pale': 168, 'heurt': 103, 'lute': 113, 'scelles': 36, 'bourre': 24, 'bail': 15, 'éclaire': 69, 'tirs': 202, 'puits': 176, 'pense': 145, 'bossent': 23, 'moult': 133, 'garantie': 93, 'entretiens': 71, 'vissent': 220, 'veaux': 216, 'trafiques': 210, 'réveils': 180, 'caps': 32, 'vos': 216, 'foie': 86, 'entres': 7, 'restaurants': 179, 'pin': 142, 'crie': 58, 'bois': 21, 'coûts': 55, 'gêne': 95, 'loups': 112, 'prêts': 172, 'mythe': 128, 'brick': 27, 'tonds': 206, 'haire': 1, 'gangue': 92, 'appelles': 8, 'cals': 29, 'pore': 160, 'souffrent': 194, 'valet': 215, 'sens': 182, 'diagnostiquent': 64, 'poule': 161, 'ver': 218, 'taie': 200, 'balles': 16, 'haires': 1, 'souffre': 194, 'beau': 20, 'marrent': 122, 'rappellent': 165, 'conte': 52, 'ais': 72, 'cites': 50, 'pré': 172, 'saines': 38, 'valais': 215, 'allé': 4, 'vole': 224, 'calcul': 30, 'sites': 50, 'monts': 129, 'dois': 66, 'pain': 142, 'ailles': 2, 'auteurs': 13, 'boitent': 22, 'appellent': 8, 'chics': 45, 'amènes': 5, 'Gauss': 97, 'relais': 177, 'été': 75, 'pouffes': 163, 'part': 147, 'paris': 148, 'dyne': 65, 'pussent': 175, 'hères': 1, 'pusses': 175, 'jeûnent': 105, 'verts': 218, 'brique': 27, 'fins': 84, 'attelle': 11, 'bah': 18, 'relaye': 177, 'croîs': 59, 'sots': 195, 'vices': 220, 'pênes': 170, 'fasces': 77, 'sis': 47, 'soient': 189, 'pares': 147, 'roque': 166, 'comte': 52, 'dans': 61, 'morts': 130, 'flics': 85, 'pins': 142, 'rappels': 165, 'cries': 58, 'cale': 29, 'rocs': 166, 'basiliques': 19, 'torts': 207, 'fourrent': 90, 'vol': 224, 'avait': 14, 'marrais': 121, 'gangues': 92, 'vaut': 216, 'houx': 140, 'toi': 205, 'pic': 171, 'viole': 221, 'bric': 27, 'calcule': 30, 'santon': 39, 'mots': 131, 'garantit': 93, 'pensée': 146, 'eau': 12, 'poignets': 156, 'savon': 185, 'cris': 58, 'puces': 175, 'cet': 42, 'sellent': 36, 'hais': 72, 'voient': 222, 'avais': 14, 'étains': 73, 'tords': 207, 'errent': 1, 'troquent': 212, 'mît': 127, 'cygne': 60, 'butte': 28, 'archées': 9, 'vau': 216, 'allez': 4, 'scies': 47, 'buttes': 28, 'pales': 168, 'mites': 128, 'peine': 170, 'éclairent': 69, 'mous': 133, 'mentent': 120, 'cales': 29, 'emploient': 70, 'gênent': 95, 'shows': 44, 'loques': 111, 'villes': 219, 'hôtes': 101, 'faire': 78, 'maure': 130, 'box': 26, 'chic': 45, 'laies': 108, 'travailles': 211, 'entretient': 71, 'sain': 186, 'étais': 75, 'crac': 56, 'loue': 112, 'ôtes': 101, 'vair': 218, 'croît': 59, 'cotent': 54, 'plies': 154, 'moud': 133, 'noient': 136, 'cire': 49, 'mes': 125, 'pouce': 164, 'scène': 38, 'faut': 80, 'gênes': 95, 'toux': 208, 'éclaires': 69, 'sellerie': 35, 'cotte': 54, 'verres': 218, 'dû': 68, 'bât': 18, 'scythes': 50, 'étangs': 74, 'chrêmes': 57, 'ah': 0, 'toquent': 204, 'peint': 142, 'prient': 173, 'khôl': 51, 'rappelles': 165, 'set': 42, 'soi': 189, 'attellent': 11, 'se': 34, 'fout': 89, 'airs': 1, 'erre': 1, 'mètres': 118, 'eh': 72, 'selle': 36, 'coque': 53, 'gang': 92, 'teins': 197, 'faite': 81, 'temps': 198, 'golfes': 96, 'sels': 36, 'poignées': 156, 'pools': 161, 'fasses': 77, 'sandre': 37, 'gosses': 97, 'doigt': 66, 'fabricant': 76, 'an': 6, 'sept': 42, 'met': 125, 'tires': 202, 'plie': 154, 'malle': 119, 'tends': 198, 'maires': 124, 'signale': 188, 'île': 104, 'pues': 174, 'as': 0, 'fait': 81, 'satyre': 183, 'pousse': 164, 'capes': 32, 'valets': 215, 'heurts': 103, 'feint': 84, 'buts': 28, 'mot': 131, 'éclair': 69, 'cous': 55, 'cite': 50, 'maire': 124, 'cirrhe': 49, 'crois': 59, 'oublient': 141, 'air': 1, 'mite': 128, 'ères': 1, 'archers': 9, 'héros': 102, 'voix': 222, 'faîtes': 81, 'krak': 56, 'coud': 55, 'serfs': 40, 'taures': 207, 'piques': 171, 'en': 6, 'faim': 84, 'diagnostic': 64, 'lie': 110, 'plient': 154, 'tore': 207, 'barre': 17, 'heur': 103, 'dent': 61, 'saint': 186, 'cape': 32, 'appel': 8, 'polissoire': 159, 'diagnostique': 64, 'thés': 200, 'toit': 205, 'côtes': 54, 'thé': 200, 'laie': 108, 'font': 87, 'moûts': 133, 'sains': 186, 'fées': 79, 'hère': 1, 'fore': 88, 'vois': 222, 'sans': 182, 'vert': 218, 'reine': 167, 'golf': 96, 'là': 106, 'due': 68, 'vains': 213, 'ces': 187, 'champ': 43, 'ferres': 78, 'senne': 38, 'mark': 123, 'las': 106, 'emploi': 70, 'mât': 114, 'attelles': 11, 'à': 0, 'satyres': 183, 'arête': 10, 'si': 47, 'suit': 196, 'étés': 75, 'murs': 134, 'toques': 204, 'khan': 31, 'héraut': 102, 'tinte': 199, 'aient': 72, 'pères': 169, 'roues': 181, 'gausses': 97, 'fors': 88, 'trafics': 210, 'amène': 5, 'tes': 200, 'éteins': 73, 'penne': 170, 'bards': 17, 'vaux': 216, 'mâles': 119, 'restaurent': 179, 'auteures': 13, 'croix': 59, 'taies': 200, 'faux': 80, 'sommes': 191, 'cash': 33, 'est': 72, 'maint': 115, 'avé': 14, 'oubli': 141, 'seins': 186, 'mais': 125, 'sceaux': 195, 'mare': 122, 'poules': 161, 'bâillent': 15, 'dîne': 65, 'violent': 221, 'filme': 83, 'choque': 46, 'chique': 45, 'mess': 126, 'four': 90, 'elles': 3, 'fourre': 90, 'teintes': 199, 'mûr': 134, 'bosses': 23, 'des': 62, 'gré': 98, 'ers': 1, 'puce': 175, 'étai': 75, 'veau': 216, 'bourgs': 24, 'cette': 42, 'poux': 162, 'maintien': 116, 'sol': 190, 'marque': 123, 'pouffe': 163, 'dînes': 65, 'hâle': 99, 'lait': 108, 'marée': 121, 'os': 100, 'crack': 56, 'pus': 174, 'filmes': 83, 'tique': 201, 'filment': 83, 'don': 67, 'fin': 84, 'vain': 213, 'vals': 214, 'mon': 129, 'tousse': 209, 'pers': 169, 'vils': 219, 'ont': 138, 'renne': 167, 'scelle': 36, 'put': 174, 'garanties': 93, 'sais': 187, 'somme': 191, 'marres': 122, 'cirres': 49, 'mantes': 120, 'mets': 125, 'calent': 29, 'luth': 113, 'serre': 40, 'pucent': 175, 'menthe': 120, 'soufres': 194, 'nôtre': 137, 'ôte': 101, 'chaut': 44, 'pains': 142, 'sautes': 184, 'vend': 217, 'erres': 1, 'bous': 25, 'visse': 220, 'teint': 197, 'la': 106, 'marées': 121, 'luttes': 113, 'garantis': 93, 'réveil': 180, 'arrête': 10, 'saute': 184, 'soutien': 193, 'scellent': 36, 'valait': 215, 'bosse': 23, 'relayes': 177, 'soles': 190, 'rauques': 166, 'maîtres': 118, 'dons': 67, 'balle': 16, 'trafique': 210, 'pot': 150, 'serf': 40, 'cirent': 49, 'boxes': 26, 'pars': 147, 'près': 172, 'ce': 34, 'mit': 127, 'fou': 89, 'soit': 189, 'céleri': 35, 'marraient': 121, 'gaussent': 97, 'bâts': 18, 'fer': 78, 'bourrent': 24, 'haie': 72, 'lit': 110, 'poêle': 155, 'chauds': 44, 'parts': 147, 'noix': 136, 'cokes': 53, 'lices': 109, 'gausse': 97, 'comtes': 52, 'ait': 72, 'hors': 139, 'renvoi': 178, 'scient': 47, 'marques': 123, 'hâles': 99, 'cols': 51, 'tiques': 201, 'entrent': 7, 'tintent': 199, 'collent': 51, 'ôtent': 101, 'coup': 55, 'mains': 115, 'partis': 149, 'fasce': 77, 'ailes': 3, 'haies': 72, 'marc': 122, 'hauteur': 13, 'centons': 39, 'marre': 122, 'bal': 16, 'tire': 202, 'dents': 61, 'lutes': 113, 'ci': 47, 'mai': 125, 'renvoient': 178, 'boxe': 26, 'ors': 139, 'sel': 36, 'ou': 140, 'on': 138, 'appels': 8, 'étend': 74, 'mères': 124, 'fabricants': 76, 'mente': 120, 'silice': 48, 'sons': 192, 'lisses': 109, 'cachent': 33, 'sentons': 39, 'pâles': 168, 'pâle': 168, 'fée': 79, 'entretien': 71, 'golfent': 96, 'rauque': 166, 'fourres': 90, 'croit': 59, 'roquent': 166, 'saule': 190, 'bayent': 15, 'moût': 133, 'bout': 25, 'chocs': 46, 'arrêtes': 10, 'champs': 43, 'cèlent': 36, 'jeûne': 105, 'tort': 207, 'polissoires': 159, 'prit': 173, 'pensent': 145, 'aïe': 2, 'rappelle': 165, 'faims': 84, 'gaze': 94, 'vents': 217, 'atèle': 11, 'éclairs': 69, 'allées': 4, 'allaient': 4, 'perds': 169, 'ferre': 78, 'restaurant': 179, 'fores': 88, 'moi': 132, 'mou': 133, 'gaz': 94, 'dès': 62, 'fil': 82, 'vent': 217, 'croient': 59, 'peinent': 170, 'poil': 155, 'baillent': 15, 'tirent': 202, 'parties': 149, 'forent': 88, 'mentes': 120, 'citent': 50, 'pare': 147, 'pouf': 163, 'choquent': 46, 'auteure': 13, 'tintes': 199, 'prie': 173, 'mies': 127, 'point': 158, 'marks': 123, 'pli': 154, 'hautes': 101, 'pair': 169, 'notre': 137, 'poussent': 164, 'barres': 17, 'fils': 82, 'voire': 223, 'lochs': 111, 'lys': 109, 'entre': 7, 'prés': 172, 'file': 82, 'baux': 20, 'parti': 149, 'jeune': 105, 'rênes': 167, 'peaux': 150, 'pari': 148, 'mâle': 119, 'oublis': 141, 'pouffent': 163, 'coût': 55, 'signal': 188, 'marrait': 121, 'sandres': 37, 'et': 72, 'cotes': 54, 'filent': 82, 'voit': 222, 'voles': 224, 'lutent': 113, 'craquent': 56, 'halle': 99, 'foi': 86, 'gangs': 92}
+# packed table (french.phonet.tbl in _dictionaries) or, if it has not been built, the dictionary of phonet_data.py
+_dWord = getTable("french.phonet.tbl", ".phonet_data", "_dWord", __package__)
 
 _lSet = [['a', 'ah', 'as', 'ha', 'à'], ['air', 'aire', 'aires', 'airs', 'erre', 'errent', 'erres', 'ers', 'haire', 'haires', 'hère', 'hères', 'ère', 'ères'], ['ail', 'aille', 'aillent', 'ailles', 'aïe'], ['aile', 'ailes', 'elle', 'elles'], ['allaient', 'allais', 'allait', 'aller', 'allers', 'allez', 'allé', 'allée', 'allées', 'allés'], ['amen', 'amène', 'amènent', 'amènes'], ['an', 'ans', 'en'], ['antre', 'antres', 'entre', 'entrent', 'entres'], ['appel', 'appelle', 'appellent', 'appelles', 'appels'], ['archer', 'archers', 'archet', 'archets', 'archée', 'archées'], ['arrête', 'arrêtent', 'arrêtes', 'arête', 'arêtes'], ['attelle', 'attellent', 'attelles', 'atèle'], ['au', 'aux', 'eau', 'eaux', 'haut', 'hauts', 'ô'], ['auteur', 'auteure', 'auteures', 'auteurs', 'hauteur', 'hauteurs'], ['avaient', 'avais', 'avait', 'avez', 'avé'], ['bail', 'baille', 'baillent', 'bailles', 'baye', 'bayent', 'bayes', 'bâille', 'bâillent', 'bâillent', 'bâilles'], ['bal', 'balle', 'balles', 'bals'], ['bar', 'bard', 'bards', 'barre', 'barrent', 'barres', 'bars'], ['bah', 'bas', 'bât', 'bâts'], ['basilic', 'basilics', 'basilique', 'basiliques'], ['baux', 'beau', 'beaux'], ['bois', 'boit'], ['boite', 'boite', 'boitent', 'boîte', 'boîtes'], ['boss', 'bosse', 'bossent', 'bosses'], ['bourg', 'bourgs', 'bourre', 'bourrent', 'bourres'], ['boue', 'boues', 'bous', 'bout', 'bouts'], ['box', 'boxe', 'boxent', 'boxes'], ['bric', 'brick', 'bricks', 'brique', 'briquent', 'briques'], ['but', 'bute', 'butent', 'butes', 'buts', 'butte', 'buttent', 'buttes', 'bûtes'], ['cal', 'cale', 'calent', 'cales', 'cals'], ['calcul', 'calcule', 'calculent', 'calcules', 'calculs'], ['camp', 'camps', 'khan', 'khans', 'quand', 'quant'], ['cap', 'cape', 'capes', 'caps'], ['cache', 'cachent', 'caches', 'cash'], ['ce', 'se'], ['céleri', 'céleris', 'sellerie', 'selleries'], ['celle', 'celles', 'cèle', 'cèlent', 'cèles', 'scelle', 'scellent', 'scelles', 'sel', 'selle', 'sellent', 'selles', 'sels'], ['cendre', 'cendres', 'sandre', 'sandres'], ['Seine', 'cène', 'saine', 'saines', 'scène', 'scènes', 'sen', 'senne', 'sennes'], ['centon', 'centons', 'santon', 'santons', 'sentons'], ['cerf', 'cerfs', 'serf', 'serfs', 'serre', 'serrent', 'serres', 'sers', 'sert'], ['ces', 'sais', 'sait', 'ses'], ['cet', 'cette', 'sept', 'set', 'sets'], ['champ', 'champs', 'chant', 'chants'], ['chaud', 'chauds', 'chaut', 'chaux', 'show', 'shows'], ['chic', 'chics', 'chique', 'chiquent', 'chiques'], ['choc', 'chocs', 'choque', 'choquent', 'choques'], ['ci', 'scie', 'scient', 'scies', 'si', 'sis', 'six'], ['cilice', 'cilices', 'silice', 'silices'], ['cire', 'cirent', 'cires', 'cirre', 'cirres', 'cirrhe', 'cirrhes', 'sire', 'sires'], ['cite', 'citent', 'cites', 'scythe', 'scythes', 'site', 'sites'], ['col', 'colle', 'collent', 'colles', 'cols', 'khôl', 'khôls'], ['compte', 'comptent', 'comptes', 'comte', 'comtes', 'conte', 'content', 'contes'], ['coke', 'cokes', 'coq', 'coqs', 'coque', 'coques'], ['cote', 'cotent', 'cotes', 'cotte', 'cottes', 'côte', 'côtes'], ['cou', 'coud', 'couds', 'coup', 'coups', 'cous', 'coût', 'coûts'], ['crac', 'crack', 'cracks', 'craque', 'craquent', 'craques', 'krak', 'kraks'], ['chrême', 'chrêmes', 'crème', 'crèmes'], ['cri', 'crie', 'crient', 'cries', 'cris'], ['croient', 'crois', 'croit', 'croix', 'croîs', 'croît'], ['cygne', 'cygnes', 'signe', 'signent', 'signes'], ['dans', 'dent', 'dents'], ['dais', 'des', 'dès', 'dé', 'dés'], ['desceller', 'desseller', 'déceler'], ['diagnostic', 'diagnostics', 'diagnostique', 'diagnostiquent', 'diagnostiques'], ['dyne', 'dynes', 'dîne', 'dînent', 'dînes'], ['doigt', 'doigts', 'dois', 'doit'], ['don', 'dons', 'dont'], ['du', 'due', 'dues', 'dus', 'dû'], ['éclair', 'éclaire', 'éclairent', 'éclaires', 'éclairs'], ['emploi', 'emploie', 'emploient', 'emploies', 'emplois'], ['entretien', 'entretiens', 'entretient'], ['ai', 'aie', 'aient', 'aies', 'ais', 'ait', 'eh', 'es', 'est', 'et', 'haie', 'haies', 'hais', 'hé'], ['étain', 'étains', 'éteins', 'éteint'], ['étang', 'étangs', 'étant', 'étend', 'étends'], ['étai', 'étaient', 'étais', 'était', 'été', 'étés'], ['fabricant', 'fabricants', 'fabriquant'], ['face', 'faces', 'fasce', 'fasces', 'fasse', 'fassent', 'fasses'], ['faire', 'fer', 'ferre', 'ferrent', 'ferres', 'fers'], ['fait', 'faits', 'fée', 'fées'], ['faut', 'faux'], ['fait', 'faite', 'faites', 'faits', 'faîte', 'faîtes', 'fête', 'fêtes'], ['fil', 'file', 'filent', 'files', 'fils'], ['film', 'filme', 'filment', 'filmes', 'films'], ['faim', 'faims', 'feins', 'feint', 'fin', 'fins'], ['flic', 'flics', 'flique', 'fliquent', 'fliques'], ['foi', 'foie', 'foies', 'fois'], ['fond', 'fonds', 'font', 'fonts'], ['for', 'fore', 'forent', 'fores', 'fors', 'fort', 'forts'], ['fou', 'fous', 'fout'], ['four', 'fourre', 'fourrent', 'fourres', 'fours'], ['fus', 'fut', 'fût'], ['gang', 'gangs', 'gangue', 'gangues'], ['garantie', 'garanties', 'garantis', 'garantit'], ['gaz', 'gaze', 'gazent', 'gazes'], ['gène', 'gènes', 'gêne', 'gênent', 'gênes'], ['golf', 'golfe', 'golfent', 'golfes', 'golfs'], ['Gauss', 'gauss', 'gausse', 'gaussent', 'gausses', 'gosse', 'gosses'], ['grès', 'gré'], ['halle', 'halles', 'hâle', 'hâles'], ['hausse', 'haussent', 'hausses', 'os'], ['haute', 'hautes', 'hotte', 'hotte', 'hôte', 'hôtes', 'ôte', 'ôtent', 'ôtes'], ['héraut', 'hérauts', 'héro', 'héros'], ['heur', 'heure', 'heures', 'heurt', 'heurts'], ['il', 'ils', 'île', 'îles'], ['jeune', 'jeunes', 'jeûne', 'jeûnent', 'jeûnes'], ['la', 'las', 'là'], ['lac', 'lacs', 'laque', 'laquent', 'laques'], ['lai', 'laid', 'laids', 'laie', 'laies', 'lait', 'laits', 'les'], ['lice', 'lices', 'lisse', 'lissent', 'lisses', 'lys'], ['lie', 'lient', 'lies', 'lis', 'lit', 'lits'], ['loch', 'lochs', 'loque', 'loques'], ['loue', 'louent', 'loues', 'loup', 'loups'], ['lut', 'lute', 'lutent', 'lutes', 'luth', 'luths', 'luttent', 'luttes', 'luttes'], ['ma', 'mas', 'mât', 'mâts'], ['main', 'mains', 'maint', 'maints'], ['maintien', 'maintiens', 'maintient'], ['maire', 'maires', 'mer', 'mers', 'mère', 'mères'], ['maître', 'maîtres', 'mettre', 'mètre', 'mètres'], ['mal', 'malle', 'malles', 'mâle', 'mâles'], ['mante', 'mantes', 'mente', 'mentent', 'mentes', 'menthe', 'menthes'], ['marais', 'marraient', 'marrais', 'marrait', 'marée', 'marées'], ['marc', 'marcs', 'mare', 'mares', 'marre', 'marrent', 'marres'], ['mark', 'marks', 'marque', 'marquent', 'marques'], ['maire', 'maires', 'mer', 'mers', 'mère', 'mères'], ['mai', 'mais', 'mes', 'met', 'mets'], ['mess', 'messe', 'messes'], ['mie', 'mies', 'mis', 'mit', 'mît'], ['mite', 'mites', 'mythe', 'mythes'], ['mon', 'mont', 'monts'], ['maure', 'maures', 'mord', 'mords', 'mors', 'mort', 'morts'], ['maux', 'mot', 'mots'], ['moi', 'mois'], ['mou', 'moud', 'mouds', 'moue', 'moues', 'moult', 'mous', 'moût', 'moûts'], ['mur', 'mure', 'murent', 'mures', 'murs', 'mûr', 'mûre', 'mûres', 'mûrs'], ['ni', 'nid', 'nids', 'nie', 'nient', 'nies'], ['noie', 'noient', 'noies', 'noix'], ['notre', 'nôtre', 'nôtres'], ['on', 'ont'], ['hors', 'or', 'ors'], ['houx', 'ou', 'où'], ['oubli', 'oublie', 'oublient', 'oublies', 'oublis'], ['pain', 'pains', 'peins', 'peint', 'pin', 'pins'], ['pair', 'paire', 'paires', 'pairs', 'père', 'pères'], ['pal', 'pale', 'pales', 'pals', 'pâle', 'pâles'], ['panse', 'panses', 'pense', 'pensent', 'penses'], ['pansé', 'pansés', 'pensé', 'pensée', 'pensées', 'pensés'], ['par', 'par', 'pare', 'parent', 'pares', 'pars', 'part', 'parts'], ['Paris', 'pari', 'parie', 'parient', 'paries', 'paris'], ['parti', 'partie', 'parties', 'partis', 'partit'], ['peau', 'peaux', 'pot', 'pots'], ['peine', 'peinent', 'peines', 'penne', 'pennes', 'pêne', 'pênes'], ['peu', 'peut', 'peux'], ['pic', 'pics', 'pique', 'piquent', 'piques'], ['pli', 'plie', 'plient', 'plies', 'plis'], ['poil', 'poils', 'poêle', 'poêle'], ['poignet', 'poignets', 'poignée', 'poignées'], ['poids', 'pois', 'poix', 'pouah'], ['poing', 'poings', 'point', 'points'], ['polissoir', 'polissoire', 'polissoires', 'polissoirs'], ['porc', 'porcs', 'pore', 'pores', 'port', 'ports'], ['pool', 'pools', 'poule', 'poules'], ['pou', 'pouls', 'poux'], ['pouf', 'pouffe', 'pouffent', 'pouffes'], ['pouce', 'pouces', 'pousse', 'poussent', 'pousses'], ['rappel', 'rappelle', 'rappellent', 'rappelles', 'rappels'], ['rauque', 'rauques', 'roc', 'rocs', 'roque', 'roquent', 'roques'], ['reine', 'reines', 'renne', 'rennes', 'rêne', 'rênes'], ['pal', 'pale', 'pales', 'pals', 'pâle', 'pâles'], ['pair', 'paire', 'paires', 'pairs', 'perd', 'perds', 'pers', 'père', 'pères'], ['peine', 'peinent', 'peines', 'penne', 'pennes', 'pêne', 'pênes'], ['pic', 'pics', 'pique', 'piquent', 'piques'], ['près', 'pré', 'prés', 'prêt', 'prêts'], ['prie', 'prient', 'pries', 'pris', 'prit', 'prix', 'prît'], ['pu', 'pue', 'pues', 'pus', 'put'], ['puce', 'pucent', 'puces', 'pusse', 'pussent', 'pusses'], ['puis', 'puits'], ['relai', 'relais', 'relaye', 'relayent', 'relayes'], ['renvoi', 'renvoie', 'renvoient', 'renvoies', 'renvois'], ['restaurant', 'restaurants', 'restaurent'], ['réveil', 'réveille', 'réveillent', 'réveilles', 'réveils'], ['roue', 'rouent', 'roues', 'roux'], ['cens', 'cent', 'cents', 'sang', 'sangs', 'sans', 'sens', 'sent'], ['satire', 'satires', 'satyre', 'satyres'], ['saute', 'sautent', 'sautes', 'sotte', 'sottes'], ['savon', 'savons'], ['ceins', 'ceint', 'ceints', 'sain', 'sains', 'saint', 'saints', 'sein', 'seins'], ['ces', 'sais', 'sait', 'ses'], ['signal', 'signale', 'signalent', 'signales'], ['soi', 'soie', 'soient', 'soies', 'sois', 'soit'], ['saule', 'saules', 'sol', 'sole', 'soles', 'sols'], ['somme', 'sommes'], ['son', 'sons', 'sont'], ['soutien', 'soutiens', 'soutient'], ['souffre', 'souffre', 'souffrent', 'soufres', 'soufres'], ['sceau', 'sceaux', 'seau', 'seaux', 'sot', 'sots'], ['suie', 'suies', 'suis', 'suit'], ['tain', 'teins', 'teint', 'teints', 'thym', 'thyms', 'tin', 'tins', 'tint'], ['tant', 'temps', 'tend', 'tends'], ['teinte', 'teintent', 'teintes', 'tinte', 'tintent', 'tintes'], ['taie', 'taies', 'tes', 'thé', 'thés'], ['tic', 'tique', 'tiquent', 'tiques'], ['tir', 'tire', 'tirent', 'tires', 'tirs'], ['tien', 'tiens', 'tient'], ['toc', 'toque', 'toquent', 'toques'], ['toi', 'toit', 'toits'], ['thon', 'thons', 'ton', 'tond', 'tonds', 'tons'], ['taure', 'taures', 'tord', 'tords', 'tore', 'tores', 'tors', 'tort', 'torts'], ['tout', 'toux'], ['tous', 'tousse', 'toussent', 'tousses'], ['trafic', 'trafics', 'trafique', 'trafiquent', 'trafiques'], ['travail', 'travaille', 'travaillent', 'travailles'], ['troc', 'trocs', 'troque', 'troquent', 'troques'], ['vain', 'vainc', 'vaincs', 'vains', 'vingt', 'vins', 'vint'], ['val', 'valent', 'vals'], ['valaient', 'valais', 'valait', 'valet', 'valets', 'vallée', 'vallées'], ['vau', 'vaut', 'vaux', 'veau', 'veaux', 'vos'], ['van', 'vans', 'vend', 'vends', 'vent', 'vents'], ['vair', 'ver', 'verre', 'verres', 'vers', 'vert', 'verts'], ['vil', 'ville', 'villes', 'vils'], ['vice', 'vices', 'vis', 'visse', 'vissent', 'visses'], ['viol', 'viole', 'violent', 'violes', 'viols'], ['voie', 'voient', 'voies', 'vois', 'voit', 'voix'], ['voir', 'voire'], ['vol', 'vole', 'volent', 'voles', 'vols']]
 
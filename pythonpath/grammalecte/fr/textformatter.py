@@ -228,12 +228,200 @@ class TextFormatter:
         for sOpt, lTup in dReplTable.items():
             for i, t in enumerate(lTup):
                 lTup[i] = (re.compile(t[0]), t[1])
+        self.lPass = compilePasses([ sOptName  for sOptName, bVal in lOptRepl  if bVal ])
 
     def formatText (self, sText, **args):
-        for sOptName, bVal in lOptRepl:
-            if bVal:
-                for zRgx, sRep in dReplTable[sOptName]:
-                    #echo("{}  -->  {}".format(zRgx.pattern, sRep))
-                    sText = zRgx.sub(sRep, sText)
-                    #echo(sText)
+        for zTrigger, lRepl in self.lPass:
+            if zTrigger and not zTrigger.search(sText):
+                # no replacement of this option can be done
+                continue
+            for zRgx, sRep, zRuleTrigger in lRepl:
+                if zRuleTrigger and not zRuleTrigger.search(sText):
+                    continue
+                #echo("{}  -->  {}".format(zRgx.pattern, sRep))
+                sText = zRgx.sub(sRep, sText)
+                #echo(sText)
         return sText
+
+
+# Triggers
+#
+# Replacements are done one after another, as each one may create or prevent the following ones:
+# they can’t be merged in one regex without changing the results.
+# But most replacements can’t be done in most paragraphs, and a regex can’t be found in a text
+# without some strings of its pattern. These strings (triggers) are searched first:
+# for each option, one scan for the triggers of all its replacements, then, if found, for each replacement.
+
+def compilePasses (lOptName):
+    "returns list of (trigger of option or None, list of (regex, replacement, trigger or None)) for options in lOptName"
+    lPass = []
+    for sOptName in lOptName:
+        lRepl = []
+        lOptTrigger = []
+        for zRgx, sRep in dReplTable[sOptName]:
+            lTrigger = getTriggers(zRgx.pattern)
+            if lTrigger is None or lOptTrigger is None:
+                lOptTrigger = None
+            else:
+                lOptTrigger.extend(lTrigger)
+            lRepl.append((zRgx, sRep, _compileTrigger(lTrigger)))
+        if len(lRepl) == 1:
+            lPass.append((lRepl[0][2], [(lRepl[0][0], lRepl[0][1], None)]))
+        else:
+            lPass.append((_compileTrigger(lOptTrigger), lRepl))
+    return lPass
+
+
+def _compileTrigger (lTrigger):
+    if not lTrigger:
+        return None
+    return re.compile("|".join( re.escape(s)  for s in sorted(set(lTrigger), key=len, reverse=True) ))
+
+
+def getTriggers (sPattern):
+    """returns list of strings, one of them at least being in any text where sPattern can be found,
+       or None if there is no such string or if sPattern uses a syntax not analyzed here"""
+    bCaseless = sPattern.startswith("(?i)")
+    if bCaseless:
+        # only strings without letters
+        sPattern = sPattern[4:]
+    try:
+        lTrigger, _, i = _parseAlternatives(sPattern, 0, bCaseless)
+    except (IndexError, ValueError):
+        return None
+    if i != len(sPattern):
+        return None
+    return lTrigger
+
+
+def _parseAlternatives (sPattern, i, bCaseless):
+    """returns (triggers of alternatives from sPattern[i] to the closing parenthesis, exact, index of this parenthesis)
+       exact: any match of these alternatives is one of the triggers"""
+    lResult = []
+    bExact = True
+    while True:
+        lTrigger, bSeqExact, i = _parseSequence(sPattern, i, bCaseless)
+        if lTrigger is None:
+            lResult = None
+        elif lResult is not None:
+            lResult.extend( s  for s in lTrigger  if s not in lResult )
+        bExact = bExact and bSeqExact
+        if i >= len(sPattern) or sPattern[i] == ")":
+            return lResult, bExact and lResult is not None, i
+        i += 1
+
+
+def _parseSequence (sPattern, i, bCaseless):
+    """returns (triggers of the sequence from sPattern[i] to the next alternative or closing parenthesis, exact, index of its end)
+       exact: any match of the sequence is one of the triggers"""
+    lBest = None
+    lCurrent = [""]     # strings made of the last items required one after another
+    bExact = True       # lCurrent is made of all items of the sequence
+    while i < len(sPattern) and sPattern[i] not in "|)":
+        c = sPattern[i]
+        lItem = None
+        bItemExact = True
+        bZeroWidth = False
+        if c == "(":
+            if sPattern.startswith("(?:", i):
+                i += 3
+            elif sPattern.startswith("(?=", i) or sPattern.startswith("(?<=", i):
+                i += 3  if sPattern[i+2] == "="  else 4
+                bZeroWidth = True
+            elif sPattern.startswith("(?!", i) or sPattern.startswith("(?<!", i):
+                _, _, i = _parseAlternatives(sPattern, i + (3  if sPattern[i+2] == "!"  else 4), bCaseless)
+                i += 1
+                continue
+            elif sPattern.startswith("(?", i):
+                raise ValueError
+            else:
+                i += 1
+            lItem, bItemExact, i = _parseAlternatives(sPattern, i, bCaseless)
+            if sPattern[i] != ")":
+                raise ValueError
+            i += 1
+        elif c == "[":
+            j = sPattern.index("]", i+2)  if sPattern[i+1] == "]"  else sPattern.index("]", i+1)
+            lItem = _parseCharset(sPattern[i+1:j])
+            i = j + 1
+        elif c == "\\":
+            cNext = sPattern[i+1]
+            i += 2
+            if cNext in "bB":
+                continue
+            lItem = None  if cNext.isalnum()  else [cNext]
+        elif c in "^$":
+            i += 1
+            continue
+        elif c == ".":
+            i += 1
+        elif c in "*+?{":
+            raise ValueError
+        else:
+            lItem = [c]
+            i += 1
+        if bCaseless and lItem and any( s.lower() != s.upper()  for s in lItem ):
+            lItem = None
+        # quantifier
+        bOptional = False
+        bRepeated = False
+        if i < len(sPattern) and sPattern[i] in "*+?{":
+            if sPattern[i] == "{":
+                j = sPattern.index("}", i)
+                bOptional = not sPattern[i+1:j].split(",")[0].strip("0")
+                bRepeated = True
+                i = j + 1
+            else:
+                bOptional = sPattern[i] in "*?"
+                bRepeated = sPattern[i] in "*+"
+                i += 1
+            if i < len(sPattern) and sPattern[i] in "?+":
+                i += 1
+        if bOptional:
+            lItem = None
+        if lItem is None or bZeroWidth or not bItemExact:
+            # triggers of the item may be anywhere in its match: they can’t be joined to the other items
+            lBest = _selectTriggers(_selectTriggers(lBest, lCurrent), lItem)
+            lCurrent = [""]
+            bExact = False
+        elif bRepeated or len(lCurrent) * len(lItem) > _nMaxTriggers:
+            lBest = _selectTriggers(lBest, lCurrent)
+            lCurrent = lItem
+            bExact = False
+        else:
+            lCurrent = [ s1 + s2  for s1 in lCurrent  for s2 in lItem ]
+    if bExact:
+        return lCurrent  if all(lCurrent)  else None, True, i
+    return _selectTriggers(lBest, lCurrent), False, i
+
+
+def _parseCharset (sCharset):
+    "returns list of chars of sCharset, or None if negated or with ranges or classes"
+    if sCharset.startswith("^"):
+        return None
+    lChar = []
+    i = 0
+    while i < len(sCharset):
+        c = sCharset[i]
+        if c == "\\":
+            if sCharset[i+1].isalnum():
+                return None
+            c = sCharset[i+1]
+            i += 1
+        if i + 2 < len(sCharset) and sCharset[i+1] == "-":
+            return None
+        lChar.append(c)
+        i += 1
+    return lChar
+
+
+def _selectTriggers (lTrigger1, lTrigger2):
+    "returns the best list of triggers: the shortest trigger is the longest, then there is less triggers"
+    if not lTrigger2 or not all(lTrigger2):
+        return lTrigger1
+    if not lTrigger1 or (min(map(len, lTrigger2)), -len(lTrigger2)) > (min(map(len, lTrigger1)), -len(lTrigger1)):
+        return lTrigger2
+    return lTrigger1
+
+
+_nMaxTriggers = 16      # max number of triggers of a sequence of items
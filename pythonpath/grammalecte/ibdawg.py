@@ -66,16 +66,19 @@ class IBDAWG:
             self.morph = self._morph1
             self.stem = self._stem1
             self._lookupArcNode = self._lookupArcNode1
+            self._getArcs = self._getArcs1
             self._writeNodes = self._writeNodes1
         elif self.nVersion == 2:
             self.morph = self._morph2
             self.stem = self._stem2
             self._lookupArcNode = self._lookupArcNode2
+            self._getArcs = self._getArcs2
             self._writeNodes = self._writeNodes2
         elif self.nVersion == 3:
             self.morph = self._morph3
             self.stem = self._stem3
             self._lookupArcNode = self._lookupArcNode3
+            self._getArcs = self._getArcs3
             self._writeNodes = self._writeNodes3
         else:
             raise ValueError("  # Error: unknown code: {}".format(self.nVersion))
@@ -83,6 +86,13 @@ class IBDAWG:
         self.bOptNumSigle = False
         self.bOptNumAtLast = False
 
+        # overlay: entries added without rebuilding the graph (flexion -> list of morphologies)
+        self.dOverlay = {}
+
+        # tags of morphologies: tag id -> tag (tags of the graph, then new tags of the overlay)
+        self.lTag = self.lArcVal[self.nChar+self.nAff:]
+        self.dTagId = { sTag: i  for i, sTag in enumerate(self.lTag) }
+
     def getInfo (self):
         return  "  Language: {0.sLang:>10}      Version: {0.nVersion:>2}      Stemming: {0.cStemming}FX\n" \
                 "  Arcs values:  {0.nArcVal:>10,} = {0.nChar:>5,} characters,  {0.nAff:>6,} affixes,  {0.nTag:>6,} tags\n" \
@@ -120,6 +130,62 @@ class IBDAWG:
                         }, ensure_ascii=False))
             hDst.write(";\n\nexports.dictionary = dictionary;\n")
 
+    def loadOverlay (self, spfSrc):
+        """adds entries of a lexicon to the overlay
+           each line: flexion, stem, tag separated with a tabulation, or only a flexion (stem = flexion, tag = :N:e:i)"""
+        nErr = 0
+        with open(spfSrc, "r", encoding="utf-8") as hSrc:
+            for sLine in hSrc:
+                sLine = sLine.strip()
+                if sLine.startswith("#") or not sLine:
+                    continue
+                l = sLine.split("\t")
+                if len(l) == 3:
+                    self.addOverlayEntry(*l)
+                elif len(l) == 1:
+                    self.addOverlayEntry(sLine, sLine, ":N:e:i")
+                else:
+                    nErr += 1
+        if nErr:
+            echo(" # Overlay {}: {} lines ignored".format(spfSrc, nErr))
+
+    def addOverlayEntry (self, sFlex, sStem, sTag):
+        "adds an entry to the overlay"
+        if not self.dOverlay:
+            # from now, morphologies and stems are also searched in the overlay
+            self._morphGraph = self.morph
+            self._stemGraph = self.stem
+            self.morph = self._morphOverlay
+            self.stem = self._stemOverlay
+        sMorph = ">" + sStem + " " + sTag
+        self._getTagId(sTag)
+        lMorph = self.dOverlay.setdefault(sFlex, [])
+        if sMorph not in lMorph:
+            lMorph.append(sMorph)
+
+    def mergeOverlay (self, spfDest):
+        "writes a new binary dictionary with the graph and the overlay merged"
+        from .dawg import DAWG
+        spfLexicon = spfDest + ".lex"
+        with open(spfLexicon, "w", encoding="utf-8") as hDst:
+            for sFlex, sStem, sTag in self.genEntries():
+                hDst.write("{}\t{}\t{}\n".format(sFlex, sStem, sTag))
+            for sFlex, lMorph in self.dOverlay.items():
+                for sMorph in lMorph:
+                    sStem, sTag = sMorph[1:].split(" ", 1)
+                    hDst.write("{}\t{}\t{}\n".format(sFlex, sStem, sTag))
+        oDAWG = DAWG(spfLexicon, self.sLang, self.cStemming)
+        oDAWG.createBinary(spfDest, self.nVersion)
+        os.remove(spfLexicon)
+
+    def _morphOverlay (self, sWord):
+        "returns morphologies of sWord (graph and overlay)"
+        return self._morphGraph(sWord) + self.dOverlay.get(sWord, [])
+
+    def _stemOverlay (self, sWord):
+        "returns stems list of sWord (graph and overlay)"
+        return self._stemGraph(sWord) + [ s[1:s.find(" ")]  for s in self.dOverlay.get(sWord, []) ]
+
     def isValidToken (self, sToken):
         "checks if sToken is valid (if there is hyphens in sToken, sToken is split, each part is checked)"
         if self.isValid(sToken):
@@ -156,11 +222,61 @@ class IBDAWG:
         iAddr = 0
         for c in sWord:
             if c not in self.dChar:
-                return False
+                return sWord in self.dOverlay
             iAddr = self._lookupArcNode(self.dChar[c], iAddr)
             if iAddr == None:
-                return False
-        return int.from_bytes(self.byDic[iAddr:iAddr+self.nBytesArc], byteorder='big') & self._finalNodeMask
+                return sWord in self.dOverlay
+        return int.from_bytes(self.byDic[iAddr:iAddr+self.nBytesArc], byteorder='big') & self._finalNodeMask  or  sWord in self.dOverlay
+
+    def complete (self, sPrefix, nLimit=10, bAlpha=False):
+        """returns a list of at most nLimit words beginning with sPrefix (sPrefix included if it is a word)
+           words are ordered as arcs in the graph (most frequent values first), after words of the overlay,
+           or alphabetically if bAlpha"""
+        iAddr = 0
+        for c in sPrefix:
+            if c not in self.dChar:
+                iAddr = None
+                break
+            iAddr = self._lookupArcNode(self.dChar[c], iAddr)
+            if iAddr == None:
+                break
+        lOverlayWord = [ sWord  for sWord in self.dOverlay  if sWord.startswith(sPrefix) ]  if self.dOverlay  else []
+        # words of the overlay (user, domain) first, unless sorted afterwards
+        lWord = []  if bAlpha  else lOverlayWord[:nLimit]
+        # depth-first search, stopped as soon as nLimit words are found
+        lStack = [(sPrefix, iAddr)]  if iAddr != None  else []
+        while lStack and len(lWord) < nLimit:
+            sWord, iAddr = lStack.pop()
+            if sWord and int.from_bytes(self.byDic[iAddr:iAddr+self.nBytesArc], byteorder='big') & self._finalNodeMask and sWord not in lWord:
+                lWord.append(sWord)
+            lArc = [ (self.lArcVal[nArc], iNextNodeAddr)  for nArc, iNextNodeAddr in self._getArcs(iAddr)  if nArc < self.nChar ]
+            if bAlpha:
+                lArc.sort()
+            lStack.extend( (sWord+c, iNextNodeAddr)  for c, iNextNodeAddr in reversed(lArc) )
+        if bAlpha and lOverlayWord:
+            lWord.extend( sWord  for sWord in lOverlayWord  if sWord not in lWord )
+            lWord.sort()
+            return lWord[:nLimit]
+        return lWord
+
+    def getTags (self):
+        "returns the list of tags of the graph"
+        return self.lArcVal[self.nChar+self.nAff:]
+
+    def genEntries (self):
+        "generator: returns all entries of the graph as tuples (flexion, stem, tag) (overlay excluded)"
+        lStack = [("", 0)]
+        while lStack:
+            sWord, iAddr = lStack.pop()
+            for nArc, iNextNodeAddr in self._getArcs(iAddr):
+                if nArc < self.nChar:
+                    lStack.append((sWord+self.lArcVal[nArc], iNextNodeAddr))
+                elif sWord:
+                    # stemming code: arcs of the next node are tags
+                    # (none for the root node: there is no empty flexion)
+                    sStem = self.funcStemming(sWord, self.lArcVal[nArc])
+                    for nTag, _ in self._getArcs(iNextNodeAddr):
+                        yield (sWord, sStem, self.lArcVal[nTag])
 
     def getSugg (self, sWord, iAddr=0, sNewWord=""):
         "not finished"
@@ -195,6 +311,47 @@ class IBDAWG:
                 l.extend(self.morph(sWord.capitalize()))
         return l
 
+    def getMorphIds (self, sWord):
+        "retrieves morphologies list as pairs (stem, tag id), different casing allowed (tag id: index in lTag)"
+        l = self.morphIds(sWord)
+        if sWord[0:1].isupper():
+            l.extend(self.morphIds(sWord.lower()))
+            if sWord.isupper() and len(sWord) > 1:
+                l.extend(self.morphIds(sWord.capitalize()))
+        return l
+
+    def morphIds (self, sWord):
+        "returns morphologies of sWord as pairs (stem, tag id), same order as morph()"
+        l = []
+        iAddr = 0
+        for c in sWord:
+            if c not in self.dChar:
+                iAddr = None
+                break
+            iAddr = self._lookupArcNode(self.dChar[c], iAddr)
+            if iAddr == None:
+                break
+        if iAddr != None and int.from_bytes(self.byDic[iAddr:iAddr+self.nBytesArc], byteorder='big') & self._finalNodeMask:
+            nTagOffset = self.nChar + self.nAff
+            for nArc, iNextNodeAddr in self._getArcs(iAddr):
+                if nArc >= self.nChar:
+                    # stemming code: arcs of the next node are tags
+                    sStem = self.funcStemming(sWord, self.lArcVal[nArc])
+                    # (a few values of the graph read as tags are not in the tags range)
+                    l.extend( (sStem, nTag - nTagOffset  if nTag >= nTagOffset  else self._getTagId(self.lArcVal[nTag]))  for nTag, _ in self._getArcs(iNextNodeAddr) )
+        if sWord in self.dOverlay:
+            for sMorph in self.dOverlay[sWord]:
+                sStem, sTag = sMorph[1:].split(" ", 1)
+                l.append((sStem, self.dTagId[sTag]))
+        return l
+
+    def _getTagId (self, sTag):
+        "returns the tag id of sTag (a new id if sTag is not a tag of the graph)"
+        if sTag not in self.dTagId:
+            self.dTagId[sTag] = len(self.lTag)
+            self.lTag.append(sTag)
+        return self.dTagId[sTag]
+
     # def morph (self, sWord):
     #     is defined in __init__
 
@@ -268,6 +425,17 @@ class IBDAWG:
                     return None
                 iAddr = iEndArcAddr+self.nBytesNodeAddress
 
+    def _getArcs1 (self, iAddr):
+        "returns the list of (arc value, address of next node) of the node at iAddr"
+        lArc = []
+        nRawArc = 0
+        while not (nRawArc & self._lastArcMask):
+            iEndArcAddr = iAddr+self.nBytesArc
+            nRawArc = int.from_bytes(self.byDic[iAddr:iEndArcAddr], byteorder='big')
+            iAddr = iEndArcAddr+self.nBytesNodeAddress
+            lArc.append((nRawArc & self._arcMask, int.from_bytes(self.byDic[iEndArcAddr:iAddr], byteorder='big')))
+        return lArc
+
     def _writeNodes1 (self, spfDest):
         "for debugging only"
         print(" > Write binary nodes")
@@ -380,6 +548,22 @@ class IBDAWG:
                     return None
                 iAddr = iEndArcAddr+self.nBytesNodeAddress  if not (nRawArc & self._addrBitMask)  else iEndArcAddr
 
+    def _getArcs2 (self, iAddr):
+        "returns the list of (arc value, address of next node) of the node at iAddr"
+        lArc = []
+        nRawArc = 0
+        while not (nRawArc & self._lastArcMask):
+            iEndArcAddr = iAddr+self.nBytesArc
+            nRawArc = int.from_bytes(self.byDic[iAddr:iEndArcAddr], byteorder='big')
+            if not (nRawArc & self._addrBitMask):
+                iAddr = iEndArcAddr+self.nBytesNodeAddress
+                lArc.append((nRawArc & self._arcMask, int.from_bytes(self.byDic[iEndArcAddr:iAddr], byteorder='big')))
+            else:
+                # next node is the following node: its address is known at the end of this node
+                iAddr = iEndArcAddr
+                lArc.append((nRawArc & self._arcMask, None))
+        return [ (nArc, iNextNodeAddr  if iNextNodeAddr != None  else iAddr)  for nArc, iNextNodeAddr in lArc ]
+
     def _writeNodes2 (self, spfDest):
         "for debugging only"
         print(" > Write binary nodes")
@@ -479,6 +663,22 @@ class IBDAWG:
                     return None
                 iAddr = iEndArcAddr+self.nBytesNodeAddress  if not (nRawArc & self._addrBitMask)  else iEndArcAddr+self.nBytesOffset
 
+    def _getArcs3 (self, iAddr):
+        "returns the list of (arc value, address of next node) of the node at iAddr"
+        lArc = []
+        iAddrNode = iAddr
+        nRawArc = 0
+        while not (nRawArc & self._lastArcMask):
+            iEndArcAddr = iAddr+self.nBytesArc
+            nRawArc = int.from_bytes(self.byDic[iAddr:iEndArcAddr], byteorder='big')
+            if not (nRawArc & self._addrBitMask):
+                iAddr = iEndArcAddr+self.nBytesNodeAddress
+                lArc.append((nRawArc & self._arcMask, int.from_bytes(self.byDic[iEndArcAddr:iAddr], byteorder='big')))
+            else:
+                iAddr = iEndArcAddr+self.nBytesOffset
+                lArc.append((nRawArc & self._arcMask, iAddrNode + int.from_bytes(self.byDic[iEndArcAddr:iAddr], byteorder='big')))
+        return lArc
+
     def _writeNodes3 (self, spfDest):
         "for debugging only"
         print(" > Write binary nodes")
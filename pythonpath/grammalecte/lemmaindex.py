@@ -0,0 +1,158 @@
+#!python3
+# -*- coding: UTF-8 -*-
+
+# LEMMA INDEX
+#
+# Reverse index of a binary dictionary: lemma -> list of (flexion, tag)
+# Built once from an IBDAWG, then memory-mapped.
+# Flexions are stored as suffix codes (to get them from the lemma), and lemmas
+# with the same list of (suffix code, tag) share it (a paradigm).
+
+import os
+import re
+import mmap
+import zlib
+
+from .echo import echo
+from . import str_transform as st
+
+
+class LemmaIndex:
+    """LEMMA INDEX: memory-mapped hash table, lemma -> flexions and tags"""
+
+    def __init__ (self, spfSrc):
+        with open(spfSrc, "rb") as hSrc:
+            self.by = mmap.mmap(hSrc.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.by[0:11] != b"/pylemma/2/":
+            raise TypeError("# Error. Not a lemma index (version 2). Header: {}".format(self.by[0:11]))
+        self.sName = os.path.basename(spfSrc)
+        self.nSlot = int.from_bytes(self.by[11:15], byteorder='big')
+        self.nLemma = int.from_bytes(self.by[15:19], byteorder='big')
+        self.nEntries = int.from_bytes(self.by[19:23], byteorder='big')
+        self.nParadigm = int.from_bytes(self.by[23:27], byteorder='big')
+        self._iTable = 27
+        iTags = self._iTable + self.nSlot * 4
+        iSfx = self.by.find(b"\n", iTags) + 1
+        self.lTag = self.by[iTags:iSfx-1].decode("utf-8").split("\t")
+        self._iParadigmAddr = self.by.find(b"\n", iSfx) + 1
+        self.lSfx = self.by[iSfx:self._iParadigmAddr-1].decode("utf-8").split("\t")
+        self._iParadigms = self._iParadigmAddr + (self.nParadigm + 1) * 4
+
+    @classmethod
+    def build (cls, oDict, spfDest):
+        """
+        Format of the lemma index (version 2), integers are big-endian:
+            - Header: /pylemma/2/
+            - Number of slots (4 bytes), number of lemmas (4 bytes), number of entries (4 bytes),
+              number of paradigms (4 bytes)
+            - Slots: hash table with open addressing (linear probing) on the CRC32 of the lemma (UTF-8),
+              each slot is the address of a record from the start of the file (4 bytes), 0 if empty
+            - Tags: list of tags separated with a tabulation, ended with a new line, encoded in UTF-8
+            - Suffix codes (to get flexions from lemmas): same format as tags
+            - Addresses of paradigms: number of paradigms + 1 addresses (4 bytes each), relative to the first paradigm,
+              the last one being the end of the last paradigm
+            - Paradigms: a paradigm is the list of (flexion, tag) of lemmas, shared by lemmas with the same list:
+              for each flexion, index of its suffix code then index of its tag (2 bytes each)
+            - Records, sorted by lemma: lemma encoded in UTF-8, a tabulation, then the index of its paradigm (2 bytes)
+            Tags, suffix codes and paradigms are at most 65535 each.
+        """
+        echo(" > Build lemma index from " + oDict.sName)
+        dLemma = {}
+        nEntries = 0
+        for sFlex, sStem, sTag in oDict.genEntries():
+            dLemma.setdefault(sStem, []).append((st.defineSuffixCode(sStem, sFlex), sTag))
+            nEntries += 1
+        lTag = []
+        dTag = {}
+        lSfx = []
+        dSfx = {}
+        lParadigm = []
+        dParadigm = {}
+        for sLemma, lFlex in dLemma.items():
+            tParadigm = tuple(lFlex)
+            if tParadigm not in dParadigm:
+                for sSfx, sTag in tParadigm:
+                    if sSfx not in dSfx:
+                        dSfx[sSfx] = len(lSfx)
+                        lSfx.append(sSfx)
+                    if sTag not in dTag:
+                        dTag[sTag] = len(lTag)
+                        lTag.append(sTag)
+                dParadigm[tParadigm] = len(lParadigm)
+                lParadigm.append(b"".join( dSfx[sSfx].to_bytes(2, byteorder='big') + dTag[sTag].to_bytes(2, byteorder='big')  for sSfx, sTag in tParadigm ))
+            dLemma[sLemma] = dParadigm[tParadigm]
+        if max(len(lTag), len(lSfx), len(lParadigm)) > 65535:
+            raise ValueError("# Error. Too many tags, suffix codes or paradigms for a lemma index.")
+        lParadigmAddr = [0]
+        for byParadigm in lParadigm:
+            lParadigmAddr.append(lParadigmAddr[-1] + len(byParadigm))
+        nSlot = len(dLemma) * 2 + 1
+        lSlot = [0] * nSlot
+        lRecord = []
+        byTags = ("\t".join(lTag) + "\n").encode("utf-8")
+        bySfx = ("\t".join(lSfx) + "\n").encode("utf-8")
+        iAddr = 27 + nSlot * 4 + len(byTags) + len(bySfx) + len(lParadigmAddr) * 4 + lParadigmAddr[-1]
+        for sLemma in sorted(dLemma):
+            byLemma = sLemma.encode("utf-8")
+            i = zlib.crc32(byLemma) % nSlot
+            while lSlot[i]:
+                i = (i + 1) % nSlot
+            lSlot[i] = iAddr
+            byRecord = byLemma + b"\t" + dLemma[sLemma].to_bytes(2, byteorder='big')
+            lRecord.append(byRecord)
+            iAddr += len(byRecord)
+        with open(spfDest, "wb") as hDst:
+            hDst.write(b"/pylemma/2/")
+            hDst.write(nSlot.to_bytes(4, byteorder='big'))
+            hDst.write(len(dLemma).to_bytes(4, byteorder='big'))
+            hDst.write(nEntries.to_bytes(4, byteorder='big'))
+            hDst.write(len(lParadigm).to_bytes(4, byteorder='big'))
+            hDst.write(b"".join( i.to_bytes(4, byteorder='big')  for i in lSlot ))
+            hDst.write(byTags)
+            hDst.write(bySfx)
+            hDst.write(b"".join( i.to_bytes(4, byteorder='big')  for i in lParadigmAddr ))
+            hDst.write(b"".join(lParadigm))
+            hDst.write(b"".join(lRecord))
+        echo("   {:,} lemmas, {:,} entries, {:,} paradigms".format(len(dLemma), nEntries, len(lParadigm)))
+        return cls(spfDest)
+
+    def getInfo (self):
+        return "  Lemma index: {0.sName}    {0.nLemma:>10,} lemmas    {0.nEntries:>10,} entries\n".format(self)
+
+    def _getParadigm (self, sLemma):
+        "returns the paradigm index of sLemma, or None"
+        byLemma = sLemma.encode("utf-8")
+        byKey = byLemma + b"\t"
+        i = zlib.crc32(byLemma) % self.nSlot
+        while True:
+            iAddr = self._iTable + i * 4
+            iRecord = int.from_bytes(self.by[iAddr:iAddr+4], byteorder='big')
+            if not iRecord:
+                return None
+            if self.by[iRecord:iRecord+len(byKey)] == byKey:
+                iRecord += len(byKey)
+                return int.from_bytes(self.by[iRecord:iRecord+2], byteorder='big')
+            i = (i + 1) % self.nSlot
+
+    def isLemma (self, sLemma):
+        "returns True if sLemma is a lemma in the index"
+        return self._getParadigm(sLemma) != None
+
+    def getFlexions (self, sLemma):
+        "returns list of (flexion, tag) of sLemma"
+        iParadigm = self._getParadigm(sLemma)
+        if iParadigm == None:
+            return []
+        iAddr = self._iParadigmAddr + iParadigm * 4
+        iStart = self._iParadigms + int.from_bytes(self.by[iAddr:iAddr+4], byteorder='big')
+        iEnd = self._iParadigms + int.from_bytes(self.by[iAddr+4:iAddr+8], byteorder='big')
+        return [ (st.getStemFromSuffixCode(sLemma, self.lSfx[int.from_bytes(self.by[i:i+2], byteorder='big')]),
+                  self.lTag[int.from_bytes(self.by[i+2:i+4], byteorder='big')])  for i in range(iStart, iEnd, 4) ]
+
+    def getFlexionsWithTag (self, sLemma, sPattern):
+        "returns list of flexions of sLemma whose tag matches sPattern"
+        p = re.compile(sPattern)
+        return [ sFlex  for sFlex, sTag in self.getFlexions(sLemma)  if p.search(sTag) ]
+
+    def close (self):
+        self.by.close()
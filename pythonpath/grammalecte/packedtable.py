@@ -0,0 +1,166 @@
+#!python3
+# -*- coding: UTF-8 -*-
+
+# PACKED TABLE
+#
+# Read-only dictionary: string -> small integer or tuple of small integers
+# Built once from a Python dictionary (generated data), then memory-mapped.
+# The table stores the checksum of its source module: a stale table is ignored.
+
+import os
+import mmap
+import zlib
+import importlib
+import importlib.util
+import traceback
+
+
+class PackedTable:
+    """PACKED TABLE: memory-mapped hash table, key -> value (integer or tuple of integers, 0 to 65535)"""
+
+    def __init__ (self, spfSrc):
+        with open(spfSrc, "rb") as hSrc:
+            self.by = mmap.mmap(hSrc.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.by[0:11] != b"/pytable/2/":
+            sHeader = self.by[0:11]
+            self.by.close()
+            raise ValueError("# Error. Not a packed table (or old format). Header: {}".format(sHeader))
+        self.sName = os.path.basename(spfSrc)
+        self.nSlot = int.from_bytes(self.by[11:15], byteorder='big')
+        self.nEntries = int.from_bytes(self.by[15:19], byteorder='big')
+        self.nFields = self.by[19]
+        self.nSrcChecksum = int.from_bytes(self.by[20:24], byteorder='big')
+        self._iTable = 24
+        self._iRecords = self._iTable + self.nSlot * 4
+        self._nValueLen = self.nFields * 2
+
+    @classmethod
+    def build (cls, dTable, spfDest, nSrcChecksum=0):
+        """
+        Format of the packed table:
+            - Header: /pytable/2/
+            - Number of slots (4 bytes), number of entries (4 bytes), number of fields of values (1 byte),
+              checksum of the source module (4 bytes, see getSourceChecksum)
+            - Slots: hash table with open addressing (linear probing),
+              each slot is the address of a record (4 bytes), 0 if empty
+            - Records, sorted by key: key encoded in UTF-8, a tabulation, then fields of the value (2 bytes each)
+        """
+        nFields = 1
+        for xValue in dTable.values():
+            nFields = 1  if type(xValue) is int  else len(xValue)
+            break
+        nSlot = len(dTable) * 2 + 1
+        lSlot = [0] * nSlot
+        lRecord = []
+        iAddr = 24 + nSlot * 4
+        for sKey in sorted(dTable):
+            byKey = sKey.encode("utf-8")
+            i = zlib.crc32(byKey) % nSlot
+            while lSlot[i]:
+                i = (i + 1) % nSlot
+            lSlot[i] = iAddr
+            tValue = (dTable[sKey],)  if nFields == 1  else dTable[sKey]
+            byRecord = byKey + b"\t" + b"".join( n.to_bytes(2, byteorder='big')  for n in tValue )
+            lRecord.append(byRecord)
+            iAddr += len(byRecord)
+        with open(spfDest, "wb") as hDst:
+            hDst.write(b"/pytable/2/")
+            hDst.write(nSlot.to_bytes(4, byteorder='big'))
+            hDst.write(len(dTable).to_bytes(4, byteorder='big'))
+            hDst.write(nFields.to_bytes(1, byteorder='big'))
+            hDst.write(nSrcChecksum.to_bytes(4, byteorder='big'))
+            hDst.write(b"".join( i.to_bytes(4, byteorder='big')  for i in lSlot ))
+            hDst.write(b"".join(lRecord))
+        return cls(spfDest)
+
+    def getInfo (self):
+        return "  Packed table: {0.sName}    {0.nEntries:>10,} entries\n".format(self)
+
+    def _getValueAddr (self, sKey):
+        "returns the address of the value of sKey, or 0"
+        byKey = sKey.encode("utf-8") + b"\t"
+        i = zlib.crc32(byKey[:-1]) % self.nSlot
+        while True:
+            iAddr = self._iTable + i * 4
+            iRecord = int.from_bytes(self.by[iAddr:iAddr+4], byteorder='big')
+            if not iRecord:
+                return 0
+            if self.by[iRecord:iRecord+len(byKey)] == byKey:
+                return iRecord + len(byKey)
+            i = (i + 1) % self.nSlot
+
+    def _readValue (self, iAddr):
+        if self.nFields == 1:
+            return int.from_bytes(self.by[iAddr:iAddr+2], byteorder='big')
+        return tuple( int.from_bytes(self.by[i:i+2], byteorder='big')  for i in range(iAddr, iAddr+self._nValueLen, 2) )
+
+    def __len__ (self):
+        return self.nEntries
+
+    def __contains__ (self, sKey):
+        return self._getValueAddr(sKey) != 0
+
+    def __getitem__ (self, sKey):
+        iAddr = self._getValueAddr(sKey)
+        if not iAddr:
+            raise KeyError(sKey)
+        return self._readValue(iAddr)
+
+    def get (self, sKey, default=None):
+        iAddr = self._getValueAddr(sKey)
+        if not iAddr:
+            return default
+        return self._readValue(iAddr)
+
+    def items (self):
+        "generator: returns (key, value), sorted by key"
+        iAddr = self._iRecords
+        while iAddr < len(self.by):
+            iTab = self.by.find(b"\t", iAddr)
+            yield self.by[iAddr:iTab].decode("utf-8"), self._readValue(iTab+1)
+            iAddr = iTab + 1 + self._nValueLen
+
+    def keys (self):
+        "generator: returns keys, sorted"
+        for sKey, _ in self.items():
+            yield sKey
+
+    def values (self):
+        "generator: returns values, sorted by key"
+        for _, xValue in self.items():
+            yield xValue
+
+    def __iter__ (self):
+        return self.keys()
+
+    def close (self):
+        self.by.close()
+
+
+def getTable (sFileName, sModule, sVar, sPackage=None):
+    """returns the packed table sFileName (in _dictionaries), memory-mapped,
+       or, if there is no such file or if it wasn't built from the current module sModule, the dictionary sVar of this module"""
+    spfTable = getTablePath(sFileName)
+    if os.path.isfile(spfTable):
+        try:
+            oTable = PackedTable(spfTable)
+            nSrcChecksum = getSourceChecksum(sModule, sPackage)
+            if nSrcChecksum is None or oTable.nSrcChecksum == nSrcChecksum:
+                return oTable
+            oTable.close()
+        except (OSError, ValueError):
+            traceback.print_exc()
+    return getattr(importlib.import_module(sModule, sPackage), sVar)
+
+
+def getSourceChecksum (sModule, sPackage=None):
+    "returns the CRC32 of the file of the module sModule (without importing it), or None if there is no such file"
+    oSpec = importlib.util.find_spec(sModule, sPackage)
+    if not oSpec or not oSpec.has_location:
+        return None
+    with open(oSpec.origin, "rb") as hSrc:
+        return zlib.crc32(hSrc.read())
+
+
+def getTablePath (sFileName):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "_dictionaries", sFileName)
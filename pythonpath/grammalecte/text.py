@@ -1,18 +1,70 @@
 #!python3
 
 from textwrap import wrap
+from bisect import bisect_right
 
 
-def getParagraph (sText):
-    "generator: returns paragraphs of text"
+def getParagraphSpans (sText):
+    "generator: returns (start, end) of paragraphs of text (nothing copied)"
     iStart = 0
     iEnd = sText.find("\n", iStart)
     while iEnd != -1:
-        #print(str(iStart) + ":" + str(iEnd))
-        yield sText[iStart:iEnd]
+        yield (iStart, iEnd)
         iStart = iEnd + 1
         iEnd = sText.find("\n", iStart)
-    yield sText[iStart:]
+    yield (iStart, len(sText))
+
+
+def getParagraph (sText):
+    "generator: returns paragraphs of text"
+    for iStart, iEnd in getParagraphSpans(sText):
+        yield sText[iStart:iEnd]
+
+
+def genParagraphsFromLines (genLines, sMode="blank", nMaxLen=100000):
+    """generator: reassembles hard-wrapped lines (e-mails, OCR…) in paragraphs
+       returns (paragraph, number of its first line, offsets of its lines in paragraph)
+       sMode: "blank" (paragraphs separated by blank lines) or "indent" (also a new paragraph at each indented line)
+       lines are joined with a space; a paragraph longer than nMaxLen is cut at the end of a line"""
+    bIndent = sMode == "indent"
+    lLine = []
+    lOffset = []
+    nLen = 0
+    iFirstLine = 1
+    for iLine, sLine in enumerate(genLines, 1):
+        sLine = sLine.rstrip("\r\n")
+        if not sLine.strip():
+            if lLine:
+                yield " ".join(lLine), iFirstLine, lOffset
+                lLine = []
+                lOffset = []
+                nLen = 0
+            continue
+        if lLine and (nLen > nMaxLen or (bIndent and sLine[0] in " \t")):
+            yield " ".join(lLine), iFirstLine, lOffset
+            lLine = []
+            lOffset = []
+            nLen = 0
+        if not lLine:
+            iFirstLine = iLine
+        lLine.append(sLine)
+        lOffset.append(nLen)
+        nLen += len(sLine) + 1
+    if lLine:
+        yield " ".join(lLine), iFirstLine, lOffset
+
+
+def getLineAndColumn (nPos, iFirstLine, lOffset):
+    "returns (line, column) in source of position nPos in a paragraph from genParagraphsFromLines (columns from 1)"
+    i = bisect_right(lOffset, nPos) - 1
+    return iFirstLine + i, nPos - lOffset[i] + 1
+
+
+def setLineAndColumn (dErr, iFirstLine, lOffset):
+    "adds to error dErr its position in source: nLine, nColumn, nLineEnd, nColumnEnd (end excluded)"
+    dErr["nLine"], dErr["nColumn"] = getLineAndColumn(dErr["nStart"], iFirstLine, lOffset)
+    nLineEnd, nColumnEnd = getLineAndColumn(max(dErr["nEnd"]-1, dErr["nStart"]), iFirstLine, lOffset)
+    dErr["nLineEnd"], dErr["nColumnEnd"] = nLineEnd, nColumnEnd + 1
 
 
 def generateParagraph (sParagraph, aGrammErrs, aSpellErrs, nWidth=100):
@@ -69,7 +121,7 @@ def generateParagraph (sParagraph, aGrammErrs, aSpellErrs, nWidth=100):
 def getReadableError (dErr):
     "Returns an error dErr as a readable error"
     try:
-        s = u"* {nStart}:{nEnd}  # {sRuleId}  : ".format(**dErr)
+        s = u"* {nStart}:{nEnd}  # {sRuleId}  : ".format(**dErr)  if "nLine" not in dErr  else u"* {nStart}:{nEnd} (l. {nLine}, col. {nColumn})  # {sRuleId}  : ".format(**dErr)
         s += dErr.get("sMessage", "# error : message not found")
         if dErr.get("aSuggestions", None):
             s += "\n  > Suggestions : " + " | ".join(dErr.get("aSuggestions", "# error : suggestions not found"))
@@ -1,6 +1,7 @@
 # Very simple tokenizer
 
 import re
+from array import array
 
 _PATTERNS = {
     "default":
@@ -34,8 +35,37 @@ class Tokenizer:
         self.sLang = sLang
         if sLang not in _PATTERNS:
             self.sLang = "default"
-        self.zToken = re.compile( "(?i)" + '|'.join(sRegex for sRegex in _PATTERNS[sLang]) )
+        self.zToken = re.compile( "(?i)" + '|'.join(sRegex for sRegex in _PATTERNS[self.sLang]) )
+        # each pattern is one named group without other capturing group: the type code of a token is its group number
+        self.lType = [""] + [ sType  for sType, _ in sorted(self.zToken.groupindex.items(), key=lambda t: t[1]) ]
+        self.iWord = self.zToken.groupindex["WORD"]
 
     def genTokens (self, sText):
+        "generator: returns tokens as dictionaries"
         for m in self.zToken.finditer(sText):
             yield { "sType": m.lastgroup, "sValue": m.group(), "nStart": m.start(), "nEnd": m.end() }
+
+    def genTokenTuples (self, sText):
+        "generator: returns tokens as tuples (sType, sValue, nStart, nEnd)"
+        for m in self.zToken.finditer(sText):
+            yield (m.lastgroup, m.group(), m.start(), m.end())
+
+    def genWords (self, sText):
+        "generator: returns tokens of type WORD only, as tuples (sValue, nStart, nEnd)"
+        iWord = self.iWord
+        for m in self.zToken.finditer(sText):
+            if m.lastindex == iWord:
+                yield (m.group(), m.start(), m.end())
+
+    def getTokenArrays (self, sText):
+        """returns all tokens as three parallel arrays: type codes (index in self.lType), starts and ends
+           (values are not copied: sText[nStart:nEnd])"""
+        aType = array("B")
+        aStart = array("l")
+        aEnd = array("l")
+        for m in self.zToken.finditer(sText):
+            aType.append(m.lastindex)
+            nStart, nEnd = m.span()
+            aStart.append(nStart)
+            aEnd.append(nEnd)
+        return aType, aStart, aEnd
@@ -0,0 +1,82 @@
+#!python3
+# -*- coding: UTF-8 -*-
+
+# Text formatter: the passes filtered by triggers must give the same results as the replacements done one after another
+# Run from pythonpath: python -m unittest discover tests
+
+import unittest
+import warnings
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", FutureWarning)
+    import grammalecte.fr.textformatter as tf
+
+
+_lText = [
+    "Il a soixante-dix deux ans.",
+    "Il a quatre-vingt-dix neuf ans et elle soixante dix.",
+    "Vingt deux, trente trois , quarante  quatre et cinquante cinq.",
+    "Le coeur  de l'oeuvre ,dit-il ;est là !Vraiment ?",
+    "« Bonjour »,dit-elle ... puis  : “ au revoir ” etc...",
+    "( entre parenthèses ) et [ entre crochets ] .",
+    "Au XIXe siècle, le 1er janvier, la Ire République, au Xe siècle.",
+    "Une vitesse de 10 m.s-1, une surface de 12 m2, 3 kΩ, 50 % et 12 €.",
+    "Celui ci est ci joint, vis à vis de la plus value.",
+    "Y a-t'il quelqu'un ? Viendra-t il ? Qu'en pense-t-elle ?",
+    "'mot' ''mot'' \"mot\" - tiret — tiret long -- double tiret",
+    "Il est  parti.. Puis revenu…. Enfin...",
+    "ﬁn de ﬂux, eﬀet, oﬃce, aﬄux, ﬅyle",
+    "L’homme et l' enfant ; l’ Europe ; jusqu' ici.",
+    "   espaces en début, tabulations\t\tet fin   ",
+    "Des nombres : 1000000, 12 345 678, 3,14 et 1.000.",
+    "http : //exemple.fr et http ://exemple.org",
+]
+
+
+def _formatSequentially (lOptName, sText):
+    "original algorithm: all replacements of the options, one after another"
+    for sOptName in lOptName:
+        for zRgx, sRep in tf.dReplTable[sOptName]:
+            sText = zRgx.sub(sRep, sText)
+    return sText
+
+
+class TestTextFormatter (unittest.TestCase):
+
+    lOptName = [ sOptName  for sOptName, _ in tf.lOptRepl ]
+
+    def _getTextFormatter (self, lOptName):
+        "returns a new text formatter with options lOptName (the regexes of dReplTable are compiled by the first one)"
+        oTF = tf.TextFormatter()
+        oTF.lPass = tf.compilePasses(lOptName)
+        return oTF
+
+    def _check (self, lOptName):
+        oTF = self._getTextFormatter(lOptName)
+        for sText in _lText:
+            self.assertEqual(oTF.formatText(sText), _formatSequentially(lOptName, sText), (lOptName, sText))
+
+    def test_all_options (self):
+        self._check(self.lOptName)
+
+    def test_each_option (self):
+        for sOptName in self.lOptName:
+            self._check([sOptName])
+
+    def test_triggers (self):
+        tf.TextFormatter()     # compiles the regexes of dReplTable
+        for sOptName in self.lOptName:
+            for zRgx, _ in tf.dReplTable[sOptName]:
+                lTrigger = tf.getTriggers(zRgx.pattern)
+                if lTrigger:
+                    for sText in _lText:
+                        if zRgx.search(sText):
+                            self.assertTrue(any( s in sText  for s in lTrigger ), (zRgx.pattern, lTrigger, sText))
+
+    def test_numbers (self):
+        oTF = self._getTextFormatter(["mh_numbers"])
+        self.assertEqual(oTF.formatText("Il a soixante-dix deux ans."), "Il a soixante-dix-deux ans.")
+
+
+if __name__ == '__main__':
+    unittest.main()